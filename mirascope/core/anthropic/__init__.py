@@ -5,6 +5,7 @@ from typing import TypeAlias
 from anthropic.types import MessageParam
 
 from ..base import BaseMessageParam
+from . import batch
 from ._call import anthropic_call
 from ._call import anthropic_call as call
 from .call_params import AnthropicCallParams
@@ -17,6 +18,7 @@ from .tool import AnthropicTool, AnthropicToolConfig
 AnthropicMessageParam: TypeAlias = MessageParam | BaseMessageParam
 
 __all__ = [
+    "batch",
     "call",
     "AsyncAnthropicDynamicConfig",
     "AnthropicDynamicConfig",
@@ -5,31 +5,33 @@ from collections.abc import AsyncGenerator, Generator
 import jiter
 from anthropic.types import MessageStreamEvent, ToolUseBlock
 
+from ...base._utils import StreamThrottle, TextBuffer, ToolIndex, get_tool_index
 from ..call_response_chunk import AnthropicCallResponseChunk
 from ..tool import AnthropicTool
 
 
 def _handle_chunk(
-    buffer: str,
+    buffer: TextBuffer,
     chunk: MessageStreamEvent,
     current_tool_call: ToolUseBlock,
     current_tool_type: type[AnthropicTool] | None,
-    tool_types: list[type[AnthropicTool]] | None,
+    tool_index: ToolIndex[AnthropicTool] | None,
     partial_tools: bool = False,
+    throttle: StreamThrottle | None = None,
 ) -> tuple[
-    str,
+    TextBuffer,
     AnthropicTool | None,
     ToolUseBlock,
     type[AnthropicTool] | None,
 ]:
     """Handles a chunk of the stream."""
-    if not tool_types:
+    if not tool_index:
         return buffer, None, current_tool_call, current_tool_type
 
     if chunk.type == "content_block_stop" and current_tool_type and buffer:
-        current_tool_call.input = jiter.from_json(buffer.encode())
+        current_tool_call.input = jiter.from_json(str(buffer).encode())
         return (
-            "",
+            TextBuffer(),
             current_tool_type.from_tool_call(current_tool_call),
             ToolUseBlock(id="", input={}, name="", type="tool_use"),
             None,
@@ -39,17 +41,11 @@ def _handle_chunk(
         chunk.content_block, ToolUseBlock
     ):
         content_block = chunk.content_block
-        current_tool_type = None
-        for tool_type in tool_types:
-            if tool_type._name() == content_block.name:
-                current_tool_type = tool_type
-                break
-        if current_tool_type is None:
-            raise RuntimeError(
-                f"Unknown tool type in stream: {content_block.name}."
-            )  # pragma: no cover
+        if throttle is not None:
+            throttle.reset()
+        current_tool_type = tool_index[content_block.name]
         return (
-            "",
+            TextBuffer(),
             None,
             ToolUseBlock(
                 id=content_block.id, input={}, name=content_block.name, type="tool_use"
@@ -58,18 +54,22 @@ def _handle_chunk(
         )
 
     if chunk.type == "content_block_delta" and chunk.delta.type == "input_json_delta":
-        buffer += chunk.delta.partial_json
+        buffer.append(chunk.delta.partial_json)
 
         # Return partial tool if enabled
         if partial_tools and current_tool_type:
+            delta = chunk.delta.partial_json
+            # Coalesce the deltas of partial tools that the throttle holds back
+            if throttle is not None and (delta := throttle.update_json(delta)) is None:
+                return buffer, None, current_tool_call, current_tool_type
             partial_tool_call = ToolUseBlock(
                 id=current_tool_call.id,
-                input=buffer,
+                input=str(buffer),
                 name=current_tool_call.name,
                 type="tool_use",
             )
             partial_tool = current_tool_type.from_tool_call(partial_tool_call, True)
-            partial_tool.delta = chunk.delta.partial_json
+            partial_tool.delta = delta
             return buffer, partial_tool, current_tool_call, current_tool_type
     return buffer, None, current_tool_call, current_tool_type
 
@@ -78,18 +78,21 @@ def handle_stream(
     stream: Generator[MessageStreamEvent, None, None],
     tool_types: list[type[AnthropicTool]] | None,
     partial_tools: bool = False,
+    throttle: StreamThrottle | None = None,
 ) -> Generator[tuple[AnthropicCallResponseChunk, AnthropicTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
+    tool_index = get_tool_index(tool_types) if tool_types else None
     current_tool_call = ToolUseBlock(id="", input={}, name="", type="tool_use")
-    current_tool_type, buffer = None, ""
+    current_tool_type, buffer = None, TextBuffer()
     for chunk in stream:
         buffer, tool, current_tool_call, current_tool_type = _handle_chunk(
             buffer,
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_index,
             partial_tools,
+            throttle,
         )
         yield AnthropicCallResponseChunk(chunk=chunk), tool
 
@@ -98,16 +101,19 @@ async def handle_stream_async(
     stream: AsyncGenerator[MessageStreamEvent, None],
     tool_types: list[type[AnthropicTool]] | None,
     partial_tools: bool = False,
+    throttle: StreamThrottle | None = None,
 ) -> AsyncGenerator[tuple[AnthropicCallResponseChunk, AnthropicTool | None], None]:
+    tool_index = get_tool_index(tool_types) if tool_types else None
     current_tool_call = ToolUseBlock(id="", input={}, name="", type="tool_use")
-    current_tool_type, buffer = None, ""
+    current_tool_type, buffer = None, TextBuffer()
     async for chunk in stream:
         buffer, tool, current_tool_call, current_tool_type = _handle_chunk(
             buffer,
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_index,
             partial_tools,
+            throttle,
         )
         yield AnthropicCallResponseChunk(chunk=chunk), tool
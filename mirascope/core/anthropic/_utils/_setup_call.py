@@ -16,6 +16,11 @@ from anthropic.types import Message, MessageParam, MessageStreamEvent
 
 from ...base import BaseMessageParam, BaseTool, _utils
 from ...base._utils import AsyncCreateFn, CreateFn
+from ...base.client_pool import (
+    ClientPoolLimits,
+    create_httpx_client,
+    default_client_pool,
+)
 from ...base.stream_config import StreamConfig
 from .._call_kwargs import AnthropicCallKwargs
 from ..call_params import AnthropicCallParams
@@ -24,6 +29,21 @@ from ..tool import AnthropicTool
 from ._convert_common_call_params import convert_common_call_params
 from ._convert_message_params import convert_message_params
 
+_ENV_VARS = ("ANTHROPIC_API_KEY", "ANTHROPIC_AUTH_TOKEN", "ANTHROPIC_BASE_URL")
+
+
+def _get_default_client(is_async: bool) -> Anthropic | AsyncAnthropic:
+    client_type = AsyncAnthropic if is_async else Anthropic
+
+    def create(limits: ClientPoolLimits) -> Anthropic | AsyncAnthropic:
+        if http_client := create_httpx_client(limits, is_async):
+            return client_type(http_client=http_client)
+        return client_type()
+
+    return default_client_pool.get(
+        client_type, is_async=is_async, env=_ENV_VARS, create=create
+    )
+
 
 @overload
 def setup_call(
@@ -131,6 +151,6 @@ def setup_call(
     }
 
     if client is None:
-        client = AsyncAnthropic() if inspect.iscoroutinefunction(fn) else Anthropic()
+        client = _get_default_client(inspect.iscoroutinefunction(fn))
     create = client.messages.create
     return create, prompt_template, messages, tool_types, call_kwargs
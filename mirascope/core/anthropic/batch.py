@@ -0,0 +1,150 @@
+"""Functions for running Anthropic calls offline through the Message Batches API.
+
+Example:
+
+```python
+from mirascope.core import anthropic
+
+
+@anthropic.call("claude-3-5-sonnet-20240620")
+def recommend_book(genre: str) -> str:
+    return f"Recommend a {genre} book"
+
+
+inputs = [{"genre": "fantasy"}, {"genre": "mystery"}]
+batch = anthropic.batch.create_batch(recommend_book, inputs)
+...  # once the batch's `processing_status` is "ended"
+responses = anthropic.batch.get_batch_results(recommend_book, inputs, batch.id)
+for response in responses:
+    print(response.content)
+```
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any, TypeVar
+
+from anthropic import Anthropic
+from anthropic.types import Message
+
+from ..base.batch_mode import (
+    BatchRequestError,
+    build_batch_requests,
+    parse_batch_results,
+)
+from ._utils._setup_call import _get_default_client
+
+_R = TypeVar("_R")
+
+
+def _get_batches(client: Anthropic) -> Any:  # noqa: ANN401
+    # Message Batches are only available under `beta` in older SDK versions.
+    if (batches := getattr(client.messages, "batches", None)) is not None:
+        return batches
+    return client.beta.messages.batches
+
+
+def write_batch_requests(
+    fn: Callable[..., Any],
+    inputs: Iterable[Mapping[str, Any]],
+    *,
+    custom_id_prefix: str = "request",
+) -> list[dict[str, Any]]:
+    """Returns the Message Batches requests for calling `fn` on each of `inputs`.
+
+    No provider calls are made.
+    """
+    return [
+        {"custom_id": request["custom_id"], "params": request["call_kwargs"]}
+        for request in build_batch_requests(
+            fn, inputs, custom_id_prefix=custom_id_prefix
+        )
+    ]
+
+
+def read_batch_results(
+    results: Iterable[Any],
+) -> dict[str, Message | BatchRequestError]:
+    """Returns the responses of the batch `results` keyed by `custom_id`.
+
+    Each result can either be an SDK result object or its JSON (e.g. a parsed line of
+    the batch's results file).
+    """
+    responses: dict[str, Message | BatchRequestError] = {}
+    for result in results:
+        if not isinstance(result, dict):
+            result = result.model_dump()
+        custom_id, result = result["custom_id"], result["result"]
+        if result["type"] == "succeeded":
+            responses[custom_id] = Message.model_validate(result["message"])
+        else:
+            responses[custom_id] = BatchRequestError(
+                custom_id, result.get("error") or result["type"]
+            )
+    return responses
+
+
+def create_batch(
+    fn: Callable[..., Any],
+    inputs: Iterable[Mapping[str, Any]],
+    *,
+    client: Anthropic | None = None,
+    custom_id_prefix: str = "request",
+) -> Any:  # noqa: ANN401
+    """Creates a message batch for calling `fn` on each of `inputs`.
+
+    Args:
+        fn: The decorated call (e.g. decorated with `anthropic.call`).
+        inputs: The keyword arguments of each call.
+        client: The client used to create the batch. If `None`, the pooled default
+            client is used.
+        custom_id_prefix: The prefix of the `custom_id` of each request.
+
+    Returns:
+        The created message batch.
+    """
+    client = client or _get_default_client(False)  # pyright: ignore [reportAssignmentType]
+    return _get_batches(client).create(  # pyright: ignore [reportArgumentType]
+        requests=write_batch_requests(fn, inputs, custom_id_prefix=custom_id_prefix)
+    )
+
+
+def get_batch_results(
+    fn: Callable[..., _R],
+    inputs: Sequence[Mapping[str, Any]],
+    batch_id: str,
+    *,
+    client: Anthropic | None = None,
+    custom_id_prefix: str = "request",
+    return_exceptions: bool = True,
+) -> list[_R | Exception]:
+    """Returns the outputs of `fn` for each of `inputs` from the ended message batch.
+
+    Args:
+        fn: The same decorated call that the batch was created with.
+        inputs: The same keyword arguments that the batch was created with.
+        batch_id: The id of the message batch.
+        client: The client used to retrieve the batch. If `None`, the pooled default
+            client is used.
+        custom_id_prefix: The prefix of the `custom_id` of each request.
+        return_exceptions: Whether to return exceptions (e.g. failed requests) in place
+            of their outputs instead of raising them.
+
+    Returns:
+        The outputs, in the same order as `inputs`.
+
+    Raises:
+        ValueError: If the batch has not ended.
+    """
+    batches = _get_batches(client or _get_default_client(False))  # pyright: ignore [reportArgumentType]
+    batch = batches.retrieve(batch_id)
+    if batch.processing_status != "ended":
+        raise ValueError(f"Batch `{batch_id}` has not ended: {batch.processing_status}")
+    return parse_batch_results(
+        fn,
+        inputs,
+        read_batch_results(batches.results(batch_id)),
+        custom_id_prefix=custom_id_prefix,
+        return_exceptions=return_exceptions,
+    )
@@ -3,6 +3,8 @@
 usage docs: learn/calls.md#handling-responses
 """
 
+from functools import cached_property
+
 from anthropic.types import (
     Message,
     MessageParam,
@@ -13,6 +15,7 @@ from anthropic.types import (
 from pydantic import SerializeAsAny, computed_field
 
 from ..base import BaseCallResponse, transform_tool_outputs
+from ..base._utils import get_tool_index
 from ._utils import calculate_cost
 from .call_params import AnthropicCallParams
 from .dynamic_config import AnthropicDynamicConfig, AsyncAnthropicDynamicConfig
@@ -97,13 +100,13 @@ class AnthropicCallResponse(
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
-    @property
+    @cached_property
     def message_param(self) -> SerializeAsAny[MessageParam]:
         """Returns the assistants's response as a message parameter."""
         return MessageParam(**self.response.model_dump(include={"content", "role"}))
 
     @computed_field
-    @property
+    @cached_property
     def tools(self) -> list[AnthropicTool] | None:
         """Returns any available tool calls as their `AnthropicTool` definition.
 
@@ -113,19 +116,16 @@ class AnthropicCallResponse(
         if not self.tool_types:
             return None
 
-        extracted_tools = []
-        for content in self.response.content:
-            if content.type != "tool_use":
-                continue
-            for tool_type in self.tool_types:
-                if content.name == tool_type._name():
-                    extracted_tools.append(tool_type.from_tool_call(content))
-                    break
-
-        return extracted_tools
+        tool_index = get_tool_index(self.tool_types)
+        return [
+            tool_type.from_tool_call(content)
+            for content in self.response.content
+            if content.type == "tool_use"
+            and (tool_type := tool_index.get(content.name))
+        ]
 
     @computed_field
-    @property
+    @cached_property
     def tool(self) -> AnthropicTool | None:
         """Returns the 0th tool for the 0th choice message.
 
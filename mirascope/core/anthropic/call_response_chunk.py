@@ -14,6 +14,7 @@ from anthropic.types import (
 )
 
 from ..base import BaseCallResponseChunk
+from ..base._utils import cached_chunk_property
 
 FinishReason = Message.__annotations__["stop_reason"]
 
@@ -45,7 +46,9 @@ class AnthropicCallResponseChunk(
     ```
     """
 
-    @property
+    __slots__ = ()
+
+    @cached_chunk_property
     def content(self) -> str:
         """Returns the string content of the 0th message."""
         return (
@@ -55,7 +58,7 @@ class AnthropicCallResponseChunk(
             else ""
         )
 
-    @property
+    @cached_chunk_property
     def finish_reasons(self) -> list[FinishReason] | None:
         """Returns the finish reason of the response."""
         if (
@@ -65,21 +68,21 @@ class AnthropicCallResponseChunk(
             return [str(self.chunk.message.stop_reason)]
         return None
 
-    @property
+    @cached_chunk_property
     def model(self) -> str | None:
         """Returns the name of the response model."""
         if isinstance(self.chunk, MessageStartEvent):
             return self.chunk.message.model
         return None
 
-    @property
+    @cached_chunk_property
     def id(self) -> str | None:
         """Returns the id of the response."""
         if isinstance(self.chunk, MessageStartEvent):
             return self.chunk.message.id
         return None
 
-    @property
+    @cached_chunk_property
     def usage(self) -> Usage | MessageDeltaUsage | None:
         """Returns the usage of the message."""
         if isinstance(self.chunk, MessageStartEvent):
@@ -88,14 +91,14 @@ class AnthropicCallResponseChunk(
             return self.chunk.usage
         return None
 
-    @property
+    @cached_chunk_property
     def input_tokens(self) -> int | None:
         """Returns the number of input tokens."""
         if (usage := self.usage) and isinstance(usage, Usage):
             return usage.input_tokens
         return None
 
-    @property
+    @cached_chunk_property
     def output_tokens(self) -> int | None:
         """Returns the number of output tokens."""
         if self.usage:
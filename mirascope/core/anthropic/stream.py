@@ -3,10 +3,14 @@
 usage docs: learn/streams.md
 """
 
+from collections.abc import Hashable
+
 from anthropic.types import (
     Message,
     MessageParam,
+    RawContentBlockDeltaEvent,
     TextBlock,
+    TextDelta,
     ToolParam,
     ToolUseBlock,
     Usage,
@@ -64,6 +68,27 @@ class AnthropicStream(
 
     _provider = "anthropic"
 
+    @classmethod
+    def _mergeable_text(cls, chunk: object) -> tuple[Hashable, str] | None:
+        """Returns the block index and text of a text or tool input delta event."""
+        if not isinstance(chunk, RawContentBlockDeltaEvent):
+            return None
+        if isinstance(delta := chunk.delta, TextDelta):
+            return (chunk.index, delta.type), delta.text
+        if delta.type == "input_json_delta":
+            return (chunk.index, delta.type), delta.partial_json
+        return None
+
+    @classmethod
+    def _merge_chunks(
+        cls, chunk: RawContentBlockDeltaEvent, text: str
+    ) -> RawContentBlockDeltaEvent:
+        """Returns a copy of the delta event `chunk` with `text` as its text."""
+        field = "text" if isinstance(chunk.delta, TextDelta) else "partial_json"
+        return chunk.model_copy(
+            update={"delta": chunk.delta.model_copy(update={field: text})}
+        )
+
     @property
     def cost(self) -> float | None:
         """Returns the cost of the call."""
@@ -144,4 +169,5 @@ class AnthropicStream(
             user_message_param=self.user_message_param,
             start_time=self.start_time,
             end_time=self.end_time,
+            timings=self.timings,
         )
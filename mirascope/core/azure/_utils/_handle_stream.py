@@ -9,6 +9,7 @@ from azure.ai.inference.models import (
     StreamingChatCompletionsUpdate,
 )
 
+from ...base._utils import StreamThrottle, TextBuffer, ToolIndex, get_tool_index
 from ..call_response_chunk import AzureCallResponseChunk
 from ..tool import AzureTool
 
@@ -17,7 +18,8 @@ def _handle_chunk(
     chunk: StreamingChatCompletionsUpdate,
     current_tool_call: ChatCompletionsToolCall,
     current_tool_type: type[AzureTool] | None,
-    tool_types: list[type[AzureTool]] | None,
+    tool_index: ToolIndex[AzureTool] | None,
+    arguments: TextBuffer,
 ) -> tuple[
     AzureTool | None,
     ChatCompletionsToolCall,
@@ -25,7 +27,7 @@ def _handle_chunk(
 ]:
     """Handles a chunk of the stream."""
     if (
-        not tool_types
+        not tool_index
         or not chunk.choices
         or not (tool_calls := chunk.choices[0].delta.tool_calls)
     ):
@@ -34,6 +36,7 @@ def _handle_chunk(
     tool_call = tool_calls[0]
     # Reset on new tool
     if tool_call.id and tool_call.function is not None:
+        current_tool_call.function.arguments = arguments.take()
         previous_tool_call = copy.deepcopy(current_tool_call)
         previous_tool_type = current_tool_type
         current_tool_call = ChatCompletionsToolCall(
@@ -43,15 +46,7 @@ def _handle_chunk(
                 name=tool_call.function.name if tool_call.function.name else "",
             ),
         )
-        current_tool_type = None
-        for tool_type in tool_types:
-            if tool_type._name() == tool_call.function.name:
-                current_tool_type = tool_type
-                break
-        if current_tool_type is None:
-            raise RuntimeError(
-                f"Unknown tool type in stream: {tool_call.function.name}"
-            )  # pragma: no cover
+        current_tool_type = tool_index[tool_call.function.name]
         if (
             previous_tool_call.id
             and previous_tool_call.function.arguments
@@ -65,7 +60,7 @@ def _handle_chunk(
 
     # Update arguments with each chunk
     if tool_call.function and tool_call.function.arguments:
-        current_tool_call.function.arguments += tool_call.function.arguments
+        arguments.append(tool_call.function.arguments)
 
     return None, current_tool_call, current_tool_type
 
@@ -74,15 +69,18 @@ def handle_stream(
     stream: Generator[StreamingChatCompletionsUpdate, None, None],
     tool_types: list[type[AzureTool]] | None,
     partial_tools: bool = False,
+    throttle: StreamThrottle | None = None,
 ) -> Generator[tuple[AzureCallResponseChunk, AzureTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
+    tool_index = get_tool_index(tool_types) if tool_types else None
     current_tool_call = ChatCompletionsToolCall(
         id="", function=FunctionCall(arguments="", name="")
     )
-    current_tool_type = None
+    current_tool_type, arguments = None, TextBuffer()
     for chunk in stream:
         if not tool_types or not chunk.choices or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
+                current_tool_call.function.arguments = arguments.take()
                 yield (
                     AzureCallResponseChunk(chunk=chunk),
                     current_tool_type.from_tool_call(current_tool_call),
@@ -94,7 +92,8 @@ def handle_stream(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_index,
+            arguments,
         )
         if tool is not None:
             yield AzureCallResponseChunk(chunk=chunk), tool
@@ -104,15 +103,18 @@ async def handle_stream_async(
     stream: AsyncGenerator[StreamingChatCompletionsUpdate, None],
     tool_types: list[type[AzureTool]] | None,
     partial_tools: bool = False,
+    throttle: StreamThrottle | None = None,
 ) -> AsyncGenerator[tuple[AzureCallResponseChunk, AzureTool | None], None]:
     """Async iterator over the stream and constructs tools as they are streamed."""
+    tool_index = get_tool_index(tool_types) if tool_types else None
     current_tool_call = ChatCompletionsToolCall(
         id="", function=FunctionCall(arguments="", name="")
     )
-    current_tool_type = None
+    current_tool_type, arguments = None, TextBuffer()
     async for chunk in stream:
         if not tool_types or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
+                current_tool_call.function.arguments = arguments.take()
                 yield (
                     AzureCallResponseChunk(chunk=chunk),
                     current_tool_type.from_tool_call(current_tool_call),
@@ -124,7 +126,8 @@ async def handle_stream_async(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_index,
+            arguments,
         )
         if tool is not None:
             yield AzureCallResponseChunk(chunk=chunk), tool
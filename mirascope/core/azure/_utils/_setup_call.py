@@ -20,6 +20,7 @@ from azure.core.credentials import AzureKeyCredential
 from ...base import BaseMessageParam, BaseTool, _utils
 from ...base._utils import AsyncCreateFn, CreateFn, get_async_create_fn, get_create_fn
 from ...base.call_params import CommonCallParams
+from ...base.client_pool import default_client_pool
 from ...base.stream_config import StreamConfig
 from .._call_kwargs import AzureCallKwargs
 from ..call_params import AzureCallParams
@@ -30,6 +31,24 @@ from ._convert_message_params import convert_message_params
 from ._get_credential import get_credential
 
 
+def _get_default_client(
+    is_async: bool,
+) -> ChatCompletionsClient | AsyncChatCompletionsClient:
+    client_type = AsyncChatCompletionsClient if is_async else ChatCompletionsClient
+
+    def create(_: object) -> ChatCompletionsClient | AsyncChatCompletionsClient:
+        endpoint = os.environ["AZURE_INFERENCE_ENDPOINT"]
+        credential = cast(AzureKeyCredential, get_credential())
+        return client_type(endpoint=endpoint, credential=credential)
+
+    return default_client_pool.get(
+        client_type,
+        is_async=is_async,
+        env=("AZURE_INFERENCE_ENDPOINT", "AZURE_INFERENCE_CREDENTIAL"),
+        create=create,
+    )
+
+
 @overload
 def setup_call(
     *,
@@ -138,14 +157,7 @@ def setup_call(
     call_kwargs |= {"model": model, "messages": messages}
 
     if client is None:
-        endpoint = os.environ["AZURE_INFERENCE_ENDPOINT"]
-        credential = cast(AzureKeyCredential, get_credential())
-
-        client = (
-            AsyncChatCompletionsClient(endpoint=endpoint, credential=credential)
-            if inspect.iscoroutinefunction(fn)
-            else ChatCompletionsClient(endpoint=endpoint, credential=credential)
-        )
+        client = _get_default_client(inspect.iscoroutinefunction(fn))
     create = (
         get_async_create_fn(
             cast(
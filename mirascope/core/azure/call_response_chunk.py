@@ -8,9 +8,9 @@ from azure.ai.inference.models import (
     CompletionsUsage,
     StreamingChatCompletionsUpdate,
 )
-from pydantic import SkipValidation
 
 from ..base import BaseCallResponseChunk
+from ..base._utils import cached_chunk_property
 
 
 class AzureCallResponseChunk(
@@ -40,9 +40,11 @@ class AzureCallResponseChunk(
     ```
     """
 
-    chunk: SkipValidation[StreamingChatCompletionsUpdate]
+    __slots__ = ()
 
-    @property
+    chunk: StreamingChatCompletionsUpdate
+
+    @cached_chunk_property
     def content(self) -> str:
         """Returns the content for the 0th choice delta."""
         delta = None
@@ -50,7 +52,7 @@ class AzureCallResponseChunk(
             delta = self.chunk.choices[0].delta
         return delta.content if delta is not None and delta.content else ""
 
-    @property
+    @cached_chunk_property
     def finish_reasons(self) -> list[CompletionsFinishReason]:
         """Returns the finish reasons of the response."""
         return [
@@ -61,27 +63,27 @@ class AzureCallResponseChunk(
             if (finish_reason := choice.finish_reason)
         ]
 
-    @property
+    @cached_chunk_property
     def model(self) -> str:
         """Returns the name of the response model."""
         return self.chunk.model
 
-    @property
+    @cached_chunk_property
     def id(self) -> str:
         """Returns the id of the response."""
         return self.chunk.id
 
-    @property
+    @cached_chunk_property
     def usage(self) -> CompletionsUsage:
         """Returns the usage of the chat completion."""
         return self.chunk.usage
 
-    @property
+    @cached_chunk_property
     def input_tokens(self) -> int:
         """Returns the number of input tokens."""
         return self.usage.prompt_tokens
 
-    @property
+    @cached_chunk_property
     def output_tokens(self) -> int:
         """Returns the number of output tokens."""
         return self.usage.completion_tokens
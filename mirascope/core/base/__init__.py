@@ -2,11 +2,26 @@
 
 from . import _partial, _utils
 from ._call_factory import call_factory
-from ._utils import BaseType
+from ._utils import BaseType, CompiledTemplate, clear_tool_type_cache
+from .batch import abatch, as_completed, batch
+from .batch_mode import (
+    BatchRequest,
+    BatchRequestError,
+    build_batch_requests,
+    parse_batch_results,
+)
+from .cache import (
+    BaseCache,
+    DirectoryCache,
+    InMemoryCache,
+    SQLiteCache,
+    use_cache,
+)
 from .call_kwargs import BaseCallKwargs
 from .call_params import BaseCallParams, CommonCallParams
 from .call_response import BaseCallResponse, transform_tool_outputs
 from .call_response_chunk import BaseCallResponseChunk
+from .client_pool import ClientPool, ClientPoolLimits, default_client_pool
 from .dynamic_config import BaseDynamicConfig
 from .from_call_args import FromCallArgs
 from .merge_decorators import merge_decorators
@@ -22,15 +37,21 @@ from .messages import Messages
 from .metadata import Metadata
 from .prompt import BasePrompt, metadata, prompt_template
 from .response_model_config_dict import ResponseModelConfigDict
+from .single_flight import single_flight
 from .stream import BaseStream
+from .stream_timings import StreamTimings
 from .structured_stream import BaseStructuredStream
 from .tool import BaseTool, GenerateJsonSchemaNoTitles, ToolConfig
+from .tool_loop import ToolLoop, ToolLoopResult, ToolLoopStep, ToolLoopStopReason
 from .toolkit import BaseToolKit, toolkit_tool
 from .types import AudioSegment
 
 __all__ = [
+    "abatch",
+    "as_completed",
     "AudioPart",
     "AudioSegment",
+    "BaseCache",
     "BaseCallKwargs",
     "BaseCallParams",
     "BaseCallResponse",
@@ -43,22 +64,42 @@ __all__ = [
     "BaseTool",
     "BaseToolKit",
     "BaseType",
+    "batch",
+    "BatchRequest",
+    "BatchRequestError",
+    "build_batch_requests",
     "CacheControlPart",
     "call_factory",
+    "ClientPool",
+    "ClientPoolLimits",
+    "clear_tool_type_cache",
     "CommonCallParams",
+    "CompiledTemplate",
+    "default_client_pool",
+    "DirectoryCache",
     "FromCallArgs",
     "GenerateJsonSchemaNoTitles",
     "ImagePart",
+    "InMemoryCache",
     "merge_decorators",
     "metadata",
+    "parse_batch_results",
     "Messages",
     "Metadata",
     "prompt_template",
     "ResponseModelConfigDict",
+    "single_flight",
+    "SQLiteCache",
+    "StreamTimings",
     "TextPart",
     "ToolConfig",
+    "ToolLoop",
+    "ToolLoopResult",
+    "ToolLoopStep",
+    "ToolLoopStopReason",
     "toolkit_tool",
     "transform_tool_outputs",
+    "use_cache",
     "_partial",
     "_utils",
 ]
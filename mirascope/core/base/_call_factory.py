@@ -23,6 +23,7 @@ from ._utils._protocols import (
     CallDecorator,
     SyncLLMFunctionDecorator,
 )
+from .batch import add_batch_methods
 from .call_params import BaseCallParams
 from .call_response import BaseCallResponse
 from .call_response_chunk import BaseCallResponseChunk
@@ -177,7 +178,7 @@ def call_factory(  # noqa: ANN202
 
         if response_model:
             if stream:
-                return partial(
+                decorator = partial(
                     structured_stream_factory(
                         TCallResponse=TCallResponse,
                         TCallResponseChunk=TCallResponseChunk,
@@ -191,9 +192,10 @@ def call_factory(  # noqa: ANN202
                     json_mode=json_mode,
                     client=client,
                     call_params=call_params,
+                    stream_config=stream if isinstance(stream, dict) else None,
                 )  # pyright: ignore [reportReturnType, reportCallIssue]
             else:
-                return partial(
+                decorator = partial(
                     extract_factory(
                         TCallResponse=TCallResponse,
                         TToolType=TToolType,
@@ -207,9 +209,8 @@ def call_factory(  # noqa: ANN202
                     client=client,
                     call_params=call_params,
                 )  # pyright: ignore [reportCallIssue]
-
-        if stream:
-            return partial(
+        elif stream:
+            decorator = partial(
                 stream_factory(
                     TCallResponse=TCallResponse,
                     TStream=TStream,
@@ -223,15 +224,23 @@ def call_factory(  # noqa: ANN202
                 client=client,
                 call_params=call_params,
                 partial_tools=isinstance(stream, dict) and stream.get("partial_tools"),
+                stream_config=stream if isinstance(stream, dict) else None,
             )  # pyright: ignore [reportReturnType, reportCallIssue]
-        return partial(
-            create_factory(TCallResponse=TCallResponse, setup_call=setup_call),
-            model=model,
-            tools=tools,
-            output_parser=output_parser,
-            json_mode=json_mode,
-            client=client,
-            call_params=call_params,
-        )  # pyright: ignore [reportReturnType, reportCallIssue]
+        else:
+            decorator = partial(
+                create_factory(TCallResponse=TCallResponse, setup_call=setup_call),
+                model=model,
+                tools=tools,
+                output_parser=output_parser,
+                json_mode=json_mode,
+                client=client,
+                call_params=call_params,
+            )  # pyright: ignore [reportReturnType, reportCallIssue]
+
+        def inner(fn: Callable) -> Callable:
+            # Streams are consumed one at a time, so only responses can be batched.
+            return decorator(fn) if stream else add_batch_methods(decorator(fn))
+
+        return inner  # pyright: ignore [reportReturnType]
 
     return base_call  # pyright: ignore [reportReturnType]
@@ -8,9 +8,11 @@ from typing import Any, ParamSpec, TypeVar, cast, overload
 from ._utils import (
     SameSyncAndAsyncClientSetupCall,
     SetupCall,
+    call_create,
+    call_create_async,
     fn_is_async,
+    get_call_plan,
     get_dynamic_configuration,
-    get_fn_args,
     get_metadata,
     get_possible_user_message_param,
     is_prompt_template,
@@ -154,13 +156,14 @@ def create_factory(  # noqa: ANN202
             )
         fn._model = model  # pyright: ignore [reportFunctionMemberAccess]
         fn.__mirascope_call__ = True  # pyright: ignore [reportFunctionMemberAccess]
+        call_plan = get_call_plan(fn)
         if fn_is_async(fn):
 
             @wraps(fn)
             async def inner_async(
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> TCallResponse | _ParsedOutputT:
-                fn_args = get_fn_args(fn, args, kwargs)
+                fn_args = call_plan.bind(args, kwargs)
                 dynamic_config = await get_dynamic_configuration(fn, args, kwargs)
                 nonlocal client
                 if dynamic_config is not None:
@@ -178,7 +181,7 @@ def create_factory(  # noqa: ANN202
                     stream=False,
                 )
                 start_time = datetime.datetime.now().timestamp() * 1000
-                response = await create(stream=False, **call_kwargs)
+                response = await call_create_async(TCallResponse, create, call_kwargs)
                 end_time = datetime.datetime.now().timestamp() * 1000
                 output = TCallResponse(
                     metadata=get_metadata(fn, dynamic_config),
@@ -204,7 +207,7 @@ def create_factory(  # noqa: ANN202
             def inner(
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> TCallResponse | _ParsedOutputT:
-                fn_args = get_fn_args(fn, args, kwargs)
+                fn_args = call_plan.bind(args, kwargs)
                 dynamic_config = get_dynamic_configuration(fn, args, kwargs)
                 nonlocal client
                 if dynamic_config is not None:
@@ -222,7 +225,7 @@ def create_factory(  # noqa: ANN202
                     stream=False,
                 )
                 start_time = datetime.datetime.now().timestamp() * 1000
-                response = create(stream=False, **call_kwargs)
+                response = call_create(TCallResponse, create, call_kwargs)
                 end_time = datetime.datetime.now().timestamp() * 1000
                 output = TCallResponse(
                     metadata=get_metadata(fn, dynamic_config),
@@ -111,14 +111,17 @@ def extract_factory(  # noqa: ANN202
         fn._model = model  # pyright: ignore [reportFunctionMemberAccess]
         fn.__mirascope_call__ = True  # pyright: ignore [reportFunctionMemberAccess]
         tool = setup_extract_tool(response_model, TToolType)
-        create_decorator_kwargs = {
-            "model": model,
-            "tools": [tool],
-            "output_parser": None,
-            "json_mode": json_mode,
-            "client": client,
-            "call_params": call_params,
-        }
+        # Decorating once here (rather than on every call) lets the underlying call
+        # reuse its compiled `CallPlan` across invocations.
+        create_fn = create_decorator(
+            fn=fn,
+            model=model,
+            tools=[tool],
+            output_parser=None,
+            json_mode=json_mode,
+            client=client,
+            call_params=call_params,
+        )
 
         if fn_is_async(fn):
 
@@ -129,9 +132,7 @@ def extract_factory(  # noqa: ANN202
                 fields_from_call_args = get_fields_from_call_args(
                     response_model, fn, args, kwargs
                 )
-                call_response = await create_decorator(
-                    fn=fn, **create_decorator_kwargs
-                )(*args, **kwargs)
+                call_response = await create_fn(*args, **kwargs)
                 try:
                     json_output = get_json_output(call_response, json_mode)
                     output = extract_tool_return(
@@ -152,9 +153,7 @@ def extract_factory(  # noqa: ANN202
                 fields_from_call_args = get_fields_from_call_args(
                     response_model, fn, args, kwargs
                 )
-                call_response = create_decorator(fn=fn, **create_decorator_kwargs)(
-                    *args, **kwargs
-                )
+                call_response = create_fn(*args, **kwargs)
                 try:
                     json_output = get_json_output(call_response, json_mode)
                     output = extract_tool_return(
@@ -8,7 +8,9 @@ serves as an acknowledgment of the original author's contribution to this projec
 --------------------------------------------------------------------------------
 """
 
+from collections import OrderedDict
 from copy import deepcopy
+from threading import RLock
 from typing import TypeVar, get_args, get_origin
 
 from pydantic import BaseModel, create_model
@@ -16,6 +18,15 @@ from pydantic.fields import FieldInfo
 
 Model = TypeVar("Model", bound=BaseModel)
 
+# Partial models are requested for every streamed chunk, so we cache them per
+# `(wrapped_class, preserve_fields)` in a bounded LRU. The lock is re-entrant since
+# building a partial model also builds the partial models of nested models.
+_PARTIAL_CACHE_MAX_SIZE = 512
+_partial_cache: OrderedDict[tuple[type[BaseModel], frozenset[str]], type[BaseModel]] = (
+    OrderedDict()
+)
+_partial_cache_lock = RLock()
+
 
 def _process_annotation(annotation: type) -> type:
     """Recursively process type annotations to make them optional."""
@@ -61,10 +72,25 @@ def partial(
 
     user = User()  # All fields optional
     ```
-    """
-    if preserve_fields is None:
-        preserve_fields = set()
 
+    The generated class is cached, so repeated calls for the same class (and
+    `preserve_fields`) return the same class.
+    """
+    key = (wrapped_class, frozenset(preserve_fields or ()))
+    with _partial_cache_lock:
+        if (partial_class := _partial_cache.get(key)) is None:
+            partial_class = _create_partial(wrapped_class, key[1])
+            _partial_cache[key] = partial_class
+            if len(_partial_cache) > _PARTIAL_CACHE_MAX_SIZE:
+                _partial_cache.popitem(last=False)
+        else:
+            _partial_cache.move_to_end(key)
+    return partial_class  # pyright: ignore [reportReturnType]
+
+
+def _create_partial(
+    wrapped_class: type[Model], preserve_fields: frozenset[str]
+) -> type[Model]:
     def _make_field_optional(
         field: FieldInfo,
     ) -> tuple[object, FieldInfo]:
@@ -1,6 +1,23 @@
 """Internal Utilities."""
 
 from ._base_type import BaseType, is_base_type
+from ._cached_chunk_property import cached_chunk_property
+from ._call_tools import (
+    call_tools,
+    call_tools_async,
+    collect_tool_outputs,
+    collect_tool_outputs_async,
+    schedule_tool_async,
+    submit_tool,
+)
+from ._close_stream import close_stream, close_stream_async
+from ._coalesce_chunks import (
+    ChunkCoalescer,
+    coalesce_chunks,
+    coalesce_chunks_async,
+    get_chunk_coalescer,
+)
+from ._compile_template import CompiledTemplate, compile_template
 from ._convert_base_model_to_base_tool import convert_base_model_to_base_tool
 from ._convert_base_type_to_base_tool import convert_base_type_to_base_tool
 from ._convert_function_to_base_tool import convert_function_to_base_tool
@@ -9,17 +26,28 @@ from ._extract_tool_return import extract_tool_return
 from ._fn_is_async import fn_is_async
 from ._format_template import format_template
 from ._get_audio_type import get_audio_type
+from ._get_call_plan import CallPlan, get_call_plan
 from ._get_create_fn_or_async_create_fn import get_async_create_fn, get_create_fn
 from ._get_document_type import get_document_type
 from ._get_dynamic_configuration import get_dynamic_configuration
 from ._get_fn_args import get_fn_args
 from ._get_image_type import get_image_type
+from ._get_iterable_element_type import get_iterable_element_type
 from ._get_metadata import get_metadata
 from ._get_possible_user_message_param import get_possible_user_message_param
 from ._get_prompt_template import get_prompt_template
 from ._get_template_values import get_template_values
 from ._get_template_variables import get_template_variables
 from ._get_unsupported_tool_config_keys import get_unsupported_tool_config_keys
+from ._incremental_json import IncrementalJsonParser
+from ._intercept_create import (
+    CreateInterceptor,
+    call_create,
+    call_create_async,
+    intercept_create,
+    prepare_create_stream,
+    prepare_create_stream_async,
+)
 from ._is_prompt_template import is_prompt_template
 from ._json_mode_content import json_mode_content
 from ._messages_decorator import MessagesDecorator, messages_decorator
@@ -39,24 +67,51 @@ from ._protocols import (
 )
 from ._setup_call import setup_call
 from ._setup_extract_tool import setup_extract_tool
+from ._single_flight import single_flight_context
+from ._stream_tee import SlowConsumerPolicy, StreamTee, TeeConsumer
+from ._stream_throttle import StreamThrottle
+from ._text_buffer import TextBuffer
+from ._tool_index import ToolIndex, get_tool_index
+from ._tool_type_cache import clear_tool_type_cache
 
 __all__ = [
     "AsyncCreateFn",
     "SameSyncAndAsyncClientSetupCall",
     "BaseType",
+    "cached_chunk_property",
     "CalculateCost",
+    "call_create",
+    "call_create_async",
+    "call_tools",
+    "call_tools_async",
+    "collect_tool_outputs",
+    "collect_tool_outputs_async",
+    "close_stream",
+    "close_stream_async",
+    "CallPlan",
+    "ChunkCoalescer",
+    "coalesce_chunks",
+    "coalesce_chunks_async",
+    "CompiledTemplate",
+    "compile_template",
+    "clear_tool_type_cache",
     "convert_base_model_to_base_tool",
     "convert_base_type_to_base_tool",
     "convert_function_to_base_tool",
     "CreateFn",
+    "CreateInterceptor",
     "DEFAULT_TOOL_DOCSTRING",
     "extract_tool_return",
     "fn_is_async",
     "format_template",
     "GetJsonOutput",
+    "IncrementalJsonParser",
     "get_audio_type",
     "get_async_create_fn",
+    "get_call_plan",
+    "get_chunk_coalescer",
     "get_create_fn",
+    "get_iterable_element_type",
     "get_document_type",
     "get_dynamic_configuration",
     "get_fn_args",
@@ -66,9 +121,11 @@ __all__ = [
     "get_prompt_template",
     "get_template_values",
     "get_template_variables",
+    "get_tool_index",
     "get_unsupported_tool_config_keys",
     "HandleStream",
     "HandleStreamAsync",
+    "intercept_create",
     "is_base_type",
     "is_prompt_template",
     "json_mode_content",
@@ -77,7 +134,18 @@ __all__ = [
     "messages_decorator",
     "parse_content_template",
     "parse_prompt_messages",
+    "prepare_create_stream",
+    "prepare_create_stream_async",
+    "schedule_tool_async",
     "SetupCall",
     "setup_call",
     "setup_extract_tool",
+    "single_flight_context",
+    "SlowConsumerPolicy",
+    "StreamTee",
+    "StreamThrottle",
+    "submit_tool",
+    "TeeConsumer",
+    "TextBuffer",
+    "ToolIndex",
 ]
@@ -0,0 +1,57 @@
+"""The `cached_chunk_property` decorator for caching derived fields of stream chunks."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar, overload
+
+_R = TypeVar("_R")
+
+
+class cached_chunk_property(Generic[_R]):  # noqa: N801
+    """A property whose value is computed on first access and then cached.
+
+    Unlike `functools.cached_property`, this works with classes that define `__slots__`
+    (and so have no instance `__dict__`). Values are cached in the instance's `_cache`
+    slot, which must be `None` until the first cached property is accessed.
+
+    Example:
+
+    ```python
+    class Chunk:
+        __slots__ = ("text", "_cache")
+
+        def __init__(self, text: str) -> None:
+            self.text, self._cache = text, None
+
+        @cached_chunk_property
+        def words(self) -> list[str]:
+            return self.text.split()
+    ```
+    """
+
+    def __init__(self, fget: Callable[[Any], _R]) -> None:
+        """Initializes an instance of `cached_chunk_property` for the getter `fget`."""
+        self.fget = fget
+        self.name = fget.__name__
+        self.__doc__ = fget.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> Any: ...  # noqa: ANN401
+
+    @overload
+    def __get__(self, instance: object, owner: type | None = None) -> _R: ...
+
+    def __get__(self, instance: object | None, owner: type | None = None) -> Any:  # noqa: ANN401
+        if instance is None:
+            return self
+        cache: dict[str, Any] | None = instance._cache  # pyright: ignore [reportAttributeAccessIssue]
+        if cache is None:
+            cache = instance._cache = {}  # pyright: ignore [reportAttributeAccessIssue]
+        elif self.name in cache:
+            return cache[self.name]
+        value = cache[self.name] = self.fget(instance)
+        return value
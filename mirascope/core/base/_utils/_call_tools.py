@@ -0,0 +1,166 @@
+"""Utilities for calling multiple tools concurrently."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from collections.abc import Sequence
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from ..tool import BaseTool
+
+_BaseToolT = TypeVar("_BaseToolT", bound="BaseTool")
+
+
+def _call_tool(tool: BaseTool) -> Any:  # noqa: ANN401
+    """Calls the `tool`, running it to completion if its `call` is async."""
+    output = tool.call()
+    if inspect.isawaitable(output):
+        return asyncio.run(_await(output))
+    return output
+
+
+async def _await(awaitable: Any) -> Any:  # noqa: ANN401
+    return await awaitable
+
+
+def _timeout_error(tool: BaseTool, timeout: float | None) -> TimeoutError:
+    return TimeoutError(f"Tool `{tool._name()}` timed out after {timeout} seconds.")
+
+
+def submit_tool(tool: BaseTool, executor: Executor) -> Future:
+    """Starts calling the `tool` on the `executor`, returning the future of its output."""
+    return executor.submit(_call_tool, tool)
+
+
+def schedule_tool_async(
+    tool: BaseTool, executor: Executor | None = None
+) -> asyncio.Future:
+    """Starts calling the `tool` on the running event loop.
+
+    Async tools are scheduled as tasks and sync tools are run in the `executor` (the
+    loop's default executor if `None`).
+    """
+    if inspect.iscoroutinefunction(tool.call):
+        return asyncio.ensure_future(tool.call())
+    return asyncio.get_running_loop().run_in_executor(executor, _call_tool, tool)
+
+
+def collect_tool_outputs(
+    tools: Sequence[_BaseToolT],
+    futures: Sequence[Future],
+    timeout: float | None = None,
+) -> list[tuple[_BaseToolT, Any]]:
+    """Waits for the `futures` of the `tools`, returning each tool with its output.
+
+    Raises:
+        TimeoutError: If a tool doesn't finish within `timeout` seconds. The tools that
+            haven't started yet are cancelled.
+    """
+    wait(futures, timeout=timeout)
+    for tool, future in zip(tools, futures, strict=True):
+        if not future.done():
+            for pending in futures:
+                pending.cancel()
+            raise _timeout_error(tool, timeout)
+    return [
+        (tool, future.result()) for tool, future in zip(tools, futures, strict=True)
+    ]
+
+
+async def collect_tool_outputs_async(
+    tools: Sequence[_BaseToolT],
+    futures: Sequence[asyncio.Future | Future],
+    timeout: float | None = None,
+) -> list[tuple[_BaseToolT, Any]]:
+    """Awaits the `futures` of the `tools`, returning each tool with its output.
+
+    Raises:
+        TimeoutError: If a tool doesn't finish within `timeout` seconds. The remaining
+            tools are cancelled (sync tools that are already running can't be).
+    """
+
+    async def collect(
+        tool: _BaseToolT, future: asyncio.Future
+    ) -> tuple[_BaseToolT, Any]:
+        try:
+            return tool, await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise _timeout_error(tool, timeout) from None
+
+    awaitables = [
+        asyncio.wrap_future(future) if isinstance(future, Future) else future
+        for future in futures
+    ]
+    tasks = [
+        asyncio.ensure_future(collect(tool, awaitable))
+        for tool, awaitable in zip(tools, awaitables, strict=True)
+    ]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in [*tasks, *awaitables]:
+            task.cancel()
+
+
+def call_tools(
+    tools: Sequence[_BaseToolT],
+    *,
+    timeout: float | None = None,
+    executor: Executor | None = None,
+) -> list[tuple[_BaseToolT, Any]]:
+    """Calls the `tools` concurrently, returning each tool with its output.
+
+    Tools are submitted to the `executor` (a thread pool sized to the tools by
+    default), and async tools are run to completion on their worker. The result keeps
+    the order of `tools`, so it can be passed directly to `tool_message_params`.
+
+    Args:
+        tools: The tools to call.
+        timeout: The maximum number of seconds each tool may take, measured from when
+            the tools are submitted.
+        executor: The executor (e.g. a `ThreadPoolExecutor` or `ProcessPoolExecutor`)
+            on which the tools are called. Process pools require picklable tools.
+
+    Raises:
+        TimeoutError: If a tool doesn't finish within `timeout` seconds. Tools that are
+            already running can't be interrupted and are left to finish on their own.
+    """
+    if not tools:
+        return []
+    if len(tools) == 1 and timeout is None and executor is None:
+        return [(tools[0], _call_tool(tools[0]))]
+    pool = executor or ThreadPoolExecutor(max_workers=len(tools))
+    try:
+        futures = [submit_tool(tool, pool) for tool in tools]
+        return collect_tool_outputs(tools, futures, timeout)
+    finally:
+        if executor is None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def call_tools_async(
+    tools: Sequence[_BaseToolT],
+    *,
+    timeout: float | None = None,
+    executor: Executor | None = None,
+) -> list[tuple[_BaseToolT, Any]]:
+    """Calls the `tools` concurrently, returning each tool with its output.
+
+    Async tools are awaited together on the running event loop, and sync tools are run
+    in the `executor` (the loop's default executor if `None`). The result keeps the
+    order of `tools`, so it can be passed directly to `tool_message_params`.
+
+    Args:
+        tools: The tools to call.
+        timeout: The maximum number of seconds each tool may take.
+        executor: The executor on which sync tools are called.
+
+    Raises:
+        TimeoutError: If a tool doesn't finish within `timeout` seconds. The remaining
+            async tools are cancelled (sync tools that are already running can't be).
+    """
+    futures = [schedule_tool_async(tool, executor) for tool in tools]
+    return await collect_tool_outputs_async(tools, futures, timeout)
@@ -0,0 +1,24 @@
+"""Utilities for closing the (possibly partially consumed) layers of a stream."""
+
+import inspect
+
+
+def close_stream(stream: object) -> None:
+    """Closes `stream` (e.g. a generator or provider SDK stream) if it can be closed.
+
+    Breaking out of a `for` loop doesn't close the iterator it was looping over, so each
+    layer of a stream closes the layer below it to release the provider's connection.
+    """
+    if (close := getattr(stream, "close", None)) is not None:
+        close()
+
+
+async def close_stream_async(stream: object) -> None:
+    """Closes the async `stream` with `aclose()`, or `close()` if it has no `aclose()`.
+
+    Provider SDK streams (e.g. OpenAI's `AsyncStream`) often implement an async `close()`
+    instead of `aclose()`, so either is awaited if it returns an awaitable.
+    """
+    close = getattr(stream, "aclose", None) or getattr(stream, "close", None)
+    if close is not None and inspect.isawaitable(result := close()):
+        await result
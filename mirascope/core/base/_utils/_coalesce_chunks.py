@@ -0,0 +1,183 @@
+"""Utilities for coalescing the raw chunks of a provider stream into batches.
+
+Every raw chunk of a stream is wrapped into a provider call response chunk, run through
+`_update_properties`, any middleware, and user code. For providers that stream many
+tiny text deltas, merging adjacent text chunks into a single raw chunk first means all
+of that per-chunk work only runs once per batch.
+
+Each provider stream class decides which raw chunks can be merged through its
+`_mergeable_text` and `_merge_chunks` class methods, which are overridden together.
+Streams of providers that don't override them are never coalesced.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Hashable,
+    Iterable,
+    Iterator,
+)
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from ..stream_config import StreamConfig
+
+if TYPE_CHECKING:
+    from ..stream import BaseStream
+
+_T = TypeVar("_T")
+
+
+class ChunkCoalescer(Generic[_T]):
+    """Merges adjacent mergeable raw chunks until a batch limit is reached.
+
+    A batch is flushed once it contains `max_chunks` chunks, `max_bytes` of text, or
+    when a chunk arrives more than `max_ms` milliseconds after the batch started (there
+    are no timers, so a batch is never flushed between chunks). Chunks that can't be
+    merged flush the current batch and are passed through unchanged.
+    """
+
+    __slots__ = (
+        "mergeable_text",
+        "merge_chunks",
+        "max_chunks",
+        "max_bytes",
+        "max_seconds",
+        "_first",
+        "_key",
+        "_texts",
+        "_size",
+        "_started",
+    )
+
+    def __init__(
+        self,
+        mergeable_text: Callable[[_T], tuple[Hashable, str] | None],
+        merge_chunks: Callable[[_T, str], _T],
+        *,
+        max_chunks: int | None = None,
+        max_bytes: int | None = None,
+        max_ms: float | None = None,
+    ) -> None:
+        """Initializes an instance of `ChunkCoalescer`.
+
+        Args:
+            mergeable_text: Returns the merge key and text of a raw chunk, or `None` if
+                the chunk can't be merged. Only chunks with the same key are merged.
+            merge_chunks: Returns a copy of the first raw chunk of a batch with its text
+                replaced by the text of the whole batch.
+            max_chunks: The maximum number of raw chunks in a batch.
+            max_bytes: The maximum length of the text of a batch.
+            max_ms: The maximum age of a batch in milliseconds.
+        """
+        self.mergeable_text = mergeable_text
+        self.merge_chunks = merge_chunks
+        self.max_chunks = max_chunks or None
+        self.max_bytes = max_bytes or None
+        self.max_seconds = max_ms / 1000 if max_ms else None
+        self._first: _T | None = None
+        self._key: Hashable = None
+        self._texts: list[str] = []
+        self._size = 0
+        self._started = 0.0
+
+    def push(self, chunk: _T) -> list[_T]:
+        """Adds the next raw `chunk`, returning the chunks that are ready to emit."""
+        if (mergeable := self.mergeable_text(chunk)) is None:
+            return [*self.flush(), chunk]
+        key, text = mergeable
+        ready = self.flush() if self._texts and key != self._key else []
+        if not self._texts:
+            self._first, self._key, self._started = chunk, key, time.monotonic()
+        self._texts.append(text)
+        self._size += len(text)
+        if (
+            (self.max_chunks and len(self._texts) >= self.max_chunks)
+            or (self.max_bytes and self._size >= self.max_bytes)
+            or (
+                self.max_seconds
+                and time.monotonic() - self._started >= self.max_seconds
+            )
+        ):
+            ready.extend(self.flush())
+        return ready
+
+    def flush(self) -> list[_T]:
+        """Returns the current batch as a single raw chunk (if any) and clears it."""
+        if not self._texts:
+            return []
+        first = self._first
+        assert first is not None
+        chunk = (
+            first
+            if len(self._texts) == 1
+            else self.merge_chunks(first, "".join(self._texts))
+        )
+        self._first, self._key, self._texts, self._size = None, None, [], 0
+        return [chunk]
+
+
+def _overrides(stream_type: type, name: str) -> bool:
+    """Returns whether `stream_type` overrides the `BaseStream` class method `name`."""
+    return sum(name in vars(cls) for cls in stream_type.__mro__) > 1
+
+
+def get_chunk_coalescer(
+    config: StreamConfig | None, stream_type: type[BaseStream]
+) -> ChunkCoalescer | None:
+    """Returns a coalescer for the `coalesce_*` options of `config`, if any are set.
+
+    The chunks are merged by the `_mergeable_text` and `_merge_chunks` class methods of
+    `stream_type`, the provider's `BaseStream` subclass. If it overrides neither, its
+    chunks can't be merged and no coalescer is returned.
+
+    Raises:
+        TypeError: If `stream_type` only overrides one of the two class methods.
+    """
+    if not config or not (
+        config.get("coalesce_chunks")
+        or config.get("coalesce_bytes")
+        or config.get("coalesce_ms")
+    ):
+        return None
+    mergeable, merge = (
+        _overrides(stream_type, "_mergeable_text"),
+        _overrides(stream_type, "_merge_chunks"),
+    )
+    if mergeable != merge:
+        missing = "_merge_chunks" if mergeable else "_mergeable_text"
+        raise TypeError(
+            f"{stream_type.__name__} must override `{missing}` to coalesce chunks."
+        )
+    if not mergeable:
+        return None
+    return ChunkCoalescer(
+        stream_type._mergeable_text,
+        stream_type._merge_chunks,
+        max_chunks=config.get("coalesce_chunks"),
+        max_bytes=config.get("coalesce_bytes"),
+        max_ms=config.get("coalesce_ms"),
+    )
+
+
+def coalesce_chunks(
+    chunks: Iterable[_T], coalescer: ChunkCoalescer[_T]
+) -> Iterator[_T]:
+    """Returns `chunks` with adjacent mergeable chunks merged by `coalescer`."""
+    for chunk in chunks:
+        yield from coalescer.push(chunk)
+    yield from coalescer.flush()
+
+
+async def coalesce_chunks_async(
+    chunks: AsyncIterable[_T], coalescer: ChunkCoalescer[_T]
+) -> AsyncIterator[_T]:
+    """Returns async `chunks` with adjacent mergeable chunks merged by `coalescer`."""
+    async for chunk in chunks:
+        for ready in coalescer.push(chunk):
+            yield ready
+    for ready in coalescer.flush():
+        yield ready
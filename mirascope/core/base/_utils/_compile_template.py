@@ -0,0 +1,158 @@
+"""The `CompiledTemplate` class and `compile_template` function for prompt templates."""
+
+import re
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any, NamedTuple, TypeVar
+
+from ..call_params import BaseCallParams
+from ..dynamic_config import BaseDynamicConfig
+from ..message_param import BaseMessageParam
+from ._format_template import FormatTemplate, compile_format_template
+from ._get_template_variables import get_template_variables
+from ._parse_content_template import (
+    compile_content_template,
+    render_content_template,
+)
+
+_MessageParamT = TypeVar("_MessageParamT", bound=Any)
+_CallParamsT = TypeVar("_CallParamsT", bound=BaseCallParams)
+_ClientT = TypeVar("_ClientT")
+
+DEFAULT_ROLES = ("system", "user", "assistant")
+
+
+class _Section(NamedTuple):
+    role: str
+    content_template: str
+    parts: tuple | None
+    variables: list[str] | None
+
+
+def _split_role_sections(template: str, roles: tuple[str, ...]) -> list[_Section]:
+    re_roles = "|".join([role.upper() for role in roles] + ["MESSAGES"])
+    sections = []
+    for match in re.finditer(rf"({re_roles}):((.|\n)+?)(?=({re_roles}):|\Z)", template):
+        role, content_template = match.group(1).lower(), match.group(2).strip()
+        if role == "messages":
+            variables = get_template_variables(content_template, False)
+            sections.append(_Section(role, content_template, None, variables))
+        else:
+            parts = compile_content_template(content_template)
+            sections.append(_Section(role, content_template, parts, None))
+    return sections
+
+
+class CompiledTemplate:
+    """A prompt template that is parsed once and then rendered many times.
+
+    Compiling a template splits it into its role sections, splits each section into its
+    text and special (image, audio, document, cache control, etc.) parts, and extracts
+    the variables and format specs of the text parts. Rendering then only fills in the
+    values, which is what makes rendering the same template in bulk cheap.
+
+    Example:
+
+    ```python
+    from mirascope.core.base._utils import compile_template
+
+    compiled_template = compile_template("Recommend a {genre} book")
+    for genre in ["fantasy", "mystery"]:
+        print(compiled_template.message_params({"genre": genre}))
+    # > [BaseMessageParam(role='user', content='Recommend a fantasy book')]
+    # > [BaseMessageParam(role='user', content='Recommend a mystery book')]
+    ```
+
+    Attributes:
+        template: The original prompt template.
+        roles: The roles whose keywords (e.g. `USER:`) split the template into messages.
+    """
+
+    template: str
+    roles: tuple[str, ...]
+
+    def __init__(self, template: str, roles: Sequence[str] = DEFAULT_ROLES) -> None:
+        """Initializes an instance of `CompiledTemplate` by parsing `template`."""
+        self.template = template
+        self.roles = tuple(roles)
+        self._sections = _split_role_sections(template, self.roles)
+        self._str_template: FormatTemplate | None = None
+
+    def message_params(
+        self,
+        attrs: dict[str, Any],
+        dynamic_config: BaseDynamicConfig[
+            _MessageParamT, _CallParamsT, _ClientT
+        ] = None,
+    ) -> list[BaseMessageParam]:
+        """Returns the messages of the template rendered with the provided `attrs`.
+
+        Raises:
+            ValueError: if `MESSAGES` keyword is used with a non-list attribute.
+        """
+        if dynamic_config is not None:
+            computed_fields = dynamic_config.get("computed_fields", None)
+            if computed_fields:
+                attrs |= computed_fields
+        messages = []
+        for section in self._sections:
+            if section.variables is not None:
+                variable = section.variables[0]
+                if variable.startswith("self"):
+                    if "self" not in attrs:
+                        raise ValueError(
+                            "MESSAGES keyword used with `self.` but `self` was not "
+                            "found."
+                        )
+                    attr = getattr(attrs["self"], variable[5:])
+                else:
+                    attr = attrs[variable]
+                if attr is None or not isinstance(attr, list):
+                    raise ValueError(
+                        f"MESSAGES keyword used with attribute `{variable}`"
+                        ", which is not a `list` of messages."
+                    )
+                messages += attr
+            elif section.content_template:
+                content = render_content_template(
+                    section.role, section.parts or (), attrs
+                )
+                if content:
+                    messages.append(content)
+        if len(messages) == 0 and self.template:
+            content = render_content_template(
+                "user", compile_content_template(self.template), attrs
+            )
+            if content:
+                messages.append(content)
+        return messages
+
+    def format(self, attrs: dict[str, Any]) -> str:
+        """Returns the template formatted as a single string with the provided `attrs`.
+
+        Special format specs (e.g. `{image:image}`) are formatted as plain variables.
+        """
+        if self._str_template is None:
+            self._str_template = compile_format_template(
+                self.template.replace(":images}", "}")
+                .replace(":image}", "}")
+                .replace(":audios}", "}")
+                .replace(":audio}", "}")
+                .replace(":documents}", "}")
+                .replace(":document}", "}")
+                .replace(":texts}", "}")
+                .replace(":text", "")
+            )
+        return self._str_template.format(attrs)
+
+
+@lru_cache(maxsize=1024)
+def _compile_template(template: str, roles: tuple[str, ...]) -> CompiledTemplate:
+    return CompiledTemplate(template, roles)
+
+
+def compile_template(
+    template: str, roles: Sequence[str] = DEFAULT_ROLES
+) -> CompiledTemplate:
+    """Returns the (cached) `CompiledTemplate` for the given `template` and `roles`."""
+    return _compile_template(template, tuple(roles))
@@ -8,6 +8,7 @@ from pydantic import BaseModel, create_model
 
 from ..from_call_args import is_from_call_args
 from ._default_tool_docstring import DEFAULT_TOOL_DOCSTRING
+from ._tool_type_cache import get_cached_tool_type, set_cached_tool_type
 
 BaseToolT = TypeVar("BaseToolT", bound=BaseModel)
 
@@ -21,6 +22,9 @@ def convert_base_model_to_base_tool(
     dictionary format, a Pydantic `BaseModel` can be converted into an `BaseTool` for
     performing extraction.
 
+    The converted type is cached per `(model, base)` pair, so converting the same model
+    again returns the same class.
+
     Args:
         model: The `BaseModel` schema to convert.
         base: The base type to extend with the `BaseModel` fields.
@@ -28,6 +32,9 @@ def convert_base_model_to_base_tool(
     Returns:
         The constructed `BaseModelT` type.
     """
+    if (cached_tool_type := get_cached_tool_type(model, base)) is not None:
+        return cast(type[BaseToolT], cached_tool_type)
+
     field_definitions = {
         field_name: (field_info.annotation, field_info)
         for field_name, field_info in model.model_fields.items()
@@ -45,4 +52,6 @@ def convert_base_model_to_base_tool(
     for name, value in inspect.getmembers(model):
         if not hasattr(tool_type, name) or name in ["_name", "_description", "call"]:
             setattr(tool_type, name, value)
-    return update_abstractmethods(tool_type)
+    tool_type = update_abstractmethods(tool_type)
+    set_cached_tool_type(model, base, tool_type)
+    return tool_type
@@ -9,6 +9,7 @@ from pydantic import BaseModel, create_model
 from pydantic.fields import FieldInfo
 
 from ._default_tool_docstring import DEFAULT_TOOL_DOCSTRING
+from ._tool_type_cache import get_cached_tool_type, set_cached_tool_type
 
 BaseToolT = TypeVar("BaseToolT", bound=BaseModel)
 
@@ -25,6 +26,11 @@ def convert_function_to_base_tool(
     order with identical variable names, as well as descriptions of each parameter.
     Errors will be raised if any of these conditions are not met.
 
+    The converted type is cached per `(fn, base)` pair, so converting the same function
+    again returns the same class. Conversions with a custom `__doc__` or `__namespace__`
+    (e.g. toolkit tools, which are templated and configured per toolkit instance) are
+    never cached.
+
     Args:
         fn: The function to convert.
         base: The `BaseToolT` type to which the function is converted.
@@ -41,6 +47,10 @@ def convert_function_to_base_tool(
         ValueError: if a given function's parameter is in the docstring args section but
             doesn't have a docstring description.
     """
+    cacheable = __doc__ is None and __namespace__ is None
+    if cacheable and (cached_tool_type := get_cached_tool_type(fn, base)) is not None:
+        return cast(type[BaseToolT], cached_tool_type)
+
     docstring, examples = None, []
     func_doc = __doc__ or fn.__doc__
     if func_doc:
@@ -123,4 +133,7 @@ def convert_function_to_base_tool(
         model.call = call_async  # pyright: ignore [reportAttributeAccessIssue]
     else:
         model.call = call  # pyright: ignore [reportAttributeAccessIssue]
-    return update_abstractmethods(model)
+    model = update_abstractmethods(model)
+    if cacheable:
+        set_cached_tool_type(fn, base, model)
+    return model
@@ -1,6 +1,7 @@
 """This module contains the function to extract the return value of a tool."""
 
 from typing import Any, TypeAlias, TypeVar
+from weakref import WeakKeyDictionary
 
 import jiter
 from pydantic import BaseModel
@@ -14,6 +15,22 @@ _BaseTypeT = TypeVar("_BaseTypeT", bound=BaseType)
 
 _ResponseModelT: TypeAlias = _BaseModelT | _BaseTypeT
 
+# Converting a `BaseType` runs `create_model`, so we convert each one once rather than
+# for every (streamed) extraction, which also lets `partial` reuse its partial model.
+_base_type_models: WeakKeyDictionary[Any, type[BaseModel]] = WeakKeyDictionary()
+
+
+def _get_base_type_model(response_model: type[BaseType]) -> type[BaseModel]:
+    try:
+        return _base_type_models[response_model]
+    except KeyError:
+        model = _base_type_models[response_model] = convert_base_type_to_base_tool(
+            response_model, BaseModel
+        )
+        return model
+    except TypeError:  # e.g. types that can't be weakly referenced
+        return convert_base_type_to_base_tool(response_model, BaseModel)
+
 
 def extract_tool_return(
     response_model: type[_ResponseModelT],
@@ -30,7 +47,7 @@ def extract_tool_return(
         else json_output
     )
     if is_base_type(response_model):
-        temp_model = convert_base_type_to_base_tool(response_model, BaseModel)
+        temp_model = _get_base_type_model(response_model)
         if allow_partial:
             return partial(temp_model).model_validate(json_obj).value  # pyright: ignore [reportAttributeAccessIssue]
         return temp_model.model_validate(json_obj).value  # pyright: ignore [reportAttributeAccessIssue]
@@ -1,12 +1,44 @@
 """This module contains the `format_template` function."""
 
 from textwrap import dedent
-from typing import Any
+from typing import Any, NamedTuple
 
 from ._get_template_values import get_template_values
 from ._get_template_variables import get_template_variables
 
 
+class FormatTemplate(NamedTuple):
+    """A dedented template with its variables already extracted.
+
+    Attributes:
+        template: The dedented template with the special format specs removed.
+        variables: The `(variable, format_spec)` pairs of the template.
+    """
+
+    template: str
+    variables: list[tuple[str, str | None]]
+
+    def format(self, attrs: dict[str, Any]) -> str:
+        """Returns the template formatted with the values from the provided `attrs`."""
+        values = get_template_values(self.variables, attrs)
+        return self.template.format(**values).strip()
+
+
+def compile_format_template(template: str) -> FormatTemplate:
+    """Returns the `FormatTemplate` for the given `template`.
+
+    Formatting the returned template only fills in the values, so compiling a template
+    once lets us skip dedenting and parsing it again on every format.
+    """
+    dedented_template = dedent(template).strip()
+    template_vars = get_template_variables(dedented_template, True)
+
+    # Remove any special format specs that are actually invalid normally
+    dedented_template = dedented_template.replace(":lists", "").replace(":list", "")
+
+    return FormatTemplate(template=dedented_template, variables=template_vars)
+
+
 def format_template(template: str, attrs: dict[str, Any]) -> str:
     """Formats the given prompt `template`
 
@@ -18,12 +50,4 @@ def format_template(template: str, attrs: dict[str, Any]) -> str:
         The formatted template.
 
     """
-    dedented_template = dedent(template).strip()
-    template_vars = get_template_variables(dedented_template, True)
-
-    values = get_template_values(template_vars, attrs)
-
-    # Remove any special format specs that are actually invalid normally
-    dedented_template = dedented_template.replace(":lists", "").replace(":list", "")
-
-    return dedented_template.format(**values).strip()
+    return compile_format_template(template).format(attrs)
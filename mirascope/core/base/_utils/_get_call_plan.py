@@ -0,0 +1,125 @@
+"""The `CallPlan` class and `get_call_plan` function for caching call setup."""
+
+from __future__ import annotations
+
+import inspect
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any, TypeVar
+from weakref import WeakKeyDictionary, ref
+
+from ._convert_base_model_to_base_tool import convert_base_model_to_base_tool
+from ._convert_function_to_base_tool import convert_function_to_base_tool
+from ._get_prompt_template import get_prompt_template
+from ._tool_index import ToolIndex, get_tool_index
+
+if TYPE_CHECKING:
+    from ..tool import BaseTool
+
+_BaseToolT = TypeVar("_BaseToolT", bound="BaseTool")
+
+_call_plans: WeakKeyDictionary[Callable, CallPlan] = WeakKeyDictionary()
+
+
+def convert_tools(
+    tools: Sequence[type[BaseTool] | Callable], tool_type: type[_BaseToolT]
+) -> tuple[list[type[_BaseToolT]], list[Any]]:
+    """Returns the `tools` converted to `tool_type` along with their tool schemas."""
+    tool_types = [
+        convert_base_model_to_base_tool(tool, tool_type)
+        if inspect.isclass(tool)
+        else convert_function_to_base_tool(tool, tool_type)
+        for tool in tools
+    ]
+    return tool_types, [tool_type._cached_tool_schema() for tool_type in tool_types]
+
+
+class CallPlan:
+    """The setup of a call that stays the same across every invocation of `fn`.
+
+    Binding arguments against the signature, resolving the prompt template, and
+    converting the decorator's tools into provider-specific tool types (and their
+    schemas) only depend on the decorated function, so we compute them once and reuse
+    them for all subsequent calls. The per-call work is then reduced to binding the
+    arguments and rendering the template with their values.
+
+    Attributes:
+        signature: The signature of the decorated function.
+    """
+
+    signature: inspect.Signature
+
+    def __init__(self, fn: Callable) -> None:
+        """Initializes an instance of `CallPlan` for the given `fn`."""
+        self.signature = inspect.signature(fn)
+        try:
+            # Plans are cached by `fn` weakly, so they mustn't keep `fn` alive.
+            self._fn: Callable[[], Callable | None] = ref(fn)
+        except TypeError:  # such plans aren't cached, so a strong reference is fine
+            self._fn = lambda: fn
+        self._var_keyword = next(
+            (
+                name
+                for name, parameter in self.signature.parameters.items()
+                if parameter.kind == inspect.Parameter.VAR_KEYWORD
+            ),
+            None,
+        )
+        self._prompt_template: str | None = None
+        self._tools: dict[
+            tuple[type[BaseTool], tuple[type[BaseTool] | Callable, ...]],
+            tuple[list[type[BaseTool]], list[Any]],
+        ] = {}
+        # Keeps the shared tool index of each set of converted tools alive.
+        self._tool_indexes: list[ToolIndex] = []
+
+    def bind(self, args: tuple[object, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Returns the `args` and `kwargs` as a dictionary bound by the signature."""
+        bound_args = self.signature.bind_partial(*args, **kwargs)
+        bound_args.apply_defaults()
+        fn_args = bound_args.arguments
+        if self._var_keyword is not None and self._var_keyword in fn_args:
+            # `**kwargs` is always the last parameter, so updating in place preserves
+            # the ordering we would get from flattening the arguments one by one.
+            fn_args.update(fn_args.pop(self._var_keyword))
+        return fn_args
+
+    def get_prompt_template(self) -> str:
+        """Returns the (cached) prompt template of the decorated function."""
+        if self._prompt_template is None:
+            fn = self._fn()
+            assert fn is not None, "The decorated function no longer exists."
+            self._prompt_template = get_prompt_template(fn)
+        return self._prompt_template
+
+    def get_tools(
+        self,
+        tools: Sequence[type[BaseTool] | Callable],
+        tool_type: type[_BaseToolT],
+    ) -> tuple[list[type[_BaseToolT]], list[Any]]:
+        """Returns the (cached) converted tool types and their schemas.
+
+        The returned lists are copies, so callers are free to mutate them, but the tool
+        schemas themselves are shared across calls and should be treated as read-only.
+        """
+        key = (tool_type, tuple(tools))
+        try:
+            if (cached := self._tools.get(key)) is None:
+                cached = self._tools[key] = convert_tools(tools, tool_type)
+                self._tool_indexes.append(get_tool_index(cached[0]))
+        except TypeError:  # unhashable tools can't be cached
+            return convert_tools(tools, tool_type)
+        tool_types, tool_schemas = cached
+        return list(tool_types), list(tool_schemas)  # pyright: ignore [reportReturnType]
+
+
+def get_call_plan(fn: Callable) -> CallPlan:
+    """Returns the `CallPlan` for `fn`, constructing it on first use.
+
+    Functions that cannot be weakly referenced (e.g. builtins) get a fresh plan.
+    """
+    try:
+        if (call_plan := _call_plans.get(fn)) is None:
+            call_plan = _call_plans[fn] = CallPlan(fn)
+    except TypeError:
+        call_plan = CallPlan(fn)
+    return call_plan
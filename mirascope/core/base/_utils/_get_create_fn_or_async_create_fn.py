@@ -22,6 +22,7 @@ from typing import (
 from typing_extensions import TypeIs
 
 from ..stream_config import StreamConfig
+from ._close_stream import close_stream
 from ._protocols import AsyncCreateFn, CreateFn
 
 _StreamedResponse = TypeVar("_StreamedResponse")
@@ -92,6 +93,7 @@ def get_async_create_fn(
                     Awaitable[AsyncGenerator[_StreamedResponse]], async_generator
                 )
 
+    create_or_stream.__wrapped__ = async_func  # pyright: ignore [reportFunctionMemberAccess]
     return create_or_stream
 
 
@@ -128,10 +130,16 @@ def get_create_fn(
                 generator = sync_generator_func(**kwargs)
 
             def _stream() -> Generator[_StreamedResponse, None, None]:
-                yield from generator
+                try:
+                    yield from generator
+                finally:
+                    # Iterating an SDK stream (e.g. OpenAI's `Stream`) goes through an
+                    # inner generator, so closing it doesn't close the HTTP response.
+                    close_stream(generator)
 
             return _stream()
 
         return cast(_NonStreamedResponse, sync_func(**kwargs))
 
+    create_or_stream.__wrapped__ = sync_func  # pyright: ignore [reportFunctionMemberAccess]
     return create_or_stream
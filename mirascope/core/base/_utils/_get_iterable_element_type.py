@@ -0,0 +1,11 @@
+"""This module contains the `get_iterable_element_type` function."""
+
+from collections.abc import Iterable
+from typing import Any, get_args, get_origin
+
+
+def get_iterable_element_type(response_model: Any) -> type | None:  # noqa: ANN401
+    """Returns `T` if `response_model` is `Iterable[T]`, otherwise `None`."""
+    if get_origin(response_model) is Iterable and (args := get_args(response_model)):
+        return args[0]
+    return None
@@ -0,0 +1,343 @@
+"""The `IncrementalJsonParser` class for parsing streamed JSON chunk by chunk."""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from ._text_buffer import TextBuffer
+
+_WHITESPACE = frozenset(" \t\n\r")
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_STRING_SPECIAL = re.compile(r'["\\]')
+_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(\.\d+)?([eE][+-]?\d+)?")
+_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+_LITERALS = {"true": True, "false": False, "null": None}
+_MISSING = object()
+
+
+class _Frame:
+    """An open object or array and what it expects next."""
+
+    __slots__ = ("container", "key", "expect")
+
+    def __init__(self, container: dict | list) -> None:
+        self.container = container
+        self.key: str | None = None
+        self.expect = "key" if isinstance(container, dict) else "first_value"
+
+
+class _Token:
+    """A partially received string, number, or literal."""
+
+    __slots__ = ("kind", "text", "escape", "is_key", "placed")
+
+    def __init__(self, kind: str, is_key: bool = False) -> None:
+        self.kind = kind
+        self.text = TextBuffer()
+        self.escape: str | None = None
+        self.is_key = is_key
+        self.placed = False
+
+
+class IncrementalJsonParser:
+    """A resumable JSON parser that keeps its state between chunks.
+
+    Each call to `feed` only scans the new text. The parsed (partial) value is updated
+    in place and follows the same rules as `jiter`'s `trailing-strings` partial mode:
+    incomplete strings are included, incomplete numbers are included once valid, and
+    incomplete keys and literals are left out until they are complete.
+
+    Example:
+
+    ```python
+    parser = IncrementalJsonParser()
+    for chunk in ['{"title": "The Na', 'me of the Wind", "pages": 6', "62}"]:
+        parser.feed(chunk)
+        print(parser.value)
+    # > {'title': 'The Na'}
+    # > {'title': 'The Name of the Wind', 'pages': 6}
+    # > {'title': 'The Name of the Wind', 'pages': 662}
+    ```
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty instance of `IncrementalJsonParser`."""
+        self._root: Any = _MISSING
+        self._stack: list[_Frame] = []
+        self._token: _Token | None = None
+        self._done = False
+        self._changed = False
+        self._changed_keys: set[str] = set()
+
+    @property
+    def value(self) -> Any:  # noqa: ANN401
+        """Returns the value parsed so far, or `None` if nothing has been parsed."""
+        return None if self._root is _MISSING else self._root
+
+    @property
+    def done(self) -> bool:
+        """Returns whether the top-level value is complete."""
+        return self._done
+
+    @property
+    def changed_keys(self) -> set[str]:
+        """Returns the keys of the top-level object whose values changed in place.
+
+        The keys are collected until `clear_changed_keys` is called, so callers that
+        don't read `value` after every chunk can still tell which values to copy.
+        """
+        return self._changed_keys
+
+    def clear_changed_keys(self) -> None:
+        """Clears the collected `changed_keys`."""
+        self._changed_keys = set()
+
+    def completed_length(self, array: list) -> int:
+        """Returns how many items of `array` (a list within `value`) are complete.
+
+        This lets callers consume the items of an array as soon as each one is closed,
+        e.g. `array[:parser.completed_length(array)]`.
+        """
+        for depth, frame in enumerate(self._stack):
+            if frame.container is array:
+                if depth < len(self._stack) - 1:
+                    return len(array) - 1
+                token = self._token
+                return (
+                    len(array) - 1 if token is not None and token.placed else len(array)
+                )
+        return len(array)
+
+    def completed_keys(self) -> set[str]:
+        """Returns the keys of the top-level object whose values are complete."""
+        if not isinstance(self._root, dict):
+            return set()
+        keys = set(self._root)
+        if not self._done and self._stack[0].expect == "value":
+            keys.discard(self._stack[0].key)
+        return keys
+
+    def feed(self, text: str) -> bool:
+        """Parses the next chunk of `text`, returning whether `value` changed.
+
+        Any text after the top-level value is complete is ignored.
+
+        Raises:
+            ValueError: If the text is not valid JSON.
+        """
+        self._changed = False
+        index, length = 0, len(text)
+        while index < length and not self._done:
+            if self._token is not None:
+                index = self._continue_token(text, index)
+                continue
+            char = text[index]
+            if char not in _WHITESPACE:
+                self._start(char, index)
+            index += 1
+        if self._token is not None and self._token.kind != "literal":
+            self._update_token()
+        return self._changed
+
+    def _start(self, char: str, index: int) -> None:
+        frame = self._stack[-1] if self._stack else None
+        expect = frame.expect if frame else "value"
+        if frame is not None and expect == "key":
+            if char == '"':
+                self._token = _Token("string", is_key=True)
+            elif char == "}" and not frame.container:
+                self._close()
+            else:
+                self._raise(char, index)
+        elif frame is not None and expect == "colon":
+            if char != ":":
+                self._raise(char, index)
+            frame.expect = "value"
+        elif frame is not None and expect == "comma":
+            if char == ",":
+                frame.expect = "key" if isinstance(frame.container, dict) else "value"
+            elif char == ("}" if isinstance(frame.container, dict) else "]"):
+                self._close()
+            else:
+                self._raise(char, index)
+        elif char == "]" and expect == "first_value":
+            self._close()
+        elif char in "{[":
+            container = {} if char == "{" else []
+            self._place(container)
+            self._stack.append(_Frame(container))
+        elif char == '"':
+            self._token = _Token("string")
+        elif char == "-" or char.isdigit():
+            self._token = _Token("number")
+            self._token.text.append(char)
+        elif char in "tfn":
+            self._token = _Token("literal")
+            self._token.text.append(char)
+        else:
+            self._raise(char, index)
+
+    def _continue_token(self, text: str, index: int) -> int:
+        token = self._token
+        assert token is not None
+        if token.kind == "string":
+            return self._continue_string(token, text, index)
+        end = index
+        if token.kind == "number":
+            while end < len(text) and text[end] in _NUMBER_CHARS:
+                end += 1
+        else:
+            while end < len(text) and text[end].isalpha():
+                end += 1
+        token.text.append(text[index:end])
+        if end < len(text) or (
+            token.kind == "literal" and str(token.text) in _LITERALS
+        ):
+            self._finish_token(token)
+        return end
+
+    def _continue_string(self, token: _Token, text: str, index: int) -> int:
+        while index < len(text):
+            if token.escape is not None:
+                index = self._continue_escape(token, text, index)
+                continue
+            match = _STRING_SPECIAL.search(text, index)
+            end = match.start() if match else len(text)
+            token.text.append(text[index:end])
+            if match is None:
+                return len(text)
+            if text[end] == '"':
+                self._finish_token(token)
+                return end + 1
+            token.escape = ""
+            index = end + 1
+        return index
+
+    def _continue_escape(self, token: _Token, text: str, index: int) -> int:
+        escape = token.escape or ""
+        while index < len(text):
+            char = text[index]
+            index += 1
+            if len(escape) in (5, 6) and char != "\\u"[len(escape) - 5]:
+                # A lone high surrogate, so `char` is read again as a normal character
+                # (or as the start of the next escape if it followed a backslash).
+                token.text.append(chr(int(escape[1:5], 16)))
+                token.escape = "" if len(escape) == 6 else None
+                return index - 1
+            escape += char
+            if escape[0] != "u":
+                if escape not in _ESCAPES:
+                    raise ValueError(f"Invalid escape `\\{escape}` in JSON string")
+                token.text.append(_ESCAPES[escape])
+                token.escape = None
+                return index
+            if len(escape) in (5, 11):
+                if not all(c in _HEX_DIGITS for c in escape[-4:]):
+                    raise ValueError(f"Invalid escape `\\{escape}` in JSON string")
+                high = int(escape[1:5], 16)
+                if len(escape) == 5 and 0xD800 <= high < 0xDC00:
+                    continue  # Wait for the low surrogate that completes the pair.
+                if len(escape) == 5:
+                    token.text.append(chr(high))
+                elif 0xDC00 <= (low := int(escape[7:], 16)) < 0xE000:
+                    token.text.append(
+                        chr(0x10000 + ((high - 0xD800) << 10) + low - 0xDC00)
+                    )
+                else:
+                    token.text.append(chr(high) + chr(low))
+                token.escape = None
+                return index
+        token.escape = escape
+        return index
+
+    def _update_token(self) -> None:
+        token = self._token
+        assert token is not None
+        if token.is_key:
+            return
+        if token.kind == "string":
+            self._place(str(token.text), replace=token.placed)
+            token.placed = True
+        elif _NUMBER.fullmatch(text := str(token.text)):
+            self._place(_to_number(text), replace=token.placed)
+            token.placed = True
+        elif token.placed:
+            self._unplace()
+            token.placed = False
+
+    def _finish_token(self, token: _Token) -> None:
+        self._token = None
+        text = str(token.text)
+        if token.is_key:
+            frame = self._stack[-1]
+            frame.key, frame.expect = text, "colon"
+            return
+        if token.kind == "string":
+            value = text
+        elif token.kind == "number":
+            if not _NUMBER.fullmatch(text):
+                raise ValueError(f"Invalid number `{text}` in JSON")
+            value = _to_number(text)
+        else:
+            if text not in _LITERALS:
+                raise ValueError(f"Invalid literal `{text}` in JSON")
+            value = _LITERALS[text]
+        self._place(value, replace=token.placed)
+        self._end_value()
+
+    def _place(self, value: Any, replace: bool = False) -> None:  # noqa: ANN401
+        if not self._stack:
+            previous, self._root = self._root, value
+        elif isinstance(container := self._stack[-1].container, dict):
+            previous = container.get(self._stack[-1].key, _MISSING)
+            container[self._stack[-1].key] = value
+        elif replace:
+            previous, container[-1] = container[-1], value
+        else:
+            previous = _MISSING
+            container.append(value)
+        # Completing a partial token (e.g. a number) doesn't always change its value.
+        if not (replace and type(previous) is type(value) and previous == value):
+            self._mark_changed()
+
+    def _unplace(self) -> None:
+        if not self._stack:
+            self._root = _MISSING
+        elif isinstance(container := self._stack[-1].container, dict):
+            container.pop(self._stack[-1].key, None)
+        else:
+            container.pop()
+        self._mark_changed()
+
+    def _mark_changed(self) -> None:
+        self._changed = True
+        if self._stack and isinstance(self._root, dict):
+            self._changed_keys.add(self._stack[0].key)  # pyright: ignore [reportArgumentType]
+
+    def _close(self) -> None:
+        self._stack.pop()
+        self._end_value()
+
+    def _end_value(self) -> None:
+        if self._stack:
+            self._stack[-1].expect = "comma"
+        else:
+            self._done = True
+
+    def _raise(self, char: str, index: int) -> None:
+        raise ValueError(f"Unexpected character {char!r} at index {index} of chunk")
+
+
+def _to_number(text: str) -> int | float:
+    return float(text) if any(c in text for c in ".eE") else int(text)
@@ -0,0 +1,219 @@
+"""Utilities for intercepting the provider `create` calls of decorated calls.
+
+Every call eventually runs `create(stream=..., **call_kwargs)` with the finalized
+`call_kwargs` from `setup_call`. Running that through `call_create` (or
+`prepare_create_stream` for streams) lets features such as the offline batch mode
+capture the `call_kwargs` or replay a provider response, and lets the response cache
+and single-flight de-duplication serve responses, without changing how the rest of the
+call (tools, extraction, output parsers) is handled.
+"""
+
+from __future__ import annotations
+
+import inspect
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+)
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Protocol
+
+from ..cache import (
+    dump_cached,
+    get_active_cache,
+    get_cache_key,
+    get_client_url,
+    load_cached,
+)
+from ._close_stream import close_stream, close_stream_async
+from ._single_flight import (
+    is_single_flight,
+    share_call,
+    share_call_async,
+    share_stream,
+    share_stream_async,
+)
+
+if TYPE_CHECKING:
+    from ..call_response import BaseCallResponse
+
+
+class CreateInterceptor(Protocol):
+    def __call__(
+        self,
+        response_type: type[BaseCallResponse],
+        create: Callable[..., Any],
+        call_kwargs: dict[str, Any],
+    ) -> Any: ...  # noqa: ANN401
+
+
+_create_interceptor: ContextVar[CreateInterceptor | None] = ContextVar(
+    "_create_interceptor", default=None
+)
+
+
+@contextmanager
+def intercept_create(interceptor: CreateInterceptor) -> Iterator[None]:
+    """Runs the provider `create` calls in this context through `interceptor`.
+
+    The interceptor receives the call response type, the provider `create` function,
+    and the finalized `call_kwargs`, and returns the provider response (or an awaitable
+    of it for async calls). It can make the call itself with
+    `create(stream=False, **call_kwargs)`. Interceptors bypass the response cache.
+    """
+    token = _create_interceptor.set(interceptor)
+    try:
+        yield
+    finally:
+        _create_interceptor.reset(token)
+
+
+def _get_key(
+    response_type: type[BaseCallResponse],
+    create: Callable[..., Any],
+    call_kwargs: dict[str, Any],
+    stream: bool,
+) -> str | None:
+    """Returns the cache key of the call, or `None` if the call can't be keyed."""
+    try:
+        return get_cache_key(
+            response_type._provider,
+            call_kwargs,
+            stream=stream,
+            client_url=get_client_url(create),
+        )
+    except TypeError:
+        return None
+
+
+def call_create(
+    response_type: type[BaseCallResponse],
+    create: Callable[..., Any],
+    call_kwargs: dict[str, Any],
+) -> Any:  # noqa: ANN401
+    """Returns the provider response of `create`, running any active interceptor."""
+    if (interceptor := _create_interceptor.get()) is not None:
+        return interceptor(response_type, create, call_kwargs)
+    cache, shared = get_active_cache(), is_single_flight()
+    if (cache is None and not shared) or (
+        key := _get_key(response_type, create, call_kwargs, stream=False)
+    ) is None:
+        return create(stream=False, **call_kwargs)
+
+    def run() -> Any:  # noqa: ANN401
+        if cache is not None and (cached := cache.get(key)) is not None:
+            return load_cached(cached)
+        response = create(stream=False, **call_kwargs)
+        if cache is not None and (value := dump_cached(response)) is not None:
+            cache.set(key, value)
+        return response
+
+    return share_call(key, run) if shared else run()
+
+
+async def call_create_async(
+    response_type: type[BaseCallResponse],
+    create: Callable[..., Awaitable[Any]],
+    call_kwargs: dict[str, Any],
+) -> Any:  # noqa: ANN401
+    """Returns the provider response of the async `create`, running any interceptor."""
+    if (interceptor := _create_interceptor.get()) is not None:
+        response = interceptor(response_type, create, call_kwargs)
+        return await response if inspect.isawaitable(response) else response
+    cache, shared = get_active_cache(), is_single_flight()
+    if (cache is None and not shared) or (
+        key := _get_key(response_type, create, call_kwargs, stream=False)
+    ) is None:
+        return await create(stream=False, **call_kwargs)
+
+    async def run() -> Any:  # noqa: ANN401
+        if cache is not None and (cached := await cache.aget(key)) is not None:
+            return load_cached(cached)
+        response = await create(stream=False, **call_kwargs)
+        if cache is not None and (value := dump_cached(response)) is not None:
+            await cache.aset(key, value)
+        return response
+
+    return await (share_call_async(key, run) if shared else run())
+
+
+def prepare_create_stream(
+    response_type: type[BaseCallResponse],
+    create: Callable[..., Iterable[Any]],
+    call_kwargs: dict[str, Any],
+) -> Callable[[], Iterable[Any]]:
+    """Returns a function that opens the provider stream of `create(stream=True)`.
+
+    The active cache and single-flight settings are captured when preparing the stream
+    so that they apply even when the stream is consumed outside of their context.
+    Chunks are only cached once the stream has been fully consumed.
+    """
+    cache, shared = get_active_cache(), is_single_flight()
+    if (cache is None and not shared) or (
+        key := _get_key(response_type, create, call_kwargs, stream=True)
+    ) is None:
+        return lambda: create(stream=True, **call_kwargs)
+
+    def open_stream() -> Iterator[Any]:
+        if cache is not None and (cached := cache.get(key)) is not None:
+            yield from load_cached(cached)
+            return
+        chunks, source = [], create(stream=True, **call_kwargs)
+        try:
+            for chunk in source:
+                chunks.append(chunk)
+                yield chunk
+        finally:
+            close_stream(source)
+        if cache is not None and (value := dump_cached(chunks)) is not None:
+            cache.set(key, value)
+
+    if shared:
+        stream = share_stream(key, open_stream)
+        return lambda: stream
+    return open_stream
+
+
+def prepare_create_stream_async(
+    response_type: type[BaseCallResponse],
+    create: Callable[..., Awaitable[AsyncIterable[Any]]],
+    call_kwargs: dict[str, Any],
+) -> Callable[[], Awaitable[AsyncIterable[Any]]]:
+    """Returns a function that opens the provider stream of the async `create`."""
+    cache, shared = get_active_cache(), is_single_flight()
+    if (cache is None and not shared) or (
+        key := _get_key(response_type, create, call_kwargs, stream=True)
+    ) is None:
+        return lambda: create(stream=True, **call_kwargs)
+
+    async def chunks() -> AsyncIterator[Any]:
+        if cache is not None and (cached := await cache.aget(key)) is not None:
+            for chunk in load_cached(cached):
+                yield chunk
+            return
+        received, source = [], await create(stream=True, **call_kwargs)
+        try:
+            async for chunk in source:
+                received.append(chunk)
+                yield chunk
+        finally:
+            await close_stream_async(source)
+        if cache is not None and (value := dump_cached(received)) is not None:
+            await cache.aset(key, value)
+
+    async def open_stream() -> AsyncIterable[Any]:
+        return chunks()
+
+    if shared:
+        stream = share_stream_async(key, open_stream)
+
+        async def open_shared_stream() -> AsyncIterable[Any]:
+            return stream
+
+        return open_shared_stream
+    return open_stream
@@ -2,7 +2,8 @@
 
 import re
 import urllib.request
-from typing import Any, Literal, cast
+from functools import lru_cache
+from typing import Any, Literal, NamedTuple, cast
 
 from typing_extensions import TypedDict
 
@@ -14,7 +15,7 @@ from ..message_param import (
     ImagePart,
     TextPart,
 )
-from ._format_template import format_template
+from ._format_template import FormatTemplate, compile_format_template
 from ._get_audio_type import get_audio_type
 from ._get_document_type import get_document_type
 from ._get_image_type import get_image_type
@@ -65,6 +66,28 @@ def _parse_parts(template: str) -> list[_Part]:
     return parts
 
 
+class _CompiledPart(NamedTuple):
+    part: _Part
+    text: FormatTemplate | None
+
+
+@lru_cache(maxsize=1024)
+def compile_content_template(template: str) -> tuple[_CompiledPart, ...]:
+    """Returns the parts of the content `template` with their text pre-compiled.
+
+    The result is cached since the same templates are rendered over and over again.
+    """
+    return tuple(
+        _CompiledPart(
+            part=part,
+            text=compile_format_template(part["template"].strip())
+            if part["type"] == "text"
+            else None,
+        )
+        for part in _parse_parts(template)
+    )
+
+
 def _load_media(source: str | bytes) -> bytes:
     try:
         # Some typing weirdness here where checking `isinstance(source, bytes)` results
@@ -117,7 +140,7 @@ def _construct_document_part(source: str | bytes) -> DocumentPart:
 
 
 def _construct_parts(
-    part: _Part, attrs: dict[str, Any]
+    compiled_part: _CompiledPart, attrs: dict[str, Any]
 ) -> (
     list[TextPart]
     | list[ImagePart]
@@ -125,6 +148,7 @@ def _construct_parts(
     | list[CacheControlPart]
     | list[DocumentPart]
 ):
+    part = compiled_part.part
     if part["type"] == "image":
         source = attrs[part["template"]]
         return [_construct_image_part(source, part["options"])] if source else []
@@ -186,23 +210,20 @@ def _construct_parts(
         if text in attrs:
             source = attrs[text]
             return [TextPart(type="text", text=source)]
-        formatted_template = format_template(part["template"].strip(), attrs)
+        formatted_template = cast(FormatTemplate, compiled_part.text).format(attrs)
         if not formatted_template:
             return []
         return [TextPart(type="text", text=formatted_template)]
 
 
-def parse_content_template(
-    role: str, template: str, attrs: dict[str, Any]
+def render_content_template(
+    role: str, compiled_parts: tuple[_CompiledPart, ...], attrs: dict[str, Any]
 ) -> BaseMessageParam | None:
-    """Returns the content template parsed and formatted as a message parameter."""
-    if not template:
-        return None
-
+    """Returns the compiled content parts formatted as a message parameter."""
     parts = [
         item
-        for part in _parse_parts(template)
-        for item in _construct_parts(part, attrs)
+        for compiled_part in compiled_parts
+        for item in _construct_parts(compiled_part, attrs)
     ]
 
     if not parts:
@@ -211,3 +232,12 @@ def parse_content_template(
     if len(parts) == 1 and parts[0].type == "text":
         return BaseMessageParam(role=role, content=parts[0].text)
     return BaseMessageParam(role=role, content=parts)
+
+
+def parse_content_template(
+    role: str, template: str, attrs: dict[str, Any]
+) -> BaseMessageParam | None:
+    """Returns the content template parsed and formatted as a message parameter."""
+    if not template:
+        return None
+    return render_content_template(role, compile_content_template(template), attrs)
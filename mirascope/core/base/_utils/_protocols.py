@@ -29,6 +29,7 @@ from ..messages import Messages
 from ..stream_config import StreamConfig
 from ..tool import BaseTool
 from ._base_type import BaseType
+from ._stream_throttle import StreamThrottle
 
 _BaseCallResponseT = TypeVar(
     "_BaseCallResponseT", covariant=True, bound=BaseCallResponse
@@ -345,6 +346,7 @@ class HandleStream(
         stream: Generator[_InvariantResponseChunkT, None, None],
         tool_types: list[type[_BaseToolT]] | None,
         partial_tools: bool = False,
+        throttle: StreamThrottle | None = None,
     ) -> Generator[
         tuple[_BaseCallResponseChunkT, _BaseToolT | None], None, None
     ]: ...  # pragma: no cover
@@ -358,6 +360,7 @@ class HandleStreamAsync(
         stream: AsyncGenerator[_InvariantResponseChunkT, None],
         tool_types: list[type[_BaseToolT]] | None,
         partial_tools: bool = False,
+        throttle: StreamThrottle | None = None,
     ) -> AsyncGenerator[
         tuple[_BaseCallResponseChunkT, _BaseToolT | None], None
     ]: ...  # pragma: no cover
@@ -1,6 +1,5 @@
 """Utility for setting up a provider-specific call."""
 
-import inspect
 from collections.abc import (
     Awaitable,
     Callable,
@@ -13,9 +12,8 @@ from ..call_params import BaseCallParams, CommonCallParams
 from ..dynamic_config import BaseDynamicConfig
 from ..message_param import BaseMessageParam
 from ..tool import BaseTool
-from . import get_prompt_template, parse_prompt_messages
-from ._convert_base_model_to_base_tool import convert_base_model_to_base_tool
-from ._convert_function_to_base_tool import convert_function_to_base_tool
+from . import parse_prompt_messages
+from ._get_call_plan import convert_tools, get_call_plan
 
 _BaseToolT = TypeVar("_BaseToolT", bound=BaseTool)
 _BaseDynamicConfigT = TypeVar("_BaseDynamicConfigT", bound=BaseDynamicConfig)
@@ -46,7 +44,8 @@ def setup_call(
     if isinstance(call_params, dict) and call_params.keys() <= _CALL_PARAMS_KEYS:
         call_params = convert_common_call_params(cast(CommonCallParams, call_params))
     call_kwargs = cast(BaseCallKwargs[_BaseToolT], dict(call_params))
-    prompt_template, messages = None, None
+    call_plan = get_call_plan(fn)
+    prompt_template, messages, static_tools = None, None, tools
     if dynamic_config is not None:
         tools = dynamic_config.get("tools", tools)
         messages = dynamic_config.get("messages", None)
@@ -57,7 +56,7 @@ def setup_call(
             call_kwargs |= dynamic_call_params
 
     if not messages:
-        prompt_template = get_prompt_template(fn)
+        prompt_template = call_plan.get_prompt_template()
         assert prompt_template is not None, "The function must have a prompt template."
         messages = parse_prompt_messages(
             roles=["system", "user", "assistant"],
@@ -68,12 +67,12 @@ def setup_call(
 
     tool_types = None
     if tools:
-        tool_types = [
-            convert_base_model_to_base_tool(tool, tool_type)
-            if inspect.isclass(tool)
-            else convert_function_to_base_tool(tool, tool_type)
-            for tool in tools
-        ]
-        call_kwargs["tools"] = [tool_type.tool_schema() for tool_type in tool_types]
+        # Dynamic tools (e.g. from a toolkit) can change on every call, so we only
+        # cache the conversion of the static tools set on the decorator.
+        tool_types, call_kwargs["tools"] = (
+            call_plan.get_tools(tools, tool_type)
+            if tools is static_tools
+            else convert_tools(tools, tool_type)
+        )
 
     return prompt_template, messages, tool_types, call_kwargs
@@ -0,0 +1,204 @@
+"""Utilities for sharing identical in-flight provider calls and streams.
+
+Calls are identified by the same key as the response cache (see `get_cache_key`). The
+first caller of a key makes the provider call, and concurrent callers of the same key
+share its response (or attach to the same feed of chunks for streams).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Generic, TypeVar
+from weakref import WeakKeyDictionary, WeakValueDictionary
+
+_R = TypeVar("_R")
+_ChunkT = TypeVar("_ChunkT")
+
+_single_flight: ContextVar[bool] = ContextVar("_single_flight", default=False)
+
+_lock = threading.Lock()
+_calls: dict[str, Future] = {}
+_streams: WeakValueDictionary[str, _SharedStream] = WeakValueDictionary()
+_async_calls: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Task]] = (
+    WeakKeyDictionary()
+)
+_async_streams: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, WeakValueDictionary[str, _AsyncSharedStream]
+] = WeakKeyDictionary()
+
+
+@contextmanager
+def single_flight_context() -> Iterator[None]:
+    """De-duplicates identical concurrent provider calls made in this context."""
+    token = _single_flight.set(True)
+    try:
+        yield
+    finally:
+        _single_flight.reset(token)
+
+
+def is_single_flight() -> bool:
+    """Returns whether identical calls in the current context are de-duplicated."""
+    return _single_flight.get()
+
+
+def share_call(key: str, run: Callable[[], _R]) -> _R:
+    """Returns the result of `run`, shared with concurrent callers of the same `key`."""
+    with _lock:
+        future = _calls.get(key)
+        if is_leader := future is None:
+            future = _calls[key] = Future()
+    if not is_leader:
+        return future.result()
+    try:
+        result = run()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _lock:
+            _calls.pop(key, None)
+
+
+async def share_call_async(key: str, run: Callable[[], Awaitable[_R]]) -> _R:
+    """Returns the result of `run`, shared with concurrent callers of the same `key`.
+
+    The shared call keeps running even if some of its callers are cancelled.
+    """
+    with _lock:
+        calls = _async_calls.setdefault(asyncio.get_running_loop(), {})
+        if (task := calls.get(key, None)) is None:
+            task = calls[key] = asyncio.ensure_future(run())
+
+            def done(task: asyncio.Task) -> None:
+                calls.pop(key, None)
+                if not task.cancelled():
+                    task.exception()  # marks the exception as retrieved
+
+            task.add_done_callback(done)
+    return await asyncio.shield(task)
+
+
+class _SharedStream(Generic[_ChunkT]):
+    """A stream whose chunks are replayed to every iterator over it.
+
+    Whichever iterator needs a chunk that hasn't been received yet pulls it from the
+    source while the others wait, so the stream advances as fast as its fastest reader.
+    """
+
+    def __init__(self, key: str, open_source: Callable[[], Iterator[_ChunkT]]) -> None:
+        self._key = key
+        self._open_source = open_source
+        self._source: Iterator[_ChunkT] | None = None
+        self._chunks: list[_ChunkT] = []
+        self._done = False
+        self._error: BaseException | None = None
+        self._lock = threading.Lock()
+
+    def _finish(self, error: BaseException | None = None) -> None:
+        self._done, self._error = True, error
+        with _lock:
+            if _streams.get(self._key, None) is self:
+                del _streams[self._key]
+
+    def __iter__(self) -> Iterator[_ChunkT]:
+        index = 0
+        while True:
+            with self._lock:
+                if index == len(self._chunks) and not self._done:
+                    try:
+                        if self._source is None:
+                            self._source = iter(self._open_source())
+                        self._chunks.append(next(self._source))
+                    except StopIteration:
+                        self._finish()
+                    except Exception as e:
+                        self._finish(e)
+                if index < len(self._chunks):
+                    chunk = self._chunks[index]
+                elif self._error is not None:
+                    raise self._error
+                else:
+                    return
+            index += 1
+            yield chunk
+
+
+class _AsyncSharedStream(Generic[_ChunkT]):
+    """The async equivalent of `_SharedStream`."""
+
+    def __init__(
+        self, key: str, open_source: Callable[[], Awaitable[AsyncIterator[_ChunkT]]]
+    ) -> None:
+        self._key = key
+        self._open_source = open_source
+        self._source: AsyncIterator[_ChunkT] | None = None
+        self._chunks: list[_ChunkT] = []
+        self._done = False
+        self._error: BaseException | None = None
+        self._lock = asyncio.Lock()
+        self._loop = asyncio.get_running_loop()
+
+    def _finish(self, error: BaseException | None = None) -> None:
+        self._done, self._error = True, error
+        with _lock:
+            streams = _async_streams.get(self._loop, {})
+            if streams.get(self._key, None) is self:
+                del streams[self._key]
+
+    async def __aiter__(self) -> AsyncIterator[_ChunkT]:
+        index = 0
+        while True:
+            async with self._lock:
+                if index == len(self._chunks) and not self._done:
+                    try:
+                        if self._source is None:
+                            self._source = aiter(await self._open_source())
+                        self._chunks.append(await anext(self._source))
+                    except StopAsyncIteration:
+                        self._finish()
+                    except Exception as e:
+                        self._finish(e)
+                if index < len(self._chunks):
+                    chunk = self._chunks[index]
+                elif self._error is not None:
+                    raise self._error
+                else:
+                    return
+            index += 1
+            yield chunk
+
+
+def share_stream(
+    key: str, open_source: Callable[[], Iterator[_ChunkT]]
+) -> Iterator[_ChunkT]:
+    """Returns an iterator over the stream shared by concurrent callers of `key`.
+
+    The source is opened by whichever iterator first needs a chunk, and the stream is
+    shared until it has been fully received.
+    """
+    with _lock:
+        if (stream := _streams.get(key, None)) is None:
+            stream = _streams[key] = _SharedStream(key, open_source)
+    return iter(stream)
+
+
+def share_stream_async(
+    key: str, open_source: Callable[[], Awaitable[AsyncIterator[_ChunkT]]]
+) -> AsyncIterator[_ChunkT]:
+    """Returns an async iterator over the stream shared by concurrent callers of `key`."""
+    with _lock:
+        streams = _async_streams.setdefault(
+            asyncio.get_running_loop(), WeakValueDictionary()
+        )
+        if (stream := streams.get(key, None)) is None:
+            stream = streams[key] = _AsyncSharedStream(key, open_source)
+    return aiter(stream)
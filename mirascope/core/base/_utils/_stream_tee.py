@@ -0,0 +1,269 @@
+"""The `StreamTee` class for fanning out a single stream to several consumers."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Generator,
+    Iterable,
+    Iterator,
+)
+from typing import Any, Generic, Literal, TypeAlias, TypeVar, cast
+
+_T = TypeVar("_T")
+
+SlowConsumerPolicy: TypeAlias = Literal["block", "drop", "spill"]
+
+_DONE = object()
+_WAIT = object()
+_FETCH = object()
+
+
+class TeeConsumer(Generic[_T]):
+    """One consumer of a `StreamTee`, which can be iterated (sync or async) once.
+
+    Consumers that stop iterating early (e.g. by breaking out of the loop) are detached
+    from the tee, so they never hold back the other consumers.
+    """
+
+    __slots__ = ("_tee", "_index")
+
+    def __init__(self, tee: StreamTee[_T], index: int) -> None:
+        """Initializes an instance of `TeeConsumer`."""
+        self._tee = tee
+        self._index = index
+
+    @property
+    def dropped(self) -> int:
+        """Returns how many items were dropped because this consumer fell behind."""
+        return self._tee._dropped[self._index]
+
+    @property
+    def spilled(self) -> int:
+        """Returns how many items were buffered past the tee's `max_buffer`."""
+        return self._tee._spilled[self._index]
+
+    def __iter__(self) -> Generator[_T, None, None]:
+        """Iterates over the items of the source stream."""
+        try:
+            while (item := self._tee._next(self._index)) is not _DONE:
+                yield cast(_T, item)
+        finally:
+            self._tee._close(self._index)
+
+    def __aiter__(self) -> AsyncGenerator[_T, None]:
+        """Iterates over the items of the source stream."""
+
+        async def generator() -> AsyncGenerator[_T, None]:
+            try:
+                while (item := await self._tee._anext(self._index)) is not _DONE:
+                    yield cast(_T, item)
+            finally:
+                await self._tee._aclose(self._index)
+
+        return generator()
+
+
+class StreamTee(Generic[_T]):
+    """Fans out the items of a (sync or async) iterable to `n` consumers.
+
+    The source is only iterated once, on demand: whichever consumer needs an item that
+    hasn't been fetched yet pulls it from the source and buffers it for the others.
+    When a consumer's buffer holds `max_buffer` items, the slow-consumer `policy`
+    decides what happens to the next item:
+
+    - `"block"`: the faster consumers wait until the slow consumer catches up. The
+        consumers must then run concurrently (in separate threads or tasks).
+    - `"drop"`: the oldest buffered item of the slow consumer is dropped.
+    - `"spill"`: the item is buffered anyway, past `max_buffer`.
+
+    Dropped and spilled items are counted per consumer (see `TeeConsumer`). With no
+    `max_buffer`, buffers are unbounded and the policy doesn't apply.
+
+    Example:
+
+    ```python
+    first, second = StreamTee(range(3), 2).consumers
+    print(list(first), list(second))
+    # > [0, 1, 2] [0, 1, 2]
+    ```
+    """
+
+    def __init__(
+        self,
+        source: Iterable[_T] | AsyncIterable[_T],
+        n: int = 2,
+        *,
+        max_buffer: int | None = None,
+        policy: SlowConsumerPolicy = "block",
+    ) -> None:
+        """Initializes an instance of `StreamTee`.
+
+        Args:
+            source: The iterable whose items are fanned out to the consumers.
+            n: The number of consumers.
+            max_buffer: The maximum number of items buffered for each consumer.
+            policy: What to do when a consumer's buffer is full.
+
+        Raises:
+            ValueError: If `n` or `max_buffer` is less than 1, or `policy` is unknown.
+        """
+        if n < 1:
+            raise ValueError(f"A stream can't be teed into {n} consumers.")
+        if max_buffer is not None and max_buffer < 1:
+            raise ValueError(f"`max_buffer` must be at least 1, not {max_buffer}.")
+        if policy not in ("block", "drop", "spill"):
+            raise ValueError(f"Unknown slow consumer policy `{policy}`.")
+        self.max_buffer = max_buffer
+        self.policy = policy
+        self._source = source
+        self._iterator: Iterator[_T] | AsyncIterator[_T] | None = None
+        self._buffers: list[deque[_T]] = [deque() for _ in range(n)]
+        self._active = [True] * n
+        self._dropped = [0] * n
+        self._spilled = [0] * n
+        self._fetching = False
+        self._fetch: asyncio.Future | None = None
+        self._done = False
+        self._error: BaseException | None = None
+        self._condition = threading.Condition()
+        self._async_condition: asyncio.Condition | None = None
+        self.consumers = tuple(TeeConsumer(self, index) for index in range(n))
+
+    def _poll(self, index: int) -> Any:  # noqa: ANN401
+        """Returns the next item for consumer `index`, or what it should do instead."""
+        if self._buffers[index]:
+            return self._buffers[index].popleft()
+        if self._done:
+            if self._error is not None:
+                raise self._error
+            return _DONE
+        if self._fetching or self._is_blocked(index):
+            return _WAIT
+        self._fetching = True
+        return _FETCH
+
+    def _is_blocked(self, index: int) -> bool:
+        return (
+            self.policy == "block"
+            and self.max_buffer is not None
+            and any(
+                self._active[other] and len(buffer) >= self.max_buffer
+                for other, buffer in enumerate(self._buffers)
+                if other != index
+            )
+        )
+
+    def _deliver(self, index: int, item: Any) -> None:  # noqa: ANN401
+        """Buffers the `item` fetched by consumer `index` for the other consumers."""
+        self._fetching = False
+        if item is _DONE:
+            self._done = True
+            return
+        for other, buffer in enumerate(self._buffers):
+            if other == index or not self._active[other]:
+                continue
+            if self.max_buffer is not None and len(buffer) >= self.max_buffer:
+                if self.policy == "drop":
+                    buffer.popleft()
+                    self._dropped[other] += 1
+                else:
+                    self._spilled[other] += 1
+            buffer.append(item)
+
+    def _fail(self, error: BaseException) -> None:
+        self._fetching, self._done, self._error = False, True, error
+
+    def _detach(self, index: int) -> bool:
+        """Detaches consumer `index`, returning whether the source should be closed."""
+        self._active[index] = False
+        self._buffers[index].clear()
+        return not self._done and not any(self._active)
+
+    def _next(self, index: int) -> Any:  # noqa: ANN401
+        with self._condition:
+            while (item := self._poll(index)) is _WAIT:
+                self._condition.wait()
+            self._condition.notify_all()
+        if item is not _FETCH:
+            return item
+        try:
+            if self._iterator is None:
+                self._iterator = iter(cast(Iterable[_T], self._source))
+            item = next(cast(Iterator[_T], self._iterator), _DONE)
+        except BaseException as e:
+            with self._condition:
+                self._fail(e)
+                self._condition.notify_all()
+            raise
+        with self._condition:
+            self._deliver(index, item)
+            self._condition.notify_all()
+        return item
+
+    def _close(self, index: int) -> None:
+        with self._condition:
+            close = self._detach(index)
+            self._condition.notify_all()
+        if close and (close_source := getattr(self._iterator, "close", None)):
+            close_source()
+
+    async def _anext(self, index: int) -> Any:  # noqa: ANN401
+        if self._async_condition is None:
+            self._async_condition = asyncio.Condition()
+        condition = self._async_condition
+        async with condition:
+            while (item := self._poll(index)) is _WAIT:
+                await condition.wait()
+            condition.notify_all()
+        if item is not _FETCH:
+            return item
+        try:
+            if self._iterator is None:
+                self._iterator = aiter(cast(AsyncIterable[_T], self._source))
+            if self._fetch is None:
+                # The fetch runs in its own task so that cancelling the consumer that
+                # started it doesn't cancel the source for the other consumers.
+                self._fetch = asyncio.ensure_future(
+                    anext(cast(AsyncIterator[_T], self._iterator), _DONE)
+                )
+            item = await asyncio.shield(self._fetch)
+        except asyncio.CancelledError as e:
+            async with condition:
+                if self._fetch is not None and not self._fetch.cancelled():
+                    # Only this consumer was cancelled, so another consumer takes
+                    # over the (pending or finished) fetch.
+                    self._fetching = False
+                else:
+                    self._fetch = None
+                    self._fail(e)
+                condition.notify_all()
+            raise
+        except BaseException as e:
+            async with condition:
+                self._fetch = None
+                self._fail(e)
+                condition.notify_all()
+            raise
+        async with condition:
+            self._fetch = None
+            self._deliver(index, item)
+            condition.notify_all()
+        return item
+
+    async def _aclose(self, index: int) -> None:
+        condition = self._async_condition or asyncio.Condition()
+        async with condition:
+            close = self._detach(index)
+            condition.notify_all()
+        if close and (fetch := self._fetch) is not None:
+            self._fetch = None
+            fetch.cancel()
+            await asyncio.gather(fetch, return_exceptions=True)
+        if close and (close_source := getattr(self._iterator, "aclose", None)):
+            await close_source()
@@ -0,0 +1,105 @@
+"""The `StreamThrottle` class for coalescing the partial values emitted by a stream."""
+
+from __future__ import annotations
+
+import time
+
+from ..stream_config import StreamConfig
+from ._incremental_json import IncrementalJsonParser
+from ._text_buffer import TextBuffer
+
+
+class StreamThrottle:
+    """Decides when a stream should emit its next partial value (model or tool).
+
+    Partial values are only emitted when their parsed value changed since the last
+    emission (if `changes_only`), and at most once per `min_interval_ms` milliseconds or
+    `min_bytes` bytes of new content (whichever is reached first) if either is set.
+    Callers should always emit the final, complete value regardless of the throttle.
+    """
+
+    __slots__ = (
+        "changes_only",
+        "min_interval",
+        "min_bytes",
+        "_pending",
+        "_changed",
+        "_last_emitted",
+        "_parser",
+    )
+
+    def __init__(
+        self,
+        *,
+        changes_only: bool = False,
+        min_interval_ms: float | None = None,
+        min_bytes: int | None = None,
+    ) -> None:
+        """Initializes an instance of `StreamThrottle`."""
+        self.changes_only = changes_only
+        self.min_interval = min_interval_ms / 1000 if min_interval_ms else None
+        self.min_bytes = min_bytes or None
+        self._pending = TextBuffer()
+        self._changed = False
+        self._last_emitted: float | None = None
+        self._parser = IncrementalJsonParser()
+
+    @classmethod
+    def from_config(cls, config: StreamConfig | None) -> StreamThrottle | None:
+        """Returns a new throttle for `config`, or `None` if it doesn't throttle."""
+        if not config or not (
+            config.get("changes_only")
+            or config.get("min_interval_ms")
+            or config.get("min_bytes")
+        ):
+            return None
+        return cls(
+            changes_only=config.get("changes_only", False),
+            min_interval_ms=config.get("min_interval_ms"),
+            min_bytes=config.get("min_bytes"),
+        )
+
+    def update(self, delta: str, changed: bool = True) -> str | None:
+        """Records the next `delta`, returning the coalesced delta to emit (if any).
+
+        Args:
+            delta: The new content since the previous update.
+            changed: Whether the parsed value changed with `delta`.
+
+        Returns:
+            The content received since the last emission if a partial value should be
+            emitted now, otherwise `None`.
+        """
+        self._pending.append(delta)
+        self._changed = self._changed or changed
+        if self.changes_only and not self._changed:
+            return None
+        now = time.monotonic()
+        if (
+            self._last_emitted is not None
+            and (self.min_interval or self.min_bytes)
+            and not (
+                self.min_interval and now - self._last_emitted >= self.min_interval
+            )
+            and not (self.min_bytes and len(self._pending) >= self.min_bytes)
+        ):
+            return None
+        self._changed, self._last_emitted = False, now
+        return self._pending.take()
+
+    def update_json(self, delta: str) -> str | None:
+        """Records the next `delta` of a JSON value (e.g. tool arguments).
+
+        The JSON is parsed incrementally to decide whether its value changed, which is
+        only needed (and only done) when `changes_only` is set.
+        """
+        return self.update(
+            delta, self._parser.feed(delta) if self.changes_only else True
+        )
+
+    def reset(self) -> None:
+        """Resets the throttle for the next value (e.g. the next tool call)."""
+        self._pending.clear()
+        self._changed = False
+        self._last_emitted = None
+        self._parser = IncrementalJsonParser()
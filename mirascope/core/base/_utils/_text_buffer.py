@@ -0,0 +1,73 @@
+"""The `TextBuffer` class for accumulating streamed text in linear time."""
+
+from __future__ import annotations
+
+
+class TextBuffer:
+    """An append-only string builder that only joins its parts when read.
+
+    Repeatedly doing `text += delta` copies the whole accumulated text on every append
+    when `text` is referenced elsewhere (e.g. as an attribute), which is quadratic in the
+    length of the stream. Appending to a `TextBuffer` is amortized O(1), and the parts
+    are joined (once) whenever the value is read.
+
+    Example:
+
+    ```python
+    buffer = TextBuffer()
+    for delta in ["Hello", ", ", "world"]:
+        buffer.append(delta)
+    print(str(buffer))
+    # > Hello, world
+    ```
+    """
+
+    __slots__ = ("_parts", "_length")
+
+    def __init__(self, text: str = "") -> None:
+        """Initializes an instance of `TextBuffer` with the initial `text`."""
+        self._parts: list[str] = [text] if text else []
+        self._length = len(text)
+
+    def append(self, text: str) -> None:
+        """Appends `text` to the end of the buffer."""
+        if text:
+            self._parts.append(text)
+            self._length += len(text)
+
+    def take(self) -> str:
+        """Returns the value of the buffer and clears it."""
+        value = str(self)
+        self.clear()
+        return value
+
+    def clear(self) -> None:
+        """Removes all text from the buffer."""
+        self._parts.clear()
+        self._length = 0
+
+    def __str__(self) -> str:
+        """Returns the accumulated text, joining the parts appended since last read."""
+        if len(self._parts) > 1:
+            self._parts[:] = ["".join(self._parts)]
+        return self._parts[0] if self._parts else ""
+
+    def __len__(self) -> int:
+        """Returns the length of the accumulated text."""
+        return self._length
+
+    def __bool__(self) -> bool:
+        """Returns whether any text has been accumulated."""
+        return self._length > 0
+
+    def __eq__(self, other: object) -> bool:
+        """Returns whether the accumulated text equals `other`."""
+        if isinstance(other, TextBuffer):
+            return str(self) == str(other)
+        if isinstance(other, str):
+            return str(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """Returns the representation of the buffer and its text."""
+        return f"TextBuffer({str(self)!r})"
@@ -0,0 +1,86 @@
+"""The `ToolIndex` class for looking up tool types by name."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:
+    from ..tool import BaseTool
+
+_BaseToolT = TypeVar("_BaseToolT", bound="BaseTool")
+
+
+class ToolIndex(Mapping[str, type[_BaseToolT]], Generic[_BaseToolT]):
+    """A read-only mapping from tool names to their tool types.
+
+    Tool names are computed once when the index is built. If multiple tool types share
+    the same name, the first one wins (matching the order in which tools are provided).
+    Looking up an unknown name raises a `KeyError` that lists the available tools.
+
+    Example:
+
+    ```python
+    index = ToolIndex([FormatBook])
+    tool_type = index["FormatBook"]
+    ```
+    """
+
+    __slots__ = ("_tool_types", "__weakref__")
+
+    def __init__(self, tool_types: Iterable[type[_BaseToolT]]) -> None:
+        """Initializes an instance of `ToolIndex`."""
+        self._tool_types: dict[str, type[_BaseToolT]] = {}
+        for tool_type in tool_types:
+            self._tool_types.setdefault(tool_type._name(), tool_type)
+
+    def __getitem__(self, name: str) -> type[_BaseToolT]:
+        """Returns the tool type with the given `name`.
+
+        Raises:
+            KeyError: If there is no tool with the given `name`.
+        """
+        try:
+            return self._tool_types[name]
+        except KeyError:
+            available = ", ".join(self._tool_types) or "none"
+            raise KeyError(
+                f"Unknown tool `{name}`. Available tools: {available}."
+            ) from None
+
+    def get(self, name: str, default: Any = None) -> Any:  # noqa: ANN401
+        """Returns the tool type with the given `name`, or `default` if unknown."""
+        return self._tool_types.get(name, default)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._tool_types
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tool_types)
+
+    def __len__(self) -> int:
+        return len(self._tool_types)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._tool_types.values())!r})"
+
+
+# Indexes are only shared while they are in use (e.g. kept by a call plan), so the cache
+# never keeps (dynamically created) tool types alive.
+_tool_indexes: WeakValueDictionary[tuple[type[BaseTool], ...], ToolIndex] = (
+    WeakValueDictionary()
+)
+
+
+def get_tool_index(tool_types: Iterable[type[_BaseToolT]]) -> ToolIndex[_BaseToolT]:
+    """Returns the (shared) `ToolIndex` for the given tool types.
+
+    Indexes are shared per tool set while they are in use, so the response and the
+    stream of a call (as well as repeated calls with the same tools) share the same
+    index.
+    """
+    key = tuple(tool_types)
+    if (tool_index := _tool_indexes.get(key)) is None:
+        tool_index = _tool_indexes[key] = ToolIndex(key)
+    return tool_index
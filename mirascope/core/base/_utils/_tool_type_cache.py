@@ -0,0 +1,61 @@
+"""Utilities for caching the tool types converted from models and functions.
+
+Converting a `BaseModel` or function into a provider-specific tool type runs pydantic's
+`create_model` (and for functions also parses the docstring and type hints), so we
+cache the converted type per `(source, target tool type)` pair and return the same class
+on subsequent conversions. Returning the same class also lets pydantic reuse its
+validators and schemas instead of building them again for a brand new class.
+
+Sources are weakly referenced, and so are their converted tool types since each one
+references its source (as a base class or as the function it calls). A converted tool
+type is therefore cached while it is still in use (e.g. by a call plan), and neither it
+nor its source is ever kept alive by the cache.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from contextlib import suppress
+from typing import Any
+from weakref import WeakKeyDictionary, ref
+
+_tool_types: WeakKeyDictionary[Any, dict[Hashable, ref[type]]] = WeakKeyDictionary()
+
+
+def get_cached_tool_type(source: type | Callable, key: Hashable) -> type | None:
+    """Returns the tool type previously converted from `source` for `key`, if any."""
+    try:
+        tool_types = _tool_types.get(source, None)
+    except TypeError:  # sources that can't be weakly referenced (or hashed)
+        return None
+    if tool_types is None or (tool_type_ref := tool_types.get(key, None)) is None:
+        return None
+    return tool_type_ref()
+
+
+def set_cached_tool_type(
+    source: type | Callable, key: Hashable, tool_type: type
+) -> None:
+    """Caches the `tool_type` converted from `source` for `key`, if possible."""
+    try:
+        tool_types = _tool_types.setdefault(source, {})
+    except TypeError:
+        return
+    tool_types[key] = ref(tool_type)
+
+
+def clear_tool_type_cache(source: type | Callable | None = None) -> None:
+    """Clears the cached tool types converted from `source` (or from all sources).
+
+    Use this if you modify a model or function after it has already been used as a tool
+    (e.g. updating its docstring) so that the next conversion picks up the change.
+
+    Args:
+        source: The model or function whose converted tool types should be cleared. If
+            `None`, the converted tool types of every source are cleared.
+    """
+    if source is None:
+        _tool_types.clear()
+        return
+    with suppress(TypeError):
+        _tool_types.pop(source, None)
@@ -0,0 +1,286 @@
+"""Functions for running a decorated call over many inputs with bounded concurrency.
+
+Every function decorated with a provider's `call` decorator (e.g. `openai.call`) that
+doesn't stream also exposes these functions as its `batch`, `abatch`, and
+`as_completed` attributes. Calls made without a `client` all share the pooled default
+client (see `client_pool`).
+
+Example:
+
+```python
+from mirascope.core import openai
+
+
+@openai.call("gpt-4o-mini")
+def recommend_book(genre: str) -> str:
+    return f"Recommend a {genre} book"
+
+
+responses = recommend_book.batch(
+    [{"genre": "fantasy"}, {"genre": "mystery"}], max_concurrency=8
+)
+for response in responses:
+    print(response.content)
+```
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+)
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from itertools import islice
+from typing import Any, TypeVar, overload
+
+from ._utils import fn_is_async
+
+_R = TypeVar("_R")
+_F = TypeVar("_F", bound=Callable)
+
+
+def _check_max_concurrency(max_concurrency: int | None) -> None:
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("`max_concurrency` must be at least 1.")
+
+
+def _iter_threaded(
+    fn: Callable[..., _R],
+    inputs: list[Mapping[str, Any]],
+    max_concurrency: int | None,
+    return_exceptions: bool,
+) -> Iterator[tuple[int, _R | BaseException]]:
+    if not inputs:
+        return
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        futures: dict[Future[_R], int] = {
+            executor.submit(fn, **kwargs): index for index, kwargs in enumerate(inputs)
+        }
+        try:
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = futures.pop(future)
+                    if (exception := future.exception()) is None:
+                        yield index, future.result()
+                    elif return_exceptions:
+                        yield index, exception
+                    else:
+                        raise exception
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+async def _iter_async(
+    fn: Callable[..., Awaitable[_R]] | Callable[..., _R],
+    inputs: list[Mapping[str, Any]],
+    max_concurrency: int | None,
+    return_exceptions: bool,
+) -> AsyncIterator[tuple[int, _R | BaseException]]:
+    async def run(kwargs: Mapping[str, Any]) -> _R:
+        if fn_is_async(fn):
+            return await fn(**kwargs)
+        return await asyncio.to_thread(fn, **kwargs)  # pyright: ignore [reportReturnType]
+
+    # Tasks are only created as earlier calls finish so that large inputs don't
+    # create a task for every call up front.
+    queued = iter(enumerate(inputs))
+    tasks: dict[asyncio.Future[_R], int] = {}
+
+    def start(count: int) -> None:
+        for index, kwargs in islice(queued, count):
+            tasks[asyncio.ensure_future(run(kwargs))] = index
+
+    start(max_concurrency or len(inputs))
+    try:
+        while tasks:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            start(len(done))
+            for task in done:
+                index = tasks.pop(task)
+                if task.cancelled():
+                    exception: BaseException | None = asyncio.CancelledError()
+                else:
+                    exception = task.exception()
+                if exception is None:
+                    yield index, task.result()
+                elif return_exceptions:
+                    yield index, exception
+                else:
+                    raise exception
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+@overload
+def batch(
+    fn: Callable[..., Awaitable[_R]],
+    inputs: Iterable[Mapping[str, Any]],
+    *,
+    max_concurrency: int | None = None,
+    return_exceptions: bool = False,
+) -> list[_R | BaseException]: ...
+
+
+@overload
+def batch(
+    fn: Callable[..., _R],
+    inputs: Iterable[Mapping[str, Any]],
+    *,
+    max_concurrency: int | None = None,
+    return_exceptions: bool = False,
+) -> list[_R | BaseException]: ...
+
+
+def batch(
+    fn: Callable[..., Awaitable[_R]] | Callable[..., _R],
+    inputs: Iterable[Mapping[str, Any]],
+    *,
+    max_concurrency: int | None = None,
+    return_exceptions: bool = False,
+) -> list[_R | BaseException]:
+    """Calls `fn` once per set of keyword arguments in `inputs` concurrently.
+
+    Sync functions are run on a thread pool with at most `max_concurrency` workers. Async
+    functions are run on a new event loop (see `abatch` for use inside a running loop).
+
+    Args:
+        fn: The decorated call to run.
+        inputs: The keyword arguments of each call.
+        max_concurrency: The maximum number of calls in flight at once. If `None`, the
+            thread pool's default is used for sync functions and async functions are
+            unbounded.
+        return_exceptions: Whether to return exceptions in place of their results
+            instead of raising the first exception that occurs.
+
+    Returns:
+        The results in the same order as `inputs`.
+
+    Raises:
+        ValueError: If `max_concurrency` is less than 1.
+    """
+    _check_max_concurrency(max_concurrency)
+    if fn_is_async(fn):
+        return asyncio.run(
+            abatch(
+                fn,
+                inputs,
+                max_concurrency=max_concurrency,
+                return_exceptions=return_exceptions,
+            )
+        )
+    inputs = list(inputs)
+    results: list[Any] = [None] * len(inputs)
+    for index, result in _iter_threaded(fn, inputs, max_concurrency, return_exceptions):
+        results[index] = result
+    return results
+
+
+async def abatch(
+    fn: Callable[..., Awaitable[_R]] | Callable[..., _R],
+    inputs: Iterable[Mapping[str, Any]],
+    *,
+    max_concurrency: int | None = None,
+    return_exceptions: bool = False,
+) -> list[_R | BaseException]:
+    """Calls `fn` once per set of keyword arguments in `inputs` concurrently.
+
+    At most `max_concurrency` calls run at once, and each call's task is only created
+    once a slot is free. Sync functions are run in worker threads so they don't block
+    the event loop.
+
+    Args:
+        fn: The decorated call to run.
+        inputs: The keyword arguments of each call.
+        max_concurrency: The maximum number of calls in flight at once. If `None`, the
+            calls are unbounded.
+        return_exceptions: Whether to return exceptions in place of their results
+            instead of raising the first exception that occurs.
+
+    Returns:
+        The results in the same order as `inputs`.
+
+    Raises:
+        ValueError: If `max_concurrency` is less than 1.
+    """
+    _check_max_concurrency(max_concurrency)
+    inputs = list(inputs)
+    results: list[Any] = [None] * len(inputs)
+    async for index, result in _iter_async(
+        fn, inputs, max_concurrency, return_exceptions
+    ):
+        results[index] = result
+    return results
+
+
+@overload
+def as_completed(
+    fn: Callable[..., Awaitable[_R]],
+    inputs: Iterable[Mapping[str, Any]],
+    *,
+    max_concurrency: int | None = None,
+    return_exceptions: bool = False,
+) -> AsyncIterator[tuple[int, _R | BaseException]]: ...
+
+
+@overload
+def as_completed(
+    fn: Callable[..., _R],
+    inputs: Iterable[Mapping[str, Any]],
+    *,
+    max_concurrency: int | None = None,
+    return_exceptions: bool = False,
+) -> Iterator[tuple[int, _R | BaseException]]: ...
+
+
+def as_completed(
+    fn: Callable[..., Awaitable[_R]] | Callable[..., _R],
+    inputs: Iterable[Mapping[str, Any]],
+    *,
+    max_concurrency: int | None = None,
+    return_exceptions: bool = False,
+) -> (
+    AsyncIterator[tuple[int, _R | BaseException]]
+    | Iterator[tuple[int, _R | BaseException]]
+):
+    """Calls `fn` once per set of keyword arguments in `inputs`, yielding as they finish.
+
+    Results are yielded as `(index, result)` tuples where `index` is the position of the
+    call's keyword arguments in `inputs`. Async functions return an async iterator.
+    Pending calls are cancelled if iteration stops early or a call raises.
+
+    Args:
+        fn: The decorated call to run.
+        inputs: The keyword arguments of each call.
+        max_concurrency: The maximum number of calls in flight at once.
+        return_exceptions: Whether to yield exceptions in place of their results
+            instead of raising the first exception that occurs.
+
+    Returns:
+        An iterator (or async iterator) of `(index, result)` tuples.
+
+    Raises:
+        ValueError: If `max_concurrency` is less than 1.
+    """
+    _check_max_concurrency(max_concurrency)
+    inputs = list(inputs)
+    if fn_is_async(fn):
+        return _iter_async(fn, inputs, max_concurrency, return_exceptions)
+    return _iter_threaded(fn, inputs, max_concurrency, return_exceptions)
+
+
+def add_batch_methods(fn: _F) -> _F:
+    """Sets `batch`, `abatch`, and `as_completed` on the decorated call `fn`."""
+    fn.batch = partial(batch, fn)  # pyright: ignore [reportFunctionMemberAccess]
+    fn.abatch = partial(abatch, fn)  # pyright: ignore [reportFunctionMemberAccess]
+    fn.as_completed = partial(as_completed, fn)  # pyright: ignore [reportFunctionMemberAccess]
+    return fn
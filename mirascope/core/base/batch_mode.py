@@ -0,0 +1,182 @@
+"""Provider-agnostic building blocks for running decorated calls through batch APIs.
+
+Provider batch APIs (e.g. the OpenAI Batch API or Anthropic Message Batches) take a
+file of requests and return a file of responses some time later. Running a decorated
+call in batch mode happens in two stages that never reach the provider's regular
+endpoints:
+
+1. `build_batch_requests` runs the decorated call for each set of arguments up until
+   the provider call and captures the exact `call_kwargs` produced by `setup_call`.
+2. `parse_batch_results` runs the decorated call again for each set of arguments, but
+   replays the provider response from the batch results instead of calling the
+   provider, so the results are the same call responses, tools, `response_model`
+   extractions, or parsed outputs that the call would have returned directly.
+
+The provider modules (e.g. `openai.batch`) build on these to write, submit, and read
+the provider-specific batch files.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any, TypeVar
+
+from pydantic_core import to_jsonable_python
+from typing_extensions import TypedDict
+
+from ._utils import fn_is_async, intercept_create
+from .call_response import BaseCallResponse
+
+_R = TypeVar("_R")
+
+
+class BatchRequest(TypedDict):
+    """A single request of a batch.
+
+    Attributes:
+        custom_id: The identifier that matches the request with its result.
+        call_kwargs: The JSON-serializable `call_kwargs` of the provider call.
+    """
+
+    custom_id: str
+    call_kwargs: dict[str, Any]
+
+
+class BatchRequestError(Exception):
+    """An error returned by a batch API for a single request of a batch.
+
+    Attributes:
+        custom_id: The identifier of the failed request.
+        error: The provider error for the request.
+    """
+
+    custom_id: str
+    error: Any
+
+    def __init__(self, custom_id: str, error: Any) -> None:  # noqa: ANN401
+        """Initializes an instance of `BatchRequestError`."""
+        super().__init__(f"Batch request `{custom_id}` failed: {error}")
+        self.custom_id = custom_id
+        self.error = error
+
+
+class _CapturedCall(Exception):
+    def __init__(self, call_kwargs: dict[str, Any]) -> None:
+        super().__init__()
+        self.call_kwargs = call_kwargs
+
+
+def get_custom_id(index: int, prefix: str = "request") -> str:
+    """Returns the `custom_id` of the request for the arguments at `index`."""
+    return f"{prefix}-{index}"
+
+
+def _run(fn: Callable[..., Any], kwargs: Mapping[str, Any]) -> Any:  # noqa: ANN401
+    if fn_is_async(fn):
+        return asyncio.run(fn(**kwargs))
+    return fn(**kwargs)
+
+
+def _replay(response: Any) -> Callable[..., Any]:  # noqa: ANN401
+    def replay(
+        response_type: type[BaseCallResponse],
+        create: Callable[..., Any],
+        call_kwargs: dict[str, Any],
+    ) -> Any:  # noqa: ANN401
+        if isinstance(response, Exception):
+            raise response
+        response_class = response_type.model_fields["response"].annotation
+        if isinstance(response, response_class):  # pyright: ignore [reportArgumentType]
+            return response
+        return response_class.model_validate(response)  # pyright: ignore [reportOptionalMemberAccess]
+
+    return replay
+
+
+def build_batch_requests(
+    fn: Callable[..., Any],
+    inputs: Iterable[Mapping[str, Any]],
+    *,
+    custom_id_prefix: str = "request",
+) -> list[BatchRequest]:
+    """Returns the batch requests for calling `fn` with each set of `inputs`.
+
+    No provider calls are made. The decorated call runs up until the provider call, and
+    the finalized `call_kwargs` are captured instead.
+
+    Args:
+        fn: The decorated call (e.g. decorated with `openai.call`).
+        inputs: The keyword arguments of each call.
+        custom_id_prefix: The prefix of the `custom_id` of each request.
+
+    Returns:
+        The requests, in the same order as `inputs`.
+    """
+
+    def capture(
+        response_type: type[BaseCallResponse],
+        create: Callable[..., Any],
+        call_kwargs: dict[str, Any],
+    ) -> Any:  # noqa: ANN401
+        raise _CapturedCall(call_kwargs)
+
+    requests: list[BatchRequest] = []
+    with intercept_create(capture):
+        for index, kwargs in enumerate(inputs):
+            try:
+                _run(fn, kwargs)
+            except _CapturedCall as captured:
+                requests.append(
+                    BatchRequest(
+                        custom_id=get_custom_id(index, custom_id_prefix),
+                        call_kwargs=to_jsonable_python(captured.call_kwargs),
+                    )
+                )
+            else:
+                raise ValueError(
+                    "Batch mode only supports non-streaming calls, but calling `fn` "
+                    "did not reach the provider call."
+                )
+    return requests
+
+
+def parse_batch_results(
+    fn: Callable[..., _R],
+    inputs: Sequence[Mapping[str, Any]],
+    responses: Mapping[str, Any],
+    *,
+    custom_id_prefix: str = "request",
+    return_exceptions: bool = True,
+) -> list[_R | Exception]:
+    """Returns the outputs of `fn` for each set of `inputs` from the batch `responses`.
+
+    Each output is whatever `fn` would have returned had it been called directly with
+    the same arguments (e.g. a call response or a `response_model` instance).
+
+    Args:
+        fn: The same decorated call that the batch requests were built with.
+        inputs: The same keyword arguments that the batch requests were built with.
+        responses: The provider responses (e.g. `ChatCompletion`) keyed by `custom_id`.
+            A `BatchRequestError` can be provided in place of a failed response.
+        custom_id_prefix: The prefix of the `custom_id` of each request.
+        return_exceptions: Whether to return exceptions (e.g. failed requests or
+            extraction errors) in place of their outputs instead of raising them.
+
+    Returns:
+        The outputs, in the same order as `inputs`.
+    """
+    outputs: list[_R | Exception] = []
+    for index, kwargs in enumerate(inputs):
+        custom_id = get_custom_id(index, custom_id_prefix)
+        response = responses.get(custom_id, None)
+        if response is None:
+            response = BatchRequestError(custom_id, "missing from the batch results")
+        try:
+            with intercept_create(_replay(response)):
+                outputs.append(_run(fn, kwargs))
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            outputs.append(e)
+    return outputs
@@ -0,0 +1,355 @@
+"""Pluggable caches for the provider responses of calls.
+
+While a cache is active (see `use_cache`), every call first looks up its provider
+response in the cache under a stable hash of the finalized `call_kwargs` (the model,
+messages, tools, and call params from `setup_call`) and the client's base URL. On a
+hit, the provider is not called and the full call response (or stream) is rebuilt from
+the cached response (or replayed from the cached chunks). On a miss, the provider
+response is stored once it has been received (or once the stream has been fully
+consumed). Calls whose `call_kwargs` include values without a stable representation
+(see `get_cache_key`) bypass the cache. Async calls use the cache's `aget` and `aset`,
+which run the lookups of disk-backed caches in a worker thread.
+
+Example:
+
+```python
+from mirascope.core import openai
+from mirascope.core.base import InMemoryCache, use_cache
+
+
+@openai.call("gpt-4o-mini")
+def recommend_book(genre: str) -> str:
+    return f"Recommend a {genre} book"
+
+
+with use_cache(InMemoryCache(max_size=256, ttl=3600)):
+    response = recommend_book("fantasy")  # calls the provider
+    response = recommend_book("fantasy")  # replays the cached response
+```
+
+Cached responses are serialized with `pickle`, so only point `SQLiteCache` and
+`DirectoryCache` at locations you trust.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any
+
+from pydantic_core import to_jsonable_python
+
+
+class BaseCache(ABC):
+    """The interface of a response cache.
+
+    Implementations store opaque serialized responses under string keys and are
+    responsible for their own eviction.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """Returns the value stored under `key`, or `None` if missing or expired."""
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes) -> None:
+        """Stores `value` under `key`."""
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes all stored values."""
+        ...
+
+    async def aget(self, key: str) -> bytes | None:
+        """Returns the value stored under `key` without blocking the event loop.
+
+        By default, `get` runs in a worker thread so that caches backed by disk or the
+        network don't block the event loop of async calls.
+        """
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: bytes) -> None:
+        """Stores `value` under `key` without blocking the event loop."""
+        await asyncio.to_thread(self.set, key, value)
+
+
+def _is_expired(stored_at: float, ttl: float | None) -> bool:
+    return ttl is not None and time.time() - stored_at > ttl
+
+
+class InMemoryCache(BaseCache):
+    """An in-memory LRU cache with optional size and time-to-live eviction.
+
+    Attributes:
+        max_size: The maximum number of responses to keep. The least recently used
+            response is evicted once the cache is full. If `None`, the size is
+            unbounded.
+        ttl: The time (in seconds) after which a stored response expires. If `None`,
+            responses never expire.
+    """
+
+    max_size: int | None
+    ttl: float | None
+
+    def __init__(self, max_size: int | None = 1024, ttl: float | None = None) -> None:
+        """Initializes an instance of `InMemoryCache`."""
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._values: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    def get(self, key: str) -> bytes | None:
+        """Returns the value stored under `key`, or `None` if missing or expired."""
+        with self._lock:
+            if (entry := self._values.get(key, None)) is None:
+                return None
+            if _is_expired(entry[0], self.ttl):
+                del self._values[key]
+                return None
+            self._values.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: bytes) -> None:
+        """Stores `value` under `key`, evicting the least recently used values."""
+        with self._lock:
+            self._values[key] = (time.time(), value)
+            self._values.move_to_end(key)
+            while self.max_size is not None and len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all stored values."""
+        with self._lock:
+            self._values.clear()
+
+    async def aget(self, key: str) -> bytes | None:
+        """Returns the value stored under `key` (an in-memory lookup never blocks)."""
+        return self.get(key)
+
+    async def aset(self, key: str, value: bytes) -> None:
+        """Stores `value` under `key` (an in-memory store never blocks)."""
+        self.set(key, value)
+
+    def __len__(self) -> int:
+        """Returns the number of stored values, including expired ones."""
+        return len(self._values)
+
+
+class SQLiteCache(BaseCache):
+    """A cache persisted to a SQLite database.
+
+    Attributes:
+        path: The path of the database file.
+        ttl: The time (in seconds) after which a stored response expires. If `None`,
+            responses never expire.
+    """
+
+    path: Path
+    ttl: float | None
+
+    def __init__(self, path: str | os.PathLike, ttl: float | None = None) -> None:
+        """Initializes an instance of `SQLiteCache`, creating the database if needed."""
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, stored_at REAL NOT NULL)"
+            )
+
+    def get(self, key: str) -> bytes | None:
+        """Returns the value stored under `key`, or `None` if missing or expired."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if _is_expired(row[1], self.ttl):
+                with self._connection:
+                    self._connection.execute(
+                        "DELETE FROM responses WHERE key = ?", (key,)
+                    )
+                return None
+            return row[0]
+
+    def set(self, key: str, value: bytes) -> None:
+        """Stores `value` under `key`."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+
+    def clear(self) -> None:
+        """Removes all stored values."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._connection.close()
+
+
+class DirectoryCache(BaseCache):
+    """A cache that stores each response as a file in a directory.
+
+    Attributes:
+        path: The path of the directory.
+        ttl: The time (in seconds) after which a stored response expires. If `None`,
+            responses never expire.
+    """
+
+    path: Path
+    ttl: float | None
+
+    def __init__(self, path: str | os.PathLike, ttl: float | None = None) -> None:
+        """Initializes an instance of `DirectoryCache`, creating the directory."""
+        self.path = Path(path)
+        self.ttl = ttl
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key}.pkl"
+
+    def get(self, key: str) -> bytes | None:
+        """Returns the value stored under `key`, or `None` if missing or expired."""
+        file = self._file(key)
+        try:
+            if _is_expired(file.stat().st_mtime, self.ttl):
+                file.unlink(missing_ok=True)
+                return None
+            return file.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, value: bytes) -> None:
+        """Stores `value` under `key`, replacing the file atomically."""
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(value)
+        os.replace(tmp, self._file(key))
+
+    def clear(self) -> None:
+        """Removes all stored values."""
+        for file in self.path.glob("*.pkl"):
+            file.unlink(missing_ok=True)
+
+
+_active_cache: ContextVar[BaseCache | None] = ContextVar("_active_cache", default=None)
+
+
+@contextmanager
+def use_cache(cache: BaseCache | None) -> Iterator[BaseCache | None]:
+    """Caches the provider responses of the calls made in this context in `cache`.
+
+    Passing `None` disables caching within the context.
+    """
+    token = _active_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _active_cache.reset(token)
+
+
+def get_active_cache() -> BaseCache | None:
+    """Returns the cache of the current context, if any."""
+    return _active_cache.get()
+
+
+def _stable_jsonable(value: Any) -> Any:  # noqa: ANN401
+    """Returns a stable representation of a provider object in `call_kwargs`.
+
+    Provider SDK objects (e.g. Vertex `Content`, Gemini `Tool` protos, and PIL images)
+    are represented by their content, never by their `repr`, which may embed memory
+    addresses that differ between runs.
+    """
+    if callable(to_dict := getattr(value, "to_dict", None)):
+        return to_dict()
+    if callable(to_proto := getattr(value, "to_proto", None)):
+        return to_proto()
+    if callable(to_dict := getattr(type(value), "to_dict", None)):
+        return to_dict(value)  # proto-plus messages
+    if callable(tobytes := getattr(value, "tobytes", None)):
+        return [getattr(value, "mode", None), getattr(value, "size", None), tobytes()]
+    raise TypeError(
+        f"Cannot compute a stable cache key for `{type(value).__name__}` values."
+    )
+
+
+_CLIENT_URL_ATTRIBUTES = (
+    ("_client", "base_url"),  # OpenAI, Anthropic, Groq
+    ("_config", "endpoint"),  # Azure
+    ("meta", "endpoint_url"),  # Bedrock
+    ("sdk_configuration", "server_url"),  # Mistral
+)
+
+
+def get_client_url(create: Callable[..., Any]) -> str | None:
+    """Returns the base URL of the client whose method `create` calls, if known.
+
+    `create` is the function returned by `get_create_fn` (or `get_async_create_fn`),
+    which wraps a method of the provider client or one of its resources.
+    """
+    owner = getattr(getattr(create, "__wrapped__", create), "__self__", None)
+    for attribute, url_attribute in _CLIENT_URL_ATTRIBUTES:
+        url = getattr(getattr(owner, attribute, None), url_attribute, None)
+        if isinstance(url, str) or type(url).__name__ == "URL":  # e.g. `httpx.URL`
+            return str(url)
+    return None
+
+
+def get_cache_key(
+    provider: str,
+    call_kwargs: Mapping[str, Any],
+    stream: bool,
+    client_url: str | None = None,
+) -> str:
+    """Returns the stable hash of a provider call used as its cache key.
+
+    The `call_kwargs` are normalized to JSON with sorted keys so that equal requests
+    hash equally regardless of how they were constructed. Binary content (e.g. image
+    bytes) is hashed by its base64 encoding. The `client_url` (see `get_client_url`)
+    keeps clients of the same provider that point at different servers (e.g. several
+    OpenAI-compatible servers) from sharing responses.
+
+    Raises:
+        TypeError: If `call_kwargs` includes a value without a stable representation.
+    """
+    jsonable = to_jsonable_python(
+        call_kwargs, bytes_mode="base64", fallback=_stable_jsonable
+    )
+    normalized = json.dumps(
+        [provider, client_url, stream, jsonable], sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+def dump_cached(value: Any) -> bytes | None:  # noqa: ANN401
+    """Returns the serialized `value`, or `None` if it cannot be serialized."""
+    try:
+        return pickle.dumps(value)
+    except Exception:
+        return None
+
+
+def load_cached(value: bytes) -> Any:  # noqa: ANN401
+    """Returns the deserialized cached `value`."""
+    return pickle.loads(value)  # noqa: S301
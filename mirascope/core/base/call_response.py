@@ -5,8 +5,9 @@ from __future__ import annotations
 import base64
 import json
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from functools import wraps
+from collections.abc import Callable, Mapping
+from concurrent.futures import Executor
+from functools import cached_property, wraps
 from typing import Any, ClassVar, Generic, TypeAlias, TypeVar
 
 from pydantic import (
@@ -17,12 +18,14 @@ from pydantic import (
     computed_field,
     field_serializer,
 )
+from typing_extensions import Self
 
-from ._utils import BaseType
+from ._utils import BaseType, call_tools, call_tools_async
 from .call_kwargs import BaseCallKwargs
 from .call_params import BaseCallParams
 from .dynamic_config import BaseDynamicConfig
 from .metadata import Metadata
+from .stream_timings import StreamTimings
 from .tool import BaseTool
 
 _ResponseT = TypeVar("_ResponseT", bound=Any)
@@ -121,6 +124,8 @@ class BaseCallResponse(
             message. Otherwise `None`.
         start_time: The start time of the completion in ms.
         end_time: The end time of the completion in ms.
+        timings: The latency timings of the stream, if the response was constructed
+            from one.
     """
 
     metadata: Metadata
@@ -135,6 +140,7 @@ class BaseCallResponse(
     user_message_param: _UserMessageParamT | None = None
     start_time: float
     end_time: float
+    timings: StreamTimings | None = None
 
     _provider: ClassVar[str] = "NO PROVIDER"
     _model: str = "NO MODEL"
@@ -151,6 +157,31 @@ class BaseCallResponse(
         """Returns the string content of the response."""
         return self.content
 
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        """Sets the attribute, dropping derived values that may depend on it."""
+        super().__setattr__(name, value)
+        self._clear_cached_properties()
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Returns a copy of the response, recomputing derived values if updated."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._clear_cached_properties()
+        return copied
+
+    def _clear_cached_properties(self) -> None:
+        """Drops the cached values of `cached_property` computed fields.
+
+        Derived values such as `tools` and `message_param` are computed (and validated)
+        once per response and then cached, so they must be dropped if the response
+        changes.
+        """
+        for name, info in self.__pydantic_computed_fields__.items():
+            if isinstance(info.wrapped_property, cached_property):
+                self.__dict__.pop(name, None)
+
     @property
     @abstractmethod
     def content(self) -> str:
@@ -254,3 +285,41 @@ class BaseCallResponse(
                 message parameters should be constructed.
         """
         ...
+
+    def call_tools(
+        self, *, timeout: float | None = None, executor: Executor | None = None
+    ) -> list[tuple[_BaseToolT, Any]]:
+        """Calls the response's tools concurrently, returning each with its output.
+
+        The result keeps the order of `tools`, so it can be passed directly to
+        `tool_message_params`.
+
+        Args:
+            timeout: The maximum number of seconds each tool may take.
+            executor: The executor (e.g. a `ThreadPoolExecutor` or `ProcessPoolExecutor`)
+                on which the tools are called (a thread pool sized to the tools if
+                `None`).
+
+        Raises:
+            TimeoutError: If a tool doesn't finish within `timeout` seconds.
+        """
+        return call_tools(self.tools or [], timeout=timeout, executor=executor)
+
+    async def call_tools_async(
+        self, *, timeout: float | None = None, executor: Executor | None = None
+    ) -> list[tuple[_BaseToolT, Any]]:
+        """Calls the response's tools concurrently, returning each with its output.
+
+        Async tools are awaited together and sync tools are run in the `executor` (the
+        event loop's default executor if `None`).
+
+        Args:
+            timeout: The maximum number of seconds each tool may take.
+            executor: The executor on which sync tools are called.
+
+        Raises:
+            TimeoutError: If a tool doesn't finish within `timeout` seconds.
+        """
+        return await call_tools_async(
+            self.tools or [], timeout=timeout, executor=executor
+        )
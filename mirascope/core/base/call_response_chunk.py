@@ -5,25 +5,80 @@ usage docs: learn/streams.md#handling-streamed-responses
 
 from __future__ import annotations
 
+import copy
 from abc import ABC, abstractmethod
 from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import TypeAdapter
+from typing_extensions import Self
 
 _ChunkT = TypeVar("_ChunkT", bound=Any)
 _FinishReasonT = TypeVar("_FinishReasonT", bound=Any)
 
+_serializer = TypeAdapter(Any)
 
-class BaseCallResponseChunk(BaseModel, Generic[_ChunkT, _FinishReasonT], ABC):
+
+class BaseCallResponseChunk(Generic[_ChunkT, _FinishReasonT], ABC):
     """A base abstract interface for LLM streaming response chunks.
 
+    A chunk wrapper is created for every chunk of a stream, so this is a lightweight
+    class with `__slots__` rather than a pydantic model. Subclasses should also set
+    `__slots__ = ()` and use `cached_chunk_property` for properties derived from the
+    chunk so that they are only computed once.
+
+    Extra attributes (set on init or later) are still supported, and `model_dump` and
+    `model_copy` behave like their pydantic counterparts. Chunks are not validated.
+
     Attributes:
         chunk: The original response chunk from whichever model response this wraps.
     """
 
+    # `__dict__` is only allocated once it is used (e.g. to set an extra attribute).
+    __slots__ = ("chunk", "_cache", "__dict__")
+
     chunk: _ChunkT
 
-    model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
+    def __init__(self, chunk: _ChunkT, **extra: Any) -> None:  # noqa: ANN401
+        """Initializes an instance of `BaseCallResponseChunk` wrapping `chunk`."""
+        self.chunk = chunk
+        self._cache: dict[str, Any] | None = None
+        if extra:
+            self.__dict__.update(extra)
+
+    def __repr__(self) -> str:
+        """Returns the representation of the chunk wrapper."""
+        return f"{type(self).__name__}(chunk={self.chunk!r})"
+
+    def __eq__(self, other: object) -> bool:
+        """Returns whether `other` wraps an equal chunk with the same wrapper type."""
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.chunk == other.chunk and self.__dict__ == other.__dict__  # pyright: ignore [reportAttributeAccessIssue]
+
+    __hash__ = None  # pyright: ignore [reportAssignmentType]
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:  # noqa: ANN401
+        """Returns the chunk (and any extra attributes) as a dictionary.
+
+        Keyword arguments (e.g. `mode`, `include` or `exclude`) are handled as in
+        `BaseModel.model_dump`.
+        """
+        return _serializer.dump_python({"chunk": self.chunk, **self.__dict__}, **kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:  # noqa: ANN401
+        """Returns the chunk (and any extra attributes) as a JSON string."""
+        data = {"chunk": self.chunk, **self.__dict__}
+        return _serializer.dump_json(data, **kwargs).decode()
+
+    def model_copy(
+        self, *, update: dict[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Returns a copy of the chunk wrapper with the `update` attributes applied."""
+        copied = copy.deepcopy(self) if deep else copy.copy(self)
+        copied._cache = None
+        for name, value in (update or {}).items():
+            setattr(copied, name, value)
+        return copied
 
     def __str__(self) -> str:
         """Returns the string content of the chunk."""
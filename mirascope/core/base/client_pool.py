@@ -0,0 +1,273 @@
+"""The `ClientPool` class for reusing provider clients across calls.
+
+When no `client` is provided to a call, the provider's default client is taken from
+the process-wide `default_client_pool` instead of being constructed for every call, so
+the underlying HTTP connection pool (and its TLS sessions and keep-alive connections)
+is reused across calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import inspect
+import os
+import threading
+from collections.abc import Callable, Coroutine, Hashable, Sequence
+from typing import Any, TypeVar
+
+from typing_extensions import TypedDict
+
+_ClientT = TypeVar("_ClientT")
+
+
+class ClientPoolLimits(TypedDict, total=False):
+    """The connection limits of the HTTP clients of pooled provider clients.
+
+    These map directly onto `httpx.Limits` and only apply to providers whose clients
+    use `httpx` under the hood. When no limits are set, each provider's SDK defaults are
+    used.
+
+    Attributes:
+        max_connections: The maximum number of concurrent connections.
+        max_keepalive_connections: The maximum number of idle keep-alive connections.
+        keepalive_expiry: The time (in seconds) to keep idle connections alive.
+    """
+
+    max_connections: int | None
+    max_keepalive_connections: int | None
+    keepalive_expiry: float | None
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _close(client: object) -> None:
+    if callable(close := getattr(client, "close", None)):
+        if inspect.iscoroutine(result := close()):
+            _run_coroutine(result)
+    elif callable(exit_ := getattr(client, "__exit__", None)):
+        exit_(None, None, None)
+
+
+async def _aclose(client: object) -> None:
+    if callable(aclose := getattr(client, "aclose", None)):
+        await aclose()
+    elif callable(close := getattr(client, "close", None)):
+        result = close()
+        if inspect.isawaitable(result):
+            await result
+    elif callable(aexit := getattr(client, "__aexit__", None)):
+        await aexit(None, None, None)
+    else:
+        _close(client)
+
+
+_closing_tasks: set[asyncio.Task] = set()
+
+
+def _run_coroutine(coroutine: Coroutine[Any, Any, Any]) -> None:
+    """Runs the `coroutine` as a task of the running loop, or to completion if none."""
+    if (loop := _running_loop()) is None:
+        asyncio.run(coroutine)
+        return
+    task = loop.create_task(coroutine)
+    _closing_tasks.add(task)  # The loop only keeps weak references to tasks.
+    task.add_done_callback(_closing_tasks.discard)
+
+
+async def _aclose_all(clients: list[Any]) -> None:
+    for client in clients:
+        await _aclose(client)
+
+
+def _close_on_loop(loop: asyncio.AbstractEventLoop, clients: list[Any]) -> None:
+    """Closes the async `clients` on the event `loop` that they are bound to."""
+    if loop.is_closed():
+        return
+    if loop is _running_loop():
+        _run_coroutine(_aclose_all(clients))
+    elif loop.is_running():
+        asyncio.run_coroutine_threadsafe(_aclose_all(clients), loop)
+    elif _running_loop() is None:
+        loop.run_until_complete(_aclose_all(clients))
+    else:
+        # An idle loop can't be run while another loop runs in this thread.
+        thread = threading.Thread(
+            target=loop.run_until_complete, args=(_aclose_all(clients),)
+        )
+        thread.start()
+        thread.join()
+
+
+class ClientPool:
+    """A registry of provider clients that are reused across calls.
+
+    Clients are keyed by their type (which identifies the provider and whether it is
+    sync or async), the values of the environment variables they are configured from,
+    and an optional provider-specific key (e.g. the model and `vertexai.init`
+    configuration for Vertex). Async clients are additionally keyed by the running event
+    loop since their connections are bound to the loop that created them.
+
+    Example:
+
+    ```python
+    from mirascope.core.base import default_client_pool
+
+    default_client_pool.configure({"max_connections": 50})
+
+    ...  # calls without a `client` reuse the pooled clients
+
+    default_client_pool.close()
+    ```
+
+    The pool can also be used as a (async) context manager that closes its clients on
+    exit, e.g. in the lifespan of a web application:
+
+    ```python
+    async with default_client_pool:
+        ...
+    ```
+    """
+
+    def __init__(self, limits: ClientPoolLimits | None = None) -> None:
+        """Initializes an instance of `ClientPool` with the given `limits`."""
+        self._limits: ClientPoolLimits = limits or ClientPoolLimits()
+        self._lock = threading.Lock()
+        self._clients: dict[Hashable, Any] = {}
+        # Async clients (through their transports) keep their loop alive, so the
+        # clients of closed loops are removed explicitly rather than by weak keys.
+        self._async_clients: dict[asyncio.AbstractEventLoop, dict[Hashable, Any]] = {}
+
+    @property
+    def limits(self) -> ClientPoolLimits:
+        """Returns the connection limits used when constructing new clients."""
+        return self._limits
+
+    def configure(self, limits: ClientPoolLimits) -> None:
+        """Sets the connection `limits` of the pool's clients.
+
+        Clients that have already been constructed are closed so that the new limits
+        apply to every subsequent call.
+        """
+        self.close()
+        self._limits = limits
+
+    def get(
+        self,
+        client_type: Callable[..., _ClientT],
+        *,
+        is_async: bool = False,
+        env: Sequence[str] = (),
+        key: Hashable = None,
+        create: Callable[[ClientPoolLimits], _ClientT] | None = None,
+    ) -> _ClientT:
+        """Returns the pooled client of `client_type`, constructing it on first use.
+
+        Args:
+            client_type: The type of the client (e.g. `OpenAI` or `AsyncOpenAI`).
+            is_async: Whether the client is used asynchronously and is therefore bound
+                to the running event loop.
+            env: The environment variables the client reads its configuration from. A
+                new client is constructed whenever any of their values change.
+            key: An additional provider-specific key for the client.
+            create: A function that constructs the client using the pool's limits. If
+                `None`, the client is constructed by calling `client_type()`.
+
+        Returns:
+            The pooled client.
+        """
+        client_key = (client_type, tuple(os.environ.get(var) for var in env), key)
+        with self._lock:
+            self._remove_closed_loops()
+            clients = self._clients
+            if is_async and (loop := _running_loop()) is not None:
+                clients = self._async_clients.setdefault(loop, {})
+            if (client := clients.get(client_key, None)) is None:
+                client = clients[client_key] = (
+                    create(self._limits) if create else client_type()
+                )
+        return client
+
+    def _remove_closed_loops(self) -> None:
+        """Removes the async clients of event loops that have been closed.
+
+        Their connections were bound to the closed loop, so they can't be closed
+        anymore and are released once the clients are garbage collected.
+        """
+        for loop in [loop for loop in self._async_clients if loop.is_closed()]:
+            del self._async_clients[loop]
+
+    def close(self) -> None:
+        """Closes and removes all of the pooled clients.
+
+        Async clients are closed on their own event loop: in a task if it's the running
+        loop or running in another thread, or to completion if the loop is idle. The
+        async clients of loops that are already closed can't be closed anymore, so
+        their connections are only released once they are garbage collected.
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            async_clients = list(self._async_clients.items())
+            self._async_clients = {}
+        for client in clients:
+            _close(client)
+        for loop, loop_clients in async_clients:
+            _close_on_loop(loop, list(loop_clients.values()))
+
+    async def aclose(self) -> None:
+        """Closes and removes the pooled clients, awaiting the async ones.
+
+        Only the async clients of the running event loop are closed here. The async
+        clients of other loops are closed by calling `aclose` from within those loops
+        (or by `close`).
+        """
+        loop = _running_loop()
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            if loop is not None:
+                clients += self._async_clients.pop(loop, {}).values()
+        for client in clients:
+            await _aclose(client)
+
+    def __enter__(self) -> ClientPool:
+        """Returns the pool, closing its clients on exit."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Closes the pooled clients."""
+        self.close()
+
+    async def __aenter__(self) -> ClientPool:
+        """Returns the pool, closing its clients on exit."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Closes the pooled clients."""
+        await self.aclose()
+
+
+default_client_pool = ClientPool()
+"""The process-wide pool used for calls made without a `client`."""
+
+atexit.register(default_client_pool.close)
+
+
+def create_httpx_client(limits: ClientPoolLimits, is_async: bool) -> Any:  # noqa: ANN401
+    """Returns an `httpx` client with the given `limits`, or `None` if none are set.
+
+    Providers whose SDKs are built on `httpx` use this to construct the HTTP client of
+    their pooled clients so that the pool's limits apply.
+    """
+    if not limits:
+        return None
+    import httpx
+
+    http_client_type = httpx.AsyncClient if is_async else httpx.Client
+    return http_client_type(limits=httpx.Limits(**limits))
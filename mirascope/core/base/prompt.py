@@ -15,14 +15,14 @@ from pydantic import BaseModel
 
 from ._utils import (
     BaseType,
+    CompiledTemplate,
     MessagesDecorator,
+    compile_template,
     fn_is_async,
-    format_template,
     get_fn_args,
     get_metadata,
     get_prompt_template,
     messages_decorator,
-    parse_prompt_messages,
 )
 from .call_response import BaseCallResponse
 from .dynamic_config import BaseDynamicConfig
@@ -72,25 +72,21 @@ class BasePrompt(BaseModel):
 
     def __str__(self) -> str:
         """Returns the formatted template."""
-        prompt_template = get_prompt_template(self)
-        prompt_template = (
-            prompt_template.replace(":images}", "}")
-            .replace(":image}", "}")
-            .replace(":audios}", "}")
-            .replace(":audio}", "}")
-            .replace(":documents}", "}")
-            .replace(":document}", "}")
-            .replace(":texts}", "}")
-            .replace(":text", "")
-        )
-        return format_template(prompt_template, self.model_dump())
+        return self.compiled_template().format(self.model_dump())
+
+    @classmethod
+    def compiled_template(cls) -> CompiledTemplate:
+        """Returns the `CompiledTemplate` of the prompt's template.
+
+        The template is only parsed the first time, so rendering many instances of the
+        same prompt (e.g. for an offline evaluation) only fills in the values.
+        """
+        return compile_template(get_prompt_template(cls), SUPPORTED_MESSAGE_ROLES)  # pyright: ignore [reportArgumentType]
 
     def message_params(self) -> list[BaseMessageParam]:
         """Returns the list of parsed message parameters."""
-        return parse_prompt_messages(
-            roles=SUPPORTED_MESSAGE_ROLES,
-            template=get_prompt_template(self),
-            attrs={field: getattr(self, field) for field in self.model_fields},
+        return self.compiled_template().message_params(
+            {field: getattr(self, field) for field in self.model_fields}
         )
 
     def dynamic_config(self) -> BaseDynamicConfig:
@@ -307,6 +303,8 @@ _BasePromptT = TypeVar("_BasePromptT", bound=BasePrompt)
 
 
 class PromptDecorator(Protocol):
+    compiled_template: CompiledTemplate
+
     @overload
     def __call__(
         self, prompt: Callable[_P, BaseDynamicConfig]
@@ -362,6 +360,10 @@ def prompt_template(
     # Output: [BaseMessageParam(role='user', content='Recommend a fantasy book')]
     ```
 
+    The template is compiled once when the decorator is created and exposed as its
+    `compiled_template` attribute so that it can be rendered directly with
+    `compiled_template.message_params(attrs)` without parsing it again.
+
     Returns:
         decorator (Callable): The decorator function that turns the decorated function
             into a prompt template.
@@ -373,6 +375,8 @@ def prompt_template(
         decorator.__mirascope_prompt_template__ = True  # pyright: ignore [reportAttributeAccessIssue]
         return decorator
 
+    compiled_template = compile_template(template, SUPPORTED_MESSAGE_ROLES)
+
     @overload
     def inner(
         prompt: Callable[_P, BaseDynamicConfig],
@@ -407,9 +411,7 @@ def prompt_template(
             async def get_base_message_params_async(
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> list[BaseMessageParam]:
-                return parse_prompt_messages(
-                    roles=SUPPORTED_MESSAGE_ROLES,
-                    template=template,
+                return compiled_template.message_params(
                     attrs=get_fn_args(prompt, args, kwargs),
                     dynamic_config=await prompt(*args, **kwargs),
                 )
@@ -423,9 +425,7 @@ def prompt_template(
             def get_base_message_params(
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> list[BaseMessageParam]:
-                return parse_prompt_messages(
-                    roles=SUPPORTED_MESSAGE_ROLES,
-                    template=template,
+                return compiled_template.message_params(
                     attrs=get_fn_args(prompt, args, kwargs),
                     dynamic_config=prompt(*args, **kwargs),
                 )
@@ -434,6 +434,7 @@ def prompt_template(
             return get_base_message_params
 
     inner.__mirascope_prompt_template__ = True  # pyright: ignore [reportFunctionMemberAccess]
+    inner.compiled_template = compiled_template  # pyright: ignore [reportFunctionMemberAccess]
     return inner
 
 
@@ -0,0 +1,53 @@
+"""The `single_flight` decorator for de-duplicating identical in-flight calls.
+
+When many threads or coroutines make an identical call (the same finalized
+`call_kwargs`) at the same time, only one provider request is sent. The other callers
+wait for its response, and streams attach to the same feed of chunks, so a burst of
+identical requests (e.g. hot cache misses behind a web endpoint) costs one request.
+
+Example:
+
+```python
+from mirascope.core import openai
+from mirascope.core.base import single_flight
+
+
+@single_flight
+@openai.call("gpt-4o-mini")
+def recommend_book(genre: str) -> str:
+    return f"Recommend a {genre} book"
+```
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import wraps
+from typing import Any, TypeVar
+
+from ._utils import fn_is_async, single_flight_context
+from .batch import add_batch_methods
+
+_F = TypeVar("_F", bound=Callable)
+
+
+def single_flight(fn: _F) -> _F:
+    """Returns `fn` with identical concurrent provider calls de-duplicated.
+
+    Must be applied on top of a provider's call decorator (e.g. `openai.call`).
+    """
+    if fn_is_async(fn):
+
+        @wraps(fn)
+        async def inner_async(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            with single_flight_context():
+                return await fn(*args, **kwargs)
+
+        return add_batch_methods(inner_async)  # pyright: ignore [reportReturnType]
+
+    @wraps(fn)
+    def inner(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        with single_flight_context():
+            return fn(*args, **kwargs)
+
+    return add_batch_methods(inner)  # pyright: ignore [reportReturnType]
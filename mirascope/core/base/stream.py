@@ -1,8 +1,17 @@
 """This module contains the base classes for streaming responses from LLMs."""
 
-import datetime
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Generator
+from collections.abc import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Generator,
+    Hashable,
+)
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import suppress
 from functools import wraps
 from typing import (
     Any,
@@ -14,17 +23,37 @@ from typing import (
     overload,
 )
 
+from typing_extensions import Self
+
 from ._utils import (
     HandleStream,
     HandleStreamAsync,
     SameSyncAndAsyncClientSetupCall,
     SetupCall,
+    SlowConsumerPolicy,
+    StreamTee,
+    StreamThrottle,
+    TeeConsumer,
+    TextBuffer,
+    call_tools,
+    call_tools_async,
+    close_stream,
+    close_stream_async,
+    coalesce_chunks,
+    coalesce_chunks_async,
+    collect_tool_outputs,
+    collect_tool_outputs_async,
     fn_is_async,
+    get_call_plan,
+    get_chunk_coalescer,
     get_dynamic_configuration,
-    get_fn_args,
     get_metadata,
     get_possible_user_message_param,
     is_prompt_template,
+    prepare_create_stream,
+    prepare_create_stream_async,
+    schedule_tool_async,
+    submit_tool,
 )
 from .call_kwargs import BaseCallKwargs
 from .call_params import BaseCallParams
@@ -34,6 +63,8 @@ from .dynamic_config import BaseDynamicConfig
 from .messages import Messages
 from .metadata import Metadata
 from .prompt import prompt_template
+from .stream_config import StreamConfig
+from .stream_timings import StreamTimings
 from .tool import BaseTool
 
 _BaseCallResponseT = TypeVar("_BaseCallResponseT", bound=BaseCallResponse)
@@ -78,7 +109,6 @@ class BaseStream(
             None,
         ]
     )
-    content: str
     metadata: Metadata
     tool_types: list[type[_BaseToolT]] | None
     call_response_type: type[_BaseCallResponseT]
@@ -97,8 +127,20 @@ class BaseStream(
     finish_reasons: list[_FinishReason] | None = None
     start_time: float = 0
     end_time: float = 0
+    timings: StreamTimings | None = None
+    cancelled: bool = False
+    tools: list[_BaseToolT]
 
     _provider: ClassVar[str] = "NO PROVIDER"
+    _content: TextBuffer
+    _stop_when: Callable[[_BaseCallResponseChunkT, _BaseToolT | None], bool] | None = (
+        None
+    )
+    _eager_tools: bool = False
+    _tool_executor: Executor | None = None
+    _tool_pool: ThreadPoolExecutor | None = None
+    _tool_futures: list[Future | asyncio.Future]
+    _async_iterator: AsyncGenerator | None = None
 
     def __init__(
         self,
@@ -118,9 +160,14 @@ class BaseStream(
         messages: list[_MessageParamT],
         call_params: _BaseCallParamsT,
         call_kwargs: BaseCallKwargs[_ToolSchemaT],
+        stream_config: StreamConfig | None = None,
     ) -> None:
         """Initializes an instance of `BaseStream`."""
         self.content = ""
+        self.tools, self._tool_futures = [], []
+        if stream_config:
+            self._eager_tools = stream_config.get("eager_tools", False)
+            self._tool_executor = stream_config.get("tool_executor", None)
         self.stream = stream
         self.metadata = metadata
         self.tool_types = tool_types
@@ -134,6 +181,15 @@ class BaseStream(
         self.call_kwargs = call_kwargs
         self.user_message_param = get_possible_user_message_param(messages)  # pyright: ignore [reportAttributeAccessIssue]
 
+    @property
+    def content(self) -> str:
+        """Returns the content streamed so far."""
+        return str(self._content)
+
+    @content.setter
+    def content(self, content: str) -> None:
+        self._content = TextBuffer(content)
+
     def __iter__(
         self,
     ) -> Generator[tuple[_BaseCallResponseChunkT, _BaseToolT | None], None, None]:
@@ -141,19 +197,39 @@ class BaseStream(
         assert isinstance(
             self.stream, Generator
         ), "Stream must be a generator for __iter__"
-        self.content, tool_calls = "", []
-        self.start_time = datetime.datetime.now().timestamp() * 1000
-        for chunk, tool in self.stream:
-            self._update_properties(chunk)
-            if tool:
-                tool_call = getattr(tool, "tool_call", _DEFAULT)
-                if tool_call != _DEFAULT:
-                    tool_calls.append(tool_call)
-            yield chunk, tool
-        self.end_time = datetime.datetime.now().timestamp() * 1000
-        self.message_param = self._construct_message_param(
-            tool_calls or None, self.content
-        )
+        self.content, self.tools, self._tool_futures, tool_calls = "", [], [], []
+        tool_types = set(self.tool_types or ())
+        timings = self.timings = StreamTimings()
+        self.start_time = timings.start_time
+        try:
+            for chunk, tool in self.stream:
+                if self.cancelled:
+                    break
+                timings.record_chunk(bool(chunk.content), tool is not None)
+                self._update_properties(chunk)
+                if tool:
+                    tool_call = getattr(tool, "tool_call", _DEFAULT)
+                    if tool_call != _DEFAULT:
+                        tool_calls.append(tool_call)
+                    if type(tool) in tool_types:
+                        self.tools.append(tool)
+                        if self._eager_tools:
+                            self._submit_tool(tool)
+                yield chunk, tool
+                if self._stop_when is not None and self._stop_when(chunk, tool):
+                    self.cancelled = True
+                    break
+        finally:
+            # Closes the provider's stream if the loop ended early or was abandoned.
+            self.stream.close()
+            if self._tool_pool is not None:
+                # The tools that were already submitted still finish.
+                self._tool_pool.shutdown(wait=False)
+                self._tool_pool = None
+            self.end_time = self.start_time + timings.record_end()
+            self.message_param = self._construct_message_param(
+                tool_calls or None, self.content
+            )
 
     def __aiter__(
         self,
@@ -167,23 +243,124 @@ class BaseStream(
             assert isinstance(
                 self.stream, AsyncGenerator
             ), "Stream must be an async generator for __aiter__"
-            tool_calls = []
-            async for chunk, tool in self.stream:
-                self._update_properties(chunk)
-                if tool:
-                    tool_call = getattr(tool, "tool_call", _DEFAULT)
-                    if tool_call != _DEFAULT:
-                        tool_calls.append(tool_call)
-                yield chunk, tool
-            self.message_param = self._construct_message_param(
-                tool_calls or None, self.content
-            )
+            self.tools, self._tool_futures, tool_calls = [], [], []
+            tool_types = set(self.tool_types or ())
+            timings = self.timings = StreamTimings()
+            self.start_time = timings.start_time
+            try:
+                async for chunk, tool in self.stream:
+                    if self.cancelled:
+                        break
+                    timings.record_chunk(bool(chunk.content), tool is not None)
+                    self._update_properties(chunk)
+                    if tool:
+                        tool_call = getattr(tool, "tool_call", _DEFAULT)
+                        if tool_call != _DEFAULT:
+                            tool_calls.append(tool_call)
+                        if type(tool) in tool_types:
+                            self.tools.append(tool)
+                            if self._eager_tools:
+                                self._tool_futures.append(
+                                    schedule_tool_async(tool, self._tool_executor)
+                                )
+                    yield chunk, tool
+                    if self._stop_when is not None and self._stop_when(chunk, tool):
+                        self.cancelled = True
+                        break
+            finally:
+                await self.stream.aclose()
+                self.end_time = self.start_time + timings.record_end()
+                self.message_param = self._construct_message_param(
+                    tool_calls or None, self.content
+                )
+
+        self._async_iterator = generator()
+        return self._async_iterator
+
+    def cancel(self) -> None:
+        """Stops the stream early and closes the provider's connection.
+
+        Any iteration in progress finishes after the chunks it has already received, so
+        the content streamed so far (and `construct_call_response`) is still available.
+        When the stream is currently waiting for a chunk in another thread or task, or
+        is an async stream (see `acancel`), it stops as soon as the next chunk arrives.
+
+        Simply breaking out of the loop over a sync stream has the same effect. An async
+        stream is only finalized once its iterator is closed, so await `acancel` after
+        breaking out of the loop to access the partial response.
+        """
+        self.cancelled = True
+        if isinstance(self.stream, Generator):
+            with suppress(ValueError):  # The stream is running in another thread.
+                self.stream.close()
+
+    async def acancel(self) -> None:
+        """Stops an async stream early and closes the provider's connection.
+
+        See `cancel` for details.
+        """
+        self.cancelled = True
+        if self._async_iterator is not None:
+            with suppress(RuntimeError):  # The stream is running in another task.
+                await self._async_iterator.aclose()
+        if isinstance(self.stream, AsyncGenerator):
+            with suppress(RuntimeError):
+                await self.stream.aclose()
+
+    def stop_when(
+        self,
+        predicate: Callable[[_BaseCallResponseChunkT, _BaseToolT | None], bool],
+    ) -> Self:
+        """Stops the stream after the first chunk for which `predicate` returns `True`.
+
+        The stream is then cancelled (see `cancel`) without generating further tokens.
+
+        Example:
 
-        return generator()
+        ```python
+        stream = answer_question("...").stop_when(
+            lambda chunk, tool: "</answer>" in chunk.content
+        )
+        ```
+
+        Returns:
+            The stream itself, so that it can be iterated directly.
+        """
+        self._stop_when = predicate
+        return self
+
+    def tee(
+        self,
+        n: int = 2,
+        *,
+        max_buffer: int | None = None,
+        policy: SlowConsumerPolicy = "block",
+    ) -> tuple[TeeConsumer[tuple[_BaseCallResponseChunkT, _BaseToolT | None]], ...]:
+        """Returns `n` consumers that each iterate over every chunk of the stream.
+
+        The stream itself is only iterated once, so its properties (and
+        `construct_call_response`) are available as soon as any consumer has finished.
+        Consumers are iterated the same way as the stream (sync or async).
+
+        Args:
+            n: The number of consumers.
+            max_buffer: The maximum number of chunks buffered for each consumer, or
+                `None` for unbounded buffers.
+            policy: What to do when a consumer's buffer is full: `"block"` the other
+                consumers until it catches up (they must run in separate threads or
+                tasks), `"drop"` its oldest chunk, or `"spill"` past `max_buffer`.
+
+        Example:
+
+        ```python
+        sse, log = recommend_book("fantasy").tee(2)
+        ```
+        """
+        return StreamTee(self, n, max_buffer=max_buffer, policy=policy).consumers
 
     def _update_properties(self, chunk: _BaseCallResponseChunkT) -> None:
         """Updates the properties of the stream."""
-        self.content += chunk.content
+        self._content.append(chunk.content)
         if chunk.input_tokens is not None:
             self.input_tokens = (
                 chunk.input_tokens
@@ -203,6 +380,25 @@ class BaseStream(
         if chunk.finish_reasons is not None:
             self.finish_reasons = chunk.finish_reasons
 
+    @classmethod
+    def _mergeable_text(cls, chunk: Any) -> tuple[Hashable, str] | None:  # noqa: ANN401
+        """Returns the merge key and text of a raw provider chunk if it can be merged.
+
+        Adjacent raw chunks with the same key are merged into a single raw chunk when a
+        `coalesce_*` option is set in the `StreamConfig`. Providers that support this
+        override both this and `_merge_chunks`, otherwise chunks are never merged.
+        """
+        return None
+
+    @classmethod
+    def _merge_chunks(cls, chunk: Any, text: str) -> Any:  # noqa: ANN401
+        """Returns a copy of the raw provider `chunk` with its text replaced by `text`.
+
+        Only called for streams that override `_mergeable_text` as well (which
+        `get_chunk_coalescer` checks), so by default `chunk` is returned unchanged.
+        """
+        return chunk
+
     @property
     @abstractmethod
     def cost(self) -> float | None:
@@ -227,6 +423,69 @@ class BaseStream(
         """
         return self.call_response_type.tool_message_params(tools_and_outputs)
 
+    def _submit_tool(self, tool: _BaseToolT) -> None:
+        """Starts calling the streamed `tool` while the stream continues."""
+        if (executor := self._tool_executor) is None:
+            if self._tool_pool is None:
+                self._tool_pool = ThreadPoolExecutor()
+            executor = self._tool_pool
+        self._tool_futures.append(submit_tool(tool, executor))
+
+    def call_tools(
+        self, *, timeout: float | None = None, executor: Executor | None = None
+    ) -> list[tuple[_BaseToolT, Any]]:
+        """Calls the streamed tools concurrently, returning each with its output.
+
+        The stream must be iterated first. The result keeps the order in which the tools
+        were streamed, so it can be passed directly to `tool_message_params`.
+
+        If the stream was configured with `eager_tools`, the tools were already called
+        as they were streamed, and this only collects their outputs.
+
+        Args:
+            timeout: The maximum number of seconds each tool may take (for eager tools,
+                measured from when their outputs are collected).
+            executor: The executor on which the tools are called (a thread pool sized
+                to the tools if `None`). Ignored for eager tools.
+
+        Raises:
+            TimeoutError: If a tool doesn't finish within `timeout` seconds.
+        """
+        if self._eager_tools:
+            assert all(
+                isinstance(future, Future) for future in self._tool_futures
+            ), "Use `call_tools_async` for tools called eagerly by an async stream"
+            return collect_tool_outputs(
+                self.tools,
+                cast(list[Future], self._tool_futures),
+                timeout,
+            )
+        return call_tools(self.tools, timeout=timeout, executor=executor)
+
+    async def call_tools_async(
+        self, *, timeout: float | None = None, executor: Executor | None = None
+    ) -> list[tuple[_BaseToolT, Any]]:
+        """Calls the streamed tools concurrently, returning each with its output.
+
+        Async tools are awaited together and sync tools are run in the `executor` (the
+        event loop's default executor if `None`). If the stream was configured with
+        `eager_tools`, this only collects the outputs of the tools already called.
+
+        Args:
+            timeout: The maximum number of seconds each tool may take (for eager tools,
+                measured from when their outputs are collected).
+            executor: The executor on which sync tools are called. Ignored for eager
+                tools.
+
+        Raises:
+            TimeoutError: If a tool doesn't finish within `timeout` seconds.
+        """
+        if self._eager_tools:
+            return await collect_tool_outputs_async(
+                self.tools, self._tool_futures, timeout
+            )
+        return await call_tools_async(self.tools, timeout=timeout, executor=executor)
+
     @abstractmethod
     def construct_call_response(self) -> _BaseCallResponseT:
         """Constructs the call response."""
@@ -284,6 +543,7 @@ def stream_factory(  # noqa: ANN201
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | None,
         call_params: _BaseCallParamsT,
         partial_tools: bool,
+        stream_config: StreamConfig | None = None,
     ) -> Callable[_P, BaseStream]: ...
 
     @overload
@@ -295,6 +555,7 @@ def stream_factory(  # noqa: ANN201
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | None,
         call_params: _BaseCallParamsT,
         partial_tools: bool,
+        stream_config: StreamConfig | None = None,
     ) -> Callable[_P, BaseStream]: ...
 
     @overload
@@ -310,6 +571,7 @@ def stream_factory(  # noqa: ANN201
         client: _SameSyncAndAsyncClientT | _AsyncBaseClientT | None,
         call_params: _BaseCallParamsT,
         partial_tools: bool,
+        stream_config: StreamConfig | None = None,
     ) -> Callable[_P, Awaitable[BaseStream]]: ...
 
     @overload
@@ -321,6 +583,7 @@ def stream_factory(  # noqa: ANN201
         client: _SameSyncAndAsyncClientT | _AsyncBaseClientT | None,
         call_params: _BaseCallParamsT,
         partial_tools: bool,
+        stream_config: StreamConfig | None = None,
     ) -> Callable[_P, Awaitable[BaseStream]]: ...
 
     def decorator(
@@ -338,6 +601,7 @@ def stream_factory(  # noqa: ANN201
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | _AsyncBaseClientT | None,
         call_params: _BaseCallParamsT,
         partial_tools: bool,
+        stream_config: StreamConfig | None = None,
     ) -> Callable[_P, BaseStream] | Callable[_P, Awaitable[BaseStream]]:
         if not is_prompt_template(fn):
             fn = cast(
@@ -351,11 +615,12 @@ def stream_factory(  # noqa: ANN201
             )
         fn._model = model  # pyright: ignore [reportFunctionMemberAccess]
         fn.__mirascope_call__ = True  # pyright: ignore [reportFunctionMemberAccess]
+        call_plan = get_call_plan(fn)
         if fn_is_async(fn):
 
             @wraps(fn)
             async def inner_async(*args: _P.args, **kwargs: _P.kwargs) -> BaseStream:
-                fn_args = get_fn_args(fn, args, kwargs)
+                fn_args = call_plan.bind(args, kwargs)
                 dynamic_config = await get_dynamic_configuration(fn, args, kwargs)
                 nonlocal client
                 if dynamic_config is not None:
@@ -372,18 +637,30 @@ def stream_factory(  # noqa: ANN201
                     extract=False,
                     stream=True,
                 )
+                open_stream = prepare_create_stream_async(
+                    TCallResponse, create, call_kwargs
+                )
 
                 async def generator() -> (
                     AsyncGenerator[
                         tuple[_BaseCallResponseChunkT, _BaseToolT | None], None
                     ]
                 ):
-                    async for chunk, tool in handle_stream_async(
-                        await create(stream=True, **call_kwargs),
+                    chunks = source = await open_stream()
+                    if coalescer := get_chunk_coalescer(stream_config, TStream):
+                        chunks = coalesce_chunks_async(chunks, coalescer)
+                    handled = handle_stream_async(
+                        chunks,  # pyright: ignore [reportArgumentType]
                         tool_types,
                         partial_tools=partial_tools,
-                    ):
-                        yield chunk, tool
+                        throttle=StreamThrottle.from_config(stream_config),
+                    )
+                    try:
+                        async for chunk, tool in handled:
+                            yield chunk, tool
+                    finally:
+                        await close_stream_async(handled)
+                        await close_stream_async(source)
 
                 return TStream(
                     stream=generator(),
@@ -397,6 +674,7 @@ def stream_factory(  # noqa: ANN201
                     messages=messages,
                     call_params=call_params,
                     call_kwargs=call_kwargs,
+                    stream_config=stream_config,
                 )
 
             return inner_async
@@ -404,7 +682,7 @@ def stream_factory(  # noqa: ANN201
 
             @wraps(fn)
             def inner(*args: _P.args, **kwargs: _P.kwargs) -> BaseStream:
-                fn_args = get_fn_args(fn, args, kwargs)
+                fn_args = call_plan.bind(args, kwargs)
                 dynamic_config = get_dynamic_configuration(fn, args, kwargs)
                 nonlocal client
                 if dynamic_config is not None:
@@ -421,6 +699,7 @@ def stream_factory(  # noqa: ANN201
                     extract=False,
                     stream=True,
                 )
+                open_stream = prepare_create_stream(TCallResponse, create, call_kwargs)
 
                 def generator() -> (
                     Generator[
@@ -429,11 +708,18 @@ def stream_factory(  # noqa: ANN201
                         None,
                     ]
                 ):
-                    yield from handle_stream(
-                        create(stream=True, **call_kwargs),
-                        tool_types,
-                        partial_tools=partial_tools,
-                    )
+                    chunks = source = open_stream()
+                    if coalescer := get_chunk_coalescer(stream_config, TStream):
+                        chunks = coalesce_chunks(chunks, coalescer)
+                    try:
+                        yield from handle_stream(
+                            chunks,  # pyright: ignore [reportArgumentType]
+                            tool_types,
+                            partial_tools=partial_tools,
+                            throttle=StreamThrottle.from_config(stream_config),
+                        )
+                    finally:
+                        close_stream(source)
 
                 return TStream(
                     stream=generator(),
@@ -447,6 +733,7 @@ def stream_factory(  # noqa: ANN201
                     messages=messages,
                     call_params=call_params,
                     call_kwargs=call_kwargs,
+                    stream_config=stream_config,
                 )
 
             return inner
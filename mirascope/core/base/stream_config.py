@@ -1,11 +1,35 @@
+from concurrent.futures import Executor
 from typing import TypedDict
 
 
-class StreamConfig(TypedDict):
+class StreamConfig(TypedDict, total=False):
     """Configuration options for streaming.
 
     Attributes:
         partial_tools (bool): Whether to stream partial tool responses
+        changes_only (bool): Whether to only emit partial tools and partial structured
+            outputs when their parsed value changed
+        min_interval_ms (float): Emit partial tools and partial structured outputs at
+            most once per this many milliseconds
+        min_bytes (int): Emit partial tools and partial structured outputs at most once
+            per this many bytes of new content
+        coalesce_chunks (int): Merge up to this many adjacent text chunks of the
+            provider's stream into one chunk before they are processed
+        coalesce_bytes (int): Merge adjacent text chunks until their text reaches this
+            many bytes
+        coalesce_ms (float): Merge adjacent text chunks until this many milliseconds
+            have passed since the first one (checked as each chunk arrives)
+        eager_tools (bool): Whether to start calling each tool as soon as it has been
+            streamed, while the rest of the response is still streaming
+        tool_executor (Executor): The executor on which eager tools are called
     """
 
     partial_tools: bool
+    changes_only: bool
+    min_interval_ms: float
+    min_bytes: int
+    coalesce_chunks: int
+    coalesce_bytes: int
+    coalesce_ms: float
+    eager_tools: bool
+    tool_executor: Executor
@@ -0,0 +1,84 @@
+"""This module contains the `StreamTimings` class.
+
+usage docs: learn/streams.md#stream-timings
+"""
+
+from __future__ import annotations
+
+import datetime
+import time
+
+from pydantic import BaseModel, Field, PrivateAttr
+
+
+class StreamTimings(BaseModel):
+    """The latency timings of a stream, measured with a monotonic high-resolution clock.
+
+    All durations are in milliseconds since the request was started (i.e. since the
+    stream started being iterated).
+
+    Attributes:
+        start_time: The wall-clock start time of the request in ms since the epoch.
+        time_to_first_chunk: The time until the first chunk was received.
+        time_to_first_token: The time until the first chunk with content was received.
+        time_to_first_tool_call: The time until the first (partial) tool was received.
+        duration: The time until the stream finished.
+        chunk_gaps: The time between each pair of consecutive chunks.
+    """
+
+    start_time: float = Field(
+        default_factory=lambda: datetime.datetime.now().timestamp() * 1000
+    )
+    time_to_first_chunk: float | None = None
+    time_to_first_token: float | None = None
+    time_to_first_tool_call: float | None = None
+    duration: float | None = None
+    chunk_gaps: list[float] = Field(default_factory=list)
+
+    _start: float = PrivateAttr(default=0)
+    _last_chunk: float | None = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: object) -> None:
+        """Starts the monotonic clock that all durations are measured with."""
+        self._start = time.perf_counter()
+
+    @property
+    def end_time(self) -> float | None:
+        """Returns the wall-clock end time of the stream in ms since the epoch."""
+        return None if self.duration is None else self.start_time + self.duration
+
+    def record_chunk(self, has_content: bool, has_tool: bool) -> None:
+        """Records the arrival of a chunk (and whether it has content or a tool)."""
+        now = time.perf_counter()
+        elapsed = (now - self._start) * 1000
+        if self._last_chunk is None:
+            self.time_to_first_chunk = elapsed
+        else:
+            self.chunk_gaps.append((now - self._last_chunk) * 1000)
+        self._last_chunk = now
+        if has_content and self.time_to_first_token is None:
+            self.time_to_first_token = elapsed
+        if has_tool and self.time_to_first_tool_call is None:
+            self.time_to_first_tool_call = elapsed
+
+    def record_end(self) -> float:
+        """Records that the stream finished, returning its duration."""
+        self.duration = (time.perf_counter() - self._start) * 1000
+        return self.duration
+
+    def chunk_gap_percentile(self, percentile: float) -> float | None:
+        """Returns the given percentile (0-100) of the gaps between chunks.
+
+        Percentiles are linearly interpolated between the closest recorded gaps, so
+        `chunk_gap_percentile(50)` is the median gap. Returns `None` if fewer than two
+        chunks were received.
+        """
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100, not {percentile}.")
+        if not self.chunk_gaps:
+            return None
+        gaps = sorted(self.chunk_gaps)
+        position = (len(gaps) - 1) * percentile / 100
+        lower = int(position)
+        upper = min(lower + 1, len(gaps) - 1)
+        return gaps[lower] + (gaps[upper] - gaps[lower]) * (position - lower)
@@ -8,6 +8,7 @@ from collections.abc import (
     Generator,
     Iterable,
 )
+from copy import deepcopy
 from functools import wraps
 from typing import (
     Any,
@@ -18,15 +19,25 @@ from typing import (
     overload,
 )
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from typing_extensions import Self
 
 from ._utils import (
     BaseType,
     GetJsonOutput,
+    IncrementalJsonParser,
     SameSyncAndAsyncClientSetupCall,
     SetupCall,
+    SlowConsumerPolicy,
+    StreamTee,
+    StreamThrottle,
+    TeeConsumer,
+    TextBuffer,
+    close_stream,
+    close_stream_async,
     extract_tool_return,
     fn_is_async,
+    get_iterable_element_type,
     setup_extract_tool,
 )
 from ._utils._get_fields_from_call_args import (
@@ -37,6 +48,7 @@ from .call_response import BaseCallResponse
 from .call_response_chunk import BaseCallResponseChunk
 from .dynamic_config import BaseDynamicConfig
 from .stream import BaseStream, stream_factory
+from .stream_config import StreamConfig
 from .tool import BaseTool
 
 _BaseCallResponseT = TypeVar("_BaseCallResponseT", bound=BaseCallResponse)
@@ -50,11 +62,19 @@ _ResponseModelT = TypeVar("_ResponseModelT", bound=BaseModel | BaseType)
 
 
 class BaseStructuredStream(Generic[_ResponseModelT]):
-    """A base class for streaming structured outputs from LLMs."""
+    """A base class for streaming structured outputs from LLMs.
+
+    By default, each chunk yields the partial response model constructed so far, and the
+    final item is the complete response model. When the response model is `Iterable[T]`,
+    each element of type `T` is instead yielded exactly once as soon as it is complete.
+    """
 
     stream: BaseStream
     response_model: type[_ResponseModelT]
     constructed_response_model: _ResponseModelT
+    cancelled: bool = False
+
+    _stop_when: Callable[[_ResponseModelT], bool] | None = None
 
     def __init__(
         self,
@@ -62,64 +82,240 @@ class BaseStructuredStream(Generic[_ResponseModelT]):
         stream: BaseStream,
         response_model: type[_ResponseModelT],
         fields_from_call_args: dict[str, Any],
+        stream_config: StreamConfig | None = None,
     ) -> None:
         """Initializes an instance of `BaseStructuredStream`."""
         self.stream = stream
         self.response_model = response_model
         self.fields_from_call_args = fields_from_call_args
+        self.stream_config = stream_config
+        element_type = get_iterable_element_type(response_model)
+        self._element_adapter = (
+            TypeAdapter(element_type) if element_type is not None else None
+        )
+        self._reset()
 
-    def __iter__(self) -> Generator[_ResponseModelT, None, None]:
-        """Iterates over the stream and extracts structured outputs."""
-        json_output = ""
-        for chunk, _ in self.stream:
-            json_output += chunk.content
-            if json_output and json_output[0] != "{":
-                try:
-                    json_start = json_output.index("{")
-                    json_output = json_output[json_start:]
-                except ValueError:
-                    json_output = ""
-            if chunk.model is not None:
-                self.stream.model = chunk.model
-            if json_output:
-                yield extract_tool_return(
-                    self.response_model, json_output, True, self.fields_from_call_args
+    @property
+    def completed_fields(self) -> set[str]:
+        """Returns the fields of the JSON output streamed so far whose values are complete.
+
+        Partial models include values that are still being streamed (e.g. the start of
+        a string), so use this to check which fields are final (e.g. with `stop_when`).
+        """
+        return self._parser.completed_keys()
+
+    def cancel(self) -> None:
+        """Stops the stream early and closes the provider's connection.
+
+        The stream then ends without validating the full response model, and
+        `constructed_response_model` is the last partial model yielded (or the elements
+        yielded so far for an `Iterable` response model).
+        """
+        self.cancelled = True
+        self.stream.cancel()
+
+    async def acancel(self) -> None:
+        """Stops an async stream early and closes the provider's connection.
+
+        See `cancel` for details.
+        """
+        self.cancelled = True
+        await self.stream.acancel()
+
+    def stop_when(self, predicate: Callable[[_ResponseModelT], bool]) -> Self:
+        """Stops the stream after the first output for which `predicate` returns `True`.
+
+        The stream is then cancelled (see `cancel`), e.g. to stop generating tokens once
+        the fields you need are complete:
+
+        ```python
+        stream = extract_book("...")
+        stream.stop_when(lambda _: {"title", "author"} <= stream.completed_fields)
+        ```
+
+        Returns:
+            The stream itself, so that it can be iterated directly.
+        """
+        self._stop_when = predicate
+        return self
+
+    def tee(
+        self,
+        n: int = 2,
+        *,
+        max_buffer: int | None = None,
+        policy: SlowConsumerPolicy = "block",
+    ) -> tuple[TeeConsumer[_ResponseModelT], ...]:
+        """Returns `n` consumers that each iterate over every output of the stream.
+
+        The stream itself is only iterated once, so `constructed_response_model` is
+        available as soon as any consumer has finished. See `BaseStream.tee` for the
+        meaning of `max_buffer` and `policy`.
+        """
+        return StreamTee(self, n, max_buffer=max_buffer, policy=policy).consumers
+
+    def _reset(self) -> None:
+        self._json_output = TextBuffer()
+        self._parser = IncrementalJsonParser()
+        self._partial_model: _ResponseModelT | None = None
+        self._snapshot: dict[str, Any] = {}
+        self._stale = True
+        self._throttle = StreamThrottle.from_config(self.stream_config)
+        self._elements: list[Any] = []
+
+    def _feed(self, content: str) -> bool:
+        """Parses the JSON `content` of a chunk, returning whether the value changed.
+
+        The JSON is parsed incrementally, so each chunk only costs its own length to
+        parse. Any text before the start of the JSON object is skipped.
+        """
+        if not self._json_output:
+            if (json_start := content.find("{")) == -1:
+                return False
+            content = content[json_start:]
+        self._json_output.append(content)
+        return self._parser.feed(content)
+
+    def _update_partial(self, content: str) -> _ResponseModelT | None:
+        """Returns the partial model to yield for the JSON `content` of a chunk, if any.
+
+        The partial model is only re-validated when the parsed value changed, and the
+        stream's `StreamConfig` can hold back partial models (e.g. unchanged ones).
+        """
+        changed = self._feed(content)
+        if not self._json_output:
+            return None
+        self._stale = self._stale or changed
+        if (
+            self._throttle is not None
+            and self._throttle.update(content, changed) is None
+        ):
+            return None
+        if self._stale:
+            self._partial_model = extract_tool_return(
+                self.response_model,
+                self._take_snapshot(),
+                True,
+                self.fields_from_call_args,
+            )
+            self._stale = False
+        return self._partial_model
+
+    def _take_snapshot(self) -> Any:  # noqa: ANN401
+        """Returns a copy of the parsed value that later chunks won't change.
+
+        The parser updates its containers in place, and partial models may keep
+        references to them (e.g. for `Any` or `dict` fields). Only the top-level values
+        that changed since the last snapshot are copied.
+        """
+        json_obj = self._parser.value
+        if not isinstance(json_obj, dict):
+            return deepcopy(json_obj)
+        changed_keys = self._parser.changed_keys
+        self._snapshot = {
+            key: deepcopy(value)
+            if key in changed_keys or key not in self._snapshot
+            else self._snapshot[key]
+            for key, value in json_obj.items()
+        }
+        self._parser.clear_changed_keys()
+        return dict(self._snapshot)
+
+    def _update_elements(self, content: str) -> list[Any]:
+        """Returns the elements completed by the JSON `content` of a chunk."""
+        # Closing an element doesn't change the parsed value, so we always check.
+        self._feed(content)
+        json_obj = self._parser.value
+        if not isinstance(json_obj, dict) or not isinstance(
+            items := json_obj.get("value"), list
+        ):
+            return []
+        completed = items[len(self._elements) : self._parser.completed_length(items)]
+        elements = [self._validate_element(item) for item in completed]
+        self._elements.extend(elements)
+        return elements
+
+    def _validate_element(self, item: Any) -> Any:  # noqa: ANN401
+        assert self._element_adapter is not None
+        if self.fields_from_call_args and isinstance(item, dict):
+            item = item | self.fields_from_call_args
+        return self._element_adapter.validate_python(item)
+
+    def _construct_response_model(self) -> _ResponseModelT:
+        if self._element_adapter is not None:
+            if not self._parser.done:
+                raise ValueError(
+                    "The stream ended before the JSON array of elements was complete."
                 )
+            self.constructed_response_model = self._elements  # pyright: ignore [reportAttributeAccessIssue]
+            return self.constructed_response_model
+        json_output = str(self._json_output)
         if json_output:
             json_output = json_output[: json_output.rfind("}") + 1]
         self.constructed_response_model = extract_tool_return(
             self.response_model, json_output, False, self.fields_from_call_args
         )
-        yield self.constructed_response_model
+        return self.constructed_response_model
+
+    def _outputs(self, content: str) -> list[Any]:
+        """Returns the outputs to yield for the JSON `content` of a chunk."""
+        if self._element_adapter is not None:
+            return self._update_elements(content)
+        partial_model = self._update_partial(content)
+        return [] if partial_model is None else [partial_model]
+
+    def _final_outputs(self) -> list[Any]:
+        """Returns the outputs to yield once the stream has ended."""
+        if self.cancelled:
+            self.constructed_response_model = (  # pyright: ignore [reportAttributeAccessIssue]
+                self._elements
+                if self._element_adapter is not None
+                else self._partial_model
+            )
+            return []
+        response_model = self._construct_response_model()
+        return [response_model] if self._element_adapter is None else []
+
+    def __iter__(self) -> Generator[_ResponseModelT, None, None]:
+        """Iterates over the stream and extracts structured outputs."""
+        self._reset()
+        chunks = iter(self.stream)
+        try:
+            for chunk, _ in chunks:
+                if self.cancelled:
+                    break
+                if chunk.model is not None:
+                    self.stream.model = chunk.model
+                for output in self._outputs(chunk.content):
+                    yield output
+                    if self._stop_when is not None and self._stop_when(output):
+                        self.cancel()
+                        break
+        finally:
+            close_stream(chunks)
+        yield from self._final_outputs()
 
     def __aiter__(self) -> AsyncGenerator[_ResponseModelT, None]:
         """Iterates over the stream and extracts structured outputs."""
 
         async def generator() -> AsyncGenerator[_ResponseModelT, None]:
-            json_output = ""
-            async for chunk, _ in self.stream:
-                json_output += chunk.content
-                if json_output and json_output[0] != "{":
-                    try:
-                        json_start = json_output.index("{")
-                        json_output = json_output[json_start:]
-                    except ValueError:
-                        json_output = ""
-                if chunk.model is not None:
-                    self.stream.model = chunk.model
-                if json_output:
-                    yield extract_tool_return(
-                        self.response_model,
-                        json_output,
-                        True,
-                        self.fields_from_call_args,
-                    )
-            if json_output:
-                json_output = json_output[: json_output.rfind("}") + 1]
-            self.constructed_response_model = extract_tool_return(
-                self.response_model, json_output, False, self.fields_from_call_args
-            )
-            yield self.constructed_response_model
+            self._reset()
+            chunks = aiter(self.stream)
+            try:
+                async for chunk, _ in chunks:
+                    if self.cancelled:
+                        break
+                    if chunk.model is not None:
+                        self.stream.model = chunk.model
+                    for output in self._outputs(chunk.content):
+                        yield output
+                        if self._stop_when is not None and self._stop_when(output):
+                            await self.acancel()
+                            break
+            finally:
+                await close_stream_async(chunks)
+            for output in self._final_outputs():
+                yield output
 
         return generator()
 
@@ -168,7 +364,11 @@ def structured_stream_factory(  # noqa: ANN201
     get_json_output: GetJsonOutput[_BaseCallResponseChunkT],
 ):
     class CustomContentChunk(TCallResponseChunk):
-        json_output: str
+        __slots__ = ("json_output",)
+
+        def __init__(self, chunk: Any, json_output: str) -> None:  # noqa: ANN401
+            super().__init__(chunk)
+            self.json_output = json_output
 
         @property
         def content(self) -> str:
@@ -182,6 +382,7 @@ def structured_stream_factory(  # noqa: ANN201
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        stream_config: StreamConfig | None = None,
     ) -> Callable[
         _P,
         Iterable[_ResponseModelT],
@@ -195,6 +396,7 @@ def structured_stream_factory(  # noqa: ANN201
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _AsyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        stream_config: StreamConfig | None = None,
     ) -> Callable[
         _P,
         Awaitable[AsyncIterable[_ResponseModelT]],
@@ -208,6 +410,7 @@ def structured_stream_factory(  # noqa: ANN201
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | _AsyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        stream_config: StreamConfig | None = None,
     ) -> Callable[
         _P,
         Iterable[_ResponseModelT] | Awaitable[AsyncIterable[_ResponseModelT]],
@@ -228,6 +431,7 @@ def structured_stream_factory(  # noqa: ANN201
             stream: Generator[_ResponseChunkT, None, None],
             tool_types: list[type[_BaseToolT]] | None,
             partial_tools: bool = False,
+            throttle: StreamThrottle | None = None,
         ) -> Generator[tuple[_BaseCallResponseChunkT, None], None, None]:
             for chunk in stream:
                 yield handle_chunk(chunk)
@@ -236,6 +440,7 @@ def structured_stream_factory(  # noqa: ANN201
             stream: AsyncGenerator[_AsyncResponseChunkT, None],
             tool_types: list[type[_BaseToolT]] | None,
             partial_tools: bool = False,
+            throttle: StreamThrottle | None = None,
         ) -> AsyncGenerator[tuple[_BaseCallResponseChunkT, None], None]:
             async for chunk in stream:
                 yield handle_chunk(chunk)
@@ -248,16 +453,25 @@ def structured_stream_factory(  # noqa: ANN201
             handle_stream_async=handle_stream_async,
         )
 
-        tool = setup_extract_tool(response_model, TToolType)
-        stream_decorator_kwargs = {
-            "model": model,
-            "tools": [tool],
-            "json_mode": json_mode,
-            "client": client,
-            "call_params": call_params,
-        }
+        element_type = get_iterable_element_type(response_model)
+        tool = setup_extract_tool(
+            list[element_type] if element_type is not None else response_model,  # pyright: ignore [reportArgumentType]
+            TToolType,
+        )
         fn._model = model  # pyright: ignore [reportFunctionMemberAccess]
         fn.__mirascope_call__ = True  # pyright: ignore [reportFunctionMemberAccess]
+        # Decorating once here (rather than on every call) lets the underlying stream
+        # reuse its compiled `CallPlan` across invocations.
+        stream_fn = stream_decorator(
+            fn=fn,
+            model=model,
+            tools=[tool],
+            json_mode=json_mode,
+            client=client,
+            call_params=call_params,
+            partial_tools=False,
+            stream_config=stream_config,
+        )
         if fn_is_async(fn):
 
             @wraps(fn)
@@ -265,14 +479,13 @@ def structured_stream_factory(  # noqa: ANN201
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> AsyncIterable[_ResponseModelT]:
                 fields_from_call_args = get_fields_from_call_args(
-                    response_model, fn, args, kwargs
+                    element_type or response_model, fn, args, kwargs
                 )
                 return BaseStructuredStream[_ResponseModelT](
-                    stream=await stream_decorator(fn=fn, **stream_decorator_kwargs)(
-                        *args, **kwargs
-                    ),
+                    stream=await stream_fn(*args, **kwargs),
                     response_model=response_model,
                     fields_from_call_args=fields_from_call_args,
+                    stream_config=stream_config,
                 )
 
             return inner_async
@@ -281,14 +494,13 @@ def structured_stream_factory(  # noqa: ANN201
             @wraps(fn)
             def inner(*args: _P.args, **kwargs: _P.kwargs) -> Iterable[_ResponseModelT]:
                 fields_from_call_args = get_fields_from_call_args(
-                    response_model, fn, args, kwargs
+                    element_type or response_model, fn, args, kwargs
                 )
                 return BaseStructuredStream[_ResponseModelT](
-                    stream=stream_decorator(fn=fn, **stream_decorator_kwargs)(
-                        *args, **kwargs
-                    ),
+                    stream=stream_fn(*args, **kwargs),
                     response_model=response_model,
                     fields_from_call_args=fields_from_call_args,
+                    stream_config=stream_config,
                 )
 
             return inner
@@ -9,7 +9,9 @@ import inspect
 import warnings
 from abc import abstractmethod
 from collections.abc import Callable
+from copy import deepcopy
 from typing import Any, ClassVar, TypeVar
+from weakref import WeakKeyDictionary
 
 import jiter
 from pydantic import BaseModel, ConfigDict
@@ -28,6 +30,13 @@ from . import _utils
 _BaseToolT = TypeVar("_BaseToolT", bound=BaseModel)
 _ToolSchemaT = TypeVar("_ToolSchemaT")
 
+# The cached values never reference their tool type, so weak keys are enough to make
+# sure that dynamically created tool types (e.g. from toolkits) can still be collected.
+_json_schemas: WeakKeyDictionary[type[BaseTool], dict[tuple, JsonSchemaValue]] = (
+    WeakKeyDictionary()
+)
+_tool_schemas: WeakKeyDictionary[type[BaseTool], Any] = WeakKeyDictionary()
+
 
 class ToolConfig(TypedDict, total=False):
     """A base class for tool configurations."""
@@ -164,6 +173,16 @@ class BaseTool(BaseModel):
             "This method should be implemented in provider-specific tool classes."
         )
 
+    @classmethod
+    def _cached_tool_schema(cls) -> Any:  # noqa: ANN401
+        """Returns the provider-specific `tool_schema()`, generating it only once.
+
+        The returned schema is shared across calls and must be treated as read-only.
+        """
+        if (tool_schema := _tool_schemas.get(cls, None)) is None:
+            tool_schema = _tool_schemas[cls] = cls.tool_schema()
+        return tool_schema
+
     @classmethod
     def model_json_schema(
         cls,
@@ -172,14 +191,22 @@ class BaseTool(BaseModel):
         schema_generator: type[GenerateJsonSchema] = GenerateJsonSchemaNoTitles,
         mode: JsonSchemaMode = "validation",
     ) -> dict[str, Any]:
-        """Returns the generated JSON schema for the class."""
-        cls.warn_for_unsupported_configurations()
-        return super().model_json_schema(
-            by_alias=by_alias,
-            ref_template=ref_template,
-            schema_generator=schema_generator,
-            mode=mode,
-        )
+        """Returns the generated JSON schema for the class.
+
+        The schema is generated once per class and schema generator (and the other
+        arguments), so this returns a copy that callers are free to mutate.
+        """
+        key = (by_alias, ref_template, schema_generator, mode)
+        json_schemas = _json_schemas.setdefault(cls, {})
+        if (json_schema := json_schemas.get(key, None)) is None:
+            cls.warn_for_unsupported_configurations()
+            json_schema = json_schemas[key] = super().model_json_schema(
+                by_alias=by_alias,
+                ref_template=ref_template,
+                schema_generator=schema_generator,
+                mode=mode,
+            )
+        return deepcopy(json_schema)
 
     @classmethod
     def warn_for_unsupported_configurations(cls) -> None:
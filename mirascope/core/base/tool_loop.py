@@ -0,0 +1,298 @@
+"""The `ToolLoop` class for running a call and its tools until the LLM is done.
+
+usage docs: learn/tools.md#tool-loops
+"""
+
+from __future__ import annotations
+
+import inspect
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor
+from typing import Any, Literal, TypeAlias
+
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation
+
+from ._utils import fn_is_async
+from .call_response import BaseCallResponse
+from .stream import BaseStream
+from .stream_timings import StreamTimings
+from .tool import BaseTool
+
+ToolLoopStopReason: TypeAlias = Literal["done", "max_steps", "max_tokens"]
+
+
+class ToolLoopStep(BaseModel):
+    """The telemetry of a single step (a call and its tool calls) of a `ToolLoop`.
+
+    Attributes:
+        response: The response of the call (or the stream, once it was iterated).
+        tools_and_outputs: The tools the LLM asked for and their outputs.
+        call_duration: The time the call took (including streaming) in ms.
+        tools_duration: The time it took to call the tools in ms.
+        input_tokens: The number of input tokens of the call.
+        output_tokens: The number of output tokens of the call.
+        cost: The cost of the call in dollars.
+        timings: The latency timings of the call, if it was streamed.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    response: SkipValidation[BaseCallResponse | BaseStream]
+    tools_and_outputs: SkipValidation[list[tuple[BaseTool, Any]]] = Field(
+        default_factory=list
+    )
+    call_duration: float
+    tools_duration: float = 0
+    input_tokens: int | float | None = None
+    output_tokens: int | float | None = None
+    cost: float | None = None
+    timings: StreamTimings | None = None
+
+
+class ToolLoopResult(BaseModel):
+    """The result of running a `ToolLoop`.
+
+    Attributes:
+        response: The response of the last call (or the stream, once it was iterated).
+        history: The history the loop appended each step's messages to.
+        steps: The telemetry of each step.
+        stop_reason: Why the loop stopped: the LLM didn't ask for any more tools
+            (`"done"`), or the `max_steps` or `max_tokens` limit was reached.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    response: SkipValidation[BaseCallResponse | BaseStream]
+    history: SkipValidation[list[Any]]
+    steps: list[ToolLoopStep]
+    stop_reason: ToolLoopStopReason
+
+    @property
+    def content(self) -> str:
+        """Returns the string content of the last response."""
+        return self.response.content
+
+    @property
+    def input_tokens(self) -> int | float:
+        """Returns the number of input tokens of all steps."""
+        return sum(step.input_tokens or 0 for step in self.steps)
+
+    @property
+    def output_tokens(self) -> int | float:
+        """Returns the number of output tokens of all steps."""
+        return sum(step.output_tokens or 0 for step in self.steps)
+
+    @property
+    def cost(self) -> float | None:
+        """Returns the cost of all steps in dollars, if known for every step."""
+        if any(step.cost is None for step in self.steps):
+            return None
+        return sum(step.cost or 0 for step in self.steps)
+
+    @property
+    def duration(self) -> float:
+        """Returns the time spent on calls and tools across all steps in ms."""
+        return sum(step.call_duration + step.tools_duration for step in self.steps)
+
+
+class ToolLoop:
+    """Runs a call in a loop, calling the tools it asks for until it's done.
+
+    Each step makes the call, appends its `message_param` and the `tool_message_params`
+    of the tools it asked for to the history, and calls again with the updated history.
+    The loop stops once a response doesn't ask for any tools, or when a limit is
+    reached. The tools of each response are called concurrently (see `call_tools`).
+
+    The history is passed to the call as its `history_arg` argument, so the call must
+    include it in its messages. It is appended in place with the provider's
+    message params, so earlier steps are never converted again. If the call streams,
+    each chunk is passed to `on_chunk` as it arrives, and tools streamed with the
+    `eager_tools` stream option are already running before the stream ends.
+
+    Example:
+
+    ```python
+    from mirascope.core import Messages, openai
+    from mirascope.core.base import ToolLoop
+
+
+    def get_book_author(title: str) -> str:
+        return "Patrick Rothfuss" if title == "The Name of the Wind" else "Unknown"
+
+
+    @openai.call("gpt-4o-mini", tools=[get_book_author])
+    def librarian(history: list) -> Messages.Type:
+        return [Messages.System("You are a librarian"), *history]
+
+
+    result = ToolLoop(librarian, max_steps=5).run(
+        history=[Messages.User("Who wrote The Name of the Wind?")]
+    )
+    print(result.content, result.output_tokens, len(result.steps))
+    ```
+    """
+
+    def __init__(
+        self,
+        fn: Callable[..., Any],
+        *,
+        history_arg: str = "history",
+        max_steps: int = 10,
+        max_tokens: int | None = None,
+        tool_timeout: float | None = None,
+        tool_executor: Executor | None = None,
+        on_chunk: Callable[[Any, BaseTool | None], None] | None = None,
+        on_step: Callable[[ToolLoopStep], None] | None = None,
+    ) -> None:
+        """Initializes an instance of `ToolLoop`.
+
+        Args:
+            fn: The decorated call (which may stream) to run in the loop.
+            history_arg: The name of the call's argument that takes the history.
+            max_steps: The maximum number of calls to make.
+            max_tokens: The maximum number of input and output tokens (summed over all
+                steps) after which no more calls are made.
+            tool_timeout: The maximum number of seconds each tool may take.
+            tool_executor: The executor on which (sync) tools are called.
+            on_chunk: Called with each `(chunk, tool)` of streamed calls.
+            on_step: Called with the telemetry of each step once it's finished.
+
+        Raises:
+            ValueError: If `max_steps` is less than 1.
+        """
+        if max_steps < 1:
+            raise ValueError(f"`max_steps` must be at least 1, not {max_steps}.")
+        self.fn = fn
+        self.history_arg = history_arg
+        self.max_steps = max_steps
+        self.max_tokens = max_tokens
+        self.tool_timeout = tool_timeout
+        self.tool_executor = tool_executor
+        self.on_chunk = on_chunk
+        self.on_step = on_step
+
+    def _get_history(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> list[Any]:
+        """Returns the history passed to the call, adding an empty one to `kwargs`."""
+        if self.history_arg in kwargs:
+            return kwargs[self.history_arg]
+        try:
+            arguments = inspect.signature(self.fn).bind_partial(*args).arguments
+        except (TypeError, ValueError):  # the call itself reports invalid arguments
+            arguments = {}
+        if self.history_arg in arguments:  # passed positionally
+            return arguments[self.history_arg]
+        history = kwargs[self.history_arg] = []
+        return history
+
+    def _check_response(self, response: object) -> BaseCallResponse | BaseStream:
+        if not isinstance(response, BaseCallResponse | BaseStream):
+            raise ValueError(
+                "A `ToolLoop` call must return a call response or a stream, not "
+                f"{type(response).__name__}."
+            )
+        return response
+
+    def _finish_step(
+        self,
+        history: list[Any],
+        steps: list[ToolLoopStep],
+        response: BaseCallResponse | BaseStream,
+        tools_and_outputs: list[tuple[BaseTool, Any]],
+        call_duration: float,
+        tools_duration: float,
+    ) -> ToolLoopResult | None:
+        """Records the step, returning the result if the loop should stop."""
+        if tools_and_outputs:
+            history += response.tool_message_params(tools_and_outputs)
+        step = ToolLoopStep(
+            response=response,
+            tools_and_outputs=tools_and_outputs,
+            call_duration=call_duration,
+            tools_duration=tools_duration,
+            input_tokens=response.input_tokens,
+            output_tokens=response.output_tokens,
+            cost=response.cost,
+            timings=response.timings,
+        )
+        steps.append(step)
+        if self.on_step is not None:
+            self.on_step(step)
+        stop_reason: ToolLoopStopReason | None = None
+        if not tools_and_outputs:
+            stop_reason = "done"
+        elif self.max_tokens is not None and (
+            sum((s.input_tokens or 0) + (s.output_tokens or 0) for s in steps)
+            >= self.max_tokens
+        ):
+            stop_reason = "max_tokens"
+        elif len(steps) >= self.max_steps:
+            stop_reason = "max_steps"
+        if stop_reason is None:
+            return None
+        return ToolLoopResult(
+            response=response, history=history, steps=steps, stop_reason=stop_reason
+        )
+
+    def run(self, *args: Any, **kwargs: Any) -> ToolLoopResult:  # noqa: ANN401
+        """Runs the loop, passing `args` and `kwargs` to every call.
+
+        If the history is passed (by `history_arg` or positionally), that list is
+        appended to in place. Otherwise the loop starts from an empty history.
+        """
+        assert not fn_is_async(self.fn), "Use `run_async` for async calls"
+        history = self._get_history(args, kwargs)
+        steps: list[ToolLoopStep] = []
+        while True:
+            start = time.perf_counter()
+            response = self._check_response(self.fn(*args, **kwargs))
+            if isinstance(response, BaseStream):
+                for chunk, tool in response:
+                    if self.on_chunk is not None:
+                        self.on_chunk(chunk, tool)
+            history.append(response.message_param)
+            tools_start = time.perf_counter()
+            tools_and_outputs = response.call_tools(
+                timeout=self.tool_timeout, executor=self.tool_executor
+            )
+            end = time.perf_counter()
+            if result := self._finish_step(
+                history,
+                steps,
+                response,
+                tools_and_outputs,
+                (tools_start - start) * 1000,
+                (end - tools_start) * 1000,
+            ):
+                return result
+
+    async def run_async(self, *args: Any, **kwargs: Any) -> ToolLoopResult:  # noqa: ANN401
+        """Runs the loop with an async call, passing `args` and `kwargs` to every call.
+
+        If the history is passed (by `history_arg` or positionally), that list is
+        appended to in place. Otherwise the loop starts from an empty history.
+        """
+        history = self._get_history(args, kwargs)
+        steps: list[ToolLoopStep] = []
+        while True:
+            start = time.perf_counter()
+            response = self._check_response(await self.fn(*args, **kwargs))
+            if isinstance(response, BaseStream):
+                async for chunk, tool in response:
+                    if self.on_chunk is not None:
+                        self.on_chunk(chunk, tool)
+            history.append(response.message_param)
+            tools_start = time.perf_counter()
+            tools_and_outputs = await response.call_tools_async(
+                timeout=self.tool_timeout, executor=self.tool_executor
+            )
+            end = time.perf_counter()
+            if result := self._finish_step(
+                history,
+                steps,
+                response,
+                tools_and_outputs,
+                (tools_start - start) * 1000,
+                (end - tools_start) * 1000,
+            ):
+                return result
@@ -8,6 +8,7 @@ from mypy_boto3_bedrock_runtime.type_defs import (
 )
 from typing_extensions import TypedDict
 
+from ...base._utils import StreamThrottle, TextBuffer, ToolIndex, get_tool_index
 from .._types import (
     AsyncStreamOutputChunk,
     StreamOutputChunk,
@@ -19,7 +20,7 @@ from ..tool import BedrockTool
 
 class ToolUseChunk(TypedDict):
     tool_use_id: str
-    input_chunk: str
+    input_chunk: TextBuffer
     name: str
     stop: bool
 
@@ -27,21 +28,21 @@ class ToolUseChunk(TypedDict):
 def _handle_chunk(
     chunk: StreamOutputChunk | AsyncStreamOutputChunk,
     current_tool_use_chunk: ToolUseChunk | None,
-    tool_types: list[type[BedrockTool]] | None,
+    tool_index: ToolIndex[BedrockTool] | None,
 ) -> tuple[
     BedrockCallResponseChunk | None,
     BedrockTool | None,
     ToolUseChunk | None,
 ]:
     """Handles a chunk of the stream."""
-    if not tool_types:
+    if not tool_index:
         return BedrockCallResponseChunk(chunk=chunk), None, None
     elif (content_block_start := chunk.get("contentBlockStart")) and (
         tool_use := content_block_start["start"].get("toolUse")
     ):
         current_tool_use_chunk = ToolUseChunk(
             tool_use_id=tool_use["toolUseId"],
-            input_chunk="",
+            input_chunk=TextBuffer(),
             name=tool_use["name"],
             stop=False,
         )
@@ -51,26 +52,25 @@ def _handle_chunk(
         and current_tool_use_chunk
         and not current_tool_use_chunk["stop"]
     ):
-        current_tool_use_chunk["input_chunk"] += tool_use["input"]
+        current_tool_use_chunk["input_chunk"].append(tool_use["input"])
         return None, None, current_tool_use_chunk
     elif "contentBlockStop" in chunk and current_tool_use_chunk:
         current_tool_use_chunk["stop"] = True
         return None, None, current_tool_use_chunk
     elif current_tool_use_chunk and current_tool_use_chunk["stop"]:
-        for tool_type in tool_types:
-            if current_tool_use_chunk["name"] == tool_type._name():
-                current_tool_use = ToolUseBlockContentTypeDef(
-                    toolUse=ToolUseBlockOutputTypeDef(
-                        toolUseId=current_tool_use_chunk["tool_use_id"],
-                        input=json.loads(current_tool_use_chunk["input_chunk"]),
-                        name=current_tool_use_chunk["name"],
-                    )
-                )
-                return (
-                    BedrockCallResponseChunk(chunk=chunk),
-                    tool_type.from_tool_call(current_tool_use),
-                    None,
-                )
+        tool_type = tool_index[current_tool_use_chunk["name"]]
+        current_tool_use = ToolUseBlockContentTypeDef(
+            toolUse=ToolUseBlockOutputTypeDef(
+                toolUseId=current_tool_use_chunk["tool_use_id"],
+                input=json.loads(str(current_tool_use_chunk["input_chunk"])),
+                name=current_tool_use_chunk["name"],
+            )
+        )
+        return (
+            BedrockCallResponseChunk(chunk=chunk),
+            tool_type.from_tool_call(current_tool_use),
+            None,
+        )
     return BedrockCallResponseChunk(chunk=chunk), None, current_tool_use_chunk
 
 
@@ -78,12 +78,14 @@ def handle_stream(
     stream: Generator[StreamOutputChunk, None, None],
     tool_types: list[type[BedrockTool]] | None,
     partial_tools: bool = False,
+    throttle: StreamThrottle | None = None,
 ) -> Generator[tuple[BedrockCallResponseChunk, BedrockTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
+    tool_index = get_tool_index(tool_types) if tool_types else None
     current_tool_use_chunk = None
     for chunk in stream:
         call_response, tool, current_tool_use_chunk = _handle_chunk(
-            chunk, current_tool_use_chunk, tool_types
+            chunk, current_tool_use_chunk, tool_index
         )
         if call_response:
             yield call_response, tool
@@ -93,12 +95,14 @@ async def handle_stream_async(
     stream: AsyncGenerator[AsyncStreamOutputChunk, None],
     tool_types: list[type[BedrockTool]] | None,
     partial_tools: bool = False,
+    throttle: StreamThrottle | None = None,
 ) -> AsyncGenerator[tuple[BedrockCallResponseChunk, BedrockTool | None], None]:
     """Async iterator over the stream and constructs tools as they are streamed."""
+    tool_index = get_tool_index(tool_types) if tool_types else None
     current_tool_use_chunk = None
     async for chunk in stream:
         call_response, tool, current_tool_use_chunk = _handle_chunk(
-            chunk, current_tool_use_chunk, tool_types
+            chunk, current_tool_use_chunk, tool_index
         )
         if call_response:
             yield call_response, tool
@@ -9,6 +9,7 @@ from typing import Any, ParamSpec, cast, overload
 
 from aiobotocore.session import AioSession, get_session
 from boto3.session import Session
+from botocore.config import Config
 from mypy_boto3_bedrock_runtime import BedrockRuntimeClient
 from mypy_boto3_bedrock_runtime.type_defs import (
     ConverseResponseTypeDef,
@@ -36,6 +37,7 @@ from ...base._utils import (
     get_create_fn,
 )
 from ...base.call_params import CommonCallParams
+from ...base.client_pool import ClientPoolLimits, default_client_pool
 from ...base.stream_config import StreamConfig
 from .._call_kwargs import BedrockCallKwargs
 from .._types import (
@@ -85,9 +87,87 @@ def _extract_async_stream_fn(
     return _inner
 
 
-async def _get_async_client(session: AioSession) -> AsyncBedrockRuntimeClient:
-    async with session.create_client("bedrock-runtime") as client:
-        return client
+_ENV_VARS = (
+    "AWS_PROFILE",
+    "AWS_REGION",
+    "AWS_DEFAULT_REGION",
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+    "AWS_SESSION_TOKEN",
+)
+
+
+def _get_config(limits: ClientPoolLimits) -> Config | None:
+    if (max_connections := limits.get("max_connections", None)) is None:
+        return None
+    return Config(max_pool_connections=max_connections)
+
+
+class _AsyncBedrockClient:
+    """A long-lived aiobotocore `bedrock-runtime` client for the running event loop.
+
+    aiobotocore clients must be entered from within the event loop that uses them, but
+    `setup_call` is synchronous, so the client is entered on first use and then kept
+    open for every subsequent call until `aclose` is called (e.g. by awaiting
+    `default_client_pool.aclose()` on shutdown).
+    """
+
+    def __init__(self, session: AioSession, config: Config | None = None) -> None:
+        self._session = session
+        self._config = config
+        self._context: Any = None
+        self._client: AsyncBedrockRuntimeClient | None = None
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> AsyncBedrockRuntimeClient:
+        """Returns the open client, entering it on first use."""
+        async with self._lock:
+            if self._client is None:
+                context = self._session.create_client(
+                    "bedrock-runtime", config=self._config
+                )
+                self._client = await context.__aenter__()
+                self._context = context
+        return self._client
+
+    async def converse(self, **kwargs: Any) -> AsyncConverseResponseTypeDef:  # noqa: ANN401
+        """Calls `converse` on the open client."""
+        return await (await self.get()).converse(**kwargs)
+
+    async def converse_stream(
+        self,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncConverseStreamResponseTypeDef:
+        """Calls `converse_stream` on the open client."""
+        return await (await self.get()).converse_stream(**kwargs)
+
+    async def aclose(self) -> None:
+        """Exits the client if it has been entered."""
+        async with self._lock:
+            context, self._context, self._client = self._context, None, None
+            if context is not None:
+                await context.__aexit__(None, None, None)
+
+
+def _get_default_client(
+    is_async: bool,
+) -> BedrockRuntimeClient | _AsyncBedrockClient:
+    if is_async:
+        return default_client_pool.get(
+            _AsyncBedrockClient,
+            is_async=True,
+            env=_ENV_VARS,
+            create=lambda limits: _AsyncBedrockClient(
+                get_session(), _get_config(limits)
+            ),
+        )
+    return default_client_pool.get(
+        Session,
+        env=_ENV_VARS,
+        create=lambda limits: Session().client(
+            "bedrock-runtime", config=_get_config(limits)
+        ),
+    )
 
 
 @overload
@@ -202,18 +282,13 @@ def setup_call(
     call_kwargs |= cast(BedrockCallKwargs, {"modelId": model, "messages": messages})
 
     if client is None:
-        if fn_is_async(fn):
-            session = get_session()
-            client = asyncio.run(_get_async_client(session))
-        else:
-            session = Session()
-            client = session.client("bedrock-runtime")
+        client = _get_default_client(fn_is_async(fn))
 
     create = (
         get_async_create_fn(
             client.converse, _extract_async_stream_fn(client.converse_stream, model)
         )
-        if isinstance(client, AsyncBedrockRuntimeClient)
+        if isinstance(client, AsyncBedrockRuntimeClient | _AsyncBedrockClient)
         else get_create_fn(
             client.converse, _extract_sync_stream_fn(client.converse_stream, model)
         )
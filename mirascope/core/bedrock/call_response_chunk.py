@@ -3,10 +3,10 @@
 usage docs: learn/streams.md#handling-streamed-responses
 """
 
-from pydantic import SkipValidation
 from types_aiobotocore_bedrock_runtime.literals import StopReasonType as FinishReason
 
 from ..base import BaseCallResponseChunk
+from ..base._utils import cached_chunk_property
 from ._types import AsyncStreamOutputChunk, StreamOutputChunk, TokenUsageTypeDef
 
 
@@ -38,16 +38,18 @@ class BedrockCallResponseChunk(
     ```
     """
 
-    chunk: SkipValidation[StreamOutputChunk | AsyncStreamOutputChunk]
+    __slots__ = ()
 
-    @property
+    chunk: StreamOutputChunk | AsyncStreamOutputChunk
+
+    @cached_chunk_property
     def content(self) -> str:
         """Returns the content for the 0th choice delta."""
         if content_block_delta := self.chunk.get("contentBlockDelta"):
             return content_block_delta["delta"].get("text", "")
         return ""
 
-    @property
+    @cached_chunk_property
     def finish_reasons(self) -> list[FinishReason]:
         """Returns the finish reasons of the response."""
         if (stop_reason := self.chunk.get("messageStop")) and stop_reason.get(
@@ -56,17 +58,17 @@ class BedrockCallResponseChunk(
             return [stop_reason["stopReason"]]
         return []
 
-    @property
+    @cached_chunk_property
     def model(self) -> str:
         """Returns the name of the response model."""
         return self.chunk["model"]
 
-    @property
+    @cached_chunk_property
     def id(self) -> str:
         """Returns the id of the response."""
         return self.chunk["responseMetadata"]["RequestId"]
 
-    @property
+    @cached_chunk_property
     def usage(self) -> TokenUsageTypeDef | None:
         """Returns the usage of the chat completion."""
         usage = self.chunk.get("metadata", {}).get("usage")
@@ -74,14 +76,14 @@ class BedrockCallResponseChunk(
             return usage
         return None
 
-    @property
+    @cached_chunk_property
     def input_tokens(self) -> int | None:
         """Returns the number of input tokens."""
         if self.usage:
             return self.usage["inputTokens"]
         return None
 
-    @property
+    @cached_chunk_property
     def output_tokens(self) -> int | None:
         """Returns the number of output tokens."""
         if self.usage:
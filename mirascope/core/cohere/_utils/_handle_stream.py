@@ -4,6 +4,7 @@ from collections.abc import AsyncGenerator, Generator
 
 from cohere.types import StreamedChatResponse
 
+from ...base._utils import StreamThrottle
 from ..call_response_chunk import CohereCallResponseChunk
 from ..tool import CohereTool
 
@@ -12,6 +13,7 @@ def handle_stream(
     stream: Generator[StreamedChatResponse, None, None],
     tool_types: list[type[CohereTool]] | None = None,
     partial_tools: bool = False,
+    throttle: StreamThrottle | None = None,
 ) -> Generator[tuple[CohereCallResponseChunk, None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed.
 
@@ -25,6 +27,7 @@ async def handle_stream_async(
     stream: AsyncGenerator[StreamedChatResponse, None],
     tool_types: list[type[CohereTool]] | None = None,
     partial_tools: bool = False,
+    throttle: StreamThrottle | None = None,
 ) -> AsyncGenerator[tuple[CohereCallResponseChunk, None], None]:
     """
     Async iterator over the stream and constructs tools as they are streamed.
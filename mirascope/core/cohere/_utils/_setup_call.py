@@ -26,6 +26,11 @@ from ...base._utils import (
     get_create_fn,
 )
 from ...base.call_params import CommonCallParams
+from ...base.client_pool import (
+    ClientPoolLimits,
+    create_httpx_client,
+    default_client_pool,
+)
 from ...base.stream_config import StreamConfig
 from .._call_kwargs import CohereCallKwargs
 from ..call_params import CohereCallParams
@@ -34,6 +39,21 @@ from ..tool import CohereTool
 from ._convert_common_call_params import convert_common_call_params
 from ._convert_message_params import convert_message_params
 
+_ENV_VARS = ("CO_API_KEY",)
+
+
+def _get_default_client(is_async: bool) -> Client | AsyncClient:
+    client_type = AsyncClient if is_async else Client
+
+    def create(limits: ClientPoolLimits) -> Client | AsyncClient:
+        if http_client := create_httpx_client(limits, is_async):
+            return client_type(httpx_client=http_client)
+        return client_type()
+
+    return default_client_pool.get(
+        client_type, is_async=is_async, env=_ENV_VARS, create=create
+    )
+
 
 @overload
 def setup_call(
@@ -140,7 +160,7 @@ def setup_call(
     }
 
     if client is None:
-        client = AsyncClient() if inspect.iscoroutinefunction(fn) else Client()
+        client = _get_default_client(inspect.iscoroutinefunction(fn))
 
     create_or_stream = (
         get_async_create_fn(client.chat, client.chat_stream)
@@ -3,6 +3,8 @@
 usage docs: learn/calls.md#handling-responses
 """
 
+from functools import cached_property
+
 from cohere.types import (
     ApiMetaBilledUnits,
     ChatMessage,
@@ -13,6 +15,7 @@ from cohere.types import (
 from pydantic import SkipValidation, computed_field
 
 from ..base import BaseCallResponse, transform_tool_outputs
+from ..base._utils import get_tool_index
 from ._utils import calculate_cost
 from .call_params import CohereCallParams
 from .dynamic_config import AsyncCohereDynamicConfig, CohereDynamicConfig
@@ -105,7 +108,7 @@ class CohereCallResponse(
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
-    @property
+    @cached_property
     def message_param(self) -> ChatMessage:
         """Returns the assistant's response as a message parameter."""
         return ChatMessage(
@@ -115,7 +118,7 @@ class CohereCallResponse(
         )
 
     @computed_field
-    @property
+    @cached_property
     def tools(self) -> list[CohereTool] | None:
         """Returns the tools for the 0th choice message.
 
@@ -124,16 +127,15 @@ class CohereCallResponse(
         """
         if not self.tool_types or not self.response.tool_calls:
             return None
-        extracted_tools: list[CohereTool] = []
-        for tool_call in self.response.tool_calls:
-            for tool_type in self.tool_types:
-                if tool_call.name == tool_type._name():
-                    extracted_tools.append(tool_type.from_tool_call(tool_call))
-                    break
-        return extracted_tools
+        tool_index = get_tool_index(self.tool_types)
+        return [
+            tool_type.from_tool_call(tool_call)
+            for tool_call in self.response.tool_calls
+            if (tool_type := tool_index.get(tool_call.name))
+        ]
 
     @computed_field
-    @property
+    @cached_property
     def tool(self) -> CohereTool | None:
         """Returns the 0th tool for the 0th choice message.
 
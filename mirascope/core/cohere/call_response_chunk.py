@@ -8,9 +8,9 @@ from cohere.types import (
     ChatStreamEndEventFinishReason,
     StreamedChatResponse,
 )
-from pydantic import SkipValidation
 
 from ..base import BaseCallResponseChunk
+from ..base._utils import cached_chunk_property
 from ._types import (
     StreamEndStreamedChatResponse,
     StreamStartStreamedChatResponse,
@@ -19,9 +19,7 @@ from ._types import (
 
 
 class CohereCallResponseChunk(
-    BaseCallResponseChunk[
-        SkipValidation[StreamedChatResponse], ChatStreamEndEventFinishReason
-    ]
+    BaseCallResponseChunk[StreamedChatResponse, ChatStreamEndEventFinishReason]
 ):
     """A convenience wrapper around the Cohere `ChatCompletionChunk` streamed chunks.
 
@@ -47,21 +45,23 @@ class CohereCallResponseChunk(
     ```
     """
 
-    @property
+    __slots__ = ()
+
+    @cached_chunk_property
     def content(self) -> str:
         """Returns the content for the 0th choice delta."""
         if isinstance(self.chunk, TextGenerationStreamedChatResponse):
             return self.chunk.text
         return ""
 
-    @property
+    @cached_chunk_property
     def finish_reasons(self) -> list[ChatStreamEndEventFinishReason] | None:
         """Returns the finish reasons of the response."""
         if isinstance(self.chunk, StreamEndStreamedChatResponse):
             return [self.chunk.finish_reason]
         return None
 
-    @property
+    @cached_chunk_property
     def model(self) -> str | None:
         """Returns the name of the response model.
 
@@ -69,7 +69,7 @@ class CohereCallResponseChunk(
         """
         return None
 
-    @property
+    @cached_chunk_property
     def id(self) -> str | None:
         """Returns the id of the response."""
         if isinstance(self.chunk, StreamStartStreamedChatResponse):
@@ -78,7 +78,7 @@ class CohereCallResponseChunk(
             return self.chunk.response.generation_id
         return None
 
-    @property
+    @cached_chunk_property
     def usage(self) -> ApiMetaBilledUnits | None:
         """Returns the usage of the response."""
         if (
@@ -88,14 +88,14 @@ class CohereCallResponseChunk(
             return self.chunk.response.meta.billed_units
         return None
 
-    @property
+    @cached_chunk_property
     def input_tokens(self) -> float | None:
         """Returns the number of input tokens."""
         if self.usage:
             return self.usage.input_tokens
         return None
 
-    @property
+    @cached_chunk_property
     def output_tokens(self) -> float | None:
         """Returns the number of output tokens."""
         if self.usage:
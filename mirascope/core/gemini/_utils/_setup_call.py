@@ -129,6 +129,8 @@ def setup_call(
     call_kwargs |= {"contents": messages}
 
     if client is None:
+        # Models are cheap to construct and share the SDK's default clients, which
+        # `genai.configure` replaces, so they aren't pooled.
         client = GenerativeModel(model_name=model)
 
     create = (
@@ -7,6 +7,7 @@ from google.ai.generativelanguage import Candidate
 from google.generativeai.types import GenerateContentResponse
 
 from ..base import BaseCallResponseChunk
+from ..base._utils import cached_chunk_property
 
 
 class GeminiCallResponseChunk(
@@ -35,17 +36,19 @@ class GeminiCallResponseChunk(
     ```
     """
 
-    @property
+    __slots__ = ()
+
+    @cached_chunk_property
     def content(self) -> str:
         """Returns the chunk content for the 0th choice."""
         return self.chunk.candidates[0].content.parts[0].text
 
-    @property
+    @cached_chunk_property
     def finish_reasons(self) -> list[Candidate.FinishReason]:
         """Returns the finish reasons of the response."""
         return [candidate.finish_reason for candidate in self.chunk.candidates]
 
-    @property
+    @cached_chunk_property
     def model(self) -> None:
         """Returns the model name.
 
@@ -53,7 +56,7 @@ class GeminiCallResponseChunk(
         """
         return None
 
-    @property
+    @cached_chunk_property
     def id(self) -> str | None:
         """Returns the id of the response.
 
@@ -61,7 +64,7 @@ class GeminiCallResponseChunk(
         """
         return None
 
-    @property
+    @cached_chunk_property
     def usage(self) -> None:
         """Returns the usage of the chat completion.
 
@@ -69,12 +72,12 @@ class GeminiCallResponseChunk(
         """
         return None
 
-    @property
+    @cached_chunk_property
     def input_tokens(self) -> None:
         """Returns the number of input tokens."""
         return None
 
-    @property
+    @cached_chunk_property
     def output_tokens(self) -> None:
         """Returns the number of output tokens."""
         return None
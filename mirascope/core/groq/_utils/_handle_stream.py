@@ -5,6 +5,7 @@ from collections.abc import AsyncGenerator, Generator
 from groq.types.chat import ChatCompletionChunk, ChatCompletionMessageToolCall
 from groq.types.chat.chat_completion_message_tool_call import Function
 
+from ...base._utils import StreamThrottle, TextBuffer, ToolIndex, get_tool_index
 from ..call_response_chunk import GroqCallResponseChunk
 from ..tool import GroqTool
 
@@ -13,19 +14,21 @@ def _handle_chunk(
     chunk: ChatCompletionChunk,
     current_tool_call: ChatCompletionMessageToolCall,
     current_tool_type: type[GroqTool] | None,
-    tool_types: list[type[GroqTool]] | None,
+    tool_index: ToolIndex[GroqTool] | None,
+    arguments: TextBuffer,
 ) -> tuple[
     GroqTool | None,
     ChatCompletionMessageToolCall,
     type[GroqTool] | None,
 ]:
     """Handles a chunk of the stream."""
-    if not tool_types or not (tool_calls := chunk.choices[0].delta.tool_calls):
+    if not tool_index or not (tool_calls := chunk.choices[0].delta.tool_calls):
         return None, current_tool_call, current_tool_type
 
     tool_call = tool_calls[0]
     # Reset on new tool
     if tool_call.id and tool_call.function is not None:
+        current_tool_call.function.arguments = arguments.take()
         previous_tool_call = current_tool_call.model_copy()
         previous_tool_type = current_tool_type
         current_tool_call = ChatCompletionMessageToolCall(
@@ -36,15 +39,7 @@ def _handle_chunk(
             ),
             type="function",
         )
-        current_tool_type = None
-        for tool_type in tool_types:
-            if tool_type._name() == tool_call.function.name:
-                current_tool_type = tool_type
-                break
-        if current_tool_type is None:
-            raise RuntimeError(
-                f"Unknown tool type in stream: {tool_call.function.name}"
-            )  # pragma: no cover
+        current_tool_type = tool_index[tool_call.function.name]
         if (
             previous_tool_call.id
             and previous_tool_call.function.arguments
@@ -58,7 +53,7 @@ def _handle_chunk(
 
     # Update arguments with each chunk
     if tool_call.function and tool_call.function.arguments:
-        current_tool_call.function.arguments += tool_call.function.arguments
+        arguments.append(tool_call.function.arguments)
 
     return None, current_tool_call, current_tool_type
 
@@ -67,15 +62,18 @@ def handle_stream(
     stream: Generator[ChatCompletionChunk, None, None],
     tool_types: list[type[GroqTool]] | None,
     partial_tools: bool = False,
+    throttle: StreamThrottle | None = None,
 ) -> Generator[tuple[GroqCallResponseChunk, GroqTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
+    tool_index = get_tool_index(tool_types) if tool_types else None
     current_tool_call = ChatCompletionMessageToolCall(
         id="", function=Function(arguments="", name=""), type="function"
     )
-    current_tool_type = None
+    current_tool_type, arguments = None, TextBuffer()
     for chunk in stream:
         if not tool_types or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
+                current_tool_call.function.arguments = arguments.take()
                 yield (
                     GroqCallResponseChunk(chunk=chunk),
                     current_tool_type.from_tool_call(current_tool_call),
@@ -87,7 +85,8 @@ def handle_stream(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_index,
+            arguments,
         )
         if tool is not None:
             yield GroqCallResponseChunk(chunk=chunk), tool
@@ -97,15 +96,18 @@ async def handle_stream_async(
     stream: AsyncGenerator[ChatCompletionChunk, None],
     tool_types: list[type[GroqTool]] | None,
     partial_tools: bool = False,
+    throttle: StreamThrottle | None = None,
 ) -> AsyncGenerator[tuple[GroqCallResponseChunk, GroqTool | None], None]:
     """Async iterator over the stream and constructs tools as they are streamed."""
+    tool_index = get_tool_index(tool_types) if tool_types else None
     current_tool_call = ChatCompletionMessageToolCall(
         id="", function=Function(arguments="", name=""), type="function"
     )
-    current_tool_type = None
+    current_tool_type, arguments = None, TextBuffer()
     async for chunk in stream:
         if not tool_types or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
+                current_tool_call.function.arguments = arguments.take()
                 yield (
                     GroqCallResponseChunk(chunk=chunk),
                     current_tool_type.from_tool_call(current_tool_call),
@@ -117,7 +119,8 @@ async def handle_stream_async(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_index,
+            arguments,
         )
         if tool is not None:
             yield GroqCallResponseChunk(chunk=chunk), tool
@@ -14,6 +14,11 @@ from groq.types.chat import (
 from ...base import BaseMessageParam, BaseTool, _utils
 from ...base._utils import AsyncCreateFn, CreateFn, get_async_create_fn, get_create_fn
 from ...base.call_params import CommonCallParams
+from ...base.client_pool import (
+    ClientPoolLimits,
+    create_httpx_client,
+    default_client_pool,
+)
 from ...base.stream_config import StreamConfig
 from .._call_kwargs import GroqCallKwargs
 from ..call_params import GroqCallParams
@@ -22,6 +27,21 @@ from ..tool import GroqTool
 from ._convert_common_call_params import convert_common_call_params
 from ._convert_message_params import convert_message_params
 
+_ENV_VARS = ("GROQ_API_KEY", "GROQ_BASE_URL")
+
+
+def _get_default_client(is_async: bool) -> Groq | AsyncGroq:
+    client_type = AsyncGroq if is_async else Groq
+
+    def create(limits: ClientPoolLimits) -> Groq | AsyncGroq:
+        if http_client := create_httpx_client(limits, is_async):
+            return client_type(http_client=http_client)
+        return client_type()
+
+    return default_client_pool.get(
+        client_type, is_async=is_async, env=_ENV_VARS, create=create
+    )
+
 
 @overload
 def setup_call(
@@ -123,7 +143,7 @@ def setup_call(
     call_kwargs |= {"model": model, "messages": messages}
 
     if client is None:
-        client = AsyncGroq() if inspect.iscoroutinefunction(fn) else Groq()
+        client = _get_default_client(inspect.iscoroutinefunction(fn))
 
     create = (
         get_async_create_fn(client.chat.completions.create)
@@ -8,6 +8,7 @@ from groq.types.chat.chat_completion import Choice
 from groq.types.completion_usage import CompletionUsage
 
 from ..base import BaseCallResponseChunk
+from ..base._utils import cached_chunk_property
 
 FinishReason = Choice.__annotations__["finish_reason"]
 
@@ -36,7 +37,9 @@ class GroqCallResponseChunk(BaseCallResponseChunk[ChatCompletionChunk, FinishRea
     ```
     """
 
-    @property
+    __slots__ = ()
+
+    @cached_chunk_property
     def content(self) -> str:
         """Returns the content for the 0th choice delta."""
         delta = None
@@ -44,7 +47,7 @@ class GroqCallResponseChunk(BaseCallResponseChunk[ChatCompletionChunk, FinishRea
             delta = self.chunk.choices[0].delta
         return delta.content if delta is not None and delta.content else ""
 
-    @property
+    @cached_chunk_property
     def finish_reasons(
         self,
     ) -> list[FinishReason]:
@@ -55,31 +58,31 @@ class GroqCallResponseChunk(BaseCallResponseChunk[ChatCompletionChunk, FinishRea
             if choice.finish_reason
         ]
 
-    @property
+    @cached_chunk_property
     def model(self) -> str:
         """Returns the name of the response model."""
         return self.chunk.model
 
-    @property
+    @cached_chunk_property
     def id(self) -> str:
         """Returns the id of the response."""
         return self.chunk.id
 
-    @property
+    @cached_chunk_property
     def usage(self) -> CompletionUsage | None:
         """Returns the usage of the chat completion."""
         if self.chunk.usage:
             return self.chunk.usage
         return None
 
-    @property
+    @cached_chunk_property
     def input_tokens(self) -> int | None:
         """Returns the number of input tokens."""
         if self.usage:
             return self.usage.prompt_tokens
         return None
 
-    @property
+    @cached_chunk_property
     def output_tokens(self) -> int | None:
         """Returns the number of output tokens."""
         if self.usage:
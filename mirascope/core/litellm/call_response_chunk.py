@@ -12,3 +12,5 @@ class LiteLLMCallResponseChunk(OpenAICallResponseChunk):
     Everything is the same except the `cost` property, which has been updated to use
     LiteLLM's cost calculations so that cost tracking works for non-OpenAI models.
     """
+
+    __slots__ = ()
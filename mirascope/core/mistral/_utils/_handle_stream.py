@@ -9,6 +9,7 @@ from mistralai.models import (
     ToolCall,
 )
 
+from ...base._utils import StreamThrottle, TextBuffer, ToolIndex, get_tool_index
 from ..call_response_chunk import MistralCallResponseChunk
 from ..tool import MistralTool
 
@@ -17,19 +18,21 @@ def _handle_chunk(
     chunk: CompletionEvent,
     current_tool_call: ToolCall,
     current_tool_type: type[MistralTool] | None,
-    tool_types: list[type[MistralTool]] | None,
+    tool_index: ToolIndex[MistralTool] | None,
+    arguments: TextBuffer,
 ) -> tuple[
     MistralTool | None,
     ToolCall,
     type[MistralTool] | None,
 ]:
     """Handles a chunk of the stream."""
-    if not tool_types or not (tool_calls := chunk.data.choices[0].delta.tool_calls):
+    if not tool_index or not (tool_calls := chunk.data.choices[0].delta.tool_calls):
         return None, current_tool_call, current_tool_type
 
     tool_call = tool_calls[0]
     # Reset on new tool
     if tool_call.id != "null" and tool_call.function is not None:
+        current_tool_call.function.arguments = arguments.take()
         previous_tool_call = current_tool_call.model_copy()
         previous_tool_type = current_tool_type
         current_tool_call = ToolCall(
@@ -40,15 +43,7 @@ def _handle_chunk(
             ),
             type="function",
         )
-        current_tool_type = None
-        for tool_type in tool_types:
-            if tool_type._name() == tool_call.function.name:
-                current_tool_type = tool_type
-                break
-        if current_tool_type is None:
-            raise RuntimeError(
-                f"Unknown tool type in stream: {tool_call.function.name}"
-            )  # pragma: no cover
+        current_tool_type = tool_index[tool_call.function.name]
         if previous_tool_call.id and previous_tool_type is not None:
             return (
                 previous_tool_type.from_tool_call(previous_tool_call),
@@ -58,7 +53,7 @@ def _handle_chunk(
 
     # Update arguments with each chunk
     if tool_call.function and tool_call.function.arguments:
-        current_tool_call.function.arguments += cast(str, tool_call.function.arguments)  # pyright: ignore [reportOperatorIssue]
+        arguments.append(cast(str, tool_call.function.arguments))
 
     return None, current_tool_call, current_tool_type
 
@@ -67,16 +62,19 @@ def handle_stream(
     stream: Generator[CompletionEvent, None, None],
     tool_types: list[type[MistralTool]] | None,
     partial_tools: bool = False,
+    throttle: StreamThrottle | None = None,
 ) -> Generator[tuple[MistralCallResponseChunk, MistralTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
+    tool_index = get_tool_index(tool_types) if tool_types else None
     current_tool_call = ToolCall(
         id="", function=FunctionCall(arguments="", name=""), type="function"
     )
-    current_tool_type = None
+    current_tool_type, arguments = None, TextBuffer()
     last_chuk_data = None
     for chunk in stream:
         if not tool_types or not chunk.data.choices[0].delta.tool_calls:
             if current_tool_type:
+                current_tool_call.function.arguments = arguments.take()
                 yield (
                     MistralCallResponseChunk(chunk=chunk.data),
                     current_tool_type.from_tool_call(current_tool_call),
@@ -88,13 +86,15 @@ def handle_stream(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_index,
+            arguments,
         )
         if tool is not None:
             yield MistralCallResponseChunk(chunk=chunk.data), tool
         else:
             last_chuk_data = chunk.data
     if current_tool_type and last_chuk_data:
+        current_tool_call.function.arguments = arguments.take()
         yield (
             MistralCallResponseChunk(chunk=last_chuk_data),
             current_tool_type.from_tool_call(current_tool_call),
@@ -105,16 +105,19 @@ async def handle_stream_async(
     stream: AsyncGenerator[CompletionEvent, None],
     tool_types: list[type[MistralTool]] | None,
     partial_tools: bool = False,
+    throttle: StreamThrottle | None = None,
 ) -> AsyncGenerator[tuple[MistralCallResponseChunk, MistralTool | None], None]:
     """Async iterator over the stream and constructs tools as they are streamed."""
+    tool_index = get_tool_index(tool_types) if tool_types else None
     current_tool_call = ToolCall(
         id="", function=FunctionCall(arguments="", name=""), type="function"
     )
-    current_tool_type = None
+    current_tool_type, arguments = None, TextBuffer()
     last_chuk_data = None
     async for chunk in stream:
         if not tool_types or not chunk.data.choices[0].delta.tool_calls:
             if current_tool_type:
+                current_tool_call.function.arguments = arguments.take()
                 yield (
                     MistralCallResponseChunk(chunk=chunk.data),
                     current_tool_type.from_tool_call(current_tool_call),
@@ -126,13 +129,15 @@ async def handle_stream_async(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_index,
+            arguments,
         )
         if tool is not None:
             yield MistralCallResponseChunk(chunk=chunk.data), tool
         else:
             last_chuk_data = chunk.data
     if current_tool_type and last_chuk_data:
+        current_tool_call.function.arguments = arguments.take()
         yield (
             MistralCallResponseChunk(chunk=last_chuk_data),
             current_tool_type.from_tool_call(current_tool_call),
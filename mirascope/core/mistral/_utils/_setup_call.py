@@ -30,6 +30,11 @@ from ...base._utils import (
     get_create_fn,
 )
 from ...base.call_params import CommonCallParams
+from ...base.client_pool import (
+    ClientPoolLimits,
+    create_httpx_client,
+    default_client_pool,
+)
 from ...base.stream_config import StreamConfig
 from .._call_kwargs import MistralCallKwargs
 from ..call_params import MistralCallParams
@@ -39,6 +44,22 @@ from ._convert_common_call_params import convert_common_call_params
 from ._convert_message_params import convert_message_params
 
 
+def _get_default_client(is_async: bool) -> Mistral:
+    def create(limits: ClientPoolLimits) -> Mistral:
+        api_key = os.environ["MISTRAL_API_KEY"]
+        if http_client := create_httpx_client(limits, is_async):
+            return (
+                Mistral(api_key=api_key, async_client=http_client)
+                if is_async
+                else Mistral(api_key=api_key, client=http_client)
+            )
+        return Mistral(api_key=api_key)
+
+    return default_client_pool.get(
+        Mistral, is_async=is_async, env=("MISTRAL_API_KEY",), create=create
+    )
+
+
 @overload
 def setup_call(
     *,
@@ -143,7 +164,7 @@ def setup_call(
     call_kwargs |= {"model": model, "messages": messages}
 
     if client is None:
-        client = Mistral(api_key=os.environ["MISTRAL_API_KEY"])
+        client = _get_default_client(fn_is_async(fn))
     if fn_is_async(fn):
         create_or_stream = get_async_create_fn(
             client.chat.complete_async, client.chat.stream_async
@@ -3,6 +3,7 @@
 usage docs: learn/calls.md#handling-responses
 """
 
+from functools import cached_property
 from typing import Any, cast
 
 from mistralai import ChatCompletionChoice
@@ -17,6 +18,7 @@ from mistralai.models import (
 from pydantic import computed_field
 
 from ..base import BaseCallResponse, transform_tool_outputs
+from ..base._utils import get_tool_index
 from ._utils import calculate_cost
 from .call_params import MistralCallParams
 from .dynamic_config import MistralDynamicConfig
@@ -106,7 +108,7 @@ class MistralCallResponse(
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
-    @property
+    @cached_property
     def message_param(
         self,
     ) -> AssistantMessage:
@@ -114,7 +116,7 @@ class MistralCallResponse(
         return cast(AssistantMessage, self._response_choices[0].message)
 
     @computed_field
-    @property
+    @cached_property
     def tools(self) -> list[MistralTool] | None:
         """Returns the tools for the 0th choice message.
 
@@ -125,17 +127,15 @@ class MistralCallResponse(
         if not self.tool_types or not tool_calls:
             return None
 
-        extracted_tools = []
-        for tool_call in tool_calls:
-            for tool_type in self.tool_types:
-                if tool_call.function.name == tool_type._name():
-                    extracted_tools.append(tool_type.from_tool_call(tool_call))
-                    break
-
-        return extracted_tools
+        tool_index = get_tool_index(self.tool_types)
+        return [
+            tool_type.from_tool_call(tool_call)
+            for tool_call in tool_calls
+            if (tool_type := tool_index.get(tool_call.function.name))
+        ]
 
     @computed_field
-    @property
+    @cached_property
     def tool(self) -> MistralTool | None:
         """Returns the 0th tool for the 0th choice message.
 
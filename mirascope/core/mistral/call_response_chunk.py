@@ -6,6 +6,7 @@ usage docs: learn/streams.md#handling-streamed-responses
 from mistralai.models import CompletionChunk, FinishReason, UsageInfo
 
 from ..base import BaseCallResponseChunk
+from ..base._utils import cached_chunk_property
 
 
 class MistralCallResponseChunk(BaseCallResponseChunk[CompletionChunk, FinishReason]):
@@ -33,7 +34,9 @@ class MistralCallResponseChunk(BaseCallResponseChunk[CompletionChunk, FinishReas
     ```
     """
 
-    @property
+    __slots__ = ()
+
+    @cached_chunk_property
     def content(self) -> str:
         """Returns the content of the delta."""
         delta = None
@@ -44,7 +47,7 @@ class MistralCallResponseChunk(BaseCallResponseChunk[CompletionChunk, FinishReas
             return delta.content
         return ""
 
-    @property
+    @cached_chunk_property
     def finish_reasons(self) -> list[FinishReason]:
         """Returns the finish reasons of the response."""
         return [
@@ -53,29 +56,29 @@ class MistralCallResponseChunk(BaseCallResponseChunk[CompletionChunk, FinishReas
             if choice.finish_reason
         ]
 
-    @property
+    @cached_chunk_property
     def model(self) -> str:
         """Returns the name of the response model."""
         return self.chunk.model
 
-    @property
+    @cached_chunk_property
     def id(self) -> str:
         """Returns the id of the response."""
         return self.chunk.id
 
-    @property
+    @cached_chunk_property
     def usage(self) -> UsageInfo | None:
         """Returns the usage of the chat completion."""
         return self.chunk.usage
 
-    @property
+    @cached_chunk_property
     def input_tokens(self) -> int | None:
         """Returns the number of input tokens."""
         if self.usage:
             return self.usage.prompt_tokens
         return None
 
-    @property
+    @cached_chunk_property
     def output_tokens(self) -> int | None:
         """Returns the number of output tokens."""
         if self.usage:
@@ -5,6 +5,7 @@ from typing import TypeAlias
 from openai.types.chat import ChatCompletionMessageParam
 
 from ..base import BaseMessageParam
+from . import batch
 from ._call import openai_call
 from ._call import openai_call as call
 from .call_params import OpenAICallParams
@@ -17,6 +18,7 @@ from .tool import OpenAITool, OpenAIToolConfig
 OpenAIMessageParam: TypeAlias = ChatCompletionMessageParam | BaseMessageParam
 
 __all__ = [
+    "batch",
     "AsyncOpenAIDynamicConfig",
     "call",
     "OpenAIDynamicConfig",
@@ -6,6 +6,7 @@ from typing import cast
 from openai.types.chat import ChatCompletionChunk, ChatCompletionMessageToolCall
 from openai.types.chat.chat_completion_message_tool_call import Function
 
+from ...base._utils import StreamThrottle, TextBuffer, ToolIndex, get_tool_index
 from ..call_response_chunk import OpenAICallResponseChunk
 from ..tool import OpenAITool
 
@@ -14,8 +15,10 @@ def _handle_chunk(
     chunk: ChatCompletionChunk,
     current_tool_call: ChatCompletionMessageToolCall,
     current_tool_type: type[OpenAITool] | None,
-    tool_types: list[type[OpenAITool]] | None,
+    tool_index: ToolIndex[OpenAITool] | None,
+    arguments: TextBuffer,
     partial_tools: bool = False,
+    throttle: StreamThrottle | None = None,
 ) -> tuple[
     OpenAITool | None,
     ChatCompletionMessageToolCall,
@@ -23,7 +26,7 @@ def _handle_chunk(
 ]:
     """Handles a chunk of the stream."""
     if (
-        not tool_types
+        not tool_index
         or not chunk.choices
         or not (tool_calls := chunk.choices[0].delta.tool_calls)
     ):
@@ -32,6 +35,7 @@ def _handle_chunk(
     tool_call = tool_calls[0]
     # Reset on new tool
     if tool_call.id and tool_call.function is not None:
+        current_tool_call.function.arguments = arguments.take()
         previous_tool_call = current_tool_call.model_copy()
         previous_tool_type = current_tool_type
         current_tool_call = ChatCompletionMessageToolCall(
@@ -42,15 +46,9 @@ def _handle_chunk(
             ),
             type="function",
         )
-        current_tool_type = None
-        for tool_type in tool_types:
-            if tool_type._name() == tool_call.function.name:
-                current_tool_type = tool_type
-                break
-        if current_tool_type is None:
-            raise RuntimeError(
-                f"Unknown tool type in stream: {tool_call.function.name}"
-            )  # pragma: no cover
+        if throttle is not None:
+            throttle.reset()
+        current_tool_type = tool_index[tool_call.function.name]
         if (
             previous_tool_call.id
             and previous_tool_call.function.arguments
@@ -64,13 +62,18 @@ def _handle_chunk(
 
     # Update arguments with each chunk
     if tool_call.function and tool_call.function.arguments:
-        current_tool_call.function.arguments += tool_call.function.arguments
+        arguments.append(tool_call.function.arguments)
 
         # Return partial tool state if enabled
         if partial_tools and current_tool_type:
+            delta = cast(str, tool_call.function.arguments)
+            # Coalesce the deltas of partial tools that the throttle holds back
+            if throttle is not None and (delta := throttle.update_json(delta)) is None:
+                return None, current_tool_call, current_tool_type
+            current_tool_call.function.arguments = str(arguments)
             partial_tool = current_tool_type.from_tool_call(current_tool_call, True)
-            # Set delta to current chunk arguments
-            partial_tool.delta = cast(str, tool_call.function.arguments)
+            # Set delta to the arguments since the last partial tool
+            partial_tool.delta = delta
             return partial_tool, current_tool_call, current_tool_type
 
     return None, current_tool_call, current_tool_type
@@ -80,15 +83,18 @@ def handle_stream(
     stream: Generator[ChatCompletionChunk, None, None],
     tool_types: list[type[OpenAITool]] | None,
     partial_tools: bool = False,
+    throttle: StreamThrottle | None = None,
 ) -> Generator[tuple[OpenAICallResponseChunk, OpenAITool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
+    tool_index = get_tool_index(tool_types) if tool_types else None
     current_tool_call = ChatCompletionMessageToolCall(
         id="", function=Function(arguments="", name=""), type="function"
     )
-    current_tool_type = None
+    current_tool_type, arguments = None, TextBuffer()
     for chunk in stream:
         if not tool_types or not chunk.choices or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
+                current_tool_call.function.arguments = arguments.take()
                 yield (
                     OpenAICallResponseChunk(chunk=chunk),
                     current_tool_type.from_tool_call(current_tool_call),
@@ -100,8 +106,10 @@ def handle_stream(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_index,
+            arguments,
             partial_tools,
+            throttle,
         )
         if tool is not None:
             yield OpenAICallResponseChunk(chunk=chunk), tool
@@ -111,15 +119,18 @@ async def handle_stream_async(
     stream: AsyncGenerator[ChatCompletionChunk, None],
     tool_types: list[type[OpenAITool]] | None,
     partial_tools: bool = False,
+    throttle: StreamThrottle | None = None,
 ) -> AsyncGenerator[tuple[OpenAICallResponseChunk, OpenAITool | None], None]:
     """Async iterator over the stream and constructs tools as they are streamed."""
+    tool_index = get_tool_index(tool_types) if tool_types else None
     current_tool_call = ChatCompletionMessageToolCall(
         id="", function=Function(arguments="", name=""), type="function"
     )
-    current_tool_type = None
+    current_tool_type, arguments = None, TextBuffer()
     async for chunk in stream:
         if not tool_types or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
+                current_tool_call.function.arguments = arguments.take()
                 yield (
                     OpenAICallResponseChunk(chunk=chunk),
                     current_tool_type.from_tool_call(current_tool_call),
@@ -131,8 +142,10 @@ async def handle_stream_async(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_index,
+            arguments,
             partial_tools,
+            throttle,
         )
         if tool is not None:
             yield OpenAICallResponseChunk(chunk=chunk), tool
@@ -16,6 +16,11 @@ from openai.types.chat import (
 from ...base import BaseMessageParam, BaseTool, _utils
 from ...base._utils import AsyncCreateFn, CreateFn, get_async_create_fn, get_create_fn
 from ...base.call_params import CommonCallParams
+from ...base.client_pool import (
+    ClientPoolLimits,
+    create_httpx_client,
+    default_client_pool,
+)
 from ...base.stream_config import StreamConfig
 from .._call_kwargs import OpenAICallKwargs
 from ..call_params import OpenAICallParams
@@ -24,6 +29,21 @@ from ..tool import GenerateOpenAIStrictToolJsonSchema, OpenAITool
 from ._convert_common_call_params import convert_common_call_params
 from ._convert_message_params import convert_message_params
 
+_ENV_VARS = ("OPENAI_API_KEY", "OPENAI_ORG_ID", "OPENAI_PROJECT_ID", "OPENAI_BASE_URL")
+
+
+def _get_default_client(is_async: bool) -> OpenAI | AsyncOpenAI:
+    client_type = AsyncOpenAI if is_async else OpenAI
+
+    def create(limits: ClientPoolLimits) -> OpenAI | AsyncOpenAI:
+        if http_client := create_httpx_client(limits, is_async):
+            return client_type(http_client=http_client)
+        return client_type()
+
+    return default_client_pool.get(
+        client_type, is_async=is_async, env=_ENV_VARS, create=create
+    )
+
 
 @overload
 def setup_call(
@@ -142,7 +162,7 @@ def setup_call(
     call_kwargs |= {"model": model, "messages": messages}
 
     if client is None:
-        client = AsyncOpenAI() if inspect.iscoroutinefunction(fn) else OpenAI()
+        client = _get_default_client(inspect.iscoroutinefunction(fn))
     create = (
         get_async_create_fn(client.chat.completions.create)
         if isinstance(client, AsyncOpenAI)
@@ -0,0 +1,169 @@
+"""Functions for running OpenAI calls offline through the OpenAI Batch API.
+
+Example:
+
+```python
+from mirascope.core import openai
+
+
+@openai.call("gpt-4o-mini")
+def recommend_book(genre: str) -> str:
+    return f"Recommend a {genre} book"
+
+
+inputs = [{"genre": "fantasy"}, {"genre": "mystery"}]
+batch = openai.batch.create_batch(recommend_book, inputs)
+...  # once `client.batches.retrieve(batch.id).status == "completed"`
+responses = openai.batch.get_batch_results(recommend_book, inputs, batch.id)
+for response in responses:
+    print(response.content)
+```
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any, TypeVar
+
+from openai import OpenAI
+from openai.types import Batch
+from openai.types.chat import ChatCompletion
+
+from ..base.batch_mode import (
+    BatchRequestError,
+    build_batch_requests,
+    parse_batch_results,
+)
+from ._utils._setup_call import _get_default_client
+
+_R = TypeVar("_R")
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+
+def write_batch_file(
+    fn: Callable[..., Any],
+    inputs: Iterable[Mapping[str, Any]],
+    *,
+    custom_id_prefix: str = "request",
+) -> str:
+    """Returns the JSONL contents of the batch input file for calling `fn` on `inputs`.
+
+    No provider calls are made.
+    """
+    return "".join(
+        json.dumps(
+            {
+                "custom_id": request["custom_id"],
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": request["call_kwargs"],
+            }
+        )
+        + "\n"
+        for request in build_batch_requests(
+            fn, inputs, custom_id_prefix=custom_id_prefix
+        )
+    )
+
+
+def read_batch_file(
+    output: str, errors: str | None = None
+) -> dict[str, ChatCompletion | BatchRequestError]:
+    """Returns the responses of the batch output (and error) file keyed by `custom_id`."""
+    responses: dict[str, ChatCompletion | BatchRequestError] = {}
+    for line in (output + "\n" + (errors or "")).splitlines():
+        if not line.strip():
+            continue
+        result = json.loads(line)
+        custom_id, response = result["custom_id"], result.get("response") or {}
+        if result.get("error") or response.get("status_code", 200) != 200:
+            responses[custom_id] = BatchRequestError(
+                custom_id, result.get("error") or response.get("body")
+            )
+        else:
+            responses[custom_id] = ChatCompletion.model_validate(response["body"])
+    return responses
+
+
+def create_batch(
+    fn: Callable[..., Any],
+    inputs: Iterable[Mapping[str, Any]],
+    *,
+    client: OpenAI | None = None,
+    completion_window: str = "24h",
+    metadata: dict[str, str] | None = None,
+    custom_id_prefix: str = "request",
+) -> Batch:
+    """Uploads the requests for calling `fn` on each of `inputs` and creates a batch.
+
+    Args:
+        fn: The decorated call (e.g. decorated with `openai.call`).
+        inputs: The keyword arguments of each call.
+        client: The client used to create the batch. If `None`, the pooled default
+            client is used.
+        completion_window: The time frame within which the batch should be processed.
+        metadata: Optional metadata of the batch.
+        custom_id_prefix: The prefix of the `custom_id` of each request.
+
+    Returns:
+        The created batch.
+    """
+    client = client or _get_default_client(False)  # pyright: ignore [reportAssignmentType]
+    contents = write_batch_file(fn, inputs, custom_id_prefix=custom_id_prefix)
+    input_file = client.files.create(
+        file=("batch.jsonl", contents.encode()), purpose="batch"
+    )
+    return client.batches.create(
+        input_file_id=input_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window=completion_window,  # pyright: ignore [reportArgumentType]
+        metadata=metadata,
+    )
+
+
+def get_batch_results(
+    fn: Callable[..., _R],
+    inputs: Sequence[Mapping[str, Any]],
+    batch_id: str,
+    *,
+    client: OpenAI | None = None,
+    custom_id_prefix: str = "request",
+    return_exceptions: bool = True,
+) -> list[_R | Exception]:
+    """Returns the outputs of `fn` for each of `inputs` from the completed batch.
+
+    Args:
+        fn: The same decorated call that the batch was created with.
+        inputs: The same keyword arguments that the batch was created with.
+        batch_id: The id of the batch.
+        client: The client used to retrieve the batch. If `None`, the pooled default
+            client is used.
+        custom_id_prefix: The prefix of the `custom_id` of each request.
+        return_exceptions: Whether to return exceptions (e.g. failed requests) in place
+            of their outputs instead of raising them.
+
+    Returns:
+        The outputs, in the same order as `inputs`.
+
+    Raises:
+        ValueError: If the batch has not completed.
+    """
+    client = client or _get_default_client(False)  # pyright: ignore [reportAssignmentType]
+    batch = client.batches.retrieve(batch_id)
+    if batch.status != "completed":
+        raise ValueError(f"Batch `{batch_id}` has not completed: {batch.status}")
+    output = (
+        client.files.content(batch.output_file_id).text if batch.output_file_id else ""
+    )
+    errors = (
+        client.files.content(batch.error_file_id).text if batch.error_file_id else None
+    )
+    return parse_batch_results(
+        fn,
+        inputs,
+        read_batch_file(output, errors),
+        custom_id_prefix=custom_id_prefix,
+        return_exceptions=return_exceptions,
+    )
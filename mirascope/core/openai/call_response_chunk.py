@@ -10,9 +10,9 @@ import base64
 from openai.types.chat import ChatCompletionChunk
 from openai.types.chat.chat_completion_chunk import Choice
 from openai.types.completion_usage import CompletionUsage
-from pydantic import SkipValidation, computed_field
 
 from ..base import BaseCallResponseChunk
+from ..base._utils import cached_chunk_property
 
 FinishReason = Choice.__annotations__["finish_reason"]
 
@@ -42,9 +42,11 @@ class OpenAICallResponseChunk(BaseCallResponseChunk[ChatCompletionChunk, FinishR
     ```
     """
 
-    chunk: SkipValidation[ChatCompletionChunk]
+    __slots__ = ()
 
-    @property
+    chunk: ChatCompletionChunk
+
+    @cached_chunk_property
     def content(self) -> str:
         """Returns the content for the 0th choice delta."""
         delta = None
@@ -52,7 +54,7 @@ class OpenAICallResponseChunk(BaseCallResponseChunk[ChatCompletionChunk, FinishR
             delta = self.chunk.choices[0].delta
         return delta.content if delta is not None and delta.content else ""
 
-    @property
+    @cached_chunk_property
     def finish_reasons(self) -> list[FinishReason]:
         """Returns the finish reasons of the response."""
         return [
@@ -61,39 +63,38 @@ class OpenAICallResponseChunk(BaseCallResponseChunk[ChatCompletionChunk, FinishR
             if choice.finish_reason
         ]
 
-    @property
+    @cached_chunk_property
     def model(self) -> str:
         """Returns the name of the response model."""
         return self.chunk.model
 
-    @property
+    @cached_chunk_property
     def id(self) -> str:
         """Returns the id of the response."""
         return self.chunk.id
 
-    @property
+    @cached_chunk_property
     def usage(self) -> CompletionUsage | None:
         """Returns the usage of the chat completion."""
         if hasattr(self.chunk, "usage") and self.chunk.usage:
             return self.chunk.usage
         return None
 
-    @property
+    @cached_chunk_property
     def input_tokens(self) -> int | None:
         """Returns the number of input tokens."""
         if self.usage:
             return self.usage.prompt_tokens
         return None
 
-    @property
+    @cached_chunk_property
     def output_tokens(self) -> int | None:
         """Returns the number of output tokens."""
         if self.usage:
             return self.usage.completion_tokens
         return None
 
-    @computed_field
-    @property
+    @cached_chunk_property
     def audio(self) -> bytes | None:
         """Returns the audio data of the response."""
         if (audio := getattr(self.chunk.choices[0].delta, "audio", None)) and (
@@ -102,8 +103,7 @@ class OpenAICallResponseChunk(BaseCallResponseChunk[ChatCompletionChunk, FinishR
             return base64.b64decode(audio_data)
         return None
 
-    @computed_field
-    @property
+    @cached_chunk_property
     def audio_transcript(self) -> str | None:
         """Returns the transcript of the audio content."""
         if audio := getattr(self.chunk.choices[0].delta, "audio", None):
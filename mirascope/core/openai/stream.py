@@ -3,11 +3,12 @@
 usage docs: learn/streams.md
 """
 
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator, Generator, Hashable
 
 from openai.types.chat import (
     ChatCompletion,
     ChatCompletionAssistantMessageParam,
+    ChatCompletionChunk,
     ChatCompletionMessage,
     ChatCompletionMessageParam,
     ChatCompletionMessageToolCall,
@@ -70,6 +71,40 @@ class OpenAIStream(
 
     _provider = "openai"
 
+    @classmethod
+    def _mergeable_text(cls, chunk: object) -> tuple[Hashable, str] | None:
+        """Returns the choice index and content of a text-only completion chunk."""
+        if (
+            not isinstance(chunk, ChatCompletionChunk)
+            or chunk.usage is not None
+            or len(chunk.choices) != 1
+        ):
+            return None
+        choice = chunk.choices[0]
+        delta = choice.delta
+        if (
+            delta.content is None
+            or choice.finish_reason is not None
+            or choice.logprobs is not None
+            or delta.tool_calls
+            or delta.function_call is not None
+            or delta.refusal is not None
+            or delta.model_extra  # e.g. audio
+        ):
+            return None
+        return choice.index, delta.content
+
+    @classmethod
+    def _merge_chunks(
+        cls, chunk: ChatCompletionChunk, text: str
+    ) -> ChatCompletionChunk:
+        """Returns a copy of the completion `chunk` with `text` as its content."""
+        choice = chunk.choices[0]
+        delta = choice.delta.model_copy(update={"content": text})
+        return chunk.model_copy(
+            update={"choices": [choice.model_copy(update={"delta": delta})]}
+        )
+
     def __iter__(
         self,
     ) -> Generator[tuple[OpenAICallResponseChunk, OpenAITool | None], None, None]:
@@ -183,4 +218,5 @@ class OpenAIStream(
             user_message_param=self.user_message_param,
             start_time=self.start_time,
             end_time=self.end_time,
+            timings=self.timings,
         )
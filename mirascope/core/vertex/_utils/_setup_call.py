@@ -3,6 +3,7 @@
 from collections.abc import AsyncIterable, Awaitable, Callable, Iterable
 from typing import Any, cast, overload
 
+from google.cloud.aiplatform import initializer
 from google.cloud.aiplatform_v1beta1.types import FunctionCallingConfig
 from vertexai.generative_models import (
     Content,
@@ -22,6 +23,7 @@ from ...base._utils import (
     get_create_fn,
 )
 from ...base.call_params import CommonCallParams
+from ...base.client_pool import default_client_pool
 from ...base.stream_config import StreamConfig
 from .._call_kwargs import VertexCallKwargs
 from ..call_params import VertexCallParams
@@ -31,6 +33,22 @@ from ._convert_common_call_params import convert_common_call_params
 from ._convert_message_params import convert_message_params
 
 
+def _init_config_key() -> tuple[object, ...]:
+    """Returns the `vertexai.init` configuration that pooled models are keyed by.
+
+    Models capture the global project, location, credentials, etc. when they are
+    constructed, so a model is only reused while that configuration is unchanged.
+    """
+    values = []
+    for value in vars(initializer.global_config).values():
+        try:
+            hash(value)
+        except TypeError:  # e.g. a list of request metadata
+            value = repr(value)
+        values.append(value)
+    return tuple(values)
+
+
 @overload
 def setup_call(
     *,
@@ -135,7 +153,12 @@ def setup_call(
     call_kwargs |= {"contents": messages}
 
     if client is None:
-        client = GenerativeModel(model_name=model)
+        client = default_client_pool.get(
+            GenerativeModel,
+            is_async=fn_is_async(fn),
+            key=(model, _init_config_key()),
+            create=lambda _: GenerativeModel(model_name=model),
+        )
 
     create = (
         cast(
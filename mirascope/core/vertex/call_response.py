@@ -3,11 +3,14 @@
 usage docs: learn/calls.md#handling-responses
 """
 
+from functools import cached_property
+
 from google.cloud.aiplatform_v1beta1.types import GenerateContentResponse
 from pydantic import computed_field
 from vertexai.generative_models import Content, GenerationResponse, Part, Tool
 
 from ..base import BaseCallResponse, transform_tool_outputs
+from ..base._utils import get_tool_index
 from ._utils import calculate_cost
 from .call_params import VertexCallParams
 from .dynamic_config import VertexDynamicConfig
@@ -110,30 +113,27 @@ class VertexCallResponse(
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
-    @property
+    @cached_property
     def message_param(self) -> Content:
         """Returns the models's response as a message parameter."""
         return Content(role="model", parts=self.response.candidates[0].content.parts)
 
     @computed_field
-    @property
+    @cached_property
     def tools(self) -> list[VertexTool] | None:
         """Returns the list of tools for the 0th candidate's 0th content part."""
         if self.tool_types is None:
             return None
 
-        extracted_tools = []
-        for part in self.response.candidates[0].content.parts:
-            tool_call = part.function_call
-            for tool_type in self.tool_types:
-                if tool_call.name == tool_type._name():
-                    extracted_tools.append(tool_type.from_tool_call(tool_call))
-                    break
-
-        return extracted_tools
+        tool_index = get_tool_index(self.tool_types)
+        return [
+            tool_type.from_tool_call(tool_call)
+            for part in self.response.candidates[0].content.parts
+            if (tool_type := tool_index.get((tool_call := part.function_call).name))
+        ]
 
     @computed_field
-    @property
+    @cached_property
     def tool(self) -> VertexTool | None:
         """Returns the 0th tool for the 0th candidate's 0th content part.
 
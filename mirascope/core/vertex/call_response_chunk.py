@@ -6,6 +6,7 @@ usage docs: learn/streams.md#handling-streamed-responses
 from vertexai.generative_models import FinishReason, GenerationResponse
 
 from ..base import BaseCallResponseChunk
+from ..base._utils import cached_chunk_property
 
 
 class VertexCallResponseChunk(
@@ -34,17 +35,19 @@ class VertexCallResponseChunk(
     ```
     """
 
-    @property
+    __slots__ = ()
+
+    @cached_chunk_property
     def content(self) -> str:
         """Returns the chunk content for the 0th choice."""
         return self.chunk.candidates[0].content.parts[0].text
 
-    @property
+    @cached_chunk_property
     def finish_reasons(self) -> list[FinishReason]:
         """Returns the finish reasons of the response."""
         return [candidate.finish_reason for candidate in self.chunk.candidates]
 
-    @property
+    @cached_chunk_property
     def model(self) -> None:
         """Returns the model name.
 
@@ -52,7 +55,7 @@ class VertexCallResponseChunk(
         """
         return None
 
-    @property
+    @cached_chunk_property
     def id(self) -> str | None:
         """Returns the id of the response.
 
@@ -60,7 +63,7 @@ class VertexCallResponseChunk(
         """
         return None
 
-    @property
+    @cached_chunk_property
     def usage(self) -> None:
         """Returns the usage of the chat completion.
 
@@ -68,12 +71,12 @@ class VertexCallResponseChunk(
         """
         return None
 
-    @property
+    @cached_chunk_property
     def input_tokens(self) -> None:
         """Returns the number of input tokens."""
         return None
 
-    @property
+    @cached_chunk_property
     def output_tokens(self) -> None:
         """Returns the number of output tokens."""
         return None
@@ -1 +1,48 @@
 """Test configuration fixtures used across various modules."""
+
+from collections.abc import Callable
+
+import pytest
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
+
+@pytest.fixture()
+def openai_completion() -> Callable[[str], ChatCompletion]:
+    """Returns a factory of OpenAI completions with the given content."""
+
+    def completion(content: str) -> ChatCompletion:
+        return ChatCompletion.model_validate(
+            {
+                "id": "id",
+                "choices": [
+                    {
+                        "finish_reason": "stop",
+                        "index": 0,
+                        "message": {"content": content, "role": "assistant"},
+                    }
+                ],
+                "created": 0,
+                "model": "gpt-4o-mini",
+                "object": "chat.completion",
+            }
+        )
+
+    return completion
+
+
+@pytest.fixture()
+def openai_chunk() -> Callable[[str], ChatCompletionChunk]:
+    """Returns a factory of OpenAI completion chunks with the given content."""
+
+    def chunk(content: str) -> ChatCompletionChunk:
+        return ChatCompletionChunk.model_validate(
+            {
+                "id": "id",
+                "choices": [{"delta": {"content": content}, "index": 0}],
+                "created": 0,
+                "model": "gpt-4o-mini",
+                "object": "chat.completion.chunk",
+            }
+        )
+
+    return chunk
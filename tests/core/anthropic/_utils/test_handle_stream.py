@@ -36,6 +36,7 @@ from mirascope.core.anthropic._utils._handle_stream import (
     handle_stream_async,
 )
 from mirascope.core.anthropic.tool import AnthropicTool
+from mirascope.core.base._utils import StreamThrottle
 
 
 class FormatBook(AnthropicTool):
@@ -278,3 +279,27 @@ def test_handle_chunk_no_tool_types() -> None:
     assert chunk is None
     assert current_tool_call == mock_current_tool_call
     assert current_tool_type is None
+
+
+def test_handle_stream_with_throttled_partial_tools(
+    mock_chunks: list[MessageStreamEvent],
+) -> None:
+    """Tests that a throttle coalesces partial tools and their deltas."""
+    result = list(
+        handle_stream(
+            (c for c in mock_chunks),
+            tool_types=[FormatBook],
+            partial_tools=True,
+            throttle=StreamThrottle(min_bytes=30),
+        )
+    )
+    tools = [tool for _, tool in result if tool is not None]
+    assert [tool.delta for tool in tools] == [
+        '{"title": "The Name',
+        ' of the Wind", "author": "Patrick Rothfuss"}',
+        None,
+    ]
+    assert tools[1].model_dump(exclude={"tool_call", "delta"}) == {
+        "title": "The Name of the Wind",
+        "author": "Patrick Rothfuss",
+    }
@@ -0,0 +1,91 @@
+"""Tests the `anthropic.batch` module against a local fake of Message Batches."""
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from mirascope.core import anthropic
+from mirascope.core.base import BatchRequestError
+
+
+class _FakeBatches:
+    """Runs message batches locally by answering each request with `respond`."""
+
+    def __init__(self, respond: Any) -> None:  # noqa: ANN401
+        self.respond = respond
+        self.results_: list[dict[str, Any]] = []
+        self.processing_status = "ended"
+
+    def create(self, requests: list[dict[str, Any]]) -> Any:  # noqa: ANN401
+        for request in requests:
+            message = self.respond(request["params"])
+            result = (
+                {"type": "succeeded", "message": message}
+                if message
+                else {"type": "errored", "error": {"type": "invalid_request"}}
+            )
+            self.results_.append({"custom_id": request["custom_id"], "result": result})
+        return SimpleNamespace(id="msgbatch-0")
+
+    def retrieve(self, batch_id: str) -> Any:  # noqa: ANN401
+        return SimpleNamespace(id=batch_id, processing_status=self.processing_status)
+
+    def results(self, batch_id: str) -> list[dict[str, Any]]:
+        return self.results_
+
+
+@pytest.fixture(autouse=True)
+def api_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+
+
+def test_batch_round_trip() -> None:
+    """Tests creating a message batch and parsing its results into call responses."""
+
+    @anthropic.call("claude-3-5-sonnet-20240620")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    def respond(params: dict[str, Any]) -> dict[str, Any] | None:
+        assert params["max_tokens"] == 1000
+        content = params["messages"][0]["content"]
+        if "horror" in content:
+            return None
+        return {
+            "id": "id",
+            "content": [{"type": "text", "text": content.upper()}],
+            "model": "claude-3-5-sonnet-20240620",
+            "role": "assistant",
+            "stop_reason": "end_turn",
+            "type": "message",
+            "usage": {"input_tokens": 1, "output_tokens": 1},
+        }
+
+    batches = _FakeBatches(respond)
+    client = SimpleNamespace(
+        messages=SimpleNamespace(), beta=SimpleNamespace(messages=SimpleNamespace())
+    )
+    client.beta.messages.batches = batches
+    inputs = [{"genre": "fantasy"}, {"genre": "horror"}]
+    batch = anthropic.batch.create_batch(recommend_book, inputs, client=client)  # pyright: ignore [reportArgumentType]
+    results = anthropic.batch.get_batch_results(
+        recommend_book,
+        inputs,
+        batch.id,
+        client=client,  # pyright: ignore [reportArgumentType]
+    )
+    assert isinstance(results[0], anthropic.AnthropicCallResponse)
+    assert results[0].content == "RECOMMEND A FANTASY BOOK"
+    assert isinstance(results[1], BatchRequestError)
+    assert results[1].error == {"type": "invalid_request"}
+
+    client.messages.batches = batches
+    batches.processing_status = "in_progress"
+    with pytest.raises(ValueError, match="has not ended"):
+        anthropic.batch.get_batch_results(
+            recommend_book,
+            inputs,
+            batch.id,
+            client=client,  # pyright: ignore [reportArgumentType]
+        )
@@ -353,3 +353,34 @@ def test_construct_call_response_string_content() -> None:
         "role": "assistant",
         "content": [{"text": "content", "type": "text"}],
     }
+
+
+def test_anthropic_stream_coalesce_chunks() -> None:
+    """Tests which Anthropic stream events can be coalesced and how they're merged."""
+    text_event = RawContentBlockDeltaEvent(
+        delta=TextDelta(text="The ", type="text_delta"),
+        index=0,
+        type="content_block_delta",
+    )
+    json_event = RawContentBlockDeltaEvent(
+        delta=InputJSONDelta(partial_json='{"ti', type="input_json_delta"),
+        index=1,
+        type="content_block_delta",
+    )
+    assert AnthropicStream._mergeable_text(text_event) == ((0, "text_delta"), "The ")
+    assert AnthropicStream._mergeable_text(json_event) == (
+        (1, "input_json_delta"),
+        '{"ti',
+    )
+    assert (
+        AnthropicStream._mergeable_text(
+            RawContentBlockStopEvent(index=0, type="content_block_stop")
+        )
+        is None
+    )
+    merged_text = AnthropicStream._merge_chunks(text_event, "The Name")
+    assert isinstance(merged_text.delta, TextDelta)
+    assert merged_text.delta.text == "The Name"
+    merged_json = AnthropicStream._merge_chunks(json_event, '{"title": ')
+    assert merged_json.delta.partial_json == '{"title": '  # pyright: ignore [reportAttributeAccessIssue]
+    assert merged_json.index == 1
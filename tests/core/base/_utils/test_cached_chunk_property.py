@@ -0,0 +1,36 @@
+"""Tests the `_utils.cached_chunk_property` decorator."""
+
+from mirascope.core.base._utils import cached_chunk_property
+
+
+class Chunk:
+    __slots__ = ("text", "calls", "_cache")
+
+    def __init__(self, text: str) -> None:
+        self.text, self.calls, self._cache = text, 0, None
+
+    @cached_chunk_property
+    def words(self) -> list[str]:
+        """Returns the words of the text."""
+        self.calls += 1
+        return self.text.split()
+
+    @cached_chunk_property
+    def first_word(self) -> str | None:
+        self.calls += 1
+        return self.words[0] if self.words else None
+
+
+def test_cached_chunk_property() -> None:
+    """Tests that values are computed once per instance and cached in `_cache`."""
+    chunk = Chunk("the name of the wind")
+    assert chunk._cache is None
+    assert chunk.words == ["the", "name", "of", "the", "wind"]
+    assert chunk.words is chunk.words
+    assert chunk.first_word == "the"
+    assert chunk.first_word == "the"
+    assert chunk.calls == 2
+    assert chunk._cache == {"words": chunk.words, "first_word": "the"}
+    assert Chunk("").first_word is None
+    assert isinstance(Chunk.words, cached_chunk_property)
+    assert Chunk.words.__doc__ == "Returns the words of the text."
@@ -0,0 +1,91 @@
+"""Tests the `_utils.call_tools` and `_utils.call_tools_async` functions."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mirascope.core.base import BaseTool
+from mirascope.core.base._utils import call_tools, call_tools_async
+
+
+class Sleep(BaseTool):
+    """Sleeps for `seconds` and returns the name of the thread it ran on."""
+
+    seconds: float
+
+    def call(self) -> str:
+        time.sleep(self.seconds)
+        return threading.current_thread().name
+
+
+class AsyncSleep(BaseTool):
+    """Sleeps for `seconds` asynchronously."""
+
+    seconds: float
+
+    async def call(self) -> float:
+        await asyncio.sleep(self.seconds)
+        return self.seconds
+
+
+class Fail(BaseTool):
+    """Always fails."""
+
+    def call(self) -> None:
+        raise ValueError("Tool failed")
+
+
+def test_call_tools() -> None:
+    """Tests that tools are called concurrently and returned in call order."""
+    assert call_tools([]) == []
+    tools = [Sleep(seconds=0.2), Sleep(seconds=0.1), AsyncSleep(seconds=0.1)]
+    start = time.perf_counter()
+    tools_and_outputs = call_tools(tools)
+    assert time.perf_counter() - start < 0.35
+    assert [tool for tool, _ in tools_and_outputs] == tools
+    assert tools_and_outputs[0][1] != tools_and_outputs[1][1]
+    assert tools_and_outputs[2][1] == 0.1
+
+    tool = Sleep(seconds=0)
+    assert call_tools([tool]) == [(tool, threading.current_thread().name)]
+    assert call_tools([AsyncSleep(seconds=0)])[0][1] == 0
+
+    with ThreadPoolExecutor(thread_name_prefix="tools") as executor:
+        tools_and_outputs = call_tools([tool], executor=executor)
+    assert tools_and_outputs[0][1].startswith("tools")
+
+
+def test_call_tools_errors() -> None:
+    """Tests that tool errors and timeouts are raised."""
+    with pytest.raises(ValueError, match="Tool failed"):
+        call_tools([Sleep(seconds=0), Fail()])
+    with pytest.raises(TimeoutError, match="`Sleep` timed out after 0.05 seconds"):
+        call_tools([AsyncSleep(seconds=0), Sleep(seconds=0.2)], timeout=0.05)
+
+
+@pytest.mark.asyncio
+async def test_call_tools_async() -> None:
+    """Tests that sync and async tools are called concurrently."""
+    tools = [AsyncSleep(seconds=0.2), Sleep(seconds=0.1), AsyncSleep(seconds=0.1)]
+    start = time.perf_counter()
+    tools_and_outputs = await call_tools_async(tools)
+    assert time.perf_counter() - start < 0.35
+    assert [tool for tool, _ in tools_and_outputs] == tools
+    assert tools_and_outputs[0][1] == 0.2
+    assert tools_and_outputs[1][1] != threading.current_thread().name
+
+    with ThreadPoolExecutor(thread_name_prefix="tools") as executor:
+        tools_and_outputs = await call_tools_async([tools[1]], executor=executor)
+    assert tools_and_outputs[0][1].startswith("tools")
+
+
+@pytest.mark.asyncio
+async def test_call_tools_async_errors() -> None:
+    """Tests that tool errors and timeouts are raised."""
+    with pytest.raises(ValueError, match="Tool failed"):
+        await call_tools_async([AsyncSleep(seconds=0), Fail()])
+    with pytest.raises(TimeoutError, match="`AsyncSleep` timed out after 0.05"):
+        await call_tools_async([AsyncSleep(seconds=1), Sleep(seconds=0)], timeout=0.05)
@@ -0,0 +1,43 @@
+"""Tests the `_utils._close_stream` module."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mirascope.core.base._utils import close_stream, close_stream_async
+
+
+def test_close_stream() -> None:
+    """Tests closing streams that can and can't be closed."""
+    stream = MagicMock()
+    close_stream(stream)
+    stream.close.assert_called_once()
+    close_stream(iter([1, 2]))
+
+
+@pytest.mark.asyncio
+async def test_close_stream_async() -> None:
+    """Tests closing async streams with `aclose()` or an async `close()`."""
+
+    async def generator():
+        try:
+            yield 1
+            yield 2
+        finally:
+            closed.append(True)
+
+    closed = []
+    stream = generator()
+    assert await anext(stream) == 1
+    await close_stream_async(stream)
+    assert closed == [True]
+
+    sdk_stream = MagicMock(spec=["close"])
+    sdk_stream.close = AsyncMock()
+    await close_stream_async(sdk_stream)
+    sdk_stream.close.assert_awaited_once()
+
+    sync_stream = MagicMock(spec=["close"])
+    await close_stream_async(sync_stream)
+    sync_stream.close.assert_called_once()
+    await close_stream_async(object())
@@ -0,0 +1,107 @@
+"""Tests the `_utils._coalesce_chunks` module."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mirascope.core.base._utils import (
+    ChunkCoalescer,
+    coalesce_chunks,
+    coalesce_chunks_async,
+    get_chunk_coalescer,
+)
+from mirascope.core.base.stream import BaseStream
+
+
+def _mergeable_text(chunk: tuple[str, str]) -> tuple[str, str] | None:
+    key, text = chunk
+    return None if key == "tool" else (key, text)
+
+
+def _merge_chunks(chunk: tuple[str, str], text: str) -> tuple[str, str]:
+    return chunk[0], text
+
+
+class _Stream(BaseStream):
+    _mergeable_text = classmethod(lambda cls, chunk: _mergeable_text(chunk))
+    _merge_chunks = classmethod(lambda cls, chunk, text: _merge_chunks(chunk, text))
+
+
+class _SubStream(_Stream): ...
+
+
+class _IncompleteStream(BaseStream):
+    _mergeable_text = classmethod(lambda cls, chunk: _mergeable_text(chunk))
+
+
+def test_get_chunk_coalescer() -> None:
+    """Tests that a coalescer is only created when a `coalesce_*` option is set."""
+    assert get_chunk_coalescer(None, _Stream) is None
+    assert get_chunk_coalescer({"partial_tools": True}, _Stream) is None
+    coalescer = get_chunk_coalescer({"coalesce_bytes": 8}, _SubStream)
+    assert isinstance(coalescer, ChunkCoalescer)
+    assert coalescer.max_bytes == 8
+    assert coalescer.max_chunks is None and coalescer.max_seconds is None
+    assert coalescer.mergeable_text(("a", "1")) == ("a", "1")
+    assert coalescer.merge_chunks(("a", "1"), "12") == ("a", "12")
+
+
+def test_get_chunk_coalescer_merge_hooks() -> None:
+    """Tests that streams must override both merge hooks to coalesce chunks."""
+    assert get_chunk_coalescer({"coalesce_chunks": 2}, BaseStream) is None
+    assert BaseStream._merge_chunks(("a", "1"), "12") == ("a", "1")
+    with pytest.raises(TypeError, match="_IncompleteStream must override `_merge"):
+        get_chunk_coalescer({"coalesce_chunks": 2}, _IncompleteStream)
+
+
+def test_coalesce_chunks_max_chunks() -> None:
+    """Tests merging adjacent chunks into batches of at most `max_chunks`."""
+    coalescer = ChunkCoalescer(_mergeable_text, _merge_chunks, max_chunks=2)
+    chunks = [("a", "1"), ("a", "2"), ("a", "3"), ("b", "4"), ("tool", "5")]
+    assert list(coalesce_chunks(chunks, coalescer)) == [
+        ("a", "12"),
+        ("a", "3"),
+        ("b", "4"),
+        ("tool", "5"),
+    ]
+
+
+def test_coalesce_chunks_max_bytes() -> None:
+    """Tests merging adjacent chunks until their text reaches `max_bytes`."""
+    coalescer = ChunkCoalescer(_mergeable_text, _merge_chunks, max_bytes=4)
+    chunks = [("a", "ab"), ("a", "cde"), ("a", "f"), ("tool", ""), ("a", "g")]
+    assert list(coalesce_chunks(chunks, coalescer)) == [
+        ("a", "abcde"),
+        ("a", "f"),
+        ("tool", ""),
+        ("a", "g"),
+    ]
+
+
+@patch("mirascope.core.base._utils._coalesce_chunks.time.monotonic")
+def test_coalesce_chunks_max_ms(mock_monotonic: MagicMock) -> None:
+    """Tests flushing a batch once a chunk arrives after `max_ms` milliseconds."""
+    mock_monotonic.side_effect = [0.0, 0.0, 0.01, 0.06, 0.1, 0.1]
+    coalescer = ChunkCoalescer(_mergeable_text, _merge_chunks, max_ms=50)
+    assert coalescer.push(("a", "1")) == []
+    assert coalescer.push(("a", "2")) == []
+    assert coalescer.push(("a", "3")) == [("a", "123")]
+    assert coalescer.push(("a", "4")) == []
+    assert coalescer.flush() == [("a", "4")]
+    assert coalescer.flush() == []
+
+
+@pytest.mark.asyncio
+async def test_coalesce_chunks_async() -> None:
+    """Tests merging the chunks of an async stream."""
+
+    async def chunks():
+        for chunk in [("a", "1"), ("a", "2"), ("tool", "3"), ("a", "4"), ("a", "5")]:
+            yield chunk
+
+    coalescer = ChunkCoalescer(_mergeable_text, _merge_chunks, max_chunks=3)
+    assert [chunk async for chunk in coalesce_chunks_async(chunks(), coalescer)] == [
+        ("a", "12"),
+        ("tool", "3"),
+        ("a", "45"),
+    ]
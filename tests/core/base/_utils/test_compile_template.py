@@ -0,0 +1,66 @@
+"""Tests the `_utils.compile_template` function and `CompiledTemplate` class."""
+
+from unittest.mock import patch
+
+from mirascope.core.base._utils._compile_template import (
+    CompiledTemplate,
+    compile_template,
+)
+from mirascope.core.base.message_param import BaseMessageParam, CacheControlPart
+
+
+def test_compile_template_is_cached() -> None:
+    """Tests that the same compiled template is returned for the same template."""
+    compiled_template = compile_template("Recommend a {genre} book.")
+    assert isinstance(compiled_template, CompiledTemplate)
+    assert compiled_template.roles == ("system", "user", "assistant")
+    assert compile_template("Recommend a {genre} book.") is compiled_template
+    assert compile_template("Recommend a {genre} book.", ["user"]) is not (
+        compiled_template
+    )
+
+
+def test_compiled_template_renders_without_parsing() -> None:
+    """Tests that rendering a compiled template doesn't parse it again."""
+    compiled_template = CompiledTemplate(
+        """
+        SYSTEM: You are a librarian. {:cache_control}
+        USER: Recommend {count} {genre} books.
+        """
+    )
+    with (
+        patch("re.finditer") as mock_finditer,
+        patch("re.split") as mock_split,
+        patch(
+            "mirascope.core.base._utils._get_template_variables.Formatter"
+        ) as mock_formatter,
+    ):
+        for genre in ["fantasy", "mystery"]:
+            assert compiled_template.message_params({"count": 2, "genre": genre}) == [
+                BaseMessageParam(
+                    role="system",
+                    content=[
+                        {"type": "text", "text": "You are a librarian."},  # pyright: ignore [reportArgumentType]
+                        CacheControlPart(type="cache_control", cache_type="ephemeral"),
+                    ],
+                ),
+                BaseMessageParam(role="user", content=f"Recommend 2 {genre} books."),
+            ]
+        mock_finditer.assert_not_called()
+        mock_split.assert_not_called()
+        mock_formatter.assert_not_called()
+
+
+def test_compiled_template_empty() -> None:
+    """Tests rendering a compiled template that renders no messages."""
+    assert CompiledTemplate("").message_params({}) == []
+
+
+def test_compiled_template_format() -> None:
+    """Tests formatting a compiled template as a single string."""
+    compiled_template = CompiledTemplate(
+        "Describe {image:image} and {content:text} as {items:list}"
+    )
+    attrs = {"image": "image.jpg", "content": "text", "items": ["a", "b"]}
+    assert compiled_template.format(attrs) == "Describe image.jpg and text as a\nb"
+    assert compiled_template.format(attrs) == "Describe image.jpg and text as a\nb"
@@ -6,6 +6,7 @@ from mirascope.core.base._utils._convert_base_model_to_base_tool import (
     convert_base_model_to_base_tool,
 )
 from mirascope.core.base._utils._default_tool_docstring import DEFAULT_TOOL_DOCSTRING
+from mirascope.core.base._utils._tool_type_cache import clear_tool_type_cache
 from mirascope.core.base.tool import BaseTool
 
 
@@ -26,3 +27,19 @@ def test_convert_base_model_to_base_tool() -> None:
         tool(title="The Name of the Wind", author="Patrick Rothfuss").call()  # type: ignore
         == "The Name of the Wind by Patrick Rothfuss"
     )
+
+
+def test_convert_base_model_to_base_tool_is_cached() -> None:
+    """Tests that converting the same model and base returns the same type."""
+
+    class Book(BaseModel):
+        title: str
+
+    class OtherTool(BaseTool):
+        def call(self) -> None: ...  # pragma: no cover
+
+    tool = convert_base_model_to_base_tool(Book, BaseTool)
+    assert convert_base_model_to_base_tool(Book, BaseTool) is tool
+    assert convert_base_model_to_base_tool(Book, OtherTool) is not tool
+    clear_tool_type_cache(Book)
+    assert convert_base_model_to_base_tool(Book, BaseTool) is not tool
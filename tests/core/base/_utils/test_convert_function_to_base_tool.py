@@ -130,3 +130,22 @@ def test_convert_function_to_base_tool_missing_parameter_description() -> None:
 
     with pytest.raises(ValueError):
         convert_function_to_base_tool(format_book, BaseTool)
+
+
+def test_convert_function_to_base_tool_is_cached() -> None:
+    """Tests that converting the same function and base returns the same type."""
+
+    def format_book(title: str, author: str) -> str:
+        """Returns the title and author nicely formatted."""
+        return f"{title} by {author}"  # pragma: no cover
+
+    tool_type = convert_function_to_base_tool(format_book, BaseTool)
+    assert convert_function_to_base_tool(format_book, BaseTool) is tool_type
+    assert (
+        convert_function_to_base_tool(format_book, BaseTool, "Custom docstring.")
+        is not tool_type
+    )
+    assert (
+        convert_function_to_base_tool(format_book, BaseTool, None, "namespace")
+        is not tool_type
+    )
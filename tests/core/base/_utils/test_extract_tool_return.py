@@ -4,6 +4,7 @@ from typing import Annotated
 
 from pydantic import BaseModel, RootModel
 
+from mirascope.core.base import _partial
 from mirascope.core.base._utils._extract_tool_return import extract_tool_return
 from mirascope.core.base.from_call_args import FromCallArgs
 
@@ -48,6 +49,25 @@ def test_extract_tool_return_base_type() -> None:
     assert title == "The Name"
 
 
+def test_extract_tool_return_base_type_cached() -> None:
+    """Tests that base types are converted once rather than for every extraction."""
+    values = [
+        extract_tool_return(
+            list[str],
+            f'{{"value": ["{i}", "',
+            allow_partial=True,
+            fields_from_call_args={},
+        )
+        for i in range(3)
+    ]
+    assert values == [["0", ""], ["1", ""], ["2", ""]]
+    cache_size = len(_partial._partial_cache)
+    extract_tool_return(
+        list[str], '{"value": ["a"', allow_partial=True, fields_from_call_args={}
+    )
+    assert len(_partial._partial_cache) == cache_size
+
+
 def test_extract_tool_return_parse_obj_with_fields_from_call_args() -> None:
     """Tests the `extract_tool_return` function parsing obj and fields from call args."""
 
@@ -0,0 +1,142 @@
+"""Tests the `_utils.get_call_plan` function and `CallPlan` class."""
+
+import gc
+from unittest.mock import patch
+from weakref import ref
+
+from mirascope.core.base._utils._get_call_plan import CallPlan, get_call_plan
+from mirascope.core.base.prompt import prompt_template
+from mirascope.core.base.tool import BaseTool
+
+
+class FormatBook(BaseTool):
+    """Returns the title and author nicely formatted."""
+
+    title: str
+    author: str
+
+    def call(self) -> str:
+        return f"{self.title} by {self.author}"  # pragma: no cover
+
+    @classmethod
+    def tool_schema(cls) -> dict:
+        return {"name": cls._name()}
+
+
+def test_get_call_plan_is_cached() -> None:
+    """Tests that the same plan is returned for the same function."""
+
+    def fn(genre: str) -> None: ...  # pragma: no cover
+
+    call_plan = get_call_plan(fn)
+    assert isinstance(call_plan, CallPlan)
+    assert get_call_plan(fn) is call_plan
+
+    class NoWeakRef:
+        __slots__ = ()
+
+        def __call__(self, genre: str) -> None: ...  # pragma: no cover
+
+    no_weak_ref_fn = NoWeakRef()
+    assert get_call_plan(no_weak_ref_fn) is not get_call_plan(no_weak_ref_fn)
+
+
+def test_call_plan_bind() -> None:
+    """Tests binding arguments with the cached signature."""
+
+    def fn(
+        genre: str, *args: str, topic: str = "magic", **kwargs: str
+    ) -> None: ...  # pragma: no cover
+
+    call_plan = get_call_plan(fn)
+    assert call_plan.bind(("fantasy",), {"extra": "value"}) == {
+        "genre": "fantasy",
+        "args": (),
+        "topic": "magic",
+        "extra": "value",
+    }
+
+    def no_kwargs_fn(genre: str) -> None: ...  # pragma: no cover
+
+    assert get_call_plan(no_kwargs_fn).bind((), {"genre": "fantasy"}) == {
+        "genre": "fantasy"
+    }
+
+
+def test_call_plan_get_prompt_template() -> None:
+    """Tests that the prompt template is resolved once."""
+
+    @prompt_template("Recommend a {genre} book.")
+    def fn(genre: str) -> None: ...  # pragma: no cover
+
+    call_plan = get_call_plan(fn)
+    with patch(
+        "mirascope.core.base._utils._get_call_plan.get_prompt_template",
+        return_value="Recommend a {genre} book.",
+    ) as mock_get_prompt_template:
+        assert call_plan.get_prompt_template() == "Recommend a {genre} book."
+        assert call_plan.get_prompt_template() == "Recommend a {genre} book."
+        mock_get_prompt_template.assert_called_once_with(fn)
+
+    class NoWeakRef:
+        __slots__ = ()
+        prompt_template = "Recommend a {genre} book."
+
+        def __call__(self, genre: str) -> None: ...  # pragma: no cover
+
+    assert get_call_plan(NoWeakRef()).get_prompt_template() == (
+        "Recommend a {genre} book."
+    )
+
+
+def test_call_plan_does_not_keep_fn_alive() -> None:
+    """Tests that cached plans don't keep their decorated function alive."""
+
+    @prompt_template("Recommend a {genre} book.")
+    def fn(genre: str) -> None: ...  # pragma: no cover
+
+    assert get_call_plan(fn).get_prompt_template() == "Recommend a {genre} book."
+    fn_ref = ref(fn)
+    del fn
+    gc.collect()
+    assert fn_ref() is None
+
+
+def test_call_plan_get_tools() -> None:
+    """Tests that tools are converted and their schemas generated only once."""
+
+    def format_author(author: str) -> str:
+        """Formats the author.
+
+        Args:
+            author: The author.
+        """
+        return author  # pragma: no cover
+
+    def fn() -> None: ...  # pragma: no cover
+
+    call_plan = get_call_plan(fn)
+    tools = [FormatBook, format_author]
+    tool_types, tool_schemas = call_plan.get_tools(tools, FormatBook)
+    assert [tool_type._name() for tool_type in tool_types] == [
+        "FormatBook",
+        "format_author",
+    ]
+    assert tool_schemas == [{"name": "FormatBook"}, {"name": "format_author"}]
+
+    cached_tool_types, cached_tool_schemas = call_plan.get_tools(tools, FormatBook)
+    assert cached_tool_types == tool_types and cached_tool_types is not tool_types
+    assert all(
+        cached is original
+        for cached, original in zip(cached_tool_schemas, tool_schemas, strict=True)
+    )
+
+    class Unhashable:
+        __hash__ = None  # pyright: ignore [reportAssignmentType]
+
+    with patch(
+        "mirascope.core.base._utils._get_call_plan.convert_tools",
+        return_value=([], []),
+    ) as mock_convert_tools:
+        assert call_plan.get_tools([Unhashable()], FormatBook) == ([], [])  # pyright: ignore [reportArgumentType]
+        mock_convert_tools.assert_called_once()
@@ -214,3 +214,22 @@ def test_get_create_fn_type_casting():
     # Consume the Generator to verify its content
     results = list(stream_result)
     assert results == ["streaming result"]
+
+
+def test_get_create_fn_streaming_closes_sdk_stream():
+    class SDKStream:
+        closed = False
+
+        def __iter__(self) -> Iterator[str]:
+            yield "streaming result 1"
+            yield "streaming result 2"
+
+        def close(self) -> None:
+            self.closed = True
+
+    sdk_stream = SDKStream()
+    create_or_stream = get_create_fn(lambda **kwargs: sdk_stream)
+    stream_result = create_or_stream(stream=True)
+    assert next(stream_result) == "streaming result 1"
+    stream_result.close()
+    assert sdk_stream.closed
@@ -0,0 +1,152 @@
+"""Tests the `_utils.IncrementalJsonParser` class."""
+
+import json
+import re
+import time
+
+import jiter
+import pytest
+
+from mirascope.core.base._utils import IncrementalJsonParser
+
+_SAMPLES = [
+    '{"title": "The Name of the Wind", "pages": 662, "tags": ["a", {"b": [[]]}]}',
+    '{"a": 1, "b": [0, 2.5, -3e2, 1E+2, true, false, null], "c": {}, "d": []}',
+    '{"s": "q\\"uote\\\\ \\/\\b\\f\\n\\r\\t\\u00e9\\ud83d\\ude00 \\ud83d lone"}',
+    '[1, {"b": "x"}, [], "s"]',
+    '"top-level string"',
+    ' { "spaced" : [ 1 , 2 ] } ',
+]
+# A prefix ending inside an escape keeps the string decoded so far (`jiter` drops it).
+_INCOMPLETE_ESCAPE = re.compile(r"\\(u[0-9a-fA-F]{0,4}(\\u?[0-9a-fA-F]{0,4})?)?$")
+
+
+@pytest.mark.parametrize("sample", _SAMPLES)
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7])
+def test_incremental_json_parser_matches_jiter(sample: str, chunk_size: int) -> None:
+    """Tests that every prefix parses the same as `jiter`'s partial mode."""
+    parser = IncrementalJsonParser()
+    for end in range(chunk_size, len(sample) + chunk_size, chunk_size):
+        previous = json.dumps(parser.value)
+        changed = parser.feed(sample[end - chunk_size : end])
+        assert changed or json.dumps(parser.value) == previous
+        prefix = sample[:end]
+        if sample.strip() and not _INCOMPLETE_ESCAPE.search(prefix):
+            try:
+                expected = jiter.from_json(
+                    prefix.encode(), partial_mode="trailing-strings"
+                )
+            except ValueError:
+                continue
+            assert parser.value == expected, prefix
+    assert parser.done
+    assert parser.value == json.loads(sample)
+
+
+def test_incremental_json_parser_partial_values() -> None:
+    """Tests which incomplete values are included in the partial value."""
+    parser = IncrementalJsonParser()
+    assert parser.value is None and not parser.feed("")
+    assert parser.feed('{"a": "x\\')
+    assert parser.value == {"a": "x"}
+    parser.feed('n", "b": 12')
+    assert parser.value == {"a": "x\n", "b": 12}
+    parser.feed(".")
+    assert parser.value == {"a": "x\n"}
+    parser.feed('5, "c": tr')
+    assert parser.value == {"a": "x\n", "b": 12.5}
+    assert not parser.feed("u")
+    parser.feed('e, "d"')
+    assert parser.value == {"a": "x\n", "b": 12.5, "c": True}
+    parser.feed(": [-")
+    assert parser.value == {"a": "x\n", "b": 12.5, "c": True, "d": []}
+    parser.feed("1]} trailing text")
+    assert parser.done
+    assert parser.value == {"a": "x\n", "b": 12.5, "c": True, "d": [-1]}
+    assert not parser.feed("{}")
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"a" 1}', '{"a": 1 "b"}', "{1: 2}", "[1,]", "{,}", '{"a": tru}', '{"a": 1.}'],
+)
+def test_incremental_json_parser_invalid(text: str) -> None:
+    """Tests that invalid JSON raises a `ValueError`."""
+    with pytest.raises(ValueError):
+        IncrementalJsonParser().feed(text)
+
+
+@pytest.mark.parametrize("text", ['{"a": "\\x"}', '{"a": "\\u12g4"}'])
+def test_incremental_json_parser_invalid_escape(text: str) -> None:
+    """Tests that invalid escapes raise a `ValueError`."""
+    with pytest.raises(ValueError, match="Invalid escape"):
+        IncrementalJsonParser().feed(text)
+
+
+def test_incremental_json_parser_throughput() -> None:
+    """Benchmarks parsing a long stream of small chunks.
+
+    Re-parsing the whole buffer on every chunk is quadratic in the length of the
+    stream, whereas feeding each chunk only scans the new text.
+    """
+    text = json.dumps({"text": "lorem ipsum " * 50_000, "items": list(range(20_000))})
+    parser = IncrementalJsonParser()
+    start = time.perf_counter()
+    for index in range(0, len(text), 16):
+        parser.feed(text[index : index + 16])
+    assert time.perf_counter() - start < 5
+    assert parser.value == json.loads(text)
+
+
+def test_incremental_json_parser_completed_length() -> None:
+    """Tests counting the completed items of an array while it is being parsed."""
+    parser = IncrementalJsonParser()
+    parser.feed('{"value": [{"a": 1}, {"a"')
+    items = parser.value["value"]
+    assert parser.completed_length(items) == 1
+    parser.feed(": 2}")
+    assert parser.completed_length(items) == 2
+    parser.feed(", 1")
+    assert len(items) == 3 and parser.completed_length(items) == 2
+    parser.feed(", tr")
+    assert len(items) == 3 and parser.completed_length(items) == 3
+    parser.feed("ue]")
+    assert parser.completed_length(items) == 4
+
+
+def test_incremental_json_parser_completed_keys() -> None:
+    """Tests which keys of the top-level object have complete values."""
+    parser = IncrementalJsonParser()
+    assert parser.completed_keys() == set()
+    steps = [
+        ('{"title": "The Na', set()),
+        ('me", "pages": 6', {"title"}),
+        ('62, "tags": ["a"', {"title", "pages"}),
+        ("]", {"title", "pages", "tags"}),
+        (', "x"', {"title", "pages", "tags"}),
+        (": {}}", {"title", "pages", "tags", "x"}),
+    ]
+    for chunk, expected in steps:
+        parser.feed(chunk)
+        assert parser.completed_keys() == expected
+    parser = IncrementalJsonParser()
+    parser.feed("[1")
+    assert parser.completed_keys() == set()
+
+
+def test_incremental_json_parser_changed_keys() -> None:
+    """Tests collecting the top-level keys whose values changed in place."""
+    parser = IncrementalJsonParser()
+    parser.feed('{"title": "A", "tags": ["a"')
+    assert parser.changed_keys == {"title", "tags"}
+    parser.clear_changed_keys()
+    parser.feed(', {"b": 1}')
+    parser.feed("]")
+    assert parser.changed_keys == {"tags"}
+    parser.clear_changed_keys()
+    parser.feed(', "pages": 6')
+    parser.feed("62")
+    assert parser.changed_keys == {"pages"}
+    parser.clear_changed_keys()
+    parser.feed("}")
+    assert parser.changed_keys == set()
@@ -1,25 +1,17 @@
 """Tests the `_utils.parse_prompt_messages` function."""
 
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import MagicMock
 
 import pytest
 
 from mirascope.core.base._utils._parse_prompt_messages import parse_prompt_messages
+from mirascope.core.base.message_param import BaseMessageParam
 
 
-@patch(
-    "mirascope.core.base._utils._parse_prompt_messages.parse_content_template",
-    new_callable=MagicMock,
-)
-def test_parse_prompt_messages(mock_parse_content_template: MagicMock) -> None:
+def test_parse_prompt_messages() -> None:
     """Test the parse_prompt_messages function."""
-    empty_user_message = {"role": "user", "content": ""}
-    mock_parse_content_template.return_value = empty_user_message
-
     messages = parse_prompt_messages(roles=["user"], template="prompt", attrs={})
-    assert messages == [empty_user_message]
-    mock_parse_content_template.assert_called_once_with("user", "prompt", {})
-    mock_parse_content_template.reset_mock()
+    assert messages == [BaseMessageParam(role="user", content="prompt")]
 
     prompt_template = """
     SYSTEM: 
@@ -28,31 +20,42 @@ def test_parse_prompt_messages(mock_parse_content_template: MagicMock) -> None:
     messages = parse_prompt_messages(
         roles=["system", "user"], template=prompt_template, attrs={}
     )
-    assert messages == [empty_user_message, empty_user_message]
-    mock_parse_content_template.assert_has_calls(
-        [call("system", "", {}), call("user", "This is a user message.", {})]
-    )
+    assert messages == [
+        BaseMessageParam(role="user", content="This is a user message.")
+    ]
 
     prompt_template = """
     SYSTEM: This is a system message.
     MESSAGES: {messages}
     MESSAGES: {self.messages}
-    USER: This is a user message.
+    USER: This is a {genre} message.
     """
+    history = [BaseMessageParam(role="assistant", content="history")]
     mock_self = MagicMock()
-    mock_messages = [empty_user_message, empty_user_message]
-    mock_self.messages = mock_messages
-    attrs = {"messages": mock_messages, "self": mock_self}
+    mock_self.messages = history
+    attrs = {"messages": history, "self": mock_self, "genre": "user"}
     messages = parse_prompt_messages(
         roles=["system", "user"], template=prompt_template, attrs=attrs
     )
-    assert messages == [empty_user_message] * 6
-    mock_parse_content_template.assert_has_calls(
-        [
-            call("system", "This is a system message.", attrs),
-            call("user", "This is a user message.", attrs),
-        ]
+    assert messages == [
+        BaseMessageParam(role="system", content="This is a system message."),
+        *history,
+        *history,
+        BaseMessageParam(role="user", content="This is a user message."),
+    ]
+
+
+def test_parse_prompt_messages_computed_fields() -> None:
+    """Test the parse_prompt_messages function with computed fields."""
+    messages = parse_prompt_messages(
+        roles=["user"],
+        template="Recommend a {genre} book.",
+        attrs={},
+        dynamic_config={"computed_fields": {"genre": "fantasy"}},
     )
+    assert messages == [
+        BaseMessageParam(role="user", content="Recommend a fantasy book.")
+    ]
 
 
 def test_parse_prompt_messages_invalid_messages() -> None:
@@ -0,0 +1,202 @@
+"""Tests the `_utils.StreamTee` class."""
+
+import asyncio
+import threading
+from collections.abc import AsyncGenerator, Generator
+
+import pytest
+
+from mirascope.core.base._utils import StreamTee
+
+
+def test_stream_tee() -> None:
+    """Tests that every consumer sees every item and the source is iterated once."""
+    pulled = []
+
+    def source() -> Generator[int, None, None]:
+        for item in range(5):
+            pulled.append(item)
+            yield item
+
+    first, second, third = StreamTee(source(), 3).consumers
+    assert list(first) == [0, 1, 2, 3, 4]
+    assert list(second) == [0, 1, 2, 3, 4]
+    assert list(third) == [0, 1, 2, 3, 4]
+    assert pulled == [0, 1, 2, 3, 4]
+    assert first.dropped == first.spilled == 0
+
+
+def test_stream_tee_invalid_arguments() -> None:
+    """Tests that invalid tee arguments raise a `ValueError`."""
+    with pytest.raises(ValueError, match="0 consumers"):
+        StreamTee([], 0)
+    with pytest.raises(ValueError, match="max_buffer"):
+        StreamTee([], 2, max_buffer=0)
+    with pytest.raises(ValueError, match="policy"):
+        StreamTee([], 2, policy="wait")  # pyright: ignore [reportArgumentType]
+
+
+def test_stream_tee_drop() -> None:
+    """Tests that the oldest items of a slow consumer are dropped."""
+    fast, slow = StreamTee(range(6), 2, max_buffer=2, policy="drop").consumers
+    assert list(fast) == [0, 1, 2, 3, 4, 5]
+    assert list(slow) == [4, 5]
+    assert slow.dropped == 4 and fast.dropped == 0
+
+
+def test_stream_tee_spill() -> None:
+    """Tests that items are buffered past `max_buffer` and counted as spilled."""
+    fast, slow = StreamTee(range(6), 2, max_buffer=2, policy="spill").consumers
+    assert list(fast) == [0, 1, 2, 3, 4, 5]
+    assert list(slow) == [0, 1, 2, 3, 4, 5]
+    assert slow.spilled == 4 and slow.dropped == 0
+
+
+def test_stream_tee_block() -> None:
+    """Tests that fast consumers wait for a slow consumer in another thread."""
+    fast, slow = StreamTee(range(20), 2, max_buffer=2).consumers
+    lag = []
+    slow_results = []
+
+    def consume_slow() -> None:
+        for item in slow:
+            slow_results.append(item)
+
+    thread = threading.Thread(target=consume_slow)
+    for item in fast:
+        lag.append(item - len(slow_results))
+        if item == 0:
+            thread.start()
+    thread.join()
+    assert slow_results == list(range(20))
+    assert max(lag) <= 3
+
+
+def test_stream_tee_detach() -> None:
+    """Tests that consumers that stop early are detached and close the source."""
+    closed = []
+
+    def source() -> Generator[int, None, None]:
+        try:
+            yield from range(10)
+        finally:
+            closed.append(True)
+
+    first, second = StreamTee(source(), 2, max_buffer=1, policy="spill").consumers
+    for item in second:
+        if item == 1:
+            break
+    assert list(first) == list(range(10))
+    assert closed == [True]
+
+    first, second = StreamTee(source(), 2).consumers
+    next(iter(first))
+    assert closed == [True]
+    iterator = iter(second)
+    assert next(iterator) == 0
+    iterator.close()
+    assert closed == [True, True]
+
+
+def test_stream_tee_error() -> None:
+    """Tests that errors from the source are raised for every consumer."""
+
+    def source() -> Generator[int, None, None]:
+        yield 1
+        raise ValueError("Source error")
+
+    first, second = StreamTee(source(), 2).consumers
+    with pytest.raises(ValueError, match="Source error"):
+        list(first)
+    iterator = iter(second)
+    assert next(iterator) == 1
+    with pytest.raises(ValueError, match="Source error"):
+        next(iterator)
+
+
+@pytest.mark.asyncio
+async def test_stream_tee_async() -> None:
+    """Tests fanning out an async source to consumers in separate tasks."""
+    closed = []
+
+    async def source() -> AsyncGenerator[int, None]:
+        try:
+            for item in range(10):
+                await asyncio.sleep(0)
+                yield item
+        finally:
+            closed.append(True)
+
+    async def consume(consumer, delay: float) -> list[int]:
+        items = []
+        async for item in consumer:
+            items.append(item)
+            await asyncio.sleep(delay)
+        return items
+
+    fast, slow = StreamTee(source(), 2, max_buffer=2).consumers
+    assert await asyncio.gather(consume(fast, 0), consume(slow, 0.001)) == [
+        list(range(10)),
+        list(range(10)),
+    ]
+    assert closed == [True]
+
+    first, second = StreamTee(source(), 2, policy="drop", max_buffer=1).consumers
+    first_iterator, second_iterator = aiter(first), aiter(second)
+    assert [await anext(first_iterator) for _ in range(4)] == [0, 1, 2, 3]
+    await first_iterator.aclose()
+    assert await anext(second_iterator) == 3
+    await second_iterator.aclose()
+    assert closed == [True, True]
+    assert second.dropped == 3
+
+
+@pytest.mark.asyncio
+async def test_stream_tee_async_cancel() -> None:
+    """Tests that cancelling the fetching consumer doesn't affect the others."""
+    fetching = asyncio.Event()
+    release = asyncio.Event()
+
+    async def source() -> AsyncGenerator[int, None]:
+        yield 1
+        fetching.set()
+        await release.wait()
+        yield 2
+
+    first, second = StreamTee(source(), 2).consumers
+    first_iterator, second_iterator = aiter(first), aiter(second)
+    assert await anext(first_iterator) == 1
+    fetch = asyncio.ensure_future(anext(first_iterator))
+    await fetching.wait()
+    fetch.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await fetch
+    release.set()
+    assert [item async for item in second_iterator] == [1, 2]
+
+    fetching.clear()
+    release.clear()
+    (only,) = StreamTee(source(), 1).consumers
+    only_iterator = aiter(only)
+    assert await anext(only_iterator) == 1
+    fetch = asyncio.ensure_future(anext(only_iterator))
+    await fetching.wait()
+    fetch.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await fetch
+    assert only._tee._fetch is None
+
+
+@pytest.mark.asyncio
+async def test_stream_tee_async_error() -> None:
+    """Tests that errors from an async source are raised for every consumer."""
+
+    async def source() -> AsyncGenerator[int, None]:
+        yield 1
+        raise ValueError("Source error")
+
+    first, second = StreamTee(source(), 2).consumers
+    with pytest.raises(ValueError, match="Source error"):
+        _ = [item async for item in first]
+    with pytest.raises(ValueError, match="Source error"):
+        _ = [item async for item in second]
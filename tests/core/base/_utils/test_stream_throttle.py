@@ -0,0 +1,52 @@
+"""Tests the `_utils.StreamThrottle` class."""
+
+from unittest.mock import patch
+
+from mirascope.core.base._utils import StreamThrottle
+
+
+def test_stream_throttle_from_config() -> None:
+    """Tests that a throttle is only created for configs that throttle."""
+    assert StreamThrottle.from_config(None) is None
+    assert StreamThrottle.from_config({"partial_tools": True}) is None
+    throttle = StreamThrottle.from_config({"changes_only": True, "min_bytes": 8})
+    assert throttle is not None
+    assert throttle.changes_only and throttle.min_bytes == 8
+    assert throttle.min_interval is None
+
+
+def test_stream_throttle_changes_only() -> None:
+    """Tests that unchanged values are held back and their deltas coalesced."""
+    throttle = StreamThrottle(changes_only=True)
+    assert throttle.update("a") == "a"
+    assert throttle.update(" ", changed=False) is None
+    assert throttle.update("b") == " b"
+    assert throttle.update_json('{"a": "x') == '{"a": "x'
+    assert throttle.update_json('", ') is None
+    assert throttle.update_json('"b"') is None
+    assert throttle.update_json(": 1}") == '", "b": 1}'
+
+
+def test_stream_throttle_min_bytes() -> None:
+    """Tests that values are emitted at most once per `min_bytes` of content."""
+    throttle = StreamThrottle(min_bytes=4)
+    assert throttle.update("ab") == "ab"
+    assert throttle.update("cd") is None
+    assert throttle.update("ef") == "cdef"
+    throttle.reset()
+    assert throttle.update("g") == "g"
+
+
+@patch("mirascope.core.base._utils._stream_throttle.time.monotonic")
+def test_stream_throttle_min_interval(mock_monotonic) -> None:
+    """Tests that values are emitted at most once per `min_interval_ms`."""
+    throttle = StreamThrottle(min_interval_ms=100, min_bytes=100)
+    for now, delta, expected in [
+        (0.0, "a", "a"),
+        (0.05, "b", None),
+        (0.09, "c", None),
+        (0.1, "d", "bcd"),
+        (0.15, "e" * 100, "e" * 100),
+    ]:
+        mock_monotonic.return_value = now
+        assert throttle.update(delta) == expected
@@ -0,0 +1,33 @@
+"""Tests the `_utils.TextBuffer` class."""
+
+from mirascope.core.base._utils import TextBuffer
+
+
+def test_text_buffer() -> None:
+    """Tests appending to, reading, and clearing a `TextBuffer`."""
+    buffer = TextBuffer("a")
+    assert buffer and len(buffer) == 1
+    for text in ["b", "", "cd"]:
+        buffer.append(text)
+    assert len(buffer) == 4
+    assert str(buffer) == "abcd"
+    assert buffer == "abcd"
+    assert buffer == TextBuffer("abcd")
+    assert buffer != 1
+    assert repr(buffer) == "TextBuffer('abcd')"
+    buffer.append("e")
+    assert buffer.take() == "abcde"
+    assert not buffer and str(buffer) == ""
+
+
+def test_text_buffer_joins_lazily() -> None:
+    """Tests that appending to a `TextBuffer` only joins its parts once it's read."""
+    buffer = TextBuffer()
+    for i in range(1000):
+        buffer.append("x")
+        assert len(buffer._parts) == i + 1
+    value = str(buffer)
+    assert value == "x" * 1000 and buffer._parts == [value]
+    assert str(buffer) is value
+    buffer.append("y")
+    assert buffer._parts == [value, "y"]
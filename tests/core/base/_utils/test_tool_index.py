@@ -0,0 +1,97 @@
+"""Tests the `_utils.ToolIndex` class and `get_tool_index` function."""
+
+import gc
+import weakref
+
+import pytest
+
+from mirascope.core.base import BaseTool
+from mirascope.core.base._utils import ToolIndex, get_call_plan, get_tool_index
+from mirascope.core.openai import OpenAITool
+
+
+class FormatBook(BaseTool):
+    """Returns the title and author nicely formatted."""
+
+    title: str
+
+    def call(self) -> str:
+        return self.title
+
+
+class RecommendBook(BaseTool):
+    """Recommends a book."""
+
+    __custom_name__ = "recommend_book"
+
+    def call(self) -> str:
+        return "The Name of the Wind"
+
+
+class OtherFormatBook(BaseTool):
+    """Another tool with the same name as `FormatBook`."""
+
+    __custom_name__ = "FormatBook"
+
+    def call(self) -> str:
+        return ""
+
+
+def test_tool_index() -> None:
+    """Tests looking up tool types by name."""
+    index = ToolIndex([FormatBook, RecommendBook, OtherFormatBook])
+    assert index["FormatBook"] is FormatBook
+    assert index["recommend_book"] is RecommendBook
+    assert index.get("RecommendBook") is None
+    assert "recommend_book" in index and "RecommendBook" not in index
+    assert list(index) == ["FormatBook", "recommend_book"]
+    assert len(index) == 2
+    assert dict(index) == {"FormatBook": FormatBook, "recommend_book": RecommendBook}
+    assert repr(index) == f"ToolIndex([{FormatBook!r}, {RecommendBook!r}])"
+
+
+def test_tool_index_unknown_tool() -> None:
+    """Tests that looking up an unknown tool raises a clear `KeyError`."""
+    with pytest.raises(
+        KeyError,
+        match="Unknown tool `RecommendBook`. Available tools: FormatBook, recommend_book.",
+    ):
+        ToolIndex([FormatBook, RecommendBook])["RecommendBook"]
+    with pytest.raises(KeyError, match="Available tools: none."):
+        ToolIndex([])["FormatBook"]
+
+
+def test_get_tool_index() -> None:
+    """Tests that indexes are shared between equal tool sets."""
+    index = get_tool_index([FormatBook, RecommendBook])
+    assert get_tool_index((FormatBook, RecommendBook)) is index
+    assert get_tool_index([RecommendBook]) is not index
+    assert index["FormatBook"] is FormatBook
+
+
+def test_get_tool_index_weak() -> None:
+    """Tests that shared indexes don't keep (dynamically created) tool types alive."""
+
+    class DynamicTool(BaseTool):
+        def call(self) -> str:
+            return ""  # pragma: no cover
+
+    tool_type_ref = weakref.ref(DynamicTool)
+    index = get_tool_index([DynamicTool])
+    assert get_tool_index([DynamicTool]) is index
+    del index, DynamicTool
+    gc.collect()
+    assert tool_type_ref() is None
+
+
+def test_call_plan_keeps_tool_index() -> None:
+    """Tests that the tool index of a call plan's tools is shared while it lives."""
+
+    def fn() -> None: ...  # pragma: no cover
+
+    call_plan = get_call_plan(fn)
+    tool_types, _ = call_plan.get_tools([FormatBook], OpenAITool)
+    index_ref = weakref.ref(get_tool_index(tool_types))
+    gc.collect()
+    assert index_ref() is not None
+    assert get_tool_index(tool_types) is index_ref()
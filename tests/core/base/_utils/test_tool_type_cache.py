@@ -0,0 +1,91 @@
+"""Tests the `_utils._tool_type_cache` module."""
+
+import gc
+from functools import wraps
+from weakref import ref
+
+from mirascope.core.base._utils import _tool_type_cache
+from mirascope.core.base._utils._tool_type_cache import (
+    clear_tool_type_cache,
+    get_cached_tool_type,
+    set_cached_tool_type,
+)
+
+
+class _ToolType:
+    pass
+
+
+def test_tool_type_cache() -> None:
+    """Tests getting, setting, and clearing cached tool types."""
+
+    def fn() -> None: ...  # pragma: no cover
+
+    assert get_cached_tool_type(fn, "key") is None
+    set_cached_tool_type(fn, "key", _ToolType)
+    assert get_cached_tool_type(fn, "key") is _ToolType
+    assert get_cached_tool_type(fn, "other") is None
+
+    clear_tool_type_cache(fn)
+    assert get_cached_tool_type(fn, "key") is None
+
+    set_cached_tool_type(fn, "key", _ToolType)
+    clear_tool_type_cache()
+    assert get_cached_tool_type(fn, "key") is None
+
+
+def test_tool_type_cache_not_shared() -> None:
+    """Tests that subclasses and wrappers don't share the cache of their source."""
+
+    class Parent:
+        pass
+
+    class Child(Parent):
+        pass
+
+    set_cached_tool_type(Parent, "key", _ToolType)
+    assert get_cached_tool_type(Child, "key") is None
+
+    def fn() -> None: ...  # pragma: no cover
+
+    set_cached_tool_type(fn, "key", _ToolType)
+
+    @wraps(fn)
+    def wrapper() -> None: ...  # pragma: no cover
+
+    assert get_cached_tool_type(wrapper, "key") is None
+    set_cached_tool_type(wrapper, "key", Parent)
+    assert get_cached_tool_type(wrapper, "key") is Parent
+    assert get_cached_tool_type(fn, "key") is _ToolType
+
+
+def test_tool_type_cache_uncacheable_sources() -> None:
+    """Tests that sources that can't hold a cache are silently skipped."""
+
+    class Slotted:
+        __slots__ = ()
+
+    source = Slotted()
+    set_cached_tool_type(source, "key", _ToolType)  # pyright: ignore [reportArgumentType]
+    assert get_cached_tool_type(source, "key") is None  # pyright: ignore [reportArgumentType]
+    clear_tool_type_cache(source)  # pyright: ignore [reportArgumentType]
+
+
+def test_tool_type_cache_weak_references() -> None:
+    """Tests that the cache neither modifies nor keeps alive sources and tool types."""
+
+    class Model:
+        pass
+
+    class ToolType(Model):
+        pass
+
+    set_cached_tool_type(Model, "key", ToolType)
+    assert get_cached_tool_type(Model, "key") is ToolType
+    assert "__mirascope_tool_type_cache__" not in vars(Model)
+
+    model_ref, tool_type_ref = ref(Model), ref(ToolType)
+    del Model, ToolType
+    gc.collect()
+    assert model_ref() is None and tool_type_ref() is None
+    assert len(_tool_type_cache._tool_types) == 0
@@ -0,0 +1,164 @@
+"""Tests for the `batch` module."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mirascope.core import openai
+from mirascope.core.base.batch import abatch, add_batch_methods, as_completed, batch
+
+
+def _tracked(max_in_flight: list[int]):  # noqa: ANN202
+    lock, in_flight = threading.Lock(), [0]
+
+    def fn(value: int) -> int:
+        with lock:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        time.sleep(0.01 * (3 - value % 3))
+        with lock:
+            in_flight[0] -= 1
+        if value < 0:
+            raise ValueError(value)
+        return value * 2
+
+    return fn
+
+
+def test_batch() -> None:
+    """Tests that `batch` preserves order and bounds concurrency."""
+    max_in_flight = [0]
+    fn = _tracked(max_in_flight)
+    inputs = [{"value": value} for value in range(6)]
+    assert batch(fn, inputs, max_concurrency=2) == [0, 2, 4, 6, 8, 10]
+    assert max_in_flight[0] == 2
+    assert batch(fn, []) == []
+
+
+def test_batch_exceptions() -> None:
+    """Tests returning and raising exceptions from `batch`."""
+    fn = _tracked([0])
+    inputs = [{"value": 1}, {"value": -1}]
+    results = batch(fn, inputs, return_exceptions=True)
+    assert results[0] == 2
+    assert isinstance(results[1], ValueError)
+    with pytest.raises(ValueError):
+        batch(fn, inputs)
+    with pytest.raises(ValueError, match="max_concurrency"):
+        batch(fn, inputs, max_concurrency=0)
+
+
+def test_batch_async_fn() -> None:
+    """Tests that `batch` runs async functions on an event loop."""
+
+    async def fn(value: int) -> int:
+        await asyncio.sleep(0)
+        return value + 1
+
+    assert batch(fn, [{"value": 1}, {"value": 2}]) == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_abatch() -> None:
+    """Tests that `abatch` preserves order and bounds concurrency."""
+    in_flight, max_in_flight = 0, 0
+
+    async def fn(value: int) -> int:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01 * (3 - value % 3))
+        in_flight -= 1
+        if value < 0:
+            raise ValueError(value)
+        return value * 2
+
+    inputs = [{"value": value} for value in range(6)]
+    assert await abatch(fn, inputs, max_concurrency=3) == [0, 2, 4, 6, 8, 10]
+    assert max_in_flight == 3
+
+    results = await abatch(fn, [{"value": -1}, {"value": 1}], return_exceptions=True)
+    assert isinstance(results[0], ValueError) and results[1] == 2
+    with pytest.raises(ValueError):
+        await abatch(fn, [{"value": -1}, {"value": 1}])
+
+    assert await abatch(_tracked([0]), [{"value": 1}]) == [2]  # sync in threads
+
+
+def test_as_completed() -> None:
+    """Tests that `as_completed` yields results as they finish."""
+    fn = _tracked([0])
+    inputs = [{"value": 0}, {"value": 2}]
+    assert list(as_completed(fn, inputs)) == [(1, 4), (0, 0)]
+
+    results = dict(as_completed(fn, [{"value": -1}], return_exceptions=True))
+    assert isinstance(results[0], ValueError)
+
+
+@pytest.mark.asyncio
+async def test_as_completed_async() -> None:
+    """Tests that `as_completed` returns an async iterator for async functions."""
+
+    async def fn(value: int) -> int:
+        await asyncio.sleep(0.01 * value)
+        return value
+
+    results = [
+        result
+        async for result in as_completed(fn, [{"value": 2}, {"value": 0}])  # pyright: ignore [reportGeneralTypeIssues]
+    ]
+    assert results == [(1, 0), (0, 2)]
+
+    iterator = as_completed(fn, [{"value": 0}, {"value": 5}])
+    assert await iterator.__anext__() == (0, 0)  # pyright: ignore [reportAttributeAccessIssue]
+    await iterator.aclose()  # pyright: ignore [reportAttributeAccessIssue]
+
+
+@pytest.mark.asyncio
+async def test_as_completed_async_lazy_tasks() -> None:
+    """Tests that calls only start once a slot is free, and cancelled calls."""
+    started = []
+
+    async def fn(value: int) -> int:
+        started.append(value)
+        if value < 0:
+            raise asyncio.CancelledError
+        await asyncio.sleep(0)
+        return value
+
+    iterator = as_completed(
+        fn, [{"value": value} for value in range(5)], max_concurrency=2
+    )
+    index, value = await iterator.__anext__()  # pyright: ignore [reportAttributeAccessIssue]
+    assert index == value
+    assert len(asyncio.all_tasks()) == 3  # this test and the two calls in flight
+    await iterator.aclose()  # pyright: ignore [reportAttributeAccessIssue]
+
+    results = await abatch(fn, [{"value": -1}, {"value": 1}], return_exceptions=True)
+    assert isinstance(results[0], asyncio.CancelledError) and results[1] == 1
+    with pytest.raises(asyncio.CancelledError):
+        await abatch(fn, [{"value": -1}])
+
+
+def test_add_batch_methods() -> None:
+    """Tests that the batch functions are attached to the decorated call."""
+
+    def fn(value: int) -> int:
+        return value
+
+    assert add_batch_methods(fn) is fn
+    assert fn.batch([{"value": 1}]) == [1]  # pyright: ignore [reportFunctionMemberAccess]
+    assert list(fn.as_completed([{"value": 1}])) == [(0, 1)]  # pyright: ignore [reportFunctionMemberAccess]
+    assert asyncio.run(fn.abatch([{"value": 1}])) == [1]  # pyright: ignore [reportFunctionMemberAccess]
+
+
+def test_stream_calls_have_no_batch_methods() -> None:
+    """Tests that only calls that don't stream get the batch functions."""
+
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    assert hasattr(openai.call("gpt-4o-mini")(recommend_book), "batch")
+    assert not hasattr(openai.call("gpt-4o-mini", stream=True)(recommend_book), "batch")
@@ -0,0 +1,59 @@
+"""Tests the `batch_mode` module."""
+
+from collections.abc import Callable
+
+import pytest
+
+from mirascope.core import openai
+from mirascope.core.base import (
+    BatchRequestError,
+    build_batch_requests,
+    parse_batch_results,
+)
+
+
+@pytest.fixture(autouse=True)
+def api_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+
+
+def test_build_and_parse_async(openai_completion: Callable) -> None:
+    """Tests building and parsing batch requests of an async call."""
+
+    @openai.call("gpt-4o-mini")
+    async def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    inputs = [{"genre": "fantasy"}, {"genre": "mystery"}]
+    requests = build_batch_requests(recommend_book, inputs, custom_id_prefix="book")
+    assert [request["custom_id"] for request in requests] == ["book-0", "book-1"]
+    assert requests[1]["call_kwargs"]["messages"] == [
+        {"role": "user", "content": "Recommend a mystery book"}
+    ]
+
+    results = parse_batch_results(
+        recommend_book,
+        inputs,
+        {"book-0": openai_completion("fantasy").model_dump()},
+        custom_id_prefix="book",
+    )
+    assert isinstance(results[0], openai.OpenAICallResponse)
+    assert results[0].content == "fantasy"
+    assert isinstance(results[1], BatchRequestError)
+    assert results[1].custom_id == "book-1"
+
+    with pytest.raises(BatchRequestError):
+        parse_batch_results(
+            recommend_book, inputs, {}, custom_id_prefix="book", return_exceptions=False
+        )
+
+
+def test_build_batch_requests_stream() -> None:
+    """Tests that streaming calls are rejected."""
+
+    @openai.call("gpt-4o-mini", stream=True)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    with pytest.raises(ValueError, match="non-streaming"):
+        build_batch_requests(recommend_book, [{"genre": "fantasy"}])
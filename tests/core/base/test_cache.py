@@ -0,0 +1,314 @@
+"""Tests the `cache` module."""
+
+from collections.abc import Callable
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from openai import AsyncOpenAI, OpenAI
+
+from mirascope.core import bedrock, openai
+from mirascope.core.base import BaseMessageParam, ImagePart, TextPart
+from mirascope.core.base.cache import (
+    BaseCache,
+    DirectoryCache,
+    InMemoryCache,
+    SQLiteCache,
+    get_active_cache,
+    get_cache_key,
+    use_cache,
+)
+
+
+def test_in_memory_cache() -> None:
+    """Tests the LRU size and TTL eviction of `InMemoryCache`."""
+    cache = InMemoryCache(max_size=2, ttl=10)
+    with patch("mirascope.core.base.cache.time.time", return_value=0):
+        cache.set("a", b"a")
+        cache.set("b", b"b")
+        assert cache.get("a") == b"a"
+        cache.set("c", b"c")
+        assert cache.get("b") is None
+        assert len(cache) == 2
+    with patch("mirascope.core.base.cache.time.time", return_value=11):
+        assert cache.get("a") is None
+        assert cache.get("c") is None
+    cache.set("d", b"d")
+    cache.clear()
+    assert cache.get("d") is None
+    assert cache.get("missing") is None
+
+
+@pytest.mark.parametrize("cache_type", [SQLiteCache, DirectoryCache])
+def test_persistent_caches(cache_type: type, tmp_path) -> None:  # noqa: ANN001
+    """Tests storing, expiring, and clearing values of the persistent caches."""
+    path = tmp_path / ("cache.db" if cache_type is SQLiteCache else "cache")
+    cache: BaseCache = cache_type(path, ttl=10)
+    assert cache.get("a") is None
+    cache.set("a", b"a")
+    cache.set("a", b"b")
+    assert cache.get("a") == b"b"
+    assert cache_type(path).get("a") == b"b"
+    with patch("mirascope.core.base.cache.time.time", return_value=2**40):
+        assert cache.get("a") is None
+    cache.set("a", b"a")
+    cache.clear()
+    assert cache.get("a") is None
+    if isinstance(cache, SQLiteCache):
+        cache.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache_type", [InMemoryCache, SQLiteCache, DirectoryCache])
+async def test_cache_async_interface(cache_type: type, tmp_path) -> None:  # noqa: ANN001
+    """Tests the async `aget` and `aset` methods of the caches."""
+    cache: BaseCache = (
+        cache_type() if cache_type is InMemoryCache else cache_type(tmp_path / "cache")
+    )
+    assert await cache.aget("a") is None
+    await cache.aset("a", b"a")
+    assert await cache.aget("a") == b"a"
+    assert cache.get("a") == b"a"
+    if isinstance(cache, SQLiteCache):
+        cache.close()
+
+
+def test_get_cache_key() -> None:
+    """Tests that cache keys only depend on the normalized `call_kwargs`."""
+    key = get_cache_key("openai", {"model": "gpt", "messages": [], "n": 1}, False)
+    assert key == get_cache_key(
+        "openai", {"n": 1, "messages": [], "model": "gpt"}, False
+    )
+    assert key != get_cache_key("openai", {"model": "gpt", "messages": []}, False)
+    assert key != get_cache_key(
+        "anthropic", {"model": "gpt", "messages": [], "n": 1}, False
+    )
+    assert key != get_cache_key(
+        "openai", {"model": "gpt", "messages": [], "n": 1}, True
+    )
+    assert key != get_cache_key(
+        "openai", {"model": "gpt", "messages": [], "n": 1}, False, "http://localhost"
+    )
+
+
+def test_get_cache_key_binary_and_provider_objects() -> None:
+    """Tests stable cache keys for binary content and provider SDK objects."""
+    image = {"format": "png", "bytes": b"\x89PNG\xff\xfe"}
+    key = get_cache_key("bedrock", {"messages": [{"content": [image]}]}, False)
+    assert key == get_cache_key(
+        "bedrock", {"messages": [{"content": [dict(image)]}]}, False
+    )
+    assert key != get_cache_key(
+        "bedrock", {"messages": [{"content": [image | {"bytes": b"\xff"}]}]}, False
+    )
+
+    class Content:
+        def __init__(self, text: str) -> None:
+            self.text = text
+
+        def to_dict(self) -> dict:
+            return {"text": self.text}
+
+    class Image:
+        mode, size = "RGB", (1, 1)
+
+        def tobytes(self) -> bytes:
+            return b"\x00\x00\x00"
+
+    assert get_cache_key("vertex", {"contents": [Content("a")]}, False) == (
+        get_cache_key("vertex", {"contents": [Content("a")]}, False)
+    )
+    assert get_cache_key("gemini", {"contents": [Image()]}, False) == (
+        get_cache_key("gemini", {"contents": [Image()]}, False)
+    )
+    with pytest.raises(TypeError, match="stable cache key for `object` values"):
+        get_cache_key("openai", {"messages": [object()]}, False)
+
+
+def test_use_cache() -> None:
+    """Tests that `use_cache` sets the cache of the current context."""
+    cache = InMemoryCache()
+    assert get_active_cache() is None
+    with use_cache(cache):
+        assert get_active_cache() is cache
+        with use_cache(None):
+            assert get_active_cache() is None
+    assert get_active_cache() is None
+
+
+def test_cached_call(openai_completion: Callable) -> None:
+    """Tests that cache hits rebuild full call responses without calling."""
+    client = MagicMock()
+    client.chat.completions.create.return_value = openai_completion("Name of the Wind")
+
+    @openai.call("gpt-4o-mini", client=client)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    cache = InMemoryCache()
+    with use_cache(cache):
+        first = recommend_book("fantasy")
+        second = recommend_book("fantasy")
+        recommend_book("mystery")
+    assert client.chat.completions.create.call_count == 2
+    assert isinstance(second, openai.OpenAICallResponse)
+    assert second.content == first.content == "Name of the Wind"
+    assert second.response == first.response
+    assert len(cache) == 2
+
+    recommend_book("fantasy")
+    assert client.chat.completions.create.call_count == 3
+
+
+def test_cached_call_per_client_url(openai_completion: Callable) -> None:
+    """Tests that clients pointing at different servers don't share responses."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.host)
+        return httpx.Response(
+            200, json=openai_completion(request.url.host).model_dump()
+        )
+
+    def recommend_book_with(base_url: str) -> openai.OpenAICallResponse:
+        client = OpenAI(
+            api_key="test",
+            base_url=base_url,
+            http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        )
+
+        @openai.call("gpt-4o-mini", client=client)
+        def recommend_book(genre: str) -> str:
+            return f"Recommend a {genre} book"
+
+        return recommend_book("fantasy")
+
+    with use_cache(InMemoryCache()):
+        assert recommend_book_with("http://first/v1").content == "first"
+        assert recommend_book_with("http://second/v1").content == "second"
+        assert recommend_book_with("http://first/v1").content == "first"
+    assert requests == ["first", "second"]
+
+
+def test_cached_stream(openai_chunk: Callable) -> None:
+    """Tests that cached streams replay their chunks once fully consumed."""
+    client = MagicMock()
+    client.chat.completions.create.side_effect = lambda **kwargs: iter(
+        [openai_chunk("Name "), openai_chunk("of the Wind")]
+    )
+
+    @openai.call("gpt-4o-mini", client=client, stream=True)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    cache = InMemoryCache()
+    with use_cache(cache):
+        for _ in recommend_book("fantasy"):
+            break
+        assert len(cache) == 0
+        list(recommend_book("fantasy"))
+        stream = recommend_book("fantasy")
+        assert [chunk.content for chunk, _ in stream] == ["Name ", "of the Wind"]
+    assert stream.content == "Name of the Wind"
+    assert client.chat.completions.create.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_call_async(
+    openai_chunk: Callable, openai_completion: Callable
+) -> None:
+    """Tests caching async calls and streams."""
+    client = AsyncOpenAI(api_key="test")
+    client.chat.completions.create = AsyncMock(return_value=openai_completion("Dune"))  # pyright: ignore [reportAttributeAccessIssue]
+
+    @openai.call("gpt-4o-mini", client=client)
+    async def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    async def chunks():  # noqa: ANN202
+        for chunk in [openai_chunk("Du"), openai_chunk("ne")]:
+            yield chunk
+
+    stream_client = AsyncOpenAI(api_key="test")
+    stream_client.chat.completions.create = AsyncMock(  # pyright: ignore [reportAttributeAccessIssue]
+        side_effect=lambda **_: chunks()
+    )
+
+    @openai.call("gpt-4o-mini", client=stream_client, stream=True)
+    async def stream_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    with use_cache(InMemoryCache()):
+        for _ in range(2):
+            assert (await recommend_book("scifi")).content == "Dune"
+            stream = await stream_book("scifi")
+            assert [chunk.content async for chunk, _ in stream] == ["Du", "ne"]
+    assert client.chat.completions.create.call_count == 1  # pyright: ignore [reportFunctionMemberAccess]
+    assert stream_client.chat.completions.create.call_count == 1  # pyright: ignore [reportFunctionMemberAccess]
+
+
+def test_cached_stream_consumed_outside_context(openai_chunk: Callable) -> None:
+    """Tests that streams created while a cache is active are cached when consumed."""
+    client = MagicMock()
+    client.chat.completions.create.side_effect = lambda **kwargs: iter(
+        [openai_chunk("Dune")]
+    )
+
+    @openai.call("gpt-4o-mini", client=client, stream=True)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    cache = InMemoryCache()
+    with use_cache(cache):
+        stream = recommend_book("scifi")
+    assert [chunk.content for chunk, _ in stream] == ["Dune"]
+    assert len(cache) == 1
+
+
+def test_cached_call_binary_content() -> None:
+    """Tests caching calls with binary image content (e.g. Bedrock images)."""
+    client = MagicMock()
+    client.converse.return_value = {
+        "output": {"message": {"content": [{"text": "A cat"}], "role": "assistant"}},
+        "ResponseMetadata": {"RequestId": "id"},
+        "stopReason": "end_turn",
+        "usage": {"inputTokens": 1, "outputTokens": 1, "totalTokens": 2},
+        "metrics": {},
+    }
+
+    @bedrock.call("anthropic.claude-3-haiku-20240307-v1:0", client=client)
+    def describe(image: bytes) -> list[BaseMessageParam]:
+        return [
+            BaseMessageParam(
+                role="user",
+                content=[
+                    TextPart(type="text", text="Describe the image"),
+                    ImagePart(
+                        type="image", media_type="image/png", image=image, detail=None
+                    ),
+                ],
+            )
+        ]
+
+    with use_cache(InMemoryCache()):
+        assert describe(b"\x89PNG\xff\xfe").content == "A cat"
+        assert describe(b"\x89PNG\xff\xfe").content == "A cat"
+        describe(b"\x89PNG\xff\xfd")
+    assert client.converse.call_count == 2
+
+
+def test_uncacheable_call(openai_completion: Callable) -> None:
+    """Tests that calls without a stable cache key bypass the cache."""
+    client = MagicMock()
+    client.chat.completions.create.return_value = openai_completion("Dune")
+
+    @openai.call("gpt-4o-mini", client=client, call_params={"user": object()})  # pyright: ignore [reportArgumentType]
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    cache = InMemoryCache()
+    with use_cache(cache):
+        recommend_book("scifi")
+        recommend_book("scifi")
+    assert client.chat.completions.create.call_count == 2
+    assert len(cache) == 0
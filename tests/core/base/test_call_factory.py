@@ -76,7 +76,10 @@ def test_call_factory_stream(
         handle_stream_async=mock_call_factory_kwargs["handle_stream_async"],
     )
     mock_partial.assert_called_once_with(
-        mock_stream_factory.return_value, **stream_kwargs, partial_tools=False
+        mock_stream_factory.return_value,
+        **stream_kwargs,
+        partial_tools=False,
+        stream_config=None,
     )
 
 
@@ -138,7 +141,9 @@ def test_call_factory_structured_stream(
         get_json_output=mock_call_factory_kwargs["get_json_output"],
     )
     mock_partial.assert_called_once_with(
-        mock_structured_stream_factory.return_value, **structured_stream_kwargs
+        mock_structured_stream_factory.return_value,
+        **structured_stream_kwargs,
+        stream_config=None,
     )
 
 
@@ -151,3 +156,22 @@ def test_call_decorator_invalid_output_parser_with_stream(
         ValueError, match="Cannot use `output_parser` with `stream=True`"
     ):
         call("model", stream=True, output_parser=MagicMock())
+
+
+@patch("mirascope.core.base._call_factory.create_factory", new_callable=MagicMock)
+def test_call_factory_adds_batch_methods(
+    mock_create_factory: MagicMock, mock_call_factory_kwargs: dict
+) -> None:
+    """Tests that decorated calls expose the batch methods."""
+
+    def decorated(genre: str) -> str:
+        return genre
+
+    mock_create_factory.return_value = lambda fn, **kwargs: decorated
+    call = call_factory(**mock_call_factory_kwargs)
+
+    def fn(genre: str) -> None: ...  # pragma: no cover
+
+    decorated_fn = call("model")(fn)
+    assert decorated_fn is decorated
+    assert decorated_fn.batch([{"genre": "fantasy"}]) == ["fantasy"]  # pyright: ignore [reportFunctionMemberAccess]
@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from pydantic import BaseModel
 
+from mirascope.core.base import BaseTool
 from mirascope.core.base.call_response import BaseCallResponse, transform_tool_outputs
 
 
@@ -42,6 +43,47 @@ def test_base_call_response() -> None:
     ]
 
 
+@pytest.mark.asyncio
+async def test_base_call_response_call_tools() -> None:
+    """Tests calling the tools of a `BaseCallResponse`."""
+
+    class FormatBook(BaseTool):
+        title: str
+
+        def call(self) -> str:
+            return f"Formatted {self.title}"
+
+    class MyCallResponse(BaseCallResponse):
+        @property
+        def tools(self) -> list[BaseTool] | None:
+            return self.fn_args["tools"]
+
+    patch.multiple(MyCallResponse, __abstractmethods__=set()).start()
+    tools = [FormatBook(title="The Name of the Wind"), FormatBook(title="Mistborn")]
+    call_response = MyCallResponse(
+        metadata={},
+        response="",
+        tool_types=[FormatBook],
+        prompt_template="",
+        fn_args={"tools": tools},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+        user_message_param=None,
+        start_time=0,
+        end_time=0,
+    )  # type: ignore
+    expected = [
+        (tools[0], "Formatted The Name of the Wind"),
+        (tools[1], "Formatted Mistborn"),
+    ]
+    assert call_response.call_tools() == expected
+    assert await call_response.call_tools_async(timeout=1) == expected
+    call_response.fn_args["tools"] = None
+    assert call_response.call_tools() == []
+
+
 class SimpleModel(BaseModel):
     name: str
     value: int
@@ -2,6 +2,9 @@
 
 from unittest.mock import patch
 
+from pydantic import BaseModel
+
+from mirascope.core.base._utils import cached_chunk_property
 from mirascope.core.base.call_response_chunk import BaseCallResponseChunk
 
 
@@ -14,3 +17,64 @@ def test_base_call_response_chunk() -> None:
     patch.multiple(MyCallResponseChunk, __abstractmethods__=set()).start()
     call_response_chunk = MyCallResponseChunk(chunk="")  # type: ignore
     assert str(call_response_chunk) == "content"
+
+
+def test_base_call_response_chunk_slots() -> None:
+    """Tests that chunk wrappers are slotted and cache their derived fields."""
+
+    class MyCallResponseChunk(BaseCallResponseChunk):
+        __slots__ = ()
+
+        @cached_chunk_property
+        def content(self) -> str:
+            return self.chunk["content"]
+
+    patch.multiple(MyCallResponseChunk, __abstractmethods__=set()).start()
+    raw_chunk = {"content": "content"}
+    call_response_chunk = MyCallResponseChunk(raw_chunk)  # type: ignore
+    assert call_response_chunk.content == "content"
+    raw_chunk["content"] = "changed"
+    assert call_response_chunk.content == "content"
+    assert repr(call_response_chunk) == (
+        "MyCallResponseChunk(chunk={'content': 'changed'})"
+    )
+    assert call_response_chunk == MyCallResponseChunk(chunk=raw_chunk)  # type: ignore
+    assert call_response_chunk != MyCallResponseChunk(chunk={})  # type: ignore
+    assert call_response_chunk != raw_chunk
+
+
+def test_base_call_response_chunk_model_methods() -> None:
+    """Tests the pydantic-compatible methods and extra attributes of chunk wrappers."""
+
+    class MyCallResponseChunk(BaseCallResponseChunk):
+        __slots__ = ()
+
+        @cached_chunk_property
+        def content(self) -> str:
+            return self.chunk.content
+
+    class Chunk(BaseModel):
+        content: str
+
+    patch.multiple(MyCallResponseChunk, __abstractmethods__=set()).start()
+    call_response_chunk = MyCallResponseChunk(Chunk(content="content"), index=0)  # type: ignore
+    call_response_chunk.extra = "extra"  # pyright: ignore [reportAttributeAccessIssue]
+    assert call_response_chunk.model_dump() == {
+        "chunk": {"content": "content"},
+        "index": 0,
+        "extra": "extra",
+    }
+    assert call_response_chunk.model_dump(exclude={"extra"}) == {
+        "chunk": {"content": "content"},
+        "index": 0,
+    }
+    assert call_response_chunk.model_dump_json(include={"chunk"}) == (
+        '{"chunk":{"content":"content"}}'
+    )
+    assert call_response_chunk.content == "content"
+    copied = call_response_chunk.model_copy(update={"chunk": Chunk(content="copy")})
+    assert copied.content == "copy"
+    assert copied.extra == "extra"  # pyright: ignore [reportAttributeAccessIssue]
+    assert call_response_chunk.content == "content"
+    assert call_response_chunk.model_copy(deep=True) == call_response_chunk
+    assert call_response_chunk != MyCallResponseChunk(Chunk(content="content"))  # type: ignore
@@ -0,0 +1,152 @@
+"""Tests for the `client_pool` module."""
+
+import asyncio
+import os
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from mirascope.core.base.client_pool import (
+    ClientPool,
+    create_httpx_client,
+    default_client_pool,
+)
+
+
+def test_client_pool_get() -> None:
+    """Tests that clients are reused per type, environment and key."""
+    pool = ClientPool()
+    client_type = MagicMock(side_effect=lambda: MagicMock())
+    client = pool.get(client_type)
+    assert pool.get(client_type) is client
+    assert pool.get(client_type, key="other") is not client
+    assert client_type.call_count == 2
+
+    with patch.dict(os.environ, {"MIRASCOPE_TEST_API_KEY": "first"}):
+        env_client = pool.get(client_type, env=["MIRASCOPE_TEST_API_KEY"])
+        assert pool.get(client_type, env=["MIRASCOPE_TEST_API_KEY"]) is env_client
+    with patch.dict(os.environ, {"MIRASCOPE_TEST_API_KEY": "second"}):
+        assert pool.get(client_type, env=["MIRASCOPE_TEST_API_KEY"]) is not env_client
+
+    create = MagicMock()
+    pool.configure({"max_connections": 10})
+    assert pool.limits == {"max_connections": 10}
+    assert pool.get(client_type, create=create) is create.return_value
+    create.assert_called_once_with({"max_connections": 10})
+
+
+def test_client_pool_async_clients_per_loop() -> None:
+    """Tests that async clients are constructed once per running event loop."""
+    pool = ClientPool()
+    client_type = MagicMock(side_effect=lambda: MagicMock())
+
+    async def get_clients() -> tuple[object, object]:
+        return pool.get(client_type, is_async=True), pool.get(
+            client_type, is_async=True
+        )
+
+    first, second = asyncio.run(get_clients())
+    assert first is second
+    other, _ = asyncio.run(get_clients())
+    assert other is not first
+    assert pool.get(client_type, is_async=True) not in (first, other)
+    assert len(pool._async_clients) == 0  # the clients of closed loops are removed
+
+
+def test_client_pool_close() -> None:
+    """Tests closing the pooled clients."""
+    pool = ClientPool()
+    client = MagicMock(spec=["close"])
+    exit_client = MagicMock(spec=["__exit__"])
+    async_client = MagicMock(spec=["close"])
+    async_client.close = AsyncMock()
+    pool.get(MagicMock(return_value=client))
+    pool.get(MagicMock(return_value=exit_client))
+    pool.get(MagicMock(return_value=async_client), is_async=True)
+    with pool:
+        pass
+    client.close.assert_called_once()
+    exit_client.__exit__.assert_called_once_with(None, None, None)
+    async_client.close.assert_awaited_once()
+    new_client = MagicMock()
+    assert pool.get(MagicMock(return_value=new_client)) is new_client
+
+
+def test_client_pool_close_async_clients() -> None:
+    """Tests that `close` closes the async clients on their own event loops."""
+    pool = ClientPool()
+
+    def async_client() -> MagicMock:
+        client = MagicMock(spec=["aclose"])
+        client.aclose = AsyncMock()
+        return client
+
+    async def get_client() -> MagicMock:
+        return pool.get(MagicMock(return_value=async_client()), is_async=True)
+
+    idle_loop = asyncio.new_event_loop()
+    idle_client = idle_loop.run_until_complete(get_client())
+    closed_loop = asyncio.new_event_loop()
+    closed_client = closed_loop.run_until_complete(get_client())
+    closed_loop.close()
+
+    threaded_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=threaded_loop.run_forever, daemon=True)
+    thread.start()
+    threaded_client = asyncio.run_coroutine_threadsafe(
+        get_client(), threaded_loop
+    ).result()
+
+    async def close_in_loop() -> MagicMock:
+        client = await get_client()
+        pool.close()
+        await asyncio.sleep(0)
+        return client
+
+    running_client = asyncio.run(close_in_loop())
+    asyncio.run_coroutine_threadsafe(asyncio.sleep(0), threaded_loop).result()
+    threaded_loop.call_soon_threadsafe(threaded_loop.stop)
+    thread.join()
+    threaded_loop.close()
+    idle_loop.close()
+    for client in [idle_client, threaded_client, running_client]:
+        client.aclose.assert_awaited_once()
+    closed_client.aclose.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_client_pool_aclose() -> None:
+    """Tests closing the pooled clients from within the event loop."""
+    pool = ClientPool()
+    aclose_client = MagicMock(spec=["aclose"])
+    aclose_client.aclose = AsyncMock()
+    close_client = MagicMock(spec=["close"])
+    close_client.close = AsyncMock()
+    aexit_client = MagicMock(spec=["__aexit__"])
+    aexit_client.__aexit__ = AsyncMock()
+    sync_client = MagicMock(spec=["__exit__"])
+    for client in [aclose_client, close_client, aexit_client]:
+        pool.get(MagicMock(return_value=client), is_async=True)
+    pool.get(MagicMock(return_value=sync_client))
+    async with pool:
+        pass
+    aclose_client.aclose.assert_awaited_once()
+    close_client.close.assert_awaited_once()
+    aexit_client.__aexit__.assert_awaited_once_with(None, None, None)
+    sync_client.__exit__.assert_called_once_with(None, None, None)
+
+
+def test_create_httpx_client() -> None:
+    """Tests constructing the `httpx` clients with the pool's limits."""
+    assert create_httpx_client({}, False) is None
+    client = create_httpx_client({"max_connections": 5}, False)
+    assert isinstance(client, httpx.Client)
+    async_client = create_httpx_client({"max_connections": 5}, True)
+    assert isinstance(async_client, httpx.AsyncClient)
+
+
+def test_default_client_pool() -> None:
+    """Tests that the default client pool is a `ClientPool`."""
+    assert isinstance(default_client_pool, ClientPool)
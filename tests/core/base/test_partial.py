@@ -1,7 +1,11 @@
 """Tests that `partial` works to make all fields optional."""
 
-from pydantic import BaseModel
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
+from pydantic import BaseModel, create_model
+
+from mirascope.core.base import _partial
 from mirascope.core.base._partial import partial
 
 
@@ -92,3 +96,38 @@ def test_list_partial() -> None:
         partial(ModelWithList).model_json_schema()
         == PartialModelWithList.model_json_schema()
     )
+
+
+def test_partial_is_cached() -> None:
+    """Tests that `partial` returns the same class for the same inputs."""
+    assert partial(DeeperModel) is partial(DeeperModel)
+    assert partial(DeeperModel, {"param"}) is partial(DeeperModel, {"param"})
+    assert partial(DeeperModel, {"param"}) is not partial(DeeperModel)
+    assert partial(DeeperModel).model_fields["shallow"].annotation == (
+        partial(ShallowModel) | None
+    )
+
+
+def test_partial_cache_is_bounded() -> None:
+    """Tests that the least recently used partial models are evicted."""
+    models = [create_model(f"Model{i}", param=(str, ...)) for i in range(3)]
+    with (
+        patch.object(_partial, "_PARTIAL_CACHE_MAX_SIZE", 2),
+        patch.object(_partial, "_partial_cache", _partial.OrderedDict()),
+    ):
+        first = partial(models[0])
+        partial(models[1])
+        assert partial(models[0]) is first
+        partial(models[2])
+        assert list(_partial._partial_cache) == [
+            (models[0], frozenset()),
+            (models[2], frozenset()),
+        ]
+
+
+def test_partial_concurrent_construction() -> None:
+    """Tests that concurrent calls for a new model construct a single class."""
+    model = create_model("ConcurrentModel", param=(str, ...), nested=(DeeperModel, ...))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        partial_models = set(executor.map(lambda _: partial(model), range(32)))
+    assert len(partial_models) == 1
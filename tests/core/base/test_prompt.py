@@ -276,3 +276,17 @@ def test_base_prompt_str_with_special_tags() -> None:
         "these: ['text1', 'text2'] and [b'image1', b'image2'] and [b'audio1', b'audio2']"
     )
     assert str(prompt).strip() == expected.strip()
+
+
+def test_prompt_template_compiled_template() -> None:
+    """Tests that the compiled template is exposed and reused."""
+    decorator = prompt_template("Recommend a {genre} book")
+    assert decorator.compiled_template.message_params({"genre": "fantasy"}) == [
+        BaseMessageParam(role="user", content="Recommend a fantasy book")
+    ]
+
+    @decorator
+    class BookRecommendationPrompt(BasePrompt):
+        genre: str
+
+    assert BookRecommendationPrompt.compiled_template() is decorator.compiled_template
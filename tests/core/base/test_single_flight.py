@@ -0,0 +1,184 @@
+"""Tests the `single_flight` module."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from openai import AsyncOpenAI
+from openai.types.chat import ChatCompletion
+
+from mirascope.core import bedrock, openai
+from mirascope.core.base import BaseMessageParam, ImagePart, single_flight
+
+
+def test_single_flight_sync(openai_completion: Callable) -> None:
+    """Tests that identical concurrent calls share a single provider call."""
+    calls = []
+
+    def create(**kwargs: dict) -> ChatCompletion:
+        calls.append(kwargs)
+        time.sleep(0.2)
+        return openai_completion(kwargs["messages"][0]["content"])
+
+    client = MagicMock()
+    client.chat.completions.create.side_effect = create
+
+    @single_flight
+    @openai.call("gpt-4o-mini", client=client)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    assert callable(recommend_book.batch)  # pyright: ignore [reportFunctionMemberAccess]
+    genres = ["fantasy"] * 4 + ["mystery"] * 2
+    with ThreadPoolExecutor(max_workers=len(genres)) as executor:
+        responses = list(executor.map(recommend_book, genres))
+    assert len(calls) == 2
+    assert [response.content for response in responses] == [
+        f"Recommend a {genre} book" for genre in genres
+    ]
+
+    recommend_book("fantasy")
+    assert len(calls) == 3
+
+
+def test_single_flight_binary_content() -> None:
+    """Tests de-duplicating identical calls with binary image content."""
+
+    def converse(**kwargs: dict) -> dict:
+        time.sleep(0.2)
+        return {
+            "output": {
+                "message": {"content": [{"text": "A cat"}], "role": "assistant"}
+            },
+            "ResponseMetadata": {"RequestId": "id"},
+            "stopReason": "end_turn",
+            "usage": {"inputTokens": 1, "outputTokens": 1, "totalTokens": 2},
+            "metrics": {},
+        }
+
+    client = MagicMock()
+    client.converse.side_effect = converse
+
+    @single_flight
+    @bedrock.call("anthropic.claude-3-haiku-20240307-v1:0", client=client)
+    def describe(image: bytes) -> list[BaseMessageParam]:
+        return [
+            BaseMessageParam(
+                role="user",
+                content=[
+                    ImagePart(
+                        type="image", media_type="image/png", image=image, detail=None
+                    )
+                ],
+            )
+        ]
+
+    images = [b"\x89PNG\xff\xfe"] * 3 + [b"\x89PNG\xff\xfd"]
+    with ThreadPoolExecutor(max_workers=len(images)) as executor:
+        responses = list(executor.map(describe, images))
+    assert [response.content for response in responses] == ["A cat"] * 4
+    assert client.converse.call_count == 2
+
+
+def test_single_flight_sync_error() -> None:
+    """Tests that errors of the shared call are raised for every caller."""
+    started = threading.Event()
+
+    def create(**kwargs: dict) -> ChatCompletion:
+        started.set()
+        time.sleep(0.2)
+        raise RuntimeError("failed")
+
+    client = MagicMock()
+    client.chat.completions.create.side_effect = create
+
+    @single_flight
+    @openai.call("gpt-4o-mini", client=client)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(recommend_book, "fantasy")
+        started.wait()
+        second = executor.submit(recommend_book, "fantasy")
+        for future in [first, second]:
+            with pytest.raises(RuntimeError, match="failed"):
+                future.result()
+    assert client.chat.completions.create.call_count == 1
+
+
+def test_single_flight_stream_sync(openai_chunk: Callable) -> None:
+    """Tests that identical concurrent streams attach to the same feed of chunks."""
+
+    def create(**kwargs: dict) -> object:
+        for content in ["Name ", "of the ", "Wind"]:
+            time.sleep(0.05)
+            yield openai_chunk(content)
+
+    client = MagicMock()
+    client.chat.completions.create.side_effect = create
+
+    @single_flight
+    @openai.call("gpt-4o-mini", client=client, stream=True)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    streams = [recommend_book("fantasy") for _ in range(3)]
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        contents = list(executor.map(lambda stream: [c for c, _ in stream], streams))
+    assert client.chat.completions.create.call_count == 1
+    for stream, chunks in zip(streams, contents, strict=True):
+        assert [chunk.content for chunk in chunks] == ["Name ", "of the ", "Wind"]
+        assert stream.content == "Name of the Wind"
+
+    list(recommend_book("fantasy"))
+    assert client.chat.completions.create.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_async(
+    openai_chunk: Callable, openai_completion: Callable
+) -> None:
+    """Tests de-duplicating identical concurrent async calls and streams."""
+    client = AsyncOpenAI(api_key="test")
+    calls = []
+
+    async def create(**kwargs: dict) -> object:
+        calls.append(kwargs)
+        await asyncio.sleep(0.05)
+        if not kwargs.get("stream"):
+            return openai_completion("Dune")
+
+        async def chunks():  # noqa: ANN202
+            for content in ["Du", "ne"]:
+                await asyncio.sleep(0.01)
+                yield openai_chunk(content)
+
+        return chunks()
+
+    client.chat.completions.create = create  # pyright: ignore [reportAttributeAccessIssue]
+
+    @single_flight
+    @openai.call("gpt-4o-mini", client=client)
+    async def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    @single_flight
+    @openai.call("gpt-4o-mini", client=client, stream=True)
+    async def stream_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    responses = await asyncio.gather(*[recommend_book("scifi") for _ in range(5)])
+    assert [response.content for response in responses] == ["Dune"] * 5
+    assert len(calls) == 1
+
+    async def consume() -> list[str]:
+        stream = await stream_book("scifi")
+        return [chunk.content async for chunk, _ in stream]
+
+    assert await asyncio.gather(*[consume() for _ in range(3)]) == [["Du", "ne"]] * 3
+    assert len(calls) == 2
@@ -1,11 +1,16 @@
 """Tests the `stream` module."""
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from typing import cast
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from mirascope.core.base import BaseTool
+from mirascope.core.base._partial import partial as partial_model
 from mirascope.core.base.stream import BaseStream, stream_factory
 
 
@@ -221,6 +226,11 @@ async def test_base_stream(mock_get_possible_user_message_param: MagicMock) -> N
     mock_construct_message_param.assert_called_once_with(["tool_call"], "content")
     assert stream.message_param == "mock_message_param"
     assert stream.model == "updated_model"
+    assert stream.timings is not None
+    assert stream.timings.time_to_first_token == stream.timings.time_to_first_chunk
+    assert stream.timings.time_to_first_tool_call is not None
+    assert stream.start_time == stream.timings.start_time
+    assert stream.end_time == stream.timings.end_time
 
     async def generator():
         yield mock_chunk, mock_tool
@@ -232,8 +242,214 @@ async def test_base_stream(mock_get_possible_user_message_param: MagicMock) -> N
         tools_and_outputs.append((tool, tool.call()))  # type: ignore
     assert stream_response == [(mock_chunk, mock_tool)]
     mock_construct_message_param.assert_called_with(["tool_call"], "content")
+    assert stream.timings is not None and stream.timings.duration is not None
+    assert stream.end_time == stream.timings.end_time
     assert stream.message_param == "mock_message_param"
     assert stream.model == "updated_model"
 
     assert stream.tool_message_params(tools_and_outputs)
     mock_tool_message_params.assert_called_once_with(tools_and_outputs)
+
+
+@patch.multiple(BaseStream, __abstractmethods__=set())
+def test_base_stream_content_buffered() -> None:
+    """Tests that `BaseStream` accumulates content without rebuilding it per chunk."""
+    chunks = []
+    for _ in range(100):
+        chunk = MagicMock()
+        chunk.content, chunk.input_tokens, chunk.output_tokens = "x", None, None
+        chunks.append((chunk, None))
+
+    stream = BaseStream(
+        stream=(t for t in chunks),
+        metadata={},
+        tool_types=[],
+        call_response_type=MagicMock,
+        model="model",
+        prompt_template="prompt_template",
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+    )  # type: ignore
+    with patch.object(BaseStream, "_construct_message_param") as mock_message_param:
+        for i, _ in enumerate(stream):
+            assert len(stream._content._parts) == i + 1
+    mock_message_param.assert_called_once_with(None, "x" * 100)
+    assert stream._content._parts == ["x" * 100]
+
+
+@patch.multiple(BaseStream, __abstractmethods__=set())
+@pytest.mark.asyncio
+async def test_base_stream_tee() -> None:
+    """Tests fanning out a `BaseStream` to several consumers."""
+    chunks = []
+    for content in ["The ", "Name ", "of the Wind"]:
+        chunk = MagicMock()
+        chunk.content, chunk.input_tokens, chunk.output_tokens = content, None, None
+        chunks.append((chunk, None))
+
+    def new_stream(source) -> BaseStream:
+        return BaseStream(
+            stream=source,
+            metadata={},
+            tool_types=[],
+            call_response_type=MagicMock,
+            model="model",
+            prompt_template="prompt_template",
+            fn_args={},
+            dynamic_config=None,
+            messages=[],
+            call_params={},
+            call_kwargs={},
+        )  # type: ignore
+
+    with patch.object(BaseStream, "_construct_message_param") as mock_message_param:
+        stream = new_stream(t for t in chunks)
+        sse, log = stream.tee(2, max_buffer=1, policy="spill")
+        assert list(sse) == chunks
+        mock_message_param.assert_called_once_with(None, "The Name of the Wind")
+        assert list(log) == chunks
+        assert log.spilled == 2
+
+        async def generator():
+            for chunk in chunks:
+                yield chunk
+
+        async def consume(consumer) -> str:
+            return "".join([chunk.content async for chunk, _ in consumer])
+
+        stream = new_stream(generator())
+        results = await asyncio.gather(*(consume(c) for c in stream.tee(3)))
+        assert results == ["The Name of the Wind"] * 3
+        assert stream.content == "The Name of the Wind"
+
+
+@patch.multiple(BaseStream, __abstractmethods__=set())
+@pytest.mark.asyncio
+async def test_base_stream_call_tools() -> None:
+    """Tests calling the complete tools of a `BaseStream`."""
+
+    class FormatBook(BaseTool):
+        title: str
+
+        def call(self) -> str:
+            return f"Formatted {self.title}"
+
+    chunk = MagicMock()
+    chunk.content, chunk.input_tokens, chunk.output_tokens = "", None, None
+    partial_tool = partial_model(FormatBook, {"delta"})(title="The Name")
+    tool = FormatBook(title="The Name of the Wind")
+    stream = BaseStream(
+        stream=(t for t in [(chunk, partial_tool), (chunk, tool), (chunk, None)]),
+        metadata={},
+        tool_types=[FormatBook],
+        call_response_type=MagicMock,
+        model="model",
+        prompt_template="prompt_template",
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+    )  # type: ignore
+    assert stream.call_tools() == []
+    with patch.object(BaseStream, "_construct_message_param"):
+        assert len(list(stream)) == 3
+    assert stream.tools == [tool]
+    assert stream.call_tools() == [(tool, "Formatted The Name of the Wind")]
+
+    async def generator():
+        yield chunk, partial_tool
+        yield chunk, tool
+
+    stream.stream = generator()
+    with patch.object(BaseStream, "_construct_message_param"):
+        assert len([item async for item in stream]) == 2
+    assert await stream.call_tools_async(timeout=1) == [
+        (tool, "Formatted The Name of the Wind")
+    ]
+
+
+@patch.multiple(BaseStream, __abstractmethods__=set())
+@pytest.mark.asyncio
+async def test_base_stream_eager_tools() -> None:
+    """Tests that eager tools are called while the stream is still running."""
+    called = threading.Event()
+
+    class FormatBook(BaseTool):
+        title: str
+
+        def call(self) -> str:
+            called.set()
+            return f"Formatted {self.title}"
+
+    class AsyncFormatBook(FormatBook):
+        async def call(self) -> str:  # pyright: ignore [reportIncompatibleMethodOverride]
+            called.set()
+            return f"Async formatted {self.title}"
+
+    chunk = MagicMock()
+    chunk.content, chunk.input_tokens, chunk.output_tokens = "", None, None
+    tool = FormatBook(title="The Name of the Wind")
+
+    def generator():
+        yield chunk, tool
+        # The tool is called before the rest of the response is streamed
+        assert called.wait(timeout=1)
+        yield chunk, None
+
+    def new_stream(source, stream_config) -> BaseStream:
+        return BaseStream(
+            stream=source,
+            metadata={},
+            tool_types=[FormatBook, AsyncFormatBook],
+            call_response_type=MagicMock,
+            model="model",
+            prompt_template="prompt_template",
+            fn_args={},
+            dynamic_config=None,
+            messages=[],
+            call_params={},
+            call_kwargs={},
+            stream_config=stream_config,
+        )  # type: ignore
+
+    with patch.object(BaseStream, "_construct_message_param"):
+        stream = new_stream(generator(), {"eager_tools": True})
+        assert len(list(stream)) == 2
+        assert stream._tool_pool is None
+        assert stream.call_tools(timeout=1) == [
+            (tool, "Formatted The Name of the Wind")
+        ]
+        assert await stream.call_tools_async() == [
+            (tool, "Formatted The Name of the Wind")
+        ]
+
+        called.clear()
+        with ThreadPoolExecutor(thread_name_prefix="tools") as executor:
+            stream = new_stream(
+                generator(), {"eager_tools": True, "tool_executor": executor}
+            )
+            assert len(list(stream)) == 2
+        assert stream.call_tools() == [(tool, "Formatted The Name of the Wind")]
+
+        async_tool = AsyncFormatBook(title="Mistborn")
+
+        async def async_generator():
+            yield chunk, tool
+            yield chunk, async_tool
+            while not called.is_set():
+                await asyncio.sleep(0)
+            yield chunk, None
+
+        called.clear()
+        stream = new_stream(async_generator(), {"eager_tools": True})
+        assert len([item async for item in stream]) == 3
+        assert await stream.call_tools_async(timeout=1) == [
+            (tool, "Formatted The Name of the Wind"),
+            (async_tool, "Async formatted Mistborn"),
+        ]
+        with pytest.raises(AssertionError, match="Use `call_tools_async`"):
+            stream.call_tools()
@@ -0,0 +1,33 @@
+"""Tests the `stream_timings` module."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mirascope.core.base.stream_timings import StreamTimings
+
+
+@patch("mirascope.core.base.stream_timings.time.perf_counter")
+def test_stream_timings(mock_perf_counter: MagicMock) -> None:
+    """Tests recording the timings of a stream."""
+    mock_perf_counter.side_effect = [10.0, 10.1, 10.15, 10.35, 10.4, 10.5]
+    timings = StreamTimings(start_time=1000)
+    assert timings.end_time is None
+    assert timings.chunk_gap_percentile(50) is None
+    timings.record_chunk(has_content=False, has_tool=False)
+    timings.record_chunk(has_content=True, has_tool=False)
+    timings.record_chunk(has_content=True, has_tool=True)
+    timings.record_chunk(has_content=False, has_tool=True)
+    assert timings.record_end() == pytest.approx(500)
+    assert timings.time_to_first_chunk == pytest.approx(100)
+    assert timings.time_to_first_token == pytest.approx(150)
+    assert timings.time_to_first_tool_call == pytest.approx(350)
+    assert timings.chunk_gaps == pytest.approx([50, 200, 50])
+    assert timings.end_time == pytest.approx(1500)
+    assert timings.chunk_gap_percentile(0) == pytest.approx(50)
+    assert timings.chunk_gap_percentile(50) == pytest.approx(50)
+    assert timings.chunk_gap_percentile(75) == pytest.approx(125)
+    assert timings.chunk_gap_percentile(100) == pytest.approx(200)
+    with pytest.raises(ValueError, match="between 0 and 100"):
+        timings.chunk_gap_percentile(101)
+    assert "_start" not in timings.model_dump()
@@ -1,10 +1,14 @@
 """Tests for the internal `_structured_stream` module."""
 
+from collections.abc import Callable, Generator, Iterable
 from functools import partial
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pydantic import BaseModel
 
+from mirascope.core import openai
 from mirascope.core.base.structured_stream import (
     BaseStructuredStream,
     structured_stream_factory,
@@ -76,6 +80,8 @@ def test_structured_stream_factory_sync(
         json_mode=mock_structured_stream_decorator_kwargs["json_mode"],
         client=mock_structured_stream_decorator_kwargs["client"],
         call_params=mock_structured_stream_decorator_kwargs["call_params"],
+        partial_tools=False,
+        stream_config=None,
     )
     mock_stream_inner.assert_called_once_with(genre="fantasy", topic="magic")
     assert list(structured_stream.stream) == [("chunk", None)]
@@ -143,6 +149,8 @@ async def test_structured_stream_factory_async(
         json_mode=mock_structured_stream_decorator_kwargs["json_mode"],
         client=mock_structured_stream_decorator_kwargs["client"],
         call_params=mock_structured_stream_decorator_kwargs["call_params"],
+        partial_tools=False,
+        stream_config=None,
     )
     mock_stream_inner.assert_called_once_with(genre="fantasy", topic="magic")
     stream_response = []
@@ -194,17 +202,273 @@ async def test_base_structured_stream(mock_extract_tool_return: MagicMock) -> No
     structured_stream = BaseStructuredStream(
         stream=base_stream, response_model=MagicMock, fields_from_call_args={}
     )
-    for i, output in enumerate(structured_stream):
+    expected_calls = [
+        ({"title": "title"}, True),
+        ('{"title": "title"}', False),
+    ]
+    for output, (json_output, allow_partial) in zip(
+        structured_stream, expected_calls, strict=True
+    ):
         assert output == "tool"
         mock_extract_tool_return.assert_called_once_with(
-            MagicMock, '{"title": "title"}', i == 0, {}
+            MagicMock, json_output, allow_partial, {}
         )
         mock_extract_tool_return.reset_mock()
-    i = 0
+    outputs = []
     async for output in structured_stream:
-        assert output == "tool"
-        mock_extract_tool_return.assert_called_with(
-            MagicMock, '{"title": "title"}', i == 0, {}
+        outputs.append(output)
+        json_output, allow_partial = expected_calls[len(outputs) - 1]
+        mock_extract_tool_return.assert_called_once_with(
+            MagicMock, json_output, allow_partial, {}
         )
         mock_extract_tool_return.reset_mock()
-        i += 1
+    assert outputs == ["tool", "tool"]
+
+
+@patch(
+    "mirascope.core.base.structured_stream.extract_tool_return", new_callable=MagicMock
+)
+def test_base_structured_stream_only_revalidates_on_change(
+    mock_extract_tool_return: MagicMock,
+) -> None:
+    """Tests that unchanged partial JSON reuses the previous partial model."""
+    mock_extract_tool_return.side_effect = lambda _, json_obj, *args: json_obj
+    chunks = []
+    for content in ['{"title": "Th', "e", ' Name"', ",  ", "", '"pages": 6', "62}"]:
+        chunk = MagicMock()
+        chunk.content, chunk.model = content, None
+        chunks.append((chunk, None))
+    base_stream = MagicMock()
+    base_stream.__iter__.return_value = iter(chunks)
+    structured_stream = BaseStructuredStream(
+        stream=base_stream, response_model=MagicMock, fields_from_call_args={}
+    )
+    assert list(structured_stream) == [
+        {"title": "Th"},
+        {"title": "The"},
+        {"title": "The Name"},
+        {"title": "The Name"},
+        {"title": "The Name"},
+        {"title": "The Name", "pages": 6},
+        {"title": "The Name", "pages": 662},
+        '{"title": "The Name",  "pages": 662}',
+    ]
+    # The unchanged chunks (`",  "` and `""`) do not re-validate the partial model.
+    assert mock_extract_tool_return.call_count == 6
+
+
+class Book(BaseModel):
+    title: str
+    pages: int
+
+
+def _mock_stream(contents: list[str]) -> MagicMock:
+    chunks = []
+    for content in contents:
+        chunk = MagicMock()
+        chunk.content, chunk.model = content, None
+        chunks.append((chunk, None))
+    base_stream = MagicMock()
+    base_stream.__iter__.return_value = iter(chunks)
+
+    async def generator(self):
+        for chunk in chunks:
+            yield chunk
+
+    base_stream.__aiter__ = generator
+    return base_stream
+
+
+_BOOK_CHUNKS = [
+    'Sure! {"value": [{"title": "A", "pag',
+    'es": 1',
+    "}",
+    ', {"title": "B", "pages": 2}, {"title"',
+    ': "C", "pages": 3}]',
+    "}",
+]
+
+
+@pytest.mark.asyncio
+async def test_base_structured_stream_iterable() -> None:
+    """Tests that each element of an `Iterable` response model is yielded once."""
+    structured_stream = BaseStructuredStream(
+        stream=_mock_stream(_BOOK_CHUNKS),
+        response_model=Iterable[Book],
+        fields_from_call_args={},
+    )
+    books = list(structured_stream)
+    assert books == [
+        Book(title="A", pages=1),
+        Book(title="B", pages=2),
+        Book(title="C", pages=3),
+    ]
+    assert structured_stream.constructed_response_model == books
+
+    structured_stream = BaseStructuredStream(
+        stream=_mock_stream(_BOOK_CHUNKS),
+        response_model=Iterable[Book],
+        fields_from_call_args={},
+    )
+    assert [book.title async for book in structured_stream] == ["A", "B", "C"]
+
+
+def test_base_structured_stream_iterable_yields_on_completion() -> None:
+    """Tests that an element is yielded as soon as its closing brace arrives."""
+    received = []
+
+    def chunks() -> Generator:
+        for content in _BOOK_CHUNKS:
+            received.append(content)
+            yield MagicMock(content=content, model=None), None
+
+    base_stream = MagicMock()
+    base_stream.__iter__.return_value = chunks()
+    structured_stream = BaseStructuredStream(
+        stream=base_stream, response_model=Iterable[Book], fields_from_call_args={}
+    )
+    yielded_at = [(book.title, len(received)) for book in structured_stream]
+    assert yielded_at == [("A", 3), ("B", 4), ("C", 5)]
+
+
+def test_base_structured_stream_iterable_incomplete() -> None:
+    """Tests that a stream ending before the array is complete raises an error."""
+    structured_stream = BaseStructuredStream(
+        stream=_mock_stream(_BOOK_CHUNKS[:4]),
+        response_model=Iterable[Book],
+        fields_from_call_args={},
+    )
+    with pytest.raises(ValueError, match="JSON array of elements"):
+        list(structured_stream)
+
+
+def test_structured_stream_iterable_response_model(openai_chunk: Callable) -> None:
+    """Tests streaming an `Iterable` response model through a provider call."""
+
+    client = MagicMock()
+    client.chat.completions.create.side_effect = lambda **kwargs: (
+        openai_chunk(content) for content in _BOOK_CHUNKS
+    )
+
+    @openai.call(
+        "gpt-4o-mini",
+        client=client,
+        stream=True,
+        response_model=Iterable[Book],
+        json_mode=True,
+    )
+    def recommend_books(genre: str) -> str:
+        return f"Recommend {genre} books"
+
+    books = list(recommend_books("fantasy"))
+    assert [book.title for book in books] == ["A", "B", "C"]
+    call_kwargs = client.chat.completions.create.call_args.kwargs
+    assert '"value"' in call_kwargs["messages"][-1]["content"]
+
+
+@pytest.mark.asyncio
+async def test_base_structured_stream_changes_only() -> None:
+    """Tests that `changes_only` skips partial models whose value didn't change."""
+    contents = ['{"title": "A", ', '"pag', 'es": 1', "}"]
+    structured_stream = BaseStructuredStream(
+        stream=_mock_stream(contents),
+        response_model=Book,
+        fields_from_call_args={},
+        stream_config={"changes_only": True},
+    )
+    with patch(
+        "mirascope.core.base.structured_stream.extract_tool_return",
+        side_effect=lambda _, json_obj, *args: json_obj,
+    ) as mock_extract_tool_return:
+        assert [output async for output in structured_stream] == [
+            {"title": "A"},
+            {"title": "A", "pages": 1},
+            '{"title": "A", "pages": 1}',
+        ]
+    assert mock_extract_tool_return.call_count == 3
+
+    structured_stream = BaseStructuredStream(
+        stream=_mock_stream(contents),
+        response_model=Book,
+        fields_from_call_args={},
+        stream_config={"min_bytes": 100},
+    )
+    outputs = list(structured_stream)
+    assert len(outputs) == 2 and outputs[-1] == Book(title="A", pages=1)
+
+
+def test_base_structured_stream_partials_are_snapshots() -> None:
+    """Tests that yielded partial models don't change as later chunks arrive."""
+
+    class Catalog(BaseModel):
+        items: Any = None
+        meta: dict = {}
+        title: str = ""
+
+    structured_stream = BaseStructuredStream(
+        stream=_mock_stream(
+            ['{"items": [1', ", 2", ', 3], "meta": {"a": [1', "]", '}, "title": "x"}']
+        ),
+        response_model=Catalog,
+        fields_from_call_args={},
+    )
+    outputs = list(structured_stream)
+    assert [output.model_dump() for output in outputs] == [
+        {"items": [1], "meta": None, "title": None},
+        {"items": [1, 2], "meta": None, "title": None},
+        {"items": [1, 2, 3], "meta": {"a": [1]}, "title": None},
+        {"items": [1, 2, 3], "meta": {"a": [1]}, "title": None},
+        {"items": [1, 2, 3], "meta": {"a": [1]}, "title": "x"},
+        {"items": [1, 2, 3], "meta": {"a": [1]}, "title": "x"},
+    ]
+
+
+def test_base_structured_stream_tee() -> None:
+    """Tests fanning out the outputs of a structured stream to several consumers."""
+    structured_stream = BaseStructuredStream(
+        stream=_mock_stream(['{"title": "A", ', '"pages": 1}']),
+        response_model=Book,
+        fields_from_call_args={},
+    )
+    first, second = structured_stream.tee(2)
+    outputs = list(first)
+    assert outputs[-1] == Book(title="A", pages=1)
+    assert structured_stream.constructed_response_model == outputs[-1]
+    assert list(second) == outputs
+
+
+@pytest.mark.asyncio
+async def test_base_structured_stream_stop_when() -> None:
+    """Tests stopping a structured stream once the required fields are complete."""
+    contents = ['{"title": "The Na', 'me", "pag', 'es": 6', "62}"]
+    structured_stream = BaseStructuredStream(
+        stream=_mock_stream(contents),
+        response_model=Book,
+        fields_from_call_args={},
+    )
+    assert structured_stream.completed_fields == set()
+    structured_stream.stop_when(lambda _: "title" in structured_stream.completed_fields)
+    outputs = list(structured_stream)
+    assert [output.title for output in outputs] == ["The Na", "The Name"]
+    assert structured_stream.cancelled
+    structured_stream.stream.cancel.assert_called_once()  # pyright: ignore [reportAttributeAccessIssue]
+    assert structured_stream.constructed_response_model is outputs[-1]
+
+    structured_stream = BaseStructuredStream(
+        stream=_mock_stream(contents),
+        response_model=Book,
+        fields_from_call_args={},
+    ).stop_when(lambda book: book.pages is not None)
+    structured_stream.stream.acancel = AsyncMock()
+    outputs = [output async for output in structured_stream]
+    assert outputs[-1].pages == 6
+    structured_stream.stream.acancel.assert_awaited_once()
+
+    structured_stream = BaseStructuredStream(
+        stream=_mock_stream(['{"value": [{"title": "A", "pages": 1}, ', '{"title']),
+        response_model=Iterable[Book],
+        fields_from_call_args={},
+    )
+    structured_stream.cancel()
+    assert list(structured_stream) == []
+    assert structured_stream.constructed_response_model == []
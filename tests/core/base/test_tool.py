@@ -1,13 +1,14 @@
 """Tests for the `tool` module."""
 
 from abc import update_abstractmethods
+from unittest.mock import patch
 
 import pytest
 from pydantic import BaseModel
 
 from mirascope.core.base._utils import DEFAULT_TOOL_DOCSTRING
 from mirascope.core.base.response_model_config_dict import ResponseModelConfigDict
-from mirascope.core.base.tool import BaseTool, ToolConfig
+from mirascope.core.base.tool import BaseTool, GenerateJsonSchemaNoTitles, ToolConfig
 
 
 def test_base_tool() -> None:
@@ -183,3 +184,57 @@ def test_base_tool_dict_from_json() -> None:
     # Test partial JSON with allow_partial=False (should use jiter's default behavior)
     with pytest.raises(ValueError):  # jiter would raise an exception for invalid JSON
         BaseTool._dict_from_json(partial_json, allow_partial=False)
+
+
+def test_base_tool_model_json_schema_is_cached() -> None:
+    """Tests that the JSON schema is generated once per class and generator."""
+
+    class FormatBook(BaseTool):
+        title: str
+
+        def call(self) -> None: ...  # pragma: no cover
+
+    generated: list[type] = []
+
+    class CountingGenerateJsonSchema(GenerateJsonSchemaNoTitles):
+        def generate(self, *args, **kwargs):  # noqa: ANN002, ANN003, ANN202
+            generated.append(type(self))
+            return super().generate(*args, **kwargs)
+
+    class OtherGenerateJsonSchema(CountingGenerateJsonSchema):
+        pass
+
+    schema = FormatBook.model_json_schema(schema_generator=CountingGenerateJsonSchema)
+    assert schema == {
+        "properties": {"title": {"type": "string"}},
+        "required": ["title"],
+        "type": "object",
+    }
+    schema["properties"] = {}  # mutating the returned copy doesn't affect the cache
+    assert FormatBook.model_json_schema(schema_generator=CountingGenerateJsonSchema)[
+        "properties"
+    ] == {"title": {"type": "string"}}
+    assert generated == [CountingGenerateJsonSchema]
+    FormatBook.model_json_schema(schema_generator=OtherGenerateJsonSchema)
+    assert generated == [CountingGenerateJsonSchema, OtherGenerateJsonSchema]
+
+
+def test_base_tool_cached_tool_schema() -> None:
+    """Tests that the provider tool schema is generated once per class."""
+
+    class FormatBook(BaseTool):
+        title: str
+
+        def call(self) -> None: ...  # pragma: no cover
+
+        @classmethod
+        def tool_schema(cls) -> dict:
+            return {"name": cls._name()}
+
+    with patch.object(
+        FormatBook, "tool_schema", wraps=FormatBook.tool_schema
+    ) as mock_tool_schema:
+        tool_schema = FormatBook._cached_tool_schema()
+        assert tool_schema == {"name": "FormatBook"}
+        assert FormatBook._cached_tool_schema() is tool_schema
+        mock_tool_schema.assert_called_once()
@@ -0,0 +1,185 @@
+"""Tests the `tool_loop` module."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from mirascope.core.base import (
+    BaseCallResponse,
+    BaseStream,
+    BaseTool,
+    ToolLoop,
+    ToolLoopStep,
+)
+
+
+class FormatBook(BaseTool):
+    title: str
+
+    def call(self) -> str:
+        return f"Formatted {self.title}"
+
+
+def _mock_response(
+    name: str, tools_and_outputs: list, cost: float | None = 0.01
+) -> MagicMock:
+    response = MagicMock(spec=BaseCallResponse)
+    response.content = name
+    response.message_param = f"{name}_message_param"
+    response.input_tokens, response.output_tokens = 10, 5
+    response.cost, response.timings = cost, None
+    response.call_tools.return_value = tools_and_outputs
+    response.call_tools_async.return_value = tools_and_outputs
+    response.tool_message_params = MagicMock(
+        return_value=[f"{name}_tool_message_param"]
+    )
+    return response
+
+
+def test_tool_loop() -> None:
+    """Tests running a call until it doesn't ask for any more tools."""
+    tool = FormatBook(title="The Name of the Wind")
+    responses = [
+        _mock_response("first", [(tool, "Formatted The Name of the Wind")]),
+        _mock_response("second", []),
+    ]
+    histories = []
+
+    def fn(genre: str, *, history: list) -> MagicMock:
+        assert genre == "fantasy"
+        histories.append(list(history))
+        return responses[len(histories) - 1]
+
+    on_step = MagicMock()
+    history = ["user_message_param"]
+    result = ToolLoop(fn, tool_timeout=5, on_step=on_step).run(
+        "fantasy", history=history
+    )
+    assert histories == [
+        ["user_message_param"],
+        ["user_message_param", "first_message_param", "first_tool_message_param"],
+    ]
+    assert result.history is history
+    assert history[-1] == "second_message_param"
+    assert result.stop_reason == "done"
+    assert result.response is responses[1]
+    assert result.content == "second"
+    responses[0].call_tools.assert_called_once_with(timeout=5, executor=None)
+    responses[0].tool_message_params.assert_called_once_with(
+        [(tool, "Formatted The Name of the Wind")]
+    )
+    responses[1].tool_message_params.assert_not_called()
+
+    assert [step.response for step in result.steps] == responses
+    assert result.steps[0].tools_and_outputs == [
+        (tool, "Formatted The Name of the Wind")
+    ]
+    assert on_step.call_args_list[0].args == (result.steps[0],)
+    assert isinstance(result.steps[1], ToolLoopStep)
+    assert result.input_tokens == 20 and result.output_tokens == 10
+    assert result.cost == pytest.approx(0.02)
+    assert result.duration == sum(
+        step.call_duration + step.tools_duration for step in result.steps
+    )
+
+
+def test_tool_loop_positional_history() -> None:
+    """Tests that a history passed positionally is appended to in place."""
+    tool = FormatBook(title="The Name of the Wind")
+    responses = [
+        _mock_response("first", [(tool, "output")]),
+        _mock_response("second", []),
+    ]
+
+    def fn(genre: str, history: list) -> MagicMock:
+        return responses[len(history) // 3]
+
+    history = ["user_message_param"]
+    result = ToolLoop(fn).run("fantasy", history)
+    assert result.history is history
+    assert history == [
+        "user_message_param",
+        "first_message_param",
+        "first_tool_message_param",
+        "second_message_param",
+    ]
+
+
+def test_tool_loop_limits() -> None:
+    """Tests that the loop stops at its `max_steps` and `max_tokens` limits."""
+    tool = FormatBook(title="The Name of the Wind")
+
+    def fn(history: list) -> MagicMock:
+        return _mock_response("response", [(tool, "output")], cost=None)
+
+    result = ToolLoop(fn, max_steps=3).run()
+    assert result.stop_reason == "max_steps"
+    assert len(result.steps) == 3
+    assert len(result.history) == 6
+    assert result.cost is None
+
+    result = ToolLoop(fn, max_tokens=30).run()
+    assert result.stop_reason == "max_tokens"
+    assert len(result.steps) == 2
+
+    with pytest.raises(ValueError, match="`max_steps` must be at least 1"):
+        ToolLoop(fn, max_steps=0)
+
+
+def test_tool_loop_stream() -> None:
+    """Tests running a streamed call, passing each chunk to `on_chunk`."""
+    stream = MagicMock(spec=BaseStream)
+    stream.__iter__.return_value = iter([("chunk", None), ("chunk", "tool")])
+    stream.message_param = "message_param"
+    stream.input_tokens = stream.output_tokens = stream.cost = stream.timings = None
+    stream.call_tools.return_value = []
+    on_chunk = MagicMock()
+
+    def fn(query: str, messages: list) -> MagicMock:
+        return stream
+
+    result = ToolLoop(fn, history_arg="messages", on_chunk=on_chunk).run("query")
+    assert [call.args for call in on_chunk.call_args_list] == [
+        ("chunk", None),
+        ("chunk", "tool"),
+    ]
+    assert result.history == ["message_param"]
+    assert result.stop_reason == "done"
+    assert result.input_tokens == 0
+
+
+def test_tool_loop_invalid_response() -> None:
+    """Tests that calls must return a call response or a stream."""
+    with pytest.raises(ValueError, match="must return a call response or a stream"):
+        ToolLoop(lambda history: "response").run()
+
+
+@pytest.mark.asyncio
+async def test_tool_loop_async() -> None:
+    """Tests running an async call (and streamed call) in a loop."""
+    tool = FormatBook(title="The Name of the Wind")
+    stream = MagicMock(spec=BaseStream)
+    stream.__aiter__.return_value = [("chunk", tool)]
+    stream.message_param = "stream_message_param"
+    stream.input_tokens = stream.output_tokens = stream.cost = stream.timings = None
+    stream.call_tools_async.return_value = [(tool, "output")]
+    stream.tool_message_params = MagicMock(return_value=["stream_tool_message_param"])
+    responses = [stream, _mock_response("second", [])]
+    on_chunk = MagicMock()
+
+    async def fn(history: list) -> MagicMock:
+        return responses[len(history) // 2]
+
+    tool_loop = ToolLoop(fn, on_chunk=on_chunk)
+    with pytest.raises(AssertionError, match="Use `run_async`"):
+        tool_loop.run()
+    result = await tool_loop.run_async()
+    assert result.history == [
+        "stream_message_param",
+        "stream_tool_message_param",
+        "second_message_param",
+    ]
+    on_chunk.assert_called_once_with("chunk", tool)
+    stream.call_tools_async.assert_awaited_once_with(timeout=None, executor=None)
+    assert result.stop_reason == "done"
+    assert len(result.steps) == 2
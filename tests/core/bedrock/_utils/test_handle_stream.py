@@ -331,10 +331,8 @@ def test_handle_stream_with_mismatched_tool_name(mock_response_text_with_tool):
         yield from mock_response_text_with_tool
 
     tool_types = [MockAnotherTool]
-    results = list(handle_stream(mock_stream(), tool_types))  # pyright: ignore [reportArgumentType]
-
-    assert all(isinstance(chunk, BedrockCallResponseChunk) for chunk, tool in results)
-    assert all(tool is None for chunk, tool in results)
+    with pytest.raises(KeyError, match="Unknown tool `RecommendBook`"):
+        list(handle_stream(mock_stream(), tool_types))  # pyright: ignore [reportArgumentType]
 
 
 def test_handle_stream_with_multiple_tool_types(mock_response_text_with_tool):
@@ -360,10 +358,8 @@ async def test_handle_stream_async_with_mismatched_tool_name(
             yield chunk
 
     tool_types = [MockAnotherTool]
-    results = [c async for c in handle_stream_async(mock_stream(), tool_types)]  # pyright: ignore [reportArgumentType]
-
-    assert all(isinstance(chunk, BedrockCallResponseChunk) for chunk, tool in results)
-    assert all(tool is None for chunk, tool in results)
+    with pytest.raises(KeyError, match="Unknown tool `RecommendBook`"):
+        _ = [c async for c in handle_stream_async(mock_stream(), tool_types)]  # pyright: ignore [reportArgumentType]
 
 
 @pytest.mark.asyncio
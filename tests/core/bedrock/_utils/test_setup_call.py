@@ -1,17 +1,19 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 from types_aiobotocore_bedrock_runtime import (
     BedrockRuntimeClient as AsyncBedrockRuntimeClient,
 )
 
+from mirascope.core.base import ClientPool
 from mirascope.core.bedrock._utils._convert_common_call_params import (
     convert_common_call_params,
 )
 from mirascope.core.bedrock._utils._setup_call import (
+    _AsyncBedrockClient,
     _extract_async_stream_fn,
     _extract_sync_stream_fn,
-    _get_async_client,
+    _get_default_client,
     setup_call,
 )
 from mirascope.core.bedrock.tool import BedrockTool
@@ -25,17 +27,61 @@ def mock_base_setup_call() -> MagicMock:
 
 
 @pytest.mark.asyncio
-async def test_get_async_client():
+async def test_async_bedrock_client():
     mock_session = MagicMock()
-
+    mock_context = mock_session.create_client.return_value
+    mock_context.__aexit__ = AsyncMock()
     mock_client = MagicMock(spec=AsyncBedrockRuntimeClient)
-    mock_session.create_client.return_value.__aenter__.return_value = mock_client
+    mock_client.converse = AsyncMock(return_value="response")
+    mock_client.converse_stream = AsyncMock(return_value="stream")
+    mock_context.__aenter__ = AsyncMock(return_value=mock_client)
+
+    client = _AsyncBedrockClient(mock_session)
+    mock_session.create_client.assert_not_called()
+    assert await client.get() is mock_client
+    assert await client.converse(modelId="model") == "response"
+    assert await client.converse_stream(modelId="model") == "stream"
+    mock_session.create_client.assert_called_once_with("bedrock-runtime", config=None)
+    mock_context.__aenter__.assert_awaited_once()
+    mock_context.__aexit__.assert_not_awaited()
+    mock_client.converse.assert_awaited_once_with(modelId="model")
+    mock_client.converse_stream.assert_awaited_once_with(modelId="model")
+
+    await client.aclose()
+    mock_context.__aexit__.assert_awaited_once_with(None, None, None)
+    await client.aclose()
+    mock_context.__aexit__.assert_awaited_once()
 
-    client = await _get_async_client(mock_session)
 
-    assert isinstance(client, MagicMock)
-    assert client == mock_client
-    mock_session.create_client.assert_called_once_with("bedrock-runtime")
+@pytest.mark.asyncio
+async def test_get_default_client_async():
+    with (
+        patch(
+            "mirascope.core.bedrock._utils._setup_call.default_client_pool",
+            ClientPool({"max_connections": 5}),
+        ) as pool,
+        patch("mirascope.core.bedrock._utils._setup_call.get_session"),
+    ):
+        client = _get_default_client(True)
+        assert isinstance(client, _AsyncBedrockClient)
+        assert client._config is not None
+        assert client._config.max_pool_connections == 5
+        assert _get_default_client(True) is client
+        await pool.aclose()
+        assert _get_default_client(True) is not client
+
+
+@patch("mirascope.core.bedrock._utils._setup_call.Session")
+def test_get_default_client_sync(mock_session: MagicMock):
+    with patch(
+        "mirascope.core.bedrock._utils._setup_call.default_client_pool", ClientPool()
+    ):
+        client = _get_default_client(False)
+        assert _get_default_client(False) is client
+    mock_session.assert_called_once_with()
+    mock_session.return_value.client.assert_called_once_with(
+        "bedrock-runtime", config=None
+    )
 
 
 def test_extract_sync_stream_fn():
@@ -279,11 +325,11 @@ def test_setup_call_with_tools(
     assert call_kwargs["toolConfig"] == {"tools": [{"name": "test_tool"}]}
 
 
-@patch("mirascope.core.bedrock._utils._setup_call._get_async_client")
+@patch("mirascope.core.bedrock._utils._setup_call._get_default_client")
 @patch("mirascope.core.bedrock._utils._setup_call._utils", new_callable=MagicMock)
 def test_setup_call_client_creation(
     mock_utils: MagicMock,
-    mock_get_async_client: AsyncMock,
+    mock_get_default_client: MagicMock,
     mock_base_setup_call: MagicMock,
 ) -> None:
     mock_utils.setup_call = mock_base_setup_call
@@ -321,7 +367,7 @@ def test_setup_call_client_creation(
         extract=False,
         stream=False,
     )
-    mock_get_async_client.assert_called_once()
+    mock_get_default_client.assert_has_calls([call(False), call(True)])
 
     # Test when client is provided
     mock_client = MagicMock()
@@ -337,4 +383,4 @@ def test_setup_call_client_creation(
         extract=False,
         stream=False,
     )
-    assert mock_get_async_client.call_count == 1
+    assert mock_get_default_client.call_count == 2
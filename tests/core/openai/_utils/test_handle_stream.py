@@ -9,6 +9,7 @@ from openai.types.chat.chat_completion_chunk import (
     ChoiceDeltaToolCallFunction,
 )
 
+from mirascope.core.base._utils import StreamThrottle
 from mirascope.core.openai._utils._handle_stream import (
     handle_stream,
     handle_stream_async,
@@ -357,3 +358,40 @@ async def test_handle_stream_async_with_partial_tools(
         == {"title": "The Name of the Wind", "author": "Patrick Rothfuss"}
         and tool.delta is None
     )
+
+
+def test_handle_stream_with_throttled_partial_tools(
+    mock_chunks: list[ChatCompletionChunk],
+) -> None:
+    """Tests that a throttle coalesces partial tools and their deltas."""
+    result = list(
+        handle_stream(
+            (c for c in mock_chunks),
+            tool_types=[FormatBook],
+            partial_tools=True,
+            throttle=StreamThrottle(min_bytes=30),
+        )
+    )
+    tools = [tool for _, tool in result if tool is not None]
+    assert [tool.delta for tool in tools] == [
+        '{"title": "The Name',
+        ' of the Wind", "author": "Patrick Rothfuss"}',
+        None,
+        '{"title": "The Name of the Wind", "author": "Patrick Rothfuss"}',
+        None,
+    ]
+    assert tools[1].model_dump(exclude={"tool_call", "delta"}) == {
+        "title": "The Name of the Wind",
+        "author": "Patrick Rothfuss",
+    }
+
+
+def test_handle_stream_unknown_tool(mock_chunks: list[ChatCompletionChunk]) -> None:
+    """Tests that streaming a tool that isn't in `tool_types` raises a `KeyError`."""
+
+    class OtherTool(OpenAITool):
+        def call(self) -> None:
+            """Dummy call."""
+
+    with pytest.raises(KeyError, match="Unknown tool `FormatBook`"):
+        list(handle_stream((c for c in mock_chunks), tool_types=[OtherTool]))
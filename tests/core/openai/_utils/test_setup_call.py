@@ -3,13 +3,14 @@
 from typing import ClassVar
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
-from mirascope.core.base import ResponseModelConfigDict
+from mirascope.core.base import ClientPool, ResponseModelConfigDict
 from mirascope.core.openai._utils._convert_common_call_params import (
     convert_common_call_params,
 )
-from mirascope.core.openai._utils._setup_call import setup_call
+from mirascope.core.openai._utils._setup_call import _get_default_client, setup_call
 from mirascope.core.openai.tool import OpenAITool
 
 
@@ -245,3 +246,45 @@ def test_setup_call_extract(
             stream=False,
         )
     assert "tool_choice" in call_kwargs and call_kwargs["tool_choice"] == "required"
+
+
+@patch("mirascope.core.openai._utils._setup_call.OpenAI", new_callable=MagicMock)
+@patch(
+    "mirascope.core.openai._utils._setup_call.convert_message_params",
+    new_callable=MagicMock,
+)
+@patch("mirascope.core.openai._utils._setup_call._utils", new_callable=MagicMock)
+def test_setup_call_reuses_default_client(
+    mock_utils: MagicMock,
+    mock_convert_message_params: MagicMock,
+    mock_openai: MagicMock,
+    mock_base_setup_call: MagicMock,
+) -> None:
+    """Tests that the default client is pooled across calls."""
+    mock_utils.setup_call = mock_base_setup_call
+    for _ in range(2):
+        setup_call(
+            model="gpt-4o",
+            client=None,
+            fn=MagicMock(),
+            fn_args={},
+            dynamic_config=None,
+            tools=None,
+            json_mode=False,
+            call_params={},
+            extract=False,
+            stream=False,
+        )
+    mock_openai.assert_called_once_with()
+
+
+@patch("mirascope.core.openai._utils._setup_call.OpenAI", new_callable=MagicMock)
+def test_get_default_client_with_limits(mock_openai: MagicMock) -> None:
+    """Tests that the pool's limits are applied to the default client."""
+    with patch(
+        "mirascope.core.openai._utils._setup_call.default_client_pool",
+        ClientPool({"max_connections": 10}),
+    ):
+        assert _get_default_client(False) is mock_openai.return_value
+    http_client = mock_openai.call_args.kwargs["http_client"]
+    assert isinstance(http_client, httpx.Client)
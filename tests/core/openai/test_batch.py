@@ -0,0 +1,157 @@
+"""Tests the `openai.batch` module against a local fake of the Batch API."""
+
+import json
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from openai.types.chat import ChatCompletion
+from pydantic import BaseModel
+
+from mirascope.core import openai
+from mirascope.core.base import BatchRequestError
+
+
+class _FakeBatchClient:
+    """Runs batches locally by answering each request with `respond(body)`."""
+
+    def __init__(self, respond: Any) -> None:  # noqa: ANN401
+        self.respond = respond
+        self.contents: dict[str, str] = {}
+        self.status = "completed"
+        self.files = SimpleNamespace(create=self._create_file, content=self._content)
+        self.batches = SimpleNamespace(create=self._create, retrieve=self._retrieve)
+
+    def _create_file(self, file: tuple[str, bytes], purpose: str) -> Any:  # noqa: ANN401
+        assert purpose == "batch"
+        file_id = f"file-{len(self.contents)}"
+        self.contents[file_id] = file[1].decode()
+        return SimpleNamespace(id=file_id)
+
+    def _content(self, file_id: str) -> Any:  # noqa: ANN401
+        return SimpleNamespace(text=self.contents[file_id])
+
+    def _create(self, input_file_id: str, endpoint: str, **kwargs: Any) -> Any:  # noqa: ANN401
+        output, errors = [], []
+        for line in self.contents[input_file_id].splitlines():
+            request = json.loads(line)
+            assert request["url"] == endpoint
+            result = {"custom_id": request["custom_id"], "error": None}
+            if (body := self.respond(request["body"])) is None:
+                errors.append(result | {"error": {"message": "failed"}})
+            else:
+                response = {"status_code": 200, "body": body}
+                output.append(result | {"response": response})
+        self.contents["output"] = "\n".join(json.dumps(line) for line in output)
+        self.contents["errors"] = "\n".join(json.dumps(line) for line in errors)
+        return SimpleNamespace(id="batch-0", **kwargs)
+
+    def _retrieve(self, batch_id: str) -> Any:  # noqa: ANN401
+        return SimpleNamespace(
+            id=batch_id,
+            status=self.status,
+            output_file_id="output",
+            error_file_id="errors",
+        )
+
+
+@pytest.fixture(autouse=True)
+def api_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+
+
+def test_write_batch_file() -> None:
+    """Tests that `write_batch_file` captures the `call_kwargs` without calling."""
+
+    @openai.call("gpt-4o-mini", call_params={"temperature": 0.5})
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    lines = openai.batch.write_batch_file(
+        recommend_book, [{"genre": "fantasy"}, {"genre": "mystery"}]
+    ).splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {
+            "custom_id": f"request-{index}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": "gpt-4o-mini",
+                "temperature": 0.5,
+                "messages": [{"role": "user", "content": f"Recommend a {genre} book"}],
+            },
+        }
+        for index, genre in enumerate(["fantasy", "mystery"])
+    ]
+
+
+def test_batch_round_trip(openai_completion: Callable) -> None:
+    """Tests creating a batch and parsing its results into call responses."""
+
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    def respond(body: dict[str, Any]) -> dict[str, Any] | None:
+        content = body["messages"][0]["content"]
+        return (
+            None
+            if "horror" in content
+            else openai_completion(content.upper()).model_dump(mode="json")
+        )
+
+    client = _FakeBatchClient(respond)
+    inputs = [{"genre": "fantasy"}, {"genre": "horror"}, {"genre": "mystery"}]
+    batch = openai.batch.create_batch(
+        recommend_book,
+        inputs,
+        client=client,
+        metadata={"name": "books"},  # pyright: ignore [reportArgumentType]
+    )
+    assert batch.metadata == {"name": "books"}
+    results = openai.batch.get_batch_results(
+        recommend_book,
+        inputs,
+        batch.id,
+        client=client,  # pyright: ignore [reportArgumentType]
+    )
+    assert isinstance(results[0], openai.OpenAICallResponse)
+    assert isinstance(results[0].response, ChatCompletion)
+    assert results[0].content == "RECOMMEND A FANTASY BOOK"
+    assert isinstance(results[1], BatchRequestError)
+    assert results[1].custom_id == "request-1"
+    assert isinstance(results[2], openai.OpenAICallResponse)
+    assert results[2].content == "RECOMMEND A MYSTERY BOOK"
+
+    client.status = "in_progress"
+    with pytest.raises(ValueError, match="has not completed"):
+        openai.batch.get_batch_results(recommend_book, inputs, batch.id, client=client)  # pyright: ignore [reportArgumentType]
+
+
+def test_batch_response_model(openai_completion: Callable) -> None:
+    """Tests that batch results are extracted into the call's `response_model`."""
+
+    class Book(BaseModel):
+        title: str
+
+    @openai.call("gpt-4o-mini", response_model=Book, json_mode=True)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    def respond(body: dict[str, Any]) -> dict[str, Any]:
+        assert body["response_format"] == {"type": "json_object"}
+        return openai_completion('{"title": "The Name of the Wind"}').model_dump(
+            mode="json"
+        )
+
+    client = _FakeBatchClient(respond)
+    inputs = [{"genre": "fantasy"}]
+    batch = openai.batch.create_batch(recommend_book, inputs, client=client)  # pyright: ignore [reportArgumentType]
+    results = openai.batch.get_batch_results(
+        recommend_book,
+        inputs,
+        batch.id,
+        client=client,  # pyright: ignore [reportArgumentType]
+    )
+    assert results == [Book(title="The Name of the Wind")]
@@ -1,6 +1,7 @@
 """Tests the `openai.call_response` module."""
 
 import base64
+from unittest.mock import patch
 
 import pytest
 from openai.types.chat import ChatCompletion, ChatCompletionToolMessageParam
@@ -133,8 +134,125 @@ def test_openai_call_response_with_tools() -> None:
     ]
 
     completion.choices[0].message.refusal = "refusal message"
+    assert call_response.tools == tools
+    refused_response = call_response.model_copy(update={"response": completion})
     with pytest.raises(ValueError, match="refusal message"):
-        tool = call_response.tools
+        tool = refused_response.tools
+
+
+def test_openai_call_response_with_unknown_tool() -> None:
+    """Tests that tool calls that don't match any tool type are skipped."""
+
+    class FormatBook(OpenAITool):
+        title: str
+
+    tool_call = ChatCompletionMessageToolCall(
+        id="id",
+        function=Function(arguments='{"genre": "fantasy"}', name="RecommendBook"),
+        type="function",
+    )
+    completion = ChatCompletion(
+        id="id",
+        choices=[
+            Choice(
+                finish_reason="tool_calls",
+                index=0,
+                message=ChatCompletionMessage(
+                    content=None, role="assistant", tool_calls=[tool_call]
+                ),
+            )
+        ],
+        created=0,
+        model="gpt-4o",
+        object="chat.completion",
+    )
+    call_response = OpenAICallResponse(
+        metadata={},
+        response=completion,
+        tool_types=[FormatBook],
+        prompt_template="",
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+        user_message_param=None,
+        start_time=0,
+        end_time=0,
+    )
+    assert call_response.tools == []
+    assert call_response.tool is None
+    assert call_response.model_dump()["tools"] == []
+
+
+def test_openai_call_response_caches_tools() -> None:
+    """Tests that the derived `OpenAICallResponse` values are only computed once."""
+
+    class FormatBook(OpenAITool):
+        title: str
+        author: str
+
+        def call(self) -> str:
+            return f"{self.title} by {self.author}"
+
+    tool_call = ChatCompletionMessageToolCall(
+        id="id",
+        function=Function(
+            arguments='{"title": "The Name of the Wind", "author": "Patrick Rothfuss"}',
+            name="FormatBook",
+        ),
+        type="function",
+    )
+    completion = ChatCompletion(
+        id="id",
+        choices=[
+            Choice(
+                finish_reason="stop",
+                index=0,
+                message=ChatCompletionMessage(
+                    content="content", role="assistant", tool_calls=[tool_call]
+                ),
+            )
+        ],
+        created=0,
+        model="gpt-4o",
+        object="chat.completion",
+    )
+    call_response = OpenAICallResponse(
+        metadata={},
+        response=completion,
+        tool_types=[FormatBook],
+        prompt_template="",
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+        user_message_param=None,
+        start_time=0,
+        end_time=0,
+    )
+    with patch.object(
+        FormatBook, "from_tool_call", wraps=FormatBook.from_tool_call
+    ) as mock_from_tool_call:
+        tools = call_response.tools
+        assert call_response.tools is tools
+        assert tools and call_response.tool is tools[0]
+        assert call_response.message_param is call_response.message_param
+        dumped = call_response.model_dump()
+        assert dumped["tools"] == [dumped["tool"]]
+        assert mock_from_tool_call.call_count == 1
+
+        call_response.tool_types = []
+        assert call_response.tools is None
+        assert call_response.tool is None
+        assert mock_from_tool_call.call_count == 1
+
+        copied_response = call_response.model_copy()
+        assert copied_response.tools is None
+        copied_response = call_response.model_copy(update={"tool_types": [FormatBook]})
+        assert copied_response.tool == tools[0]
+        assert mock_from_tool_call.call_count == 2
 
 
 def test_openai_call_response_with_audio() -> None:
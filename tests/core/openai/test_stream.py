@@ -1,6 +1,9 @@
 """Tests the `openai.stream` module."""
 
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
+from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletion, ChatCompletionChunk
 from openai.types.chat.chat_completion import Choice
 from openai.types.chat.chat_completion_chunk import (
@@ -18,6 +21,7 @@ from openai.types.chat.chat_completion_message_tool_call import (
 )
 from openai.types.completion_usage import CompletionUsage
 
+from mirascope.core import openai
 from mirascope.core.openai.call_response import OpenAICallResponse
 from mirascope.core.openai.call_response_chunk import OpenAICallResponseChunk
 from mirascope.core.openai.stream import OpenAIStream
@@ -264,6 +268,10 @@ def test_construct_call_response() -> None:
     )
     constructed_call_response = stream.construct_call_response()
     assert constructed_call_response.response == call_response.response
+    assert constructed_call_response.timings is stream.timings
+    assert stream.timings is not None
+    assert stream.timings.time_to_first_tool_call is not None
+    assert constructed_call_response.end_time == stream.timings.end_time
 
 
 def test_construct_call_response_no_usage() -> None:
@@ -383,3 +391,129 @@ async def test_openai_stream_audio() -> None:
         "content": "content",
         "audio": {"id": "audio-id-123"},
     }
+
+
+def _content_chunk(content: str | None, **choice_kwargs) -> ChatCompletionChunk:
+    return ChatCompletionChunk(
+        id="id",
+        choices=[
+            ChunkChoice(delta=ChoiceDelta(content=content), index=0, **choice_kwargs)
+        ],
+        created=0,
+        model="gpt-4o",
+        object="chat.completion.chunk",
+    )
+
+
+def test_openai_stream_coalesce_chunks() -> None:
+    """Tests coalescing the text chunks of an OpenAI stream."""
+    chunks = [
+        _content_chunk("The "),
+        _content_chunk("Name "),
+        _content_chunk("of "),
+        _content_chunk("the Wind"),
+        _content_chunk(None, finish_reason="stop"),
+    ]
+    assert OpenAIStream._mergeable_text(chunks[0]) == (0, "The ")
+    assert OpenAIStream._mergeable_text(chunks[-1]) is None
+    merged = OpenAIStream._merge_chunks(chunks[0], "The Name")
+    assert merged.choices[0].delta.content == "The Name"
+    assert chunks[0].choices[0].delta.content == "The "
+
+    client = MagicMock()
+    client.chat.completions.create.return_value = iter(chunks)
+
+    @openai.call("gpt-4o", client=client, stream={"coalesce_chunks": 3})
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    stream = recommend_book("fantasy")
+    contents = [chunk.content for chunk, _ in stream]
+    assert contents == ["The Name of ", "the Wind", ""]
+    assert stream.content == "The Name of the Wind"
+    assert stream.finish_reasons == ["stop"]
+
+
+class _SDKStream:
+    """A provider SDK stream that records whether its connection was closed."""
+
+    def __init__(self, contents: list[str]) -> None:
+        self.chunks = [_content_chunk(content) for content in contents]
+        self.closed = False
+
+    def __iter__(self):
+        yield from self.chunks
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_openai_stream_early_termination() -> None:
+    """Tests that abandoning, cancelling, or stopping a stream closes the SDK stream."""
+    sdk_streams = []
+
+    def create(**kwargs) -> _SDKStream:
+        sdk_streams.append(_SDKStream(["The ", "Name ", "of ", "the Wind"]))
+        return sdk_streams[-1]
+
+    client = MagicMock()
+    client.chat.completions.create.side_effect = create
+
+    @openai.call("gpt-4o", client=client, stream=True)
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    stream = recommend_book("fantasy")
+    for _ in stream:
+        break
+    assert sdk_streams[-1].closed
+    assert stream.construct_call_response().content == "The "
+
+    stream = recommend_book("fantasy")
+    for chunk, _ in stream:
+        if chunk.content == "Name ":
+            stream.cancel()
+            assert sdk_streams[-1].closed
+    assert stream.cancelled
+    assert stream.construct_call_response().content == "The Name "
+
+    stream = recommend_book("fantasy").stop_when(
+        lambda chunk, _: chunk.content == "of "
+    )
+    assert [chunk.content for chunk, _ in stream] == ["The ", "Name ", "of "]
+    assert sdk_streams[-1].closed
+    assert stream.message_param["content"] == "The Name of "  # pyright: ignore [reportTypedDictNotRequiredAccess]
+
+
+@pytest.mark.asyncio
+async def test_openai_stream_early_termination_async() -> None:
+    """Tests that cancelling an async stream closes the SDK stream."""
+    sdk_stream = _SDKStream(["The ", "Name ", "of ", "the Wind"])
+    client = AsyncOpenAI(api_key="api_key")
+    client.chat.completions.create = AsyncMock(return_value=sdk_stream)  # pyright: ignore [reportAttributeAccessIssue]
+
+    @openai.call("gpt-4o", client=client, stream=True)
+    async def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+    stream = await recommend_book("fantasy")
+    async for chunk, _ in stream:
+        if chunk.content == "Name ":
+            await stream.acancel()
+    assert sdk_stream.closed
+    assert stream.content == "The Name "
+    assert stream.construct_call_response().content == "The Name "
+    stream.cancel()
+
+    sdk_stream = _SDKStream(["The ", "Name "])
+    client.chat.completions.create = AsyncMock(return_value=sdk_stream)  # pyright: ignore [reportAttributeAccessIssue]
+    stream = await recommend_book("fantasy")
+    async for _ in stream:
+        break
+    await stream.acancel()
+    assert sdk_stream.closed
+    assert stream.construct_call_response().content == "The "
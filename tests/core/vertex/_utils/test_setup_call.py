@@ -3,6 +3,7 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from google.cloud.aiplatform import initializer
 from vertexai.generative_models import (
     Content,
     GenerationConfig,
@@ -78,6 +79,34 @@ def test_setup_call(
     mock_client.generate_content.assert_called_once_with(**call_kwargs)
 
 
+@patch("mirascope.core.vertex._utils._setup_call._utils", new_callable=MagicMock)
+@patch(
+    "mirascope.core.vertex._utils._setup_call.GenerativeModel", new_callable=MagicMock
+)
+def test_setup_call_pools_models_per_init_config(
+    mock_generative_model: MagicMock,
+    mock_utils: MagicMock,
+    mock_base_setup_call: MagicMock,
+) -> None:
+    """Tests that pooled models are only reused while `vertexai.init` is unchanged."""
+    mock_utils.setup_call = mock_base_setup_call
+    for project in ["first", "first", "second"]:
+        with patch.object(initializer.global_config, "_project", project):
+            setup_call(
+                model="gemini-1.5-flash",
+                client=None,
+                fn=MagicMock(),
+                fn_args={},
+                dynamic_config=None,
+                tools=None,
+                json_mode=False,
+                call_params={},
+                extract=False,
+                stream=False,
+            )
+    assert mock_generative_model.call_count == 2
+
+
 @pytest.mark.parametrize("generation_config_type", [dict, GenerationConfig])
 @patch(
     "mirascope.core.vertex._utils._setup_call.convert_message_params",